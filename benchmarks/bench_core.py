@@ -0,0 +1,382 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.bench_core module
+
+Reproducible benchmarks of KERI core hot paths: CESR primitives, Serder round
+trips, Parser throughput, Kevery acceptance of multisig witnessed events,
+escrow reprocessing, TEL issuance and revocation, credential verification and
+LMDB sub database operations.
+
+    python benchmarks/bench_core.py
+    python benchmarks/bench_core.py --select kevery escrow --rounds 3
+    python benchmarks/bench_core.py --save base.json
+    python benchmarks/bench_core.py --compare base.json --history bench.jsonl
+
+All synthetic data is generated from a fixed salt through a temporary Habery
+so every run measures the same events and credentials.
+"""
+import os
+import sys
+
+from keri.app import habbing, signing
+from keri.core import coring, eventing, parsing, scheming
+from keri.core.eventing import SealEvent
+from keri.db import basing, dbing, subing
+from keri.help import helping
+from keri.vc import proving
+from keri.vdr import credentialing, verifying
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import benching  # noqa: E402
+from benching import case  # noqa: E402
+
+Salt = coring.Salter(raw=b'0123456789abcdef').qb64
+Controllers = 16  # multisig witnessed identifiers
+Events = 8  # events in KEL of each identifier
+Credentials = 16  # credentials per issuance, revocation and verification case
+
+
+class Sink:
+    """ Stand in Kevery that only counts events so parsing is measured alone """
+
+    def __init__(self):
+        self.count = 0
+
+    def processEvent(self, **kwa):
+        self.count += 1
+
+    def __getattr__(self, name):
+        return lambda *args, **kwa: None
+
+
+class Fixture:
+    """
+    Synthetic data shared by all cases
+
+    Attributes:
+        hby (Habery): temporary source of all identifiers
+        ctls (list): of per controller lists of event messages, each
+            controller is 3 of 5 multisig with 3 witnesses and toad 2 and its
+            events are icp, ixn, rot followed by alternating ixn and rot
+        wits (list): of witness Habs
+        issuer (Hab): single sig issuer of credentials
+        rgy (Regery): registries of issuer
+        registry (Registry): credential registry of issuer
+        schema (str): SAID of credential schema
+        creds (list): of (creder, sadsigers, sadcigars) of issued credentials
+    """
+
+    def __init__(self, controllers=Controllers, events=Events, credentials=Credentials):
+        self.hby = habbing.Habery(name="bench", temp=True, salt=Salt)
+        self.dbs = []
+        self.count = 0
+        self.psr = parsing.Parser(kvy=eventing.Kevery(db=self.hby.db, lax=True))
+
+        self.wits = [self.hby.makeHab(name=f"wit{i}", transferable=False) for i in range(3)]
+        wits = [wit.pre for wit in self.wits]
+        self.ctls = []
+        for i in range(controllers):
+            hab = self.hby.makeHab(name=f"ctl{i}", isith="3", icount=5, nsith="3", ncount=5,
+                                   wits=wits, toad=2)
+            self.witness(hab)
+            for j in range(1, events):
+                if j % 2:
+                    hab.interact()
+                else:
+                    hab.rotate(isith="3", ncount=5, nsith="3")
+                self.witness(hab)
+            self.ctls.append([bytes(msg) for msg in self.hby.db.clonePreIter(pre=hab.pre)])
+
+        self.issuer = self.hby.makeHab(name="issuer")
+        self.rgy = credentialing.Regery(hby=self.hby, name="bench", temp=True)
+        self.registry = self.rgy.makeRegistry(prefix=self.issuer.pre, name="bench")
+        self.anchor([(self.registry.regk, "0", self.registry.regd)])
+
+        sad = {"$id": "", "$schema": "http://json-schema.org/draft-07/schema#",
+               "title": "Benchmark Credential", "type": "object"}
+        _, sad = coring.Saider.saidify(sad, label=coring.Ids.dollar)
+        schemer = scheming.Schemer(sed=sad)
+        self.hby.db.schema.pin(schemer.said, schemer)
+        self.schema = schemer.said
+
+        self.creds = self.credentials(credentials)
+        self.issue([creder.said for creder, _, _ in self.creds])
+
+    def witness(self, hab):
+        """ Adds receipts of all witnesses of latest event of hab. Receipts
+        go through a lax Kevery since a nonlax one skips own receipts of own
+        events """
+        serder = hab.kever.serder
+        for wit in self.wits:
+            self.psr.parse(ims=bytearray(wit.witness(serder)))
+
+    def anchor(self, seals):
+        """ Anchors each TEL event (pre, snh, said) seal in its own interaction
+        of issuer since a TEL event must be the only seal of its anchoring event """
+        hab = self.issuer
+        for pre, snh, said in seals:
+            hab.interact(data=[SealEvent(pre, snh, said)._asdict()])
+            self.registry.anchorMsg(pre=pre, regd=said,
+                                    seqner=coring.Seqner(sn=hab.kever.sn),
+                                    saider=hab.kever.serder.saider)
+        self.rgy.processEscrows()
+
+    def credentials(self, count):
+        """ Returns list of count new signed credentials of issuer """
+        creds = []
+        for _ in range(count):
+            self.count += 1
+            _, data = coring.Saider.saidify(sad=dict(d="", i=self.issuer.pre,
+                                                     dt=helping.nowIso8601(), n=self.count),
+                                            label=coring.Ids.d)
+            creder = proving.credential(issuer=self.issuer.pre, schema=self.schema, data=data,
+                                        status=self.registry.regk)
+            sadsigers, sadcigars = signing.signPaths(hab=self.issuer, serder=creder, paths=[[]])
+            creds.append((creder, sadsigers, sadcigars))
+        return creds
+
+    def issue(self, saids):
+        """ Issues and anchors credentials saids """
+        self.anchor([(serder.pre, serder.ked["s"], serder.said)
+                     for serder in (self.registry.issue(said=said) for said in saids)])
+
+    def revoke(self, saids):
+        """ Revokes and anchors credentials saids """
+        self.anchor([(serder.pre, serder.ked["s"], serder.said)
+                     for serder in (self.registry.revoke(said=said) for said in saids)])
+
+    def kevery(self):
+        """ Returns Kevery of new temporary database closed by .close """
+        db = basing.Baser(name=f"sink{len(self.dbs)}", temp=True, reopen=True)
+        self.dbs.append(db)
+        return eventing.Kevery(db=db, lax=False, local=False)
+
+    def lmdber(self, compact=False):
+        """ Returns new temporary LMDBer in compact or hex format closed by .close """
+        db = dbing.LMDBer(name=f"bench{len(self.dbs)}", temp=True, reopen=True,
+                          compact=compact)
+        self.dbs.append(db)
+        return db
+
+    def events(self, *sns):
+        """ Returns list of event messages at sequence numbers sns of all
+        controllers """
+        return [ctl[sn] for sn in sns for ctl in self.ctls]
+
+    def close(self):
+        for db in self.dbs:
+            db.close(clear=True)
+        self.rgy.close()
+        self.hby.close(clear=True)
+
+
+def ingest(kvy, msgs):
+    parser = parsing.Parser(kvy=kvy)
+    for msg in msgs:
+        parser.parse(ims=bytearray(msg))
+
+
+# CESR primitives
+
+@case("cesr.matter.encode")
+def matterEncode(fix):
+    raw = fix.wits[0].kever.verfers[0].raw
+    return lambda: coring.Matter(raw=raw, code=coring.MtrDex.Ed25519N).qb64b
+
+
+@case("cesr.matter.decode")
+def matterDecode(fix):
+    qb64b = fix.wits[0].kever.verfers[0].qb64b
+    return lambda: coring.Matter(qb64b=qb64b).raw
+
+
+@case("cesr.matter.qb2")
+def matterQb2(fix):
+    qb2 = fix.wits[0].kever.verfers[0].qb2
+    return lambda: coring.Matter(qb2=qb2).qb64b
+
+
+@case("cesr.indexer.encode")
+def indexerEncode(fix):
+    raw = bytes(64)
+    return lambda: coring.Indexer(raw=raw, code=coring.IdrDex.Ed25519_Sig, index=4).qb64b
+
+
+@case("cesr.indexer.decode")
+def indexerDecode(fix):
+    qb64b = coring.Indexer(raw=bytes(64), code=coring.IdrDex.Ed25519_Sig, index=4).qb64b
+    return lambda: coring.Indexer(qb64b=qb64b).raw
+
+
+@case("cesr.counter.roundtrip")
+def counterRoundtrip(fix):
+    def run():
+        qb64b = coring.Counter(code=coring.CtrDex.ControllerIdxSigs, count=3).qb64b
+        return coring.Counter(qb64b=qb64b).count
+    return run
+
+
+# Serder round trips of rotation event for each serialization kind
+
+def serderCase(kind):
+    @case(f"serder.{kind.lower()}.roundtrip")
+    def serderRoundtrip(fix):
+        ked = coring.Serder(raw=fix.ctls[0][2]).ked
+        raw = coring.Serder(ked=ked, kind=kind).raw
+
+        def run():
+            coring.Serder(ked=ked, kind=kind)
+            return coring.Serder(raw=raw).ked
+        return run
+
+
+for _kind in (coring.Serials.json, coring.Serials.mgpk, coring.Serials.cbor):
+    serderCase(_kind)
+
+
+# Parser throughput over KEL replays without event validation
+
+@case("parser.replay", ops=Controllers * Events)
+def parserReplay(fix):
+    stream = b"".join(msg for ctl in fix.ctls for msg in ctl)
+
+    def run():
+        sink = Sink()
+        parsing.Parser(kvy=sink).parse(ims=bytearray(stream))
+        assert sink.count == len(fix.ctls) * len(fix.ctls[0])
+    return run
+
+
+# Kevery acceptance of multisig events with witness receipts
+
+def accept(kvy, msgs, sn):
+    """ Returns callable that ingests msgs and checks all were accepted at sn """
+    def run():
+        ingest(kvy, msgs)
+        assert len(kvy.kevers) == len(msgs), "escrowed"
+        assert all(kever.sn == sn for kever in kvy.kevers.values()), "escrowed"
+    return run
+
+
+@case("kevery.icp", ops=Controllers, fresh=True)
+def keveryIcp(fix):
+    return accept(fix.kevery(), fix.events(0), 0)
+
+
+@case("kevery.ixn", ops=Controllers, fresh=True)
+def keveryIxn(fix):
+    kvy = fix.kevery()
+    ingest(kvy, fix.events(0))
+    return accept(kvy, fix.events(1), 1)
+
+
+@case("kevery.rot", ops=Controllers, fresh=True)
+def keveryRot(fix):
+    kvy = fix.kevery()
+    ingest(kvy, fix.events(0, 1))
+    return accept(kvy, fix.events(2), 2)
+
+
+@case("kevery.escrow.ooo", ops=Controllers * (Events - 1), fresh=True)
+def keveryEscrow(fix):
+    kvy = fix.kevery()
+    ingest(kvy, fix.events(*range(1, len(fix.ctls[0]))))  # all out of order
+    ingest(kvy, fix.events(0))
+
+    def run():
+        kvy.processEscrows()
+        assert len(kvy.kevers) == len(fix.ctls)
+        assert all(kever.sn == len(fix.ctls[0]) - 1 for kever in kvy.kevers.values())
+    return run
+
+
+# TEL issuance and revocation with anchoring
+
+@case("tel.issue", ops=Controllers, fresh=True)
+def telIssue(fix):
+    saids = [creder.said for creder, _, _ in fix.credentials(Credentials)]
+    return lambda: fix.issue(saids)
+
+
+@case("tel.revoke", ops=Controllers, fresh=True)
+def telRevoke(fix):
+    saids = [creder.said for creder, _, _ in fix.credentials(Credentials)]
+    fix.issue(saids)
+    return lambda: fix.revoke(saids)
+
+
+# credential verification
+
+@case("verifier.credential", ops=Credentials)
+def verifierCredential(fix):
+    verifier = verifying.Verifier(hby=fix.hby, reger=fix.rgy.reger)
+
+    def run():
+        for creder, sadsigers, sadcigars in fix.creds:
+            verifier.processCredential(creder, sadsigers=sadsigers, sadcigars=sadcigars)
+        verifier.cues.clear()
+    return run
+
+
+# LMDB sub database operations
+
+@case("lmdb.suber.put", ops=256)
+def suberPut(fix):
+    db = fix.lmdber()
+    suber = subing.Suber(db=db, subkey="bench.")
+    keys = [(f"{i:08x}", "key") for i in range(256)]
+    return lambda: [suber.pin(keys=key, val="value" * 8) for key in keys]
+
+
+@case("lmdb.suber.get", ops=256)
+def suberGet(fix):
+    db = fix.lmdber()
+    suber = subing.Suber(db=db, subkey="bench.")
+    keys = [(f"{i:08x}", "key") for i in range(256)]
+    for key in keys:
+        suber.pin(keys=key, val="value" * 8)
+    return lambda: [suber.get(keys=key) for key in keys]
+
+
+@case("lmdb.suber.iter", ops=256)
+def suberIter(fix):
+    db = fix.lmdber()
+    suber = subing.Suber(db=db, subkey="bench.")
+    for i in range(256):
+        suber.pin(keys=(f"{i:08x}", "key"), val="value" * 8)
+    return lambda: list(suber.getItemIter())
+
+
+@case("lmdb.ioset.add", ops=256, fresh=True)
+def iosetAdd(fix, compact=False):
+    db = fix.lmdber(compact=compact)
+    suber = subing.IoSetSuber(db=db, subkey="bench.")
+    return lambda: [suber.add(keys=(f"{i % 16:08x}",), val=f"value{i}") for i in range(256)]
+
+
+@case("lmdb.ioset.add.compact", ops=256, fresh=True)
+def iosetAddCompact(fix):
+    return iosetAdd(fix, compact=True)
+
+
+@case("lmdb.dup.ioval", ops=256 * 2, fresh=True)
+def dupIoVal(fix, compact=False):
+    db = fix.lmdber(compact=compact)
+    sdb = db.env.open_db(key=b"bench.", dupsort=True)
+    keys = [b"%032x" % (i % 16) for i in range(256)]
+
+    def run():
+        for i, key in enumerate(keys):
+            db.addIoVal(sdb, key, b"value%d" % i)
+        for key in keys:
+            db.getIoVals(sdb, key)
+    return run
+
+
+@case("lmdb.dup.ioval.compact", ops=256 * 2, fresh=True)
+def dupIoValCompact(fix):
+    return dupIoVal(fix, compact=True)
+
+
+if __name__ == "__main__":
+    sys.exit(benching.main(Fixture, description="Benchmark KERI core hot paths"))
@@ -0,0 +1,86 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.bench_format module
+
+Compares database size and throughput of the hex and compact storage formats
+of insertion ordinals and times online migration from hex to compact.
+
+    python benchmarks/bench_format.py --aids 64 --events 20
+
+The same replay of all KELs is ingested into a fresh hex and a fresh compact
+database. Reports bytes in use, ingest and KEL read events per second of each
+and the seconds to migrate the hex database to compact in place.
+"""
+import argparse
+import time
+
+from keri.app import habbing
+from keri.core import eventing, parsing
+from keri.db import basing
+
+
+def generate(hby, aids, events):
+    """ Returns bytearray replay of aids KELs each with events events """
+    msgs = bytearray()
+    for i in range(aids):
+        hab = hby.makeHab(name=f"bench{i}", isith="1", icount=1, ncount=1)
+        for j in range(events - 1):
+            if j % 4 == 0:
+                hab.rotate()
+            else:
+                hab.interact()
+        msgs.extend(hab.replay())
+    return msgs
+
+
+def size(db):
+    """ Returns int bytes of pages in use by LMDB environment of db """
+    return (db.env.info()["last_pgno"] + 1) * db.env.stat()["psize"]
+
+
+def run(msgs, compact):
+    """ Returns (db, ingest seconds, read seconds) of ingest of msgs into
+    fresh temporary database in compact or hex format and read of all KELs """
+    db = basing.Baser(name=f"format{int(compact)}", temp=True, reopen=True, compact=compact)
+    kvy = eventing.Kevery(db=db, lax=False, local=False)
+    start = time.perf_counter()
+    parsing.Parser(kvy=kvy).parse(ims=bytearray(msgs))
+    ingest = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for pre in list(db.kevers):
+        for _ in db.getKelIter(pre):
+            pass
+    return db, ingest, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark hex versus compact storage format")
+    parser.add_argument("--aids", type=int, default=64, help="number of identifiers")
+    parser.add_argument("--events", type=int, default=20, help="events per identifier")
+    args = parser.parse_args()
+
+    with habbing.openHby(name="source", base="bench") as hby:
+        msgs = generate(hby, args.aids, args.events)
+    total = args.aids * args.events
+
+    print(f"{'format':>8} {'bytes':>10} {'ingest/s':>10} {'read/s':>10}")
+    dbs = []
+    try:
+        for compact in (False, True):
+            db, ingest, read = run(msgs, compact)
+            dbs.append(db)
+            print(f"{'compact' if compact else 'hex':>8} {size(db):10d} {total / ingest:10.1f} "
+                  f"{total / read:10.1f}")
+
+        start = time.perf_counter()
+        counts = dbs[0].migrate(compact=True)
+        print(f"migrated {sum(counts.values())} entries hex to compact in "
+              f"{time.perf_counter() - start:.3f} s")
+    finally:
+        for db in dbs:
+            db.close(clear=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.bench_sharding module
+
+Compares serial Kevery validation with sharded validation by prefix across
+increasing numbers of worker processes.
+
+    python benchmarks/bench_sharding.py --aids 64 --events 20 --workers 1 2 4 8
+
+Each run ingests the same replay of all KELs into a fresh temporary database
+and reports events per second and speedup relative to serial validation.
+"""
+import argparse
+import os
+import time
+
+from keri.app import habbing
+from keri.core import eventing, parsing, sharding
+
+
+def generate(hby, aids, events, icount):
+    """ Returns bytearray replay of aids KELs each with events events """
+    msgs = bytearray()
+    for i in range(aids):
+        hab = hby.makeHab(name=f"bench{i}", isith="1", icount=icount, ncount=icount)
+        for j in range(events - 1):
+            if j % 4 == 0:
+                hab.rotate(isith="1", ncount=icount)
+            else:
+                hab.interact()
+        msgs.extend(hab.replay())
+    return msgs
+
+
+def ingest(msgs, workers):
+    """ Returns seconds to validate and commit msgs into fresh database """
+    with habbing.openHby(name=f"sink{workers}", base="bench") as hby:
+        kvy = eventing.Kevery(db=hby.db, lax=False, local=False)
+        if not workers:
+            start = time.perf_counter()
+            parsing.Parser(kvy=kvy).parse(ims=bytearray(msgs))
+            return time.perf_counter() - start, len(hby.db.kevers)
+
+        sharder = sharding.Sharder(kvy=kvy, workers=workers)
+        try:
+            sharder.verify([])  # warm up pool so process start is not timed
+            start = time.perf_counter()
+            sharder.process(msgs)
+            return time.perf_counter() - start, len(hby.db.kevers)
+        finally:
+            sharder.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sharded Kevery validation")
+    parser.add_argument("--aids", type=int, default=64, help="number of identifiers")
+    parser.add_argument("--events", type=int, default=20, help="events per identifier")
+    parser.add_argument("--icount", type=int, default=3, help="signing keys per identifier")
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=[w for w in (1, 2, 4, 8) if w <= (os.cpu_count() or 1)],
+                        help="worker process counts to compare against serial")
+    args = parser.parse_args()
+
+    with habbing.openHby(name="source", base="bench") as hby:
+        msgs = generate(hby, args.aids, args.events, args.icount)
+    total = args.aids * args.events
+
+    serial, _ = ingest(msgs, 0)
+    print(f"{'mode':>10} {'seconds':>9} {'events/s':>10} {'speedup':>8}")
+    print(f"{'serial':>10} {serial:9.3f} {total / serial:10.1f} {1.0:8.2f}")
+    for workers in args.workers:
+        secs, _ = ingest(msgs, workers)
+        print(f"{workers:>8}wk {secs:9.3f} {total / secs:10.1f} {serial / secs:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
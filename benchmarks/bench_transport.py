@@ -0,0 +1,144 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.bench_transport module
+
+Compares request/response latency and throughput of direct mode TCP event
+submission to the hio Doist based Directant and to the asyncio Server.
+
+    python benchmarks/bench_transport.py --events 200 --tock 0.03125
+
+A blocking socket client sends each event of a KEL and waits for the
+receipt before sending the next one so the latency includes the server's
+wake up delay. Idle CPU of each server is measured over --idle seconds.
+"""
+import argparse
+import asyncio
+import socket
+import statistics
+import threading
+import time
+
+from hio.base import doing
+from hio.core.tcp import serving
+
+from keri.app import asyncing, directing, habbing
+from keri.core import parsing
+
+
+class Tally:
+    """ Stand in Kevery that counts receipts """
+
+    def __init__(self):
+        self.count = 0
+
+    def processReceipt(self, serder, cigars):
+        self.count += 1
+
+    def __getattr__(self, name):
+        return lambda *args, **kwa: None
+
+
+def drive(port, msgs):
+    """ Returns list of round trip seconds per msg """
+    tally = Tally()
+    feeder = asyncing.Feeder(kvy=tally)
+    sock = socket.create_connection(("127.0.0.1", port))
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    rtts = []
+    try:
+        for msg in msgs:
+            count = tally.count
+            start = time.perf_counter()
+            sock.sendall(msg)
+            while tally.count == count:
+                feeder.feed(sock.recv(65536))
+            rtts.append(time.perf_counter() - start)
+    finally:
+        sock.close()
+    return rtts
+
+
+def cpu(seconds):
+    """ Returns process CPU seconds used while sleeping seconds """
+    start = time.process_time()
+    time.sleep(seconds)
+    return time.process_time() - start
+
+
+def runHio(hab, port, tock, work):
+    server = serving.Server(host="127.0.0.1", port=port)
+    doers = [serving.ServerDoer(server=server), directing.Directant(hab=hab, server=server)]
+    doist = doing.Doist(tock=tock, real=True, doers=doers)
+    stop = []
+
+    def stopper(tymth=None, tock=0.0, **opts):
+        yield
+        while not stop:
+            yield
+        return True
+
+    doist.doers.append(doing.doify(stopper))
+    thread = threading.Thread(target=doist.do)
+    thread.start()
+    time.sleep(0.2)
+    try:
+        return work()
+    finally:
+        stop.append(True)
+        doist.limit = 0.001  # force exit on next pass
+        thread.join(timeout=5)
+
+
+def runAsync(hab, port, work):
+    loop = asyncio.new_event_loop()
+    server = asyncing.Server(hab=hab, host="127.0.0.1", port=port)
+    loop.run_until_complete(server.start())
+    thread = threading.Thread(target=loop.run_forever)
+    thread.start()
+    try:
+        return work()
+    finally:
+        asyncio.run_coroutine_threadsafe(server.close(), loop).result(timeout=5)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        loop.close()
+
+
+def report(label, rtts, idle):
+    total = sum(rtts)
+    rtts = sorted(rtts)
+    p99 = rtts[min(len(rtts) - 1, int(len(rtts) * 0.99))]
+    print(f"{label:>8} {statistics.median(rtts) * 1e3:9.2f} {p99 * 1e3:9.2f} "
+          f"{len(rtts) / total:10.1f} {idle:9.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark hio Doist vs asyncio transport")
+    parser.add_argument("--events", type=int, default=200, help="number of events submitted")
+    parser.add_argument("--tock", type=float, default=0.03125, help="hio Doist tock")
+    parser.add_argument("--idle", type=float, default=2.0, help="seconds to measure idle CPU")
+    parser.add_argument("--port", type=int, default=5631, help="base TCP port")
+    args = parser.parse_args()
+
+    with habbing.openHby(name="ctl", base="bench") as ctlHby:
+        hab = ctlHby.makeHab(name="ctl", isith="1", icount=1)
+        for i in range(args.events - 1):
+            hab.interact()
+        msgs = list(ctlHby.db.clonePreIter(pre=hab.pre))
+
+    print(f"{'server':>8} {'p50 ms':>9} {'p99 ms':>9} {'events/s':>10} {'idle cpu':>9}")
+    with habbing.openHby(name="wit0", base="bench") as witHby:
+        wit = witHby.makeHab(name="wit", transferable=False)
+        rtts, idle = runHio(wit, args.port, args.tock,
+                            lambda: (drive(args.port, msgs), cpu(args.idle)))
+        report("hio", rtts, idle)
+
+    with habbing.openHby(name="wit1", base="bench") as witHby:
+        wit = witHby.makeHab(name="wit", transferable=False)
+        rtts, idle = runAsync(wit, args.port + 1,
+                              lambda: (drive(args.port + 1, msgs), cpu(args.idle)))
+        report("asyncio", rtts, idle)
+
+
+if __name__ == "__main__":
+    main()
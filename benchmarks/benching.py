@@ -0,0 +1,204 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.benching module
+
+Minimal benchmark harness used by the bench_*.py suites so results can be
+recorded and compared across commits without extra dependencies.
+
+Each case is registered with the case decorator on a prepare function that
+does all untimed setup and returns the zero argument callable to time. Cases
+marked fresh are prepared again before every round for operations that change
+state such as accepting events into a database.
+
+Results are saved as JSON with the commit, Python version and platform so a
+later run can be compared against a saved baseline and fail on regressions:
+
+    python benchmarks/bench_core.py --save baseline.json
+    python benchmarks/bench_core.py --compare baseline.json --threshold 0.25
+"""
+import datetime
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections import namedtuple
+
+Case = namedtuple("Case", "name prepare ops fresh")
+
+Cases = dict()  # registered cases by name in registration order
+
+
+def case(name, ops=1, fresh=False):
+    """ Returns decorator that registers prepare function as benchmark case
+
+    Parameters:
+        name (str): unique case name such as "cesr.matter.encode"
+        ops (int): number of operations done by one call of the timed callable
+            so results are reported per operation
+        fresh (bool): True means prepare before every round and call the
+            timed callable once per round
+    """
+    def decorator(prepare):
+        if name in Cases:
+            raise ValueError(f"duplicate benchmark case {name}")
+        Cases[name] = Case(name=name, prepare=prepare, ops=ops, fresh=fresh)
+        return prepare
+
+    return decorator
+
+
+def calibrate(run, target):
+    """ Returns number of calls of run that take at least target seconds """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        if time.perf_counter() - start >= target or number >= 1 << 20:
+            return number
+        number *= 2
+
+
+def measure(bcase, fixture, rounds=5, target=0.1):
+    """ Returns dict of result of benchmark case over rounds
+
+    Parameters:
+        bcase (Case): case to run
+        fixture (object): shared synthetic data passed to prepare
+        rounds (int): number of timed rounds
+        target (float): min seconds of each round of non fresh cases
+    """
+    times = []
+    if bcase.fresh:
+        number = 1
+        for _ in range(rounds):
+            run = bcase.prepare(fixture)
+            start = time.perf_counter()
+            run()
+            times.append(time.perf_counter() - start)
+    else:
+        run = bcase.prepare(fixture)
+        number = calibrate(run, target)
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for _ in range(number):
+                run()
+            times.append((time.perf_counter() - start) / number)
+
+    perop = [t / bcase.ops for t in times]
+    median = statistics.median(perop)
+    return dict(ops=bcase.ops, number=number, rounds=rounds,
+                min=min(perop), median=median,
+                stdev=statistics.stdev(perop) if len(perop) > 1 else 0.0,
+                rate=1.0 / median if median else float("inf"))
+
+
+def commit():
+    """ Returns str of current git commit or empty when unavailable """
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                             text=True, timeout=10)
+        return out.stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def run(fixture, select=(), rounds=5, target=0.1, out=sys.stdout):
+    """ Returns dict of run record of all selected registered cases
+
+    Parameters:
+        fixture (object): shared synthetic data passed to each prepare
+        select (Iterable): of substrings of case names to run, empty for all
+        rounds (int): number of timed rounds per case
+        target (float): min seconds of each round of non fresh cases
+        out (file): stream of progress lines or None
+    """
+    results = dict()
+    for name, bcase in Cases.items():
+        if select and not any(sel in name for sel in select):
+            continue
+        result = results[name] = measure(bcase, fixture, rounds=rounds, target=target)
+        if out is not None:
+            print(f"{name:<40} {result['median'] * 1e6:12.2f} us/op {result['rate']:12.1f} op/s",
+                  file=out)
+
+    return dict(meta=dict(commit=commit(),
+                          python=platform.python_version(),
+                          platform=platform.platform(),
+                          date=datetime.datetime.now(datetime.timezone.utc).isoformat()),
+                results=results)
+
+
+def compare(record, baseline, threshold=0.25):
+    """ Returns list of (name, base, current, change, regressed) quintuples of
+    cases in both record and baseline where change is the relative change of
+    median seconds per op and regressed is True when change exceeds threshold
+
+    Parameters:
+        record (dict): run record from run
+        baseline (dict): earlier run record
+        threshold (float): max allowed relative slow down such as 0.25 for 25%
+    """
+    rows = []
+    for name, result in record["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        change = result["median"] / base["median"] - 1.0 if base["median"] else 0.0
+        rows.append((name, base["median"], result["median"], change, change > threshold))
+    return rows
+
+
+def main(fixture, description, argv=None):
+    """ Runs registered cases from command line and returns exit status which
+    is 1 when any case regressed against --compare baseline
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--select", "-k", nargs="*", default=[],
+                        help="substrings of case names to run, default all")
+    parser.add_argument("--rounds", type=int, default=5, help="timed rounds per case")
+    parser.add_argument("--target", type=float, default=0.1,
+                        help="min seconds per round of repeatable cases")
+    parser.add_argument("--save", default=None, help="path of JSON file to save results to")
+    parser.add_argument("--history", default=None,
+                        help="path of JSON lines file to append results to for tracking over time")
+    parser.add_argument("--compare", default=None, help="path of JSON baseline results to compare to")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="relative slow down of median that counts as regression")
+    parser.add_argument("--list", action="store_true", help="list case names and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name in Cases:
+            print(name)
+        return 0
+
+    fix = fixture()
+    try:
+        record = run(fix, select=args.select, rounds=args.rounds, target=args.target)
+    finally:
+        if hasattr(fix, "close"):
+            fix.close()
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(record, f, indent=2)
+    if args.history:
+        with open(args.history, "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+    status = 0
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print(f"\ncompared to {baseline['meta'].get('commit') or args.compare}")
+        for name, base, current, change, regressed in compare(record, baseline, args.threshold):
+            flag = "REGRESSED" if regressed else ""
+            print(f"{name:<40} {base * 1e6:12.2f} {current * 1e6:12.2f} us/op {change:+8.1%} {flag}")
+            if regressed:
+                status = 1
+    return status
@@ -8,7 +8,6 @@ import random
 from urllib.parse import urlparse
 
 from hio.base import doing
-from hio.core import http
 from hio.core.tcp import clienting
 from hio.help import decking
 
@@ -17,6 +16,9 @@ from .. import help
 from .. import kering
 from ..core import eventing, parsing, coring
 from ..db import dbing
+from ..help import helping
+
+http = helping.lazyModule("hio.core.http")  # web stack imported on first use
 
 logger = help.ogler.getLogger()
 
@@ -113,10 +115,13 @@ class WitnessReceiptor(doing.DoDoer):
                         witer.msgs.append(bytearray(msg))  # make a copy
                         _ = (yield self.tock)
 
+                    txnid = None
                     while True:
-                        wigs = hab.db.getWigs(dgkey)
-                        if len(wigs) == len(wits):
-                            break
+                        if hab.db.txnid != txnid:  # only reread receipts after a commit
+                            txnid = hab.db.txnid
+                            wigs = hab.db.getWigs(dgkey)
+                            if len(wigs) == len(wits):
+                                break
                         _ = yield self.tock
 
                 # If we started with all our recipts, exit unless told to force resubmit of all receipts
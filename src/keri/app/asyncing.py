@@ -0,0 +1,576 @@
+# -*- encoding: utf-8 -*-
+"""
+keri.app.asyncing module
+
+Optional asyncio runtime for KERI transports alongside hio Doers.
+
+The hio Doist polls every doer once per tock whether or not there is any
+work. This module provides readiness driven equivalents that run on an
+asyncio event loop:
+
+    DoerHost    hosts existing hio Doers on the loop and only recurs them when
+                a doer is due or when woken by new work
+    Feeder      async feed of received bytes into a Parser with Kevery and
+                optional Tevery escrow processing
+    Reactor     per connection asyncio analogue of directing.Reactant
+    Server      event driven TCP server running a Reactor per connection
+    HttpServer  event driven HTTP server accepting CESR HTTP requests
+    Clienter    pooled keep-alive TCP and HTTP client connections
+"""
+import asyncio
+import itertools
+import time
+from urllib import parse as urlparse
+
+from hio.base import doing
+
+from . import httping
+from .. import help, kering
+from ..core import coring, eventing, parsing, routing
+from ..vdr.eventing import Tevery
+
+logger = help.ogler.getLogger()
+
+
+class DoerHost:
+    """
+    DoerHost runs hio Doers on an asyncio event loop.
+
+    Instead of sleeping a fixed .tock between each pass like a real time
+    Doist, it sleeps until the earliest retyme of any doer or until .wake is
+    called, whichever comes first. A wake makes every hosted doer due so each
+    is recurred on the next pass even when its retyme has not yet come. The
+    Doist .tyme tracks the loop's monotonic clock so doer timers behave as in
+    real time mode.
+
+    Attributes:
+        doist (Doist): Doist whose deeds are run
+        doers (list): hosted doers
+
+    """
+
+    def __init__(self, doers=None, tock=0.03125):
+        """ Initialize instance
+
+        Parameters:
+            doers (list): Doers, DoDoers or doified generator functions
+            tock (float): default retyme in seconds for doers that yield
+                without a tock. Upper bound on latency for doers that are
+                never woken explicitly.
+        """
+        self.doers = list(doers) if doers is not None else []
+        self.doist = doing.Doist(tock=tock, real=False)
+        self._event = None
+        self._start = None
+
+    def wake(self):
+        """ Wakes host to recur all doers now whether or not they are due.
+        Safe to call from loop callbacks. """
+        if self._event is not None:
+            self._event.set()
+
+    def extend(self, doers):
+        """ Adds doers to running host """
+        self.doist.extend(doers=doers)
+        self.wake()
+
+    async def run(self, limit=None):
+        """ Runs hosted doers until all are done or limit seconds elapse
+
+        Parameters:
+            limit (float | None): max run time in seconds, None means no limit
+        """
+        self._event = asyncio.Event()
+        self._start = time.monotonic()
+        self.doist.tyme = 0.0
+        self.doist.doers = self.doers
+        self.doist.enter()
+        try:
+            while self.doist.deeds:
+                self.doist.tyme = time.monotonic() - self._start
+                self.doist.recur()
+                elapsed = time.monotonic() - self._start
+                if limit is not None and elapsed >= limit:
+                    break
+
+                retymes = [retyme for (dog, retyme, doer) in self.doist.deeds]
+                delay = max(0.0, min(retymes) - elapsed) if retymes else 0.0
+                if limit is not None:
+                    delay = min(delay, max(0.0, limit - elapsed))
+
+                if delay <= 0.0:
+                    await asyncio.sleep(0)  # let other tasks run
+                    continue
+
+                try:
+                    await asyncio.wait_for(self._event.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+
+                if self._event.is_set():  # woken so make every doer due now
+                    tyme = time.monotonic() - self._start
+                    for i, (dog, retyme, doer) in enumerate(self.doist.deeds):
+                        self.doist.deeds[i] = (dog, min(retyme, tyme), doer)
+                    self._event.clear()
+        finally:
+            self.doist.exit()
+
+
+class Feeder:
+    """
+    Feeder parses bytes as they arrive into a Kevery, and optional Tevery,
+    with the same Parser used by the hio transports.
+
+    Attributes:
+        ims (bytearray): incoming message stream buffer
+        parser (Parser): framed parser reading from .ims
+        kvy (Kevery): KEL message processor
+        tvy (Tevery | None): TEL message processor
+
+    """
+
+    def __init__(self, kvy, tvy=None, exc=None, rvy=None, vry=None):
+        """ Initialize instance
+
+        Parameters:
+            kvy (Kevery): KEL message processor
+            tvy (Tevery | None): TEL message processor
+            exc (Exchanger | None): exn message processor
+            rvy (Revery | None): reply message processor
+            vry (Verifier | None): credential processor
+        """
+        self.ims = bytearray()
+        self.kvy = kvy
+        self.tvy = tvy
+        self.parser = parsing.Parser(ims=self.ims, framed=True, kvy=kvy, tvy=tvy,
+                                     exc=exc, rvy=rvy, vry=vry)
+        self._parsator = self.parser.parsator()
+        next(self._parsator)  # prime to first wait for bytes
+
+    def feed(self, data):
+        """ Parses as many whole messages as possible from data plus any bytes
+        left over from previous feeds then processes escrows.
+
+        Returns:
+            int: number of bytes consumed
+
+        Parameters:
+            data (bytes): newly received bytes
+        """
+        self.ims.extend(data)
+        size = len(self.ims)
+        while self.ims:
+            before = len(self.ims)
+            next(self._parsator)
+            if len(self.ims) == before:  # shortage so wait for more bytes
+                break
+
+        self.kvy.processEscrows()
+        if self.tvy is not None:
+            self.tvy.processEscrows()
+        return size - len(self.ims)
+
+    async def afeed(self, data):
+        """ Async feed that yields to the event loop once done """
+        consumed = self.feed(data)
+        await asyncio.sleep(0)
+        return consumed
+
+
+class Reactor:
+    """
+    Reactor is the asyncio analogue of directing.Reactant. It parses messages
+    received on one connection and writes back the responses to any cues,
+    such as receipts, as soon as they are generated.
+
+    Attributes:
+        hab (Hab): local controller context
+        kevery (Kevery): per connection Kevery on .hab.db
+        tevery (Tevery | None): per connection Tevery when verifier provided
+        feeder (Feeder): parser feed of connection
+        writer (StreamWriter): connection writer
+
+    """
+
+    def __init__(self, hab, writer, verifier=None, exchanger=None):
+        """ Initialize instance
+
+        Parameters:
+            hab (Hab): local controller context
+            writer (StreamWriter): connection writer
+            verifier (Verifier | None): TEL context
+            exchanger (Exchanger | None): exn message processor
+        """
+        self.hab = hab
+        self.writer = writer
+        self.exchanger = exchanger
+        rvy = routing.Revery(db=hab.db)
+        self.kevery = eventing.Kevery(db=hab.db, lax=False, local=False, rvy=rvy)
+        self.kevery.registerReplyRoutes(router=rvy.rtr)
+        if verifier is not None:
+            self.tevery = Tevery(reger=verifier.reger, db=hab.db, local=False, rvy=rvy)
+            self.tevery.registerReplyRoutes(router=rvy.rtr)
+        else:
+            self.tevery = None
+
+        self.feeder = Feeder(kvy=self.kevery, tvy=self.tevery, exc=exchanger, rvy=rvy)
+
+    async def react(self, data):
+        """ Processes received data and sends any responses """
+        self.feeder.feed(data)
+        for msg in self.hab.processCuesIter(self.kevery.cues):
+            if isinstance(msg, list):
+                msg = bytearray(itertools.chain(*msg))
+            self.writer.write(msg)
+
+        if self.exchanger is not None:
+            for rep in self.exchanger.processResponseIter():
+                self.writer.write(rep["msg"])
+
+        await self.writer.drain()
+
+
+class Server:
+    """
+    Server is an event driven TCP server that runs a Reactor per connection.
+    Handlers run only when a connection is readable so an idle server uses
+    no CPU.
+
+    Attributes:
+        hab (Hab): local controller context
+        host (str): listen host
+        port (int): listen port, 0 picks a free port available as .port once
+            started
+        reactors (dict): Reactor instances keyed by peer address
+
+    """
+
+    def __init__(self, hab, host="127.0.0.1", port=5620, verifier=None, exchanger=None,
+                 bufsize=65536):
+        """ Initialize instance
+
+        Parameters:
+            hab (Hab): local controller context
+            host (str): listen host
+            port (int): listen port
+            verifier (Verifier | None): TEL context
+            exchanger (Exchanger | None): exn message processor
+            bufsize (int): max bytes per read
+        """
+        self.hab = hab
+        self.host = host
+        self.port = port
+        self.verifier = verifier
+        self.exchanger = exchanger
+        self.bufsize = bufsize
+        self.reactors = dict()
+        self.server = None
+        self.tasks = set()  # connection handler tasks
+
+    async def start(self):
+        """ Starts listening """
+        self.server = await asyncio.start_server(self.serve, host=self.host, port=self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self.server
+
+    async def close(self):
+        """ Stops listening, closes open connections and closes server """
+        if self.server is not None:
+            self.server.close()
+            for task in list(self.tasks):
+                task.cancel()
+            await asyncio.gather(*self.tasks, return_exceptions=True)
+            await self.server.wait_closed()
+            self.server = None
+
+    async def serve(self, reader, writer):
+        """ Connection handler """
+        ca = writer.get_extra_info("peername")
+        task = asyncio.current_task()
+        self.tasks.add(task)
+        reactor = Reactor(hab=self.hab, writer=writer, verifier=self.verifier,
+                          exchanger=self.exchanger)
+        self.reactors[ca] = reactor
+        try:
+            while data := await reader.read(self.bufsize):
+                await reactor.react(data)
+        except (ConnectionError, asyncio.IncompleteReadError) as ex:
+            logger.info("Server %s: connection %s closed: %s", self.hab.name, ca, ex)
+        finally:
+            del self.reactors[ca]
+            self.tasks.discard(task)
+            writer.close()
+
+
+class HttpServer(Server):
+    """
+    HttpServer is an event driven HTTP/1.1 server accepting KERI messages
+    POSTed or PUT as CESR HTTP requests, the message as body and its
+    attachments in the CESR attachment header, as done by indirecting.HttpEnd.
+    Requests on a keep-alive connection are handled as soon as they are read.
+    Messages of all connections are fed to one Kevery whose cues are left in
+    .kevery.cues for the caller. Query and mailbox requests stay on the
+    falcon endpoints.
+
+    Attributes:
+        kevery (Kevery): Kevery on .hab.db shared by all connections
+        tevery (Tevery | None): Tevery when verifier provided
+        feeder (Feeder): parser feed of all connections
+
+    """
+
+    def __init__(self, hab, host="127.0.0.1", port=5632, verifier=None, exchanger=None,
+                 bufsize=65536):
+        """ Initialize instance
+
+        Parameters:
+            hab (Hab): local controller context
+            host (str): listen host
+            port (int): listen port
+            verifier (Verifier | None): TEL context
+            exchanger (Exchanger | None): exn message processor
+            bufsize (int): max bytes of request body
+        """
+        super(HttpServer, self).__init__(hab=hab, host=host, port=port, verifier=verifier,
+                                         exchanger=exchanger, bufsize=bufsize)
+        rvy = routing.Revery(db=hab.db)
+        self.kevery = eventing.Kevery(db=hab.db, lax=False, local=False, rvy=rvy)
+        self.kevery.registerReplyRoutes(router=rvy.rtr)
+        if verifier is not None:
+            self.tevery = Tevery(reger=verifier.reger, db=hab.db, local=False, rvy=rvy)
+            self.tevery.registerReplyRoutes(router=rvy.rtr)
+        else:
+            self.tevery = None
+
+        self.feeder = Feeder(kvy=self.kevery, tvy=self.tevery, exc=exchanger, rvy=rvy)
+
+    async def serve(self, reader, writer):
+        """ Connection handler """
+        ca = writer.get_extra_info("peername")
+        task = asyncio.current_task()
+        self.tasks.add(task)
+        try:
+            while line := await reader.readline():
+                method = line.split()[0] if line.strip() else b""
+                headers = await readHeaders(reader)
+                size = int(headers.get("content-length", 0))
+                if size > self.bufsize:
+                    writer.write(b"HTTP/1.1 413 Payload Too Large\r\nContent-Length: 0\r\n"
+                                 b"Connection: close\r\n\r\n")
+                    await writer.drain()
+                    break
+
+                body = await reader.readexactly(size) if size else b""
+                status = self.handle(method, headers, body)
+                writer.write(f"HTTP/1.1 {status}\r\nContent-Length: 0\r\n\r\n".encode("utf-8"))
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError) as ex:
+            logger.info("HttpServer %s: connection %s closed: %s", self.hab.name, ca, ex)
+        finally:
+            self.tasks.discard(task)
+            writer.close()
+
+    def handle(self, method, headers, body):
+        """ Returns status line of CESR HTTP request after feeding its message
+
+        Parameters:
+            method (bytes): request method
+            headers (dict): request headers with lower case names
+            body (bytes): request body
+        """
+        if method not in (b"POST", b"PUT"):
+            return "405 Method Not Allowed"
+        if headers.get("content-type") != httping.CESR_CONTENT_TYPE:
+            return "406 Not Acceptable"
+        if (atc := headers.get(httping.CESR_ATTACHMENT_HEADER.lower())) is None:
+            return "412 Precondition Failed"
+
+        msg = bytearray(body)
+        msg.extend(atc.encode("utf-8"))
+        self.feeder.feed(msg)
+        return "204 No Content"
+
+
+class Clienter:
+    """
+    Clienter pools keep-alive client connections keyed by (host, port) with a
+    cap on concurrent requests per host. It provides raw TCP send and receive
+    for direct mode and HTTP/1.1 requests for indirect mode so many messages
+    to the same witness reuse one connection.
+
+    Attributes:
+        limit (int): max concurrent requests per host
+        timeout (float): seconds to wait for a response
+
+    """
+
+    def __init__(self, limit=4, timeout=10.0):
+        """ Initialize instance
+
+        Parameters:
+            limit (int): max concurrent requests per host
+            timeout (float): seconds to wait for a response
+        """
+        self.limit = limit
+        self.timeout = timeout
+        self._idle = dict()  # (host, port) -> list of (reader, writer)
+        self._sems = dict()  # (host, port) -> Semaphore
+
+    def _sem(self, key):
+        if key not in self._sems:
+            self._sems[key] = asyncio.Semaphore(self.limit)
+        return self._sems[key]
+
+    async def _acquire(self, key):
+        """ Returns pooled (reader, writer) for key else opens new one """
+        idle = self._idle.get(key, [])
+        while idle:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer
+        return await asyncio.open_connection(*key)
+
+    def _release(self, key, conn, reuse=True):
+        reader, writer = conn
+        if reuse and not writer.is_closing():
+            self._idle.setdefault(key, []).append(conn)
+        else:
+            writer.close()
+
+    async def close(self):
+        """ Closes all pooled connections """
+        for conns in self._idle.values():
+            for reader, writer in conns:
+                writer.close()
+        self._idle.clear()
+
+    async def exchange(self, host, port, msg, reply):
+        """ Sends msg over pooled TCP connection and returns reply bytes
+
+        Parameters:
+            host (str): remote host
+            port (int): remote port
+            msg (bytes): message to send
+            reply (Callable): async function of StreamReader that reads and
+                returns one whole reply
+        """
+        key = (host, port)
+        async with self._sem(key):
+            conn = await self._acquire(key)
+            try:
+                conn[1].write(msg)
+                await conn[1].drain()
+                rx = await asyncio.wait_for(reply(conn[0]), timeout=self.timeout)
+            except Exception:
+                self._release(key, conn, reuse=False)
+                raise
+            self._release(key, conn)
+            return rx
+
+    async def request(self, method, url, body=b"", headers=None):
+        """ Sends HTTP/1.1 request with keep-alive and returns response
+
+        Returns:
+            tuple: (status, headers, body) with headers dict of lower case names
+
+        Parameters:
+            method (str): HTTP method
+            url (str): full URL
+            body (bytes): request body
+            headers (dict | None): extra request headers
+        """
+        purl = urlparse.urlsplit(url)
+        port = purl.port if purl.port else (443 if purl.scheme == "https" else 80)
+        key = (purl.hostname, port)
+        path = purl.path or "/"
+        if purl.query:
+            path += "?" + purl.query
+
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {purl.netloc}",
+                 f"Content-Length: {len(body)}", "Connection: keep-alive"]
+        for name, value in (headers or {}).items():
+            if isinstance(value, (bytes, bytearray)):
+                value = bytes(value).decode("utf-8")
+            lines.append(f"{name}: {value}")
+        raw = ("\r\n".join(lines) + "\r\n\r\n").encode("utf-8") + bytes(body)
+
+        async with self._sem(key):
+            conn = await self._acquire(key)
+            try:
+                conn[1].write(raw)
+                await conn[1].drain()
+                status, rheaders, rbody = await asyncio.wait_for(self._response(conn[0]),
+                                                                 timeout=self.timeout)
+            except Exception:
+                self._release(key, conn, reuse=False)
+                raise
+            self._release(key, conn, reuse=rheaders.get("connection", "").lower() != "close")
+            return status, rheaders, rbody
+
+    @staticmethod
+    async def _response(reader):
+        """ Reads one HTTP/1.1 response with Content-Length or chunked body """
+        line = await reader.readline()
+        if not line:
+            raise ConnectionError("Connection closed before response")
+        status = int(line.split()[1])
+        rheaders = await readHeaders(reader)
+
+        if rheaders.get("transfer-encoding", "").lower() == "chunked":
+            body = bytearray()
+            while size := int((await reader.readline()).strip() or b"0", 16):
+                body.extend(await reader.readexactly(size))
+                await reader.readline()
+            await reader.readline()
+            return status, rheaders, bytes(body)
+
+        size = int(rheaders.get("content-length", 0))
+        return status, rheaders, await reader.readexactly(size) if size else b""
+
+    async def postCESR(self, url, msg):
+        """ Posts each KERI message in msg as CESR HTTP request to url as done
+        by httping.streamCESRRequests. Returns list of response statuses.
+
+        Parameters:
+            url (str): endpoint URL
+            msg (bytes): stream of one or more messages with attachments
+        """
+        ims = bytearray(msg)
+        cold = parsing.Parser.sniff(ims)  # check for spurious counters at front of stream
+        if cold in (parsing.Colds.txt, parsing.Colds.bny):  # not message error out
+            raise kering.ColdStartError("Expecting message counter tritet={}"
+                                        "".format(cold))
+
+        statuses = []
+        while ims:  # extract and deserialize message from ims
+            try:
+                serder = coring.Serder(raw=ims)
+            except kering.ShortageError as ex:  # need more bytes
+                raise kering.ExtractionError("unable to extract a valid message to send as HTTP")
+            body = bytes(serder.raw)
+            del ims[:serder.size]  # strip off event from front of ims
+
+            end = 0
+            while end < len(ims) and ims[end] != 0x7b:  # attachments up to next message
+                end += 1
+            atc = bytes(ims[:end])
+            del ims[:end]
+
+            headers = {"Content-Type": httping.CESR_CONTENT_TYPE,
+                       httping.CESR_ATTACHMENT_HEADER: atc}
+            status, _, _ = await self.request("POST", url, body=body, headers=headers)
+            statuses.append(status)
+
+        return statuses
+
+
+async def readHeaders(reader):
+    """ Returns dict of HTTP/1.1 headers with lower case names read from reader
+    up to and including the blank line that ends them """
+    headers = dict()
+    while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+        name, _, value = line.decode("utf-8").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return headers
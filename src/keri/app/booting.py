@@ -376,7 +376,7 @@ class BootEnd(doing.DoDoer):
 
 
 def setup(servery, controller="", configFile=None, configDir=None, insecure=True, path="",
-          headDirPath=None):
+          headDirPath=None, workers=0):
     """ Set up an agent in bootloader mode """
     app = falcon.App(middleware=falcon.CORSMiddleware(
         allow_origins='*', allow_credentials='*', expose_headers=['cesr-attachment', 'cesr-date', 'content-type']))
@@ -389,6 +389,7 @@ def setup(servery, controller="", configFile=None, configDir=None, insecure=True
         controller=controller,
         insecure=insecure,
         staticPath=path,
+        workers=workers,
     )
 
     ends = loadEnds(app=app, configFile=configFile, configDir=configDir, path=path, servery=servery,
@@ -57,6 +57,8 @@ parser.add_argument("-p", "--path",
 parser.add_argument("--keypath", action="store", required=False, default=None)
 parser.add_argument("--certpath", action="store", required=False, default=None)
 parser.add_argument("--cafilepath", action="store", required=False, default=None)
+parser.add_argument("--workers", type=int, default=0,
+                    help="worker processes verifying batches of received credentials, 0 verifies each inline")
 
 
 def launch(args):
@@ -77,5 +79,6 @@ def launch(args):
     servery = booting.Servery(port=int(args.admin_http_port), keypath=args.keypath, certpath=args.certpath,
                               cafilepath=args.cafilepath)  # Manager of HTTP server environments
     booting.setup(servery=servery, controller=args.controller, configFile=args.configFile,
-                  configDir=args.configDir, insecure=args.insecure, path=args.path)
+                  configDir=args.configDir, insecure=args.insecure, path=args.path,
+                  workers=args.workers)
     return [servery]
@@ -5,14 +5,13 @@ keri.kli.commands module
 
 """
 import argparse
-import json
+import sys
 
 from hio import help
 from hio.base import doing
 
-from keri.core import eventing
+from keri.app import inspecting
 from keri.app.cli.common import existing
-from keri.db import dbing
 from keri.kering import ConfigurationError
 from keri.vdr import viring
 
@@ -28,6 +27,11 @@ parser.add_argument('--passcode', '-p', help='22 character encryption passcode f
                     dest="bran", default=None)  # passcode => bran
 
 parser.add_argument("--escrow", "-e", help="show values for one specific escrow", default=None)
+parser.add_argument("--prefix", help="only show escrowed events of this identifier prefix", default=None)
+parser.add_argument("--limit", help="max number of escrowed values to show, prints cursor of next page",
+                    type=int, default=None)
+parser.add_argument("--cursor", help="cursor of next page from previous output", default=None)
+parser.add_argument("--summary", help="only show count of values in each escrow", action="store_true")
 
 
 def handler(args):
@@ -51,117 +55,20 @@ def escrows(tymth, tock=0.0, **opts):
         with existing.existingHby(name=name, base=base, bran=bran) as hby:
             reger = viring.Reger(name=hby.name, db=hby.db, temp=False)
 
-            escrows = dict()
-            if (not escrow) or escrow == "out-of-order-events":
-                oots = list()
-                key = ekey = b''  # both start same. when not same means escrows found
-                while True:
-                    for ekey, edig in hby.db.getOoeItemsNextIter(key=key):
-                        pre, sn = dbing.splitKeySN(ekey)  # get pre and sn from escrow item
-
-                        try:
-                            oots.append(eventing.loadEvent(hby.db, pre, edig))
-                        except ValueError as e:
-                            raise e
-
-                    if ekey == key:  # still same so no escrows found on last while iteration
-                        break
-                    key = ekey  # setup next while iteration, with key after ekey
-
-                escrows["out-of-order-events"] = oots
-
-            if (not escrow) or escrow == "partially-witnessed-events":
-                pwes = list()
-                key = ekey = b''  # both start same. when not same means escrows found
-                while True:  # break when done
-                    for ekey, edig in hby.db.getPweItemsNextIter(key=key):
-                        pre, sn = dbing.splitKeySN(ekey)  # get pre and sn from escrow item
-
-                        try:
-                            pwes.append(eventing.loadEvent(hby.db, pre, edig))
-                        except ValueError as e:
-                            raise e
-
-                    if ekey == key:  # still same so no escrows found on last while iteration
-                        break
-                    key = ekey  # setup next while iteration, with key after ekey
-
-                escrows["partially-witnessed-events"] = pwes
-
-            if (not escrow) or escrow == "partially-signed-events":
-                pses = list()
-                key = ekey = b''  # both start same. when not same means escrows found
-                while True:  # break when done
-                    for ekey, edig in hby.db.getPseItemsNextIter(key=key):
-                        pre, sn = dbing.splitKeySN(ekey)  # get pre and sn from escrow item
-
-                        try:
-                            pses.append(eventing.loadEvent(hby.db, pre, edig))
-                        except ValueError as e:
-                            raise e
-
-                    if ekey == key:  # still same so no escrows found on last while iteration
-                        break
-                    key = ekey  # setup next while iteration, with key after ekey
-
-                escrows["partially-signed-events"] = pses
-
-            if (not escrow) or escrow == "likely-duplicitous-events":
-                ldes = list()
-                key = ekey = b''  # both start same. when not same means escrows found
-                while True:  # break when done
-                    for ekey, edig in hby.db.getLdeItemsNextIter(key=key):
-                        pre, sn = dbing.splitKeySN(ekey)  # get pre and sn from escrow item
-
-                        try:
-                            ldes.append(eventing.loadEvent(hby.db, pre, edig))
-                        except ValueError as e:
-                            raise e
-
-                    if ekey == key:  # still same so no escrows found on last while iteration
-                        break
-                    key = ekey  # setup next while iteration, with key after ekey
-
-                escrows["likely-duplicitous-events"] = ldes
-
-            if (not escrow) or escrow == "missing-registry-escrow":
-                creds = list()
-                for (said,), dater in reger.mre.getItemIter():
-                    creder, sadsigers, sadcigars = reger.cloneCred(said)
-                    creds.append(creder.crd)
-
-                escrows["missing-registry-escrow"] = creds
-
-            if (not escrow) or escrow == "missing-issuer-escrow":
-                creds = list()
-                for (said,), dater in reger.mie.getItemIter():
-                    creder, sadsigers, sadcigars = reger.cloneCred(said)
-                    creds.append(creder.crd)
-
-                escrows["missing-issuer-escrow"] = creds
-
-            if (not escrow) or escrow == "broken-chain-escrow":
-                creds = list()
-                for (said,), dater in reger.mce.getItemIter():
-                    creder, sadsigers, sadcigars = reger.cloneCred(said)
-                    creds.append(creder.crd)
-
-                escrows["broken-chain-escrow"] = creds
-
-            if (not escrow) or escrow == "missing-schema-escrow":
-                creds = list()
-                for (said,), dater in reger.mse.getItemIter():
-                    creder, sadsigers, sadcigars = reger.cloneCred(said)
-                    creds.append(creder.crd)
-
-                escrows["missing-schema-escrow"] = creds
-
-            print(json.dumps(escrows, indent=2))
+            inspector = inspecting.Inspector(db=hby.db, reger=reger)
+            for chunk in inspector.stream(escrow=escrow, pre=args.prefix, cursor=args.cursor,
+                                          limit=args.limit, summary=args.summary, indent=2):
+                sys.stdout.write(chunk.decode("utf-8"))
+            sys.stdout.write("\n")
 
             if not(escrow) or escrow == 'tel-partial-witness-escrow':
                 for (regk, snq), (prefixer, seqner, saider) in reger.tpwe.getItemIter():
                     pass
 
+    except ValueError as e:
+        print(e)
+        return -1
+
     except ConfigurationError as e:
         print(e)
         print(f"identifier prefix for {name} does not exist, incept must be run first", )
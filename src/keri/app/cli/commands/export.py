@@ -10,8 +10,10 @@ import sys
 from hio import help
 from hio.base import doing
 
+from keri.app import exporting
 from keri.app.cli.common import existing
 from keri.core import coring
+from keri.vdr import credentialing
 
 logger = help.ogler.getLogger()
 
@@ -20,7 +22,7 @@ parser.set_defaults(handler=lambda args: export(args),
                     transferable=True)
 parser.add_argument('--name', '-n', help='keystore name and file location of KERI keystore', required=True)
 parser.add_argument('--alias', '-a', help='human readable alias for the identifier to whom the credential was issued',
-                    required=True)
+                    required=False, default=None)
 parser.add_argument('--base', '-b', help='additional optional prefix to file location of KERI keystore',
                     required=False, default="")
 parser.add_argument('--passcode', '-p', help='22 character encryption passcode for keystore (is not saved)',
@@ -28,12 +30,42 @@ parser.add_argument('--passcode', '-p', help='22 character encryption passcode f
 parser.add_argument("--files", help="export artifacts to individual files keyed off of AIDs or SAIDS, default is "
                                     "stdout", action="store_true")
 parser.add_argument("--ends", help="export service end points", action="store_true")
+parser.add_argument("--stream", help="stream all KELs in first seen order to this file as chunked CESR with a "
+                                     "checkpoint index instead of exporting one alias", default=None)
+parser.add_argument("--tels", help="with --stream also stream all TELs after the KELs", action="store_true")
+parser.add_argument("--chunk", help="with --stream number of messages per checkpointed chunk, default 1000",
+                    type=int, default=1000)
+parser.add_argument("--compress", help="with --stream gzip compress each chunk", action="store_true")
+parser.add_argument("--resume", help="with --stream continue an interrupted export from its last checkpoint",
+                    action="store_true")
 
 
 def export(args):
     """ Command line list credential registries handler
 
     """
+    if args.stream is not None:
+        hby = existing.setupHby(name=args.name, base=args.base, bran=args.bran)
+        closers = [hby]
+        try:
+            reger = None
+            if args.tels:
+                rgy = credentialing.Regery(hby=hby, name=args.name, base=args.base)
+                closers.insert(0, rgy)
+                reger = rgy.reger
+
+            exporter = exporting.Exporter(db=hby.db, path=args.stream, reger=reger, chunk=args.chunk,
+                                          compress=args.compress)
+        except Exception:
+            for closer in closers:
+                closer.close()
+            raise
+
+        # closes stores once streamed or interrupted
+        return [exporting.ExportDoer(exporter=exporter, resume=args.resume, closers=closers)]
+
+    if args.alias is None:
+        raise ValueError("--alias is required unless --stream is given")
 
     ed = ExportDoer(name=args.name,
                     alias=args.alias,
@@ -0,0 +1,55 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.kli.commands module
+
+"""
+import argparse
+
+from hio import help
+
+from keri.app import exporting
+from keri.app.cli.common import existing
+from keri.core import eventing
+from keri.vdr import credentialing
+from keri.vdr import eventing as teventing
+
+logger = help.ogler.getLogger()
+
+parser = argparse.ArgumentParser(description='Import KELs and TELs streamed by kli export --stream, resuming after '
+                                             'the last checkpoint processed by an interrupted import')
+parser.set_defaults(handler=lambda args: handler(args),
+                    transferable=True)
+parser.add_argument('--name', '-n', help='keystore name and file location of KERI keystore', required=True)
+parser.add_argument('--base', '-b', help='additional optional prefix to file location of KERI keystore',
+                    required=False, default="")
+parser.add_argument('--passcode', '-p', help='22 character encryption passcode for keystore (is not saved)',
+                    dest="bran", default=None)  # passcode => bran
+parser.add_argument("--file", "-f", help="stream file to import", required=True)
+parser.add_argument("--tels", help="also process TEL messages in the stream", action="store_true")
+parser.add_argument("--restart", help="ignore progress of a previous import and start from the beginning",
+                    action="store_true")
+
+
+def handler(args):
+    """ Command line streaming import handler
+
+    """
+    hby = existing.setupHby(name=args.name, base=args.base, bran=args.bran)
+    closers = [hby]
+    try:
+        kvy = eventing.Kevery(db=hby.db, lax=False, local=False)
+        tvy = None
+        if args.tels:
+            rgy = credentialing.Regery(hby=hby, name=args.name, base=args.base)
+            closers.insert(0, rgy)
+            tvy = teventing.Tevery(reger=rgy.reger, db=hby.db, local=False)
+
+        importer = exporting.Importer(path=args.file, kvy=kvy, tvy=tvy)
+    except Exception:
+        for closer in closers:
+            closer.close()
+        raise
+
+    # closes stores once loaded or interrupted
+    return [exporting.ImportDoer(importer=importer, resume=not args.restart, closers=closers)]
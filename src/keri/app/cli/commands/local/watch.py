@@ -5,15 +5,12 @@ keri.kli.commands module
 """
 import argparse
 import random
-import sys
-import time
-from collections import namedtuple
 
 from hio import help
 from hio.base import doing
-from keri.app import agenting, indirecting, habbing, forwarding
+from keri.app import indirecting, habbing, forwarding, watching
 from keri.app.cli.common import existing, terming
-from keri.core import coring
+from keri.app.watching import States
 
 logger = help.ogler.getLogger()
 
@@ -29,37 +26,32 @@ parser.add_argument('--passcode', '-p', help='22 character encryption passcode f
                     dest="bran", default=None)  # passcode => bran
 parser.add_argument('--aeid', help='qualified base64 of non-transferable identifier prefix for  authentication '
                                    'and encryption of secrets in keystore', default=None)
-
-Stateage = namedtuple("Stateage", 'even ahead behind duplicitous')
-
-States = Stateage(even="even", ahead="ahead", behind="behind", duplicitous="duplicitous")
-
-
-class WitnessState:
-    wit: str
-    state: Stateage
-    sn: int
-    dig: str
+parser.add_argument('--timeout', help='max seconds to wait for all witnesses of all AIDs', type=float,
+                    default=60.0)
+parser.add_argument('--witness-timeout', help='max seconds to wait for each witness to respond', type=float,
+                    default=10.0)
 
 
 def watch(args):
     name = args.name
 
-    qryDoer = WatchDoer(name=name, base=args.base, bran=args.bran)
+    qryDoer = WatchDoer(name=name, base=args.base, bran=args.bran, timeout=args.timeout,
+                        witTimeout=args.witness_timeout)
     return [qryDoer]
 
 
 class WatchDoer(doing.DoDoer):
 
-    def __init__(self, name, base, bran, **kwa):
+    def __init__(self, name, base, bran, timeout=60.0, witTimeout=10.0, **kwa):
         doers = []
         self.hby = existing.setupHby(name=name, base=base, bran=bran)
         self.hbyDoer = habbing.HaberyDoer(habery=self.hby)  # setup doer
-        self.cues = help.decking.Deck()
 
-        self.mbd = indirecting.MailboxDirector(hby=self.hby, topics=["/replay", "/receipt", "reply"])
+        self.mbd = indirecting.MailboxDirector(hby=self.hby, topics=["/replay", "/receipt", "/reply"])
         self.postman = forwarding.Postman(hby=self.hby)
-        doers.extend([self.hbyDoer, self.mbd, self.postman, doing.doify(self.cueDo)])
+        self.watcher = watching.KeyStateWatcher(hby=self.hby, kvy=self.mbd.kvy, timeout=timeout,
+                                                witTimeout=witTimeout)
+        doers.extend([self.hbyDoer, self.mbd, self.postman, self.watcher])
 
         self.toRemove = list(doers)
         doers.extend([doing.doify(self.watchDo)])
@@ -77,166 +69,79 @@ class WatchDoer(doing.DoDoer):
         _ = (yield self.tock)
 
         for hab in self.hby.habs.values():
-            print(f"Processing {hab.name} ({hab.pre})")
             if len(hab.kever.wits) == 0:
-                print("\tNo witnesses, skipping.")
-                continue
-
-            states = []
-            for wit in hab.kever.wits:
-                sys.stdout.write(f"Checking witness {wit}...")
-                sys.stdout.flush()
-                keys = (hab.pre, wit)
-
-                # Check for Key State from this Witness and remove if exists
-                saider = hab.db.knas.get(keys)
-                if saider is not None:
-                    hab.db.knas.rem(keys)
-                    hab.db.ksns.rem((saider.qb64,))
-                    hab.db.ksns.rem((saider.qb64,))
-
-                witer = agenting.witnesser(hab, wit)
-                self.extend([witer])
-
-                msg = hab.query(pre=hab.pre, src=wit, route="ksn")
-                witer.msgs.append(bytearray(msg))
-
-                start = time.perf_counter()
-                while not witer.idle:
-                    end = time.perf_counter()
-                    if end - start > 10:
-                        break
-
-                    yield self.tock
-
-                self.remove([witer])
-
-                start = time.perf_counter()
-                skip = False
-                while True:
-                    if (saider := hab.db.knas.get(keys)) is not None:
-                        break
-
-                    end = time.perf_counter()
-                    if end - start > 10:
-                        sys.stdout.write(f"{terming.Colors.FAIL} no response received{terming.Colors.ENDC}")
-                        sys.stdout.flush()
-                        skip = True
-                        break
-
-                    yield self.tock
-
-                print("")
-
-                if skip:
-                    continue
-
-                mystate = hab.kever.state()
-                witstate = hab.db.ksns.get((saider.qb64,))
-
-                states.append(self.diffState(wit, mystate, witstate))
-
-            # First check for any duplicity, if so get out of here
-            dups = [state for state in states if state.state == States.duplicitous]
-            ahds = [state for state in states if state.state == States.ahead]
-            bhds = [state for state in states if state.state == States.behind]
-            if len(dups) > 0:
-                print("The following witnesses have a duplicitous event:")
-                for state in dups:
-                    print(f"\tWitness {state.wit} at Seq No. {state.sn} with digest: {state.dig}")
-                print("Further action must be taken to recover from the duplicity")
-
-            elif len(ahds) > 0:
-                # Only group habs can be behind their witnesses
-                if not hab.group:
-                    print("ERROR: Single sig AID behind witnesses, aborting for this AID")
-                    continue
-
-                # First check for duplicity among the witnesses that are ahead (possible only if toad is below
-                # super majority)
-                digs = set([state.dig for state in ahds])
-                if len(digs) > 1:  # Duplicity across witness sets
-                    print(f"There are multiple duplicitous events on witnesses for {hab.pre}")
-                    print("We recommend you abandon this AID")
-                else:  # all witnesses that are ahead agree on the event
-                    print("The following witnesses have an event that is ahead of the local KEL:")
-                    for state in ahds:
-                        print(f"\tWitness {state.wit} at Seq No. {state.sn} with digest: {state.dig}")
-
-                state = random.choice(ahds)
-                print("If and only if you were expecting to locally be behind your witnesses (multisig for example)")
-                print("the following command can be used to locally catch up with your witness:")
-                print(f"\n\tkli multisig update --name {self.hby.name} --alias {hab.name} --wit {state.wit} --sn "
-                      f"{state.sn} --said {state.dig}\n")
-
-                if len(bhds) > 0:
-                    print("You have some witnesses that are also behind you, catch them up afterwards with:")
-                    print(f"\n\tkli submit --name {self.hby.name} --alias {hab.name}\n")
-
-            elif len(bhds) > 0:
-                print("The following witnesses are behind the local KEL:")
-                for state in bhds:
-                    print(f"\tWitness {state.wit} at Seq No. {state.sn} with digest: {state.dig}")
-
-                print("Recommend the following command to catch up witnesses:")
-                print(f"\n\tkli submit --name {self.hby.name} --alias {hab.name}\n")
-
+                print(f"Processing {hab.name} ({hab.pre})")
+                print("\tNo witnesses, skipping.\n")
             else:
-                print(f"Local key state is consistent with the {len(states)} (out of "
-                      f"{len(hab.kever.wits)} total) witnesses that responded")
-
-            print()
+                print(f"Checking {hab.name} ({hab.pre}) with {len(hab.kever.wits)} witnesses...")
+
+        remaining = len([hab for hab in self.hby.habs.values() if hab.kever.wits])
+        while remaining:  # print each AID as soon as all its witnesses are done
+            while self.watcher.cues:
+                cue = self.watcher.cues.popleft()
+                hab = self.hby.habs[cue["pre"]]
+                if hab.kever.wits:
+                    remaining -= 1
+                    self.report(hab, cue["states"], cue["missing"])
+            yield self.tock
 
         self.remove(self.toRemove)
 
         return
 
-    def cueDo(self, tymth, tock=0.0, **opts):
-        """
-
-        Handle cues coming out of our external Mailbox listener and forward to controller
-        mailbox if appropriate
-
-        """
-        self.wind(tymth)
-        self.tock = tock
-        yield self.tock
+    def report(self, hab, states, missing):
+        """ Prints comparison of local key state of hab with states of its witnesses """
+        print(f"Processing {hab.name} ({hab.pre})")
+        for wit in missing:
+            print(f"\tWitness {wit}{terming.Colors.FAIL} no response received{terming.Colors.ENDC}")
+
+        # First check for any duplicity, if so get out of here
+        dups = [state for state in states if state.state == States.duplicitous]
+        ahds = [state for state in states if state.state == States.ahead]
+        bhds = [state for state in states if state.state == States.behind]
+        if len(dups) > 0:
+            print("The following witnesses have a duplicitous event:")
+            for state in dups:
+                print(f"\tWitness {state.wit} at Seq No. {state.sn} with digest: {state.dig}")
+            print("Further action must be taken to recover from the duplicity")
+
+        elif len(ahds) > 0:
+            # Only group habs can be behind their witnesses
+            if not hab.group:
+                print("ERROR: Single sig AID behind witnesses, aborting for this AID\n")
+                return
+
+            # First check for duplicity among the witnesses that are ahead (possible only if toad is below
+            # super majority)
+            digs = set([state.dig for state in ahds])
+            if len(digs) > 1:  # Duplicity across witness sets
+                print(f"There are multiple duplicitous events on witnesses for {hab.pre}")
+                print("We recommend you abandon this AID")
+            else:  # all witnesses that are ahead agree on the event
+                print("The following witnesses have an event that is ahead of the local KEL:")
+                for state in ahds:
+                    print(f"\tWitness {state.wit} at Seq No. {state.sn} with digest: {state.dig}")
 
-        while True:
-            while self.mbd.kvy.cues:
-                cue = self.mbd.kvy.cues.popleft()
-                cueKin = cue["kin"]  # type or kind of cue
-                if cueKin == "keyStateSaved":
-                    pass
-                    # print("KSN Saved")
+            state = random.choice(ahds)
+            print("If and only if you were expecting to locally be behind your witnesses (multisig for example)")
+            print("the following command can be used to locally catch up with your witness:")
+            print(f"\n\tkli multisig update --name {self.hby.name} --alias {hab.name} --wit {state.wit} --sn "
+                  f"{state.sn} --said {state.dig}\n")
 
-                yield self.tock
-            yield self.tock
+            if len(bhds) > 0:
+                print("You have some witnesses that are also behind you, catch them up afterwards with:")
+                print(f"\n\tkli submit --name {self.hby.name} --alias {hab.name}\n")
 
-    @staticmethod
-    def diffState(wit, preksn, witksn):
-
-        witstate = WitnessState()
-        witstate.wit = wit
-        mysn = preksn.sner.num
-        mydig = preksn.ked['d']
-        witstate.sn = coring.Number(num=witksn.ked["f"]).num
-        witstate.dig = witksn.ked['d']
-        
-        # At the same sequence number, check the DIGs
-        if mysn == witstate.sn:
-            if mydig == witstate.dig:
-                witstate.state = States.even
-            else:
-                witstate.state = States.duplicitous
+        elif len(bhds) > 0:
+            print("The following witnesses are behind the local KEL:")
+            for state in bhds:
+                print(f"\tWitness {state.wit} at Seq No. {state.sn} with digest: {state.dig}")
 
-        # This witness is behind and will need to be caught up.
-        elif mysn > witstate.sn:
-            witstate.state = States.behind
+            print("Recommend the following command to catch up witnesses:")
+            print(f"\n\tkli submit --name {self.hby.name} --alias {hab.name}\n")
 
-        # mysn < witstate.sn - We are behind this witness (multisig or restore situation).
-        # Must ensure that controller approves this event or a recovery rotation is needed
         else:
-            witstate.state = States.ahead
+            print(f"Local key state is consistent with the {len(states)} (out of "
+                  f"{len(hab.kever.wits)} total) witnesses that responded")
 
-        return witstate
+        print()
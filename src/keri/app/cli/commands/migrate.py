@@ -0,0 +1,73 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.kli.commands module
+
+"""
+import argparse
+
+from hio import help
+from hio.base import doing
+
+from keri.app import storing
+from keri.app.cli.common import existing
+from keri.kering import ConfigurationError
+from keri.vdr import viring
+
+logger = help.ogler.getLogger()
+
+parser = argparse.ArgumentParser(description='Migrate keystore databases to the compact storage format in place')
+parser.set_defaults(handler=lambda args: handler(args),
+                    transferable=True)
+parser.add_argument('--name', '-n', help='keystore name and file location of KERI keystore', required=True)
+parser.add_argument('--base', '-b', help='additional optional prefix to file location of KERI keystore',
+                    required=False, default="")
+parser.add_argument('--passcode', '-p', help='22 character encryption passcode for keystore (is not saved)',
+                    dest="bran", default=None)  # passcode => bran
+parser.add_argument("--mailbox", "-m", help="name of mailbox database to migrate as well", default=None)
+parser.add_argument("--hex", help="migrate back to the original hex storage format", action="store_true")
+
+
+def handler(args):
+    """ Command line migrate handler
+
+    """
+    kwa = dict(args=args)
+    return [doing.doify(migrate, **kwa)]
+
+
+def migrate(tymth, tock=0.0, **opts):
+    """ Migrates event, registry and optional mailbox databases of keystore.
+    Agents, witnesses and watchers using them must be stopped or restarted after.
+
+    """
+    _ = (yield tock)
+
+    args = opts["args"]
+    name = args.name
+    compact = not args.hex
+
+    try:
+        with existing.existingHby(name=name, base=args.base, bran=args.bran) as hby:
+            dbers = [hby.db, viring.Reger(name=hby.name, base=args.base, db=hby.db, temp=False)]
+            if args.mailbox:
+                dbers.append(storing.Mailboxer(name=args.mailbox, base=args.base))
+
+            for dber in dbers:
+                counts = dber.migrate(compact=compact)
+                if not counts:
+                    print(f"{dber.path} already {'compact' if compact else 'hex'}")
+                    continue
+                print(f"{dber.path} migrated {sum(counts.values())} entries to "
+                      f"{'compact' if compact else 'hex'}")
+                for subkey, count in counts.items():
+                    if count:
+                        print(f"  {subkey.decode('utf-8')} {count}")
+
+            for dber in dbers[1:]:
+                dber.close()
+
+    except ConfigurationError as e:
+        print(e)
+        print(f"identifier prefix for {name} does not exist, incept must be run first", )
+        return -1
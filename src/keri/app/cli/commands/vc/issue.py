@@ -27,8 +27,11 @@ parser.add_argument('--rules', help='AC/DC Rules Section',
 parser.add_argument('--recipient', '-R', help='alias or qb64 identifier prefix of the recipient of the credential',
                     default=None)
 parser.add_argument('--data', '-d', help='Credential data, \'@\' allowed', default=None, action="store", required=False)
-parser.add_argument('--credential', help='Full credential, \'@\' allowed', default=None, action="store",
-                    required=False)
+parser.add_argument('--credential', help='Full credential or list of them to join a batch, \'@\' allowed',
+                    default=None, action="store", required=False)
+parser.add_argument('--batch', help='JSON list of credentials to issue together, each with "data" and optional '
+                                    '"recipient", "edges" and "rules" that default to the ones given, \'@\' allowed',
+                    default=None, action="store", required=False)
 parser.add_argument('--out', '-o', help='Name of file for credential output', default="credential.json", action="store",
                     required=False)
 parser.add_argument('--base', '-b', help='additional optional prefix to file location of KERI keystore',
@@ -40,13 +43,33 @@ parser.add_argument('--passcode', '-p', help='22 character encryption passcode f
                     dest="bran", default=None)  # passcode => bran
 
 
+def loadJSON(value, what):
+    """ Returns JSON value or JSON loaded from file when value starts with '@' """
+    try:
+        if value.startswith("@"):
+            with open(value[1:], "r") as f:
+                return json.load(f)
+        return json.loads(value)
+    except json.JSONDecodeError:
+        raise kering.ConfigurationError(f"{what} supplied must be value JSON to issue in a credential")
+
+
 def issueCredential(args):
     name = args.name
     data = None
     rules = None
     edges = None
     credential = None
-    if args.data is not None:
+    batch = None
+    if args.batch is not None:
+        batch = loadJSON(args.batch, "batch")
+        if not isinstance(batch, list) or not all(isinstance(entry, dict) and "data" in entry for entry in batch):
+            raise kering.ConfigurationError("batch supplied must be a JSON list of credentials with data")
+        if args.edges is not None:
+            edges = loadJSON(args.edges, "edges")
+        if args.rules is not None:
+            rules = loadJSON(args.rules, "rules")
+    elif args.data is not None:
         try:
             if args.data.startswith("@"):
                 f = open(args.data[1:], "r")
@@ -97,6 +120,7 @@ def issueCredential(args):
                                  edges=edges,
                                  rules=rules,
                                  credential=credential,
+                                 batch=batch,
                                  out=args.out,
                                  private=args.private)
 
@@ -111,7 +135,7 @@ class CredentialIssuer(doing.DoDoer):
     """
 
     def __init__(self, name, alias, base, bran, registryName=None, schema=None, edges=None, recipient=None, data=None,
-                 rules=None, credential=None, out=None, private=False):
+                 rules=None, credential=None, batch=None, out=None, private=False):
         """ Create DoDoer for issuing a credential and managing the processes needed to complete issuance
 
         Parameters:
@@ -121,7 +145,9 @@ class CredentialIssuer(doing.DoDoer):
              edges:
              recipient:
              data: (dict) credential data dict
-             credential: (dict) full credential to issue when joining a multisig issuance
+             credential: (dict | list) full credential or list of them to issue when joining a multisig issuance
+             batch: (list) of dicts of data and optional recipient, edges and rules of credentials to issue
+                 together anchored by one KEL event
              out (str): Filename for credential output
              private: (bool) privacy preserving
 
@@ -143,34 +169,38 @@ class CredentialIssuer(doing.DoDoer):
 
         try:
             if credential is None:
-                if recipient is None:
-                    recp = None
-                elif recipient in self.hby.kevers:
-                    recp = recipient
-                else:
-                    recp = self.org.find("alias", recipient)
-                    if len(recp) != 1:
-                        raise ValueError(f"invalid recipient {recipient}")
-                    recp = recp[0]['id']
-
-                self.creder = self.credentialer.create(regname=registryName,
-                                                       recp=recp,
-                                                       schema=schema,
-                                                       source=edges,
-                                                       rules=rules,
-                                                       data=data,
-                                                       private=private)
-                print(f"Writing credential {self.creder.said} to {out}")
+                entries = batch if batch is not None else [dict(data=data)]
+                self.creders = []
+                for entry in entries:
+                    recp = self.recipient(entry.get("recipient", recipient))
+                    self.creders.append(self.credentialer.create(regname=registryName,
+                                                                 recp=recp,
+                                                                 schema=schema,
+                                                                 source=entry.get("edges", edges),
+                                                                 rules=entry.get("rules", rules),
+                                                                 data=entry["data"],
+                                                                 private=private))
+
                 f = open(out, mode="w")
-                json.dump(self.creder.crd, f)
+                if batch is None:
+                    print(f"Writing credential {self.creders[0].said} to {out}")
+                    json.dump(self.creders[0].crd, f)
+                else:
+                    print(f"Writing {len(self.creders)} credentials to {out}")
+                    json.dump([creder.crd for creder in self.creders], f)
                 f.close()
             else:
-                self.creder = proving.Creder(ked=credential)
-                self.credentialer.validate(creder=self.creder)
+                credentials = credential if isinstance(credential, list) else [credential]
+                self.creders = [proving.Creder(ked=crd) for crd in credentials]
+                for creder in self.creders:
+                    self.credentialer.validate(creder=creder)
 
-            self.credentialer.issue(creder=self.creder)
+            if len(self.creders) == 1:
+                self.credentialer.issue(creder=self.creders[0])
+            else:
+                self.credentialer.issueMany(creders=self.creders)
 
-        except kering.ConfigurationError as e:
+        except (kering.ConfigurationError, kering.ValidationError) as e:
             print(f"error issuing credential {e}")
             return
 
@@ -193,9 +223,20 @@ class CredentialIssuer(doing.DoDoer):
         self.tock = tock
         _ = (yield self.tock)
 
-        while not self.credentialer.complete(said=self.creder.said):
+        while not all(self.credentialer.complete(said=creder.said) for creder in self.creders):
             self.rgy.processEscrows()
             yield self.tock
 
-        print(f"{self.creder.said} has been issued.")
+        for creder in self.creders:
+            print(f"{creder.said} has been issued.")
         self.remove(self.toRemove)
+
+    def recipient(self, recipient):
+        """ Returns qb64 prefix of recipient given by alias or prefix if any """
+        if recipient is None or recipient in self.hby.kevers:
+            return recipient
+
+        recp = self.org.find("alias", recipient)
+        if len(recp) != 1:
+            raise ValueError(f"invalid recipient {recipient}")
+        return recp[0]['id']
@@ -0,0 +1,79 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.kli.witness module
+
+Witness load generation command line interface
+"""
+import argparse
+import json
+
+from hio.base import doing
+
+from keri.app import loading
+
+d = "Generates load against in process witnesses and mailboxes and reports throughput, latency, CPU " \
+    "and LMDB growth.\n"
+d += "Example:\nkli witness load --witnesses 3 --controllers 8 --events 10 --messages 5 --rate 20\n"
+parser = argparse.ArgumentParser(description=d)
+parser.set_defaults(handler=lambda args: load(args))
+parser.add_argument('--witnesses', '-w', type=int, default=3, help="number of witnesses. Default is 3.")
+parser.add_argument('--controllers', '-c', type=int, default=4,
+                    help="number of witnessed controller identifiers. Default is 4.")
+parser.add_argument('--events', '-e', type=int, default=4,
+                    help="rotations and interactions per controller after inception. Default is 4.")
+parser.add_argument('--messages', '-m', type=int, default=4,
+                    help="mailbox messages sent by each controller to its neighbour. Default is 4.")
+parser.add_argument('--rate', '-r', type=float, default=10.0,
+                    help="max operations started per second over all controllers. Default is 10.")
+parser.add_argument('--toad', type=int, default=None,
+                    help="witness threshold of controllers. Default is all witnesses.")
+parser.add_argument('--port', '-p', type=int, default=5700,
+                    help="HTTP port of first witness, each witness uses the next two ports for HTTP "
+                         "and TCP. Default is 5700.")
+parser.add_argument('--limit', '-l', type=float, default=0.0,
+                    help="max seconds to run before reporting. Default is no limit.")
+parser.add_argument("--json", "-j", action="store_true", help="print report as JSON")
+
+
+def load(args):
+    """ Returns doers that run load and print report
+
+    Parameters:
+        args (Namespace): parsed command line arguments
+    """
+    loader = loading.Loader(witnesses=args.witnesses, controllers=args.controllers, events=args.events,
+                            messages=args.messages, rate=args.rate, toad=args.toad, port=args.port,
+                            limit=args.limit)
+    return [loader, ReportDoer(loader=loader, asJson=args.json)]
+
+
+class ReportDoer(doing.Doer):
+    """ Prints report of Loader once it is done """
+
+    def __init__(self, loader, asJson=False, **kwa):
+        self.loader = loader
+        self.asJson = asJson
+        super(ReportDoer, self).__init__(**kwa)
+
+    def recur(self, tyme):
+        if self.loader.report is None:
+            return False
+
+        report = self.loader.report
+        if self.asJson:
+            print(json.dumps(report, indent=2))
+            return True
+
+        print(f"{report['witnesses']} witnesses, {report['controllers']} controllers, "
+              f"{report['elapsed']:.2f} s, CPU {report['cpu']:.2f} s ({report['cpuPercent']:.0f}%), "
+              f"LMDB growth {report['lmdb']['growth'] / 1024:.0f} KiB")
+        print(f"{'op':>4} {'count':>6} {'per s':>8} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+        for kind, op in report["ops"].items():
+            if not op["count"]:
+                continue
+            print(f"{kind:>4} {op['count']:>6} {op['rate']:8.2f} {op['p50'] * 1e3:8.1f} "
+                  f"{op['p99'] * 1e3:8.1f} {op['max'] * 1e3:8.1f}")
+        if report["incomplete"]:
+            print(f"{report['incomplete']} operations incomplete")
+        return True
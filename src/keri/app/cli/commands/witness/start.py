@@ -12,6 +12,7 @@ from keri import __version__
 from keri import help
 from keri.app import directing, indirecting, habbing, keeping
 from keri.app.cli.common import existing
+from keri.help import metering
 
 d = "Runs KERI witness controller.\n"
 d += "Example:\nwitness -H 5631 -t 5632\n"
@@ -38,6 +39,12 @@ parser.add_argument('--base', '-b', help='additional optional prefix to file loc
 parser.add_argument('--alias', '-a', help='human readable alias for the new identifier prefix', required=True)
 parser.add_argument('--passcode', '-p', help='22 character encryption passcode for keystore (is not saved)',
                     dest="bran", default=None)  # passcode => bran
+parser.add_argument('--metrics-port', action='store', dest="metricsPort", type=int, default=None,
+                    help="Local port number of HTTP server of Prometheus metrics of the HTTP port. "
+                         "Default is no metrics.")
+parser.add_argument('--statsd', action='store', default=None,
+                    help="host:port of StatsD agent to send event processing metrics to instead of the "
+                         "metrics port. Default is none.")
 
 
 def launch(args):
@@ -54,16 +61,28 @@ def launch(args):
                alias=args.alias,
                bran=args.bran,
                tcp=int(args.tcp),
-               http=int(args.http))
+               http=int(args.http),
+               metricsPort=args.metricsPort,
+               statsd=args.statsd)
 
     logger.info("\n******* Ended Witness for %s listening: http/%s, tcp/%s"
                 ".******\n\n", args.name, args.http, args.tcp)
 
 
-def runWitness(name="witness", base="", alias="witness", bran="", tcp=5631, http=5632, expire=0.0):
+def runWitness(name="witness", base="", alias="witness", bran="", tcp=5631, http=5632, expire=0.0,
+               metricsPort=None, statsd=None):
     """
     Setup and run one witness
+
+    Event processing metrics of Kevery, Tevery, Parser and escrows go to the
+    StatsD agent at statsd when given, otherwise to the metrics port when given.
     """
+    metrics = metering.Metrics() if metricsPort is not None else None
+    if statsd:
+        host, _, port = statsd.rpartition(":")
+        metering.install(metering.StatsdMetrics(host=host or "127.0.0.1", port=int(port)))
+    elif metrics is not None:
+        metering.install(metrics)
 
     ks = keeping.Keeper(name=name,
                         base=base,
@@ -83,6 +102,8 @@ def runWitness(name="witness", base="", alias="witness", bran="", tcp=5631, http
     doers.extend(indirecting.setupWitness(alias=alias,
                                           hby=hby,
                                           tcpPort=tcp,
-                                          httpPort=http))
+                                          httpPort=http,
+                                          metrics=metrics,
+                                          metricsPort=metricsPort))
 
     directing.runController(doers=doers, expire=expire)
@@ -95,19 +95,19 @@ def existingHab(name, alias, base="", bran=None):
 
 
 def aliasInput(hby):
-    habs = list(hby.habs.values())
+    habs = list(hby.habs.names.items())  # (pre, name) without loading Habs
     if len(habs) == 1:
-        return habs[0].name
+        return habs[0][1]
 
     while True:
         print("Enter the number of your local AID to use:")
-        for idx, hab in enumerate(habs):
-            print(f"\t{idx+1}: {hab.name} ({hab.pre})")
+        for idx, (pre, name) in enumerate(habs):
+            print(f"\t{idx+1}: {name} ({pre})")
         try:
             idx = input("Number: ")
             idx = int(idx) - 1
             if 0 <= idx < len(habs):
-                return habs[idx].name
+                return habs[idx][1]
             else:
                 print("Invalid number\n")
         except ValueError:
@@ -3,23 +3,72 @@
 keri.kli.commands module
 
 """
-import multicommand
+import argparse
+import importlib
+import pkgutil
+import sys
+
 from keri import help
 
-from keri.app import directing
 from keri.app.cli import commands
 
 logger = help.ogler.getLogger()
 
 
-def main():
-    parser = multicommand.create_parser(commands)
-    args = parser.parse_args()
+def loadParser(argv, pkg=commands, prog="kli"):
+    """ Returns ArgumentParser for argv that only imports the module of the command
+    selected by argv from the command packages in pkg. When argv selects no
+    command, such as for help, returns the parser of all commands from multicommand.
+
+    Parameters:
+        argv (list): of str command line arguments without program name
+        pkg (ModuleType): package of command modules and packages of subcommands
+        prog (str): program name
+    """
+    names = []
+    index = pkg
+    for arg in argv:
+        infos = {info.name.rpartition(".")[2]: info
+                 for info in pkgutil.iter_modules(index.__path__, index.__name__ + ".")}
+        if arg.startswith("_") or (info := infos.get(arg)) is None:
+            break
+
+        names.append(arg)
+        module = importlib.import_module(info.name)
+        if info.ispkg:  # group of subcommands
+            index = module
+            continue
+
+        command = getattr(module, "parser", None)
+        if not isinstance(command, argparse.ArgumentParser):
+            break
+
+        # same parser chain as multicommand builds but only for this command
+        parser = argparse.ArgumentParser(prog=prog)
+        node = parser
+        for i, name in enumerate(names):
+            action = node.add_subparsers(description=" ", metavar="command")
+            if i < len(names) - 1:
+                node = action.add_parser(name, prog=" ".join([prog, *names[:i + 1]]))
+            else:
+                config = {k: v for k, v in vars(command).items() if not k.startswith("_")}
+                config.update(prog=" ".join([prog, *names]), help=command.description, add_help=False)
+                action.add_parser(name, parents=[command], **config)
+        return parser
+
+    import multicommand
+    return multicommand.create_parser(pkg, prog=prog)
+
+
+def main(argv=None):
+    parser = loadParser(sys.argv[1:] if argv is None else argv)
+    args = parser.parse_args(argv)
 
     if not hasattr(args, 'handler'):
         parser.print_help()
         return
 
+    from keri.app import directing
     try:
         doers = args.handler(args)
         directing.runController(doers=doers, expire=0.0)
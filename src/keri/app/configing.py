@@ -6,12 +6,14 @@ keri.app.configing module
 import json
 import os
 
-import cbor2 as cbor
 import hjson
-import msgpack
 from hio.base import filing, doing
 
 from .. import help
+from ..help import helping
+
+cbor = helping.lazyModule("cbor2")  # serializers imported on first use
+msgpack = helping.lazyModule("msgpack")
 
 logger = help.ogler.getLogger()
 
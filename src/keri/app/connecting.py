@@ -3,16 +3,38 @@
 keri.app.connecting module
 
 """
+import itertools
 import re
 import json
+from collections import OrderedDict
 
 from ordered_set import OrderedSet as oset
 
 from keri import kering
 
 
+def normalize(val):
+    """ Returns index form of contact field value val, lower case and truncated
+    to fit in an LMDB key """
+    return val.lower()[:Organizer.MaxIdxLen]
+
+
+def tokenize(val):
+    """ Returns list of unique index words in contact field value val """
+    return list(oset(tok[:Organizer.MaxIdxLen] for tok in re.findall(r"\w+", val.lower())))
+
+
 class Organizer:
-    """ Organizes contacts relating contact information to AIDs """
+    """ Organizes contacts relating contact information to AIDs
+
+    Contact field values are indexed in .hby.db.cidx by normalized value and in
+    .hby.db.ctok by word so that searches only visit matching contacts. Contacts
+    whose signature has been verified are cached until their data or signature
+    changes, up to .CacheSize contacts with the least recently read evicted first.
+
+    """
+    MaxIdxLen = 128  # max chars of a field value or word used in index keys
+    CacheSize = 1024  # max number of verified contacts cached
 
     def __init__(self, hby):
         """ Create contact Organizer
@@ -21,6 +43,11 @@ class Organizer:
             hby (Habery): database environment for contact information
         """
         self.hby = hby
+        self._verified = OrderedDict()  # verified contact data keyed by prefix
+
+        if next(self.hby.db.cidx.getItemIter(), None) is None and \
+                next(self.hby.db.cfld.getItemIter(), None) is not None:
+            self.reindex()  # contacts created before indexing
 
     def update(self, pre, data):
         """ Add or update contact information in data for the identfier prefix
@@ -39,11 +66,16 @@ class Organizer:
         raw = json.dumps(existing).encode("utf-8")
         cigar = self.hby.signator.sign(ser=raw)
 
-        self.hby.db.ccigs.pin(keys=(pre,), val=cigar)
-        self.hby.db.cons.pin(keys=(pre,), val=raw)
+        self._verified.pop(pre, None)
+        with self.hby.db.transact():  # contact, fields and indices commit together
+            self.hby.db.ccigs.pin(keys=(pre,), val=cigar)
+            self.hby.db.cons.pin(keys=(pre,), val=raw)
 
-        for field, val in data.items():
-            self.hby.db.cfld.pin(keys=(pre, field), val=val)
+            olds = self.hby.db.cfld.getMany([(pre, field) for field in data])
+            for (field, val), old in zip(data.items(), olds):
+                self._unindex(pre, field, old)
+                self._index(pre, field, val)
+            self.hby.db.cfld.pinMany([((pre, field), val) for field, val in data.items()])
 
     def replace(self, pre, data):
         """ Replace all contact information for identifier prefix with data
@@ -92,6 +124,10 @@ class Organizer:
         Returns:
 
         """
+        self._verified.pop(pre, None)
+        for keys, val in self.hby.db.cfld.getItemIter(keys=(pre, "")):
+            self._unindex(pre, keys[1], val)
+
         self.hby.db.ccigs.rem(keys=(pre,))
         self.hby.db.cons.rem(keys=(pre,))
         return self.hby.db.cfld.trim(keys=(pre,))
@@ -112,61 +148,142 @@ class Organizer:
             return None
         cigar = self.hby.db.ccigs.get(keys=(pre,))
 
-        if not self.hby.signator.verify(ser=raw.encode("utf-8"), cigar=cigar):
-            raise kering.ValidationError(f"failed signature on {pre} contact data")
-
-        data = json.loads(raw)
-        if data is None:
-            return None
+        cached = self._verified.get(pre)
+        if cached is not None and cigar is not None and cached[:2] == (raw, cigar.qb64):
+            data = cached[2]  # same data and signature as last verified
+            self._verified.move_to_end(pre)
+        else:
+            if not self.hby.signator.verify(ser=raw.encode("utf-8"), cigar=cigar):
+                self._verified.pop(pre, None)
+                raise kering.ValidationError(f"failed signature on {pre} contact data")
+
+            data = json.loads(raw)
+            if data is None:
+                return None
+            self._verified[pre] = (raw, cigar.qb64, data)
+            self._verified.move_to_end(pre)
+            while len(self._verified) > self.CacheSize:
+                self._verified.popitem(last=False)
 
         if field is not None:
             return data[field] if field in data else None
 
+        data = dict(data)  # callers may add to returned contact
         data["id"] = pre
         return data
 
-    def list(self):
+    def list(self, start=0, limit=None, sort=None):
         """ Return list of all contact information for all remote identfiers
 
+        Parameters:
+            start (int): number of contacts to skip
+            limit (int | None): max number of contacts to return, None means all
+            sort (str | None): field to sort contacts by, None means by prefix.
+                Contacts without the field sort last.
+
         Returns:
             list: All contact information
 
         """
-        key = ""
-        data = None
-        contacts = []
-        for (pre, field), val in self.hby.db.cfld.getItemIter():
-            if pre != key:
-                if data is not None:
-                    contacts.append(data)
-                data = dict(id=pre)
-                key = pre
+        stop = start + limit if limit is not None else None
+        return list(itertools.islice(self.contactIter(sort=sort), start, stop))
 
-            data[field] = val
+    def contactIter(self, sort=None):
+        """ Returns generator of contact information for all remote identifiers
 
-        if data is not None:
-            contacts.append(data)
+        Parameters:
+            sort (str | None): field to sort contacts by, None means by prefix.
+                Contacts without the field sort last.
 
-        return contacts
+        """
+        if sort is None:
+            key = ""
+            data = None
+            for (pre, field), val in self.hby.db.cfld.getItemIter():
+                if pre != key:
+                    if data is not None:
+                        yield data
+                    data = dict(id=pre)
+                    key = pre
+
+                data[field] = val
+
+            if data is not None:
+                yield data
+            return
+
+        seen = set()
+        for keys, _ in self.hby.db.cidx.getItemIter(keys=(sort, "")):
+            pre = keys[-1]
+            if pre not in seen:
+                seen.add(pre)
+                yield self._fields(pre)
+
+        for data in self.contactIter():
+            if data["id"] not in seen:
+                yield data
 
     def find(self, field, val):
         """ Find all contact information for all contacts that have the val in field
 
+        Matches val as a case insensitive substring of the field value so scans
+        every indexed value of field. Use .lookup for exact values or .search
+        for words, which only visit matching contacts.
+
         Parameters:
             field (str): field name to search for
-            val (Union[str,bytes,list]): value to search for
+            val (str): value to search for
 
         Returns:
             list: All contacts that match the val in field
 
         """
-        pres = []
-        prog = re.compile(f".*{val}.*", re.I)
-        for (pre, f), v in self.hby.db.cfld.getItemIter():
-            if f == field and prog.match(v):
-                pres.append(pre)
+        prog = re.compile(re.escape(val), re.I)
+        pres = oset()
+        for keys, v in self.hby.db.cidx.getItemIter(keys=(field, "")):
+            if prog.search(v):
+                pres.add(keys[-1])
+
+        return [self.get(pre) for pre in sorted(pres)]
+
+    def lookup(self, field, val):
+        """ Find all contacts whose field equals val ignoring case
+
+        Parameters:
+            field (str): field name to search for
+            val (str): value to match
+
+        Returns:
+            list: All contacts with val in field sorted by prefix
+
+        """
+        norm = normalize(val)
+        pres = oset()
+        for keys, v in self.hby.db.cidx.getItemIter(keys=(field, norm, "")):
+            if normalize(v) == norm:
+                pres.add(keys[-1])
 
-        return [self.get(pre) for pre in pres]
+        return [self.get(pre) for pre in sorted(pres)]
+
+    def search(self, field, text):
+        """ Find all contacts with a word in field starting with each word in text
+
+        Parameters:
+            field (str): field name to search for
+            text (str): words or word prefixes to search for
+
+        Returns:
+            list: All matching contacts sorted by prefix
+
+        """
+        pres = None
+        for tok in tokenize(text):
+            found = set(keys[-1] for keys, _ in self.hby.db.ctok.getItemIter(keys=(field, tok)))
+            pres = found if pres is None else pres & found
+            if not pres:
+                break
+
+        return [self.get(pre) for pre in sorted(pres or [])]
 
     def values(self, field, val=None):
         """ Find unique values for field in all contacts
@@ -179,16 +296,65 @@ class Organizer:
             list: Unique values from all contacts for field
 
         """
-        prog = re.compile(f".*{val}.*", re.I) if val is not None else None
+        prog = re.compile(re.escape(val), re.I) if val is not None else None
 
         vals = oset()
-        for (pre, f), v in self.hby.db.cfld.getItemIter():
-            if f == field:
-                if prog is None or prog.match(v):
-                    vals.add(v)
+        for _, v in self.hby.db.cidx.getItemIter(keys=(field, "")):
+            if prog is None or prog.search(v):
+                vals.add(v)
 
         return list(vals)
 
+    def group(self, field, val=None):
+        """ Group contacts by their value of field in one pass over the index
+
+        Parameters:
+            field (str): field to group contacts by
+            val (Optional(str|None): optional filter for the value of the grouped field
+
+        Returns:
+            dict: of lists of contacts keyed by unique field values
+
+        """
+        prog = re.compile(re.escape(val), re.I) if val is not None else None
+
+        groups = dict()
+        for keys, v in self.hby.db.cidx.getItemIter(keys=(field, "")):
+            if prog is None or prog.search(v):
+                groups.setdefault(v, oset()).add(keys[-1])
+
+        return {v: [self.get(pre) for pre in sorted(pres)] for v, pres in groups.items()}
+
+    def reindex(self):
+        """ Rebuilds contact field indexes from contact field values """
+        self.hby.db.cidx.trim()
+        self.hby.db.ctok.trim()
+        for (pre, field), val in self.hby.db.cfld.getItemIter():
+            self._index(pre, field, val)
+
+    def _fields(self, pre):
+        """ Returns dict of contact field values for pre """
+        data = dict(id=pre)
+        for keys, val in self.hby.db.cfld.getItemIter(keys=(pre, "")):
+            data[keys[1]] = val
+        return data
+
+    def _index(self, pre, field, val):
+        """ Adds val of field of contact pre to indexes """
+        if not isinstance(val, str):
+            return
+        self.hby.db.cidx.pin(keys=(field, normalize(val), pre), val=val)
+        for tok in tokenize(val):
+            self.hby.db.ctok.pin(keys=(field, tok, pre), val=val)
+
+    def _unindex(self, pre, field, val):
+        """ Removes val of field of contact pre from indexes """
+        if not isinstance(val, str):
+            return
+        self.hby.db.cidx.rem(keys=(field, normalize(val), pre))
+        for tok in tokenize(val):
+            self.hby.db.ctok.rem(keys=(field, tok, pre))
+
     def setImg(self, pre, typ, stream):
         """ Upload image for identifier prefix
 
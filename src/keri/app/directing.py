@@ -8,6 +8,7 @@ simple direct mode demo support classes
 import itertools
 from hio.base import doing
 
+from . import scheduling
 from .. import help
 from ..core import eventing, routing
 from ..core import parsing
@@ -285,10 +286,14 @@ class Reactor(doing.DoDoer):
             add result of doify on this method to doers list
         """
         yield  # enter context
+        reger = self.tvy.reger if self.tvy is not None else None
+        backoff = scheduling.Backoff(dbs=[self.hab.db, reger])
         while True:
-            self.kevery.processEscrows()
-            if self.tvy is not None:
-                self.tvy.processEscrows()
+            if backoff.due(self.tyme):  # skip scan while nothing changed
+                self.kevery.processEscrows()
+                if self.tvy is not None:
+                    self.tvy.processEscrows()
+                backoff.done(self.tyme)
             yield
         return False  # should never get here except forced close
 
@@ -675,10 +680,14 @@ class Reactant(doing.DoDoer):
             add result of doify on this method to doers list
         """
         yield  # enter context
+        reger = self.tevery.reger if self.tevery is not None else None
+        backoff = scheduling.Backoff(dbs=[self.hab.db, reger])
         while True:
-            self.kevery.processEscrows()
-            if self.tevery is not None:
-                self.tevery.processEscrows()
+            if backoff.due(self.tyme):  # skip scan while nothing changed
+                self.kevery.processEscrows()
+                if self.tevery is not None:
+                    self.tevery.processEscrows()
+                backoff.done(self.tyme)
             yield
         return False  # should never get here except forced close
 
@@ -721,8 +730,9 @@ class Reactant(doing.DoDoer):
 
 def runController(doers, expire=0.0):
     """
-    Utiitity Function to create doist to run doers
+    Utiitity Function to create doist to run doers. Uses an idle aware
+    Scheduler so an idle controller uses next to no CPU.
     """
     tock = 0.03125
-    doist = doing.Doist(limit=expire, tock=tock, real=True)
+    doist = scheduling.Scheduler(limit=expire, tock=tock, real=True)
     doist.do(doers=doers)
@@ -0,0 +1,400 @@
+# -*- encoding: utf-8 -*-
+"""
+keri.app.exporting module
+
+Streaming export and import of KELs and TELs as chunked CESR with a
+checkpoint index so that neither side has to hold a whole replay in memory
+and an interrupted export or import can resume where it left off.
+
+Stream layout:
+    The stream file is the concatenation of first seen replay messages, all
+    KEL messages from .fels in fnKey order followed by all TEL messages from
+    .tels in fnKey order. Messages are written in chunks of at most .chunk
+    messages. When compressed each chunk is its own gzip member so the file
+    is still a valid (multi-member) gzip file.
+
+    The index file at path + IdxExt is JSON lines with one Checkpoint per
+    chunk recording the last (kind, pre, fn) written and where the chunk ends.
+    Chunks always end on message boundaries so each one parses on its own.
+
+    The import state file at path + CkpExt holds the JSON of the last
+    Checkpoint fully parsed and processed by the importer.
+"""
+import gzip
+import json
+import os
+from dataclasses import dataclass, asdict
+
+from hio.base import doing
+
+from .. import help
+from ..core import parsing
+from ..db import dbing
+
+logger = help.ogler.getLogger()
+
+IdxExt = ".idx"  # extension of export checkpoint index file
+CkpExt = ".ckp"  # extension of import resume state file
+
+
+@dataclass
+class Checkpoint:
+    """
+    Checkpoint at a chunk boundary of a streaming export
+
+    Attributes:
+        kind (str): "kel" or "tel", the log the last message of chunk came from
+        pre (str): qb64 prefix of last message in chunk
+        fn (int): first seen ordinal of last message in chunk
+        count (int): total number of messages in stream up to end of chunk
+        offset (int): uncompressed byte offset in stream at end of chunk
+        pos (int): byte position in stream file at end of chunk. Equals
+            offset when uncompressed.
+    """
+    kind: str
+    pre: str
+    fn: int
+    count: int
+    offset: int
+    pos: int
+
+
+def readCheckpoints(path):
+    """ Returns list of Checkpoints from the index file of stream at path
+
+    Returns empty list when there is no index. A trailing partial line left by
+    a crash while writing the index is ignored.
+
+    Parameters:
+        path (str): file path of stream, index is at path + IdxExt
+    """
+    ckps = []
+    if not os.path.exists(path + IdxExt):
+        return ckps
+
+    with open(path + IdxExt, "r") as f:
+        for line in f:
+            try:
+                ckps.append(Checkpoint(**json.loads(line)))
+            except (ValueError, TypeError):
+                break  # partial last line from interrupted export
+
+    return ckps
+
+
+class Exporter:
+    """
+    Exporter streams first seen replays of all KELs and optionally all TELs
+    to a file as chunked CESR with a checkpoint index.
+
+    Only one chunk of messages is held in memory at a time. Export resumes
+    from the last checkpoint in the index when resume is True.
+
+    Attributes:
+        db (Baser): source of KELs
+        reger (Reger): source of TELs when not None
+        path (str): file path of stream
+        chunk (int): max number of messages per chunk
+        compress (bool): True means gzip each chunk
+
+    """
+
+    def __init__(self, db, path, reger=None, chunk=1000, compress=False):
+        """ Initialize instance
+
+        Parameters:
+            db (Baser): source of KELs
+            path (str): file path of stream
+            reger (Reger): source of TELs, None means KELs only
+            chunk (int): max number of messages per chunk
+            compress (bool): True means gzip each chunk
+
+        """
+        self.db = db
+        self.reger = reger
+        self.path = path
+        self.chunk = max(1, chunk)
+        self.compress = True if compress else False
+
+    def export(self, resume=False):
+        """ Exports whole stream, returns last Checkpoint or None when empty
+
+        Parameters:
+            resume (bool): True means continue from last checkpoint in index
+        """
+        ckp = None
+        for ckp in self.exportIter(resume=resume):
+            pass
+        return ckp
+
+    def exportIter(self, resume=False):
+        """ Returns generator that yields Checkpoint after each chunk is written
+
+        Parameters:
+            resume (bool): True means continue from last checkpoint in index
+                else start new stream overwriting any existing one
+        """
+        ckps = readCheckpoints(self.path) if resume else []
+        last = ckps[-1] if ckps else None
+
+        if last is not None and os.path.exists(self.path):
+            # drop anything written after last complete chunk
+            with open(self.path, "r+b") as f:
+                f.truncate(last.pos)
+            mode = "ab"
+            with open(self.path + IdxExt, "w") as f:  # drop partial index line
+                for ckp in ckps:
+                    f.write(json.dumps(asdict(ckp)) + "\n")
+        else:
+            last = None
+            mode = "wb"
+            if os.path.exists(self.path + IdxExt):
+                os.remove(self.path + IdxExt)
+
+        count = last.count if last is not None else 0
+        offset = last.offset if last is not None else 0
+
+        with open(self.path, mode) as f, open(self.path + IdxExt, "a") as idx:
+            buf = bytearray()
+            n = 0
+            cur = None
+            for kind, pre, fn, msg in self._msgIter(last=last):
+                buf.extend(msg)
+                n += 1
+                cur = (kind, pre, fn)
+                if n >= self.chunk:
+                    count, offset = count + n, offset + len(buf)
+                    yield self._flush(f, idx, buf, cur, count, offset)
+                    buf = bytearray()
+                    n = 0
+
+            if n:
+                count, offset = count + n, offset + len(buf)
+                yield self._flush(f, idx, buf, cur, count, offset)
+
+    def _flush(self, f, idx, buf, cur, count, offset):
+        """ Writes chunk buf to stream file f, appends its checkpoint to index
+        idx and returns the checkpoint
+        """
+        f.write(gzip.compress(buf) if self.compress else buf)
+        f.flush()
+        os.fsync(f.fileno())  # chunk durable before it is indexed
+        kind, pre, fn = cur
+        ckp = Checkpoint(kind=kind, pre=pre, fn=fn, count=count, offset=offset,
+                         pos=f.tell())
+        idx.write(json.dumps(asdict(ckp)) + "\n")
+        idx.flush()
+        return ckp
+
+    def _msgIter(self, last=None):
+        """ Returns generator of (kind, pre, fn, msg) for each message after
+        checkpoint last or from start when last is None
+
+        Iterates .fels with Baser.getFelItemAllPreIter then .tels with
+        Reger.getTelItemAllPreIter so each only holds one cursor.
+        """
+        kelKey = b''
+        telKey = b''
+        if last is not None:
+            if last.kind == "kel":
+                kelKey = dbing.fnKey(last.pre, last.fn + 1)
+            else:
+                kelKey = None  # kels already done
+                telKey = dbing.fnKey(last.pre, last.fn + 1)
+
+        if kelKey is not None:
+            for pre, fn, dig in self.db.getFelItemAllPreIter(key=kelKey):
+                try:
+                    msg = self.db.cloneEvtMsg(pre=pre, fn=fn, dig=dig)
+                except Exception:
+                    continue  # skip this event same as cloneAllPreIter
+                yield "kel", pre.decode("utf-8"), fn, msg
+
+        if self.reger is not None:
+            for pre, fn, dig in self.reger.getTelItemAllPreIter(key=telKey):
+                msg = self.reger.cloneTvt(pre=pre, dig=dig)
+                yield "tel", pre.decode("utf-8"), fn, msg
+
+
+class Importer:
+    """
+    Importer feeds a stream written by Exporter into a Parser one chunk at a
+    time, processes escrows after each chunk and records the last processed
+    checkpoint so that an interrupted import resumes after it.
+
+    A stream without index, such as the output of kli export, is parsed as
+    a single chunk.
+
+    Attributes:
+        path (str): file path of stream
+        parser (Parser): parser fed with each chunk
+        kvy (Kevery): KEL message processor
+        tvy (Tevery): TEL message processor or None
+
+    """
+
+    def __init__(self, path, kvy, tvy=None, parser=None):
+        """ Initialize instance
+
+        Parameters:
+            path (str): file path of stream
+            kvy (Kevery): KEL message processor
+            tvy (Tevery): TEL message processor, None means KELs only
+            parser (Parser): optional parser else makes one for kvy and tvy
+
+        """
+        self.path = path
+        self.kvy = kvy
+        self.tvy = tvy
+        self.parser = parser if parser is not None else parsing.Parser(framed=True,
+                                                                      kvy=kvy,
+                                                                      tvy=tvy)
+
+    @property
+    def checkpoint(self):
+        """ Returns last Checkpoint processed by a previous import or None """
+        try:
+            with open(self.path + CkpExt, "r") as f:
+                return Checkpoint(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def load(self, resume=True):
+        """ Imports whole stream, returns last Checkpoint processed or None
+
+        Parameters:
+            resume (bool): True means skip chunks processed by previous import
+        """
+        ckp = None
+        for ckp in self.loadIter(resume=resume):
+            pass
+        return ckp
+
+    def loadIter(self, resume=True):
+        """ Returns generator that yields Checkpoint after each chunk is parsed
+        and escrows processed
+
+        Parameters:
+            resume (bool): True means skip chunks processed by previous import
+        """
+        ckps = readCheckpoints(self.path)
+        if not ckps:  # no index so parse whole stream as one chunk
+            with open(self.path, "rb") as f:
+                raw = f.read()
+            if raw[:2] == b"\x1f\x8b":  # gzip magic
+                raw = gzip.decompress(raw)
+            self._process(raw)
+            yield None
+            return
+
+        done = self.checkpoint if resume else None
+        start = 0
+        with open(self.path, "rb") as f:
+            for ckp in ckps:
+                if done is not None and ckp.pos <= done.pos:
+                    start = ckp.pos
+                    continue  # already processed
+
+                f.seek(start)
+                raw = f.read(ckp.pos - start)
+                if raw[:2] == b"\x1f\x8b":  # gzip member
+                    raw = gzip.decompress(raw)
+                self._process(raw)
+                self._commit(ckp)
+                start = ckp.pos
+                yield ckp
+
+    def _process(self, raw):
+        """ Parses chunk raw and processes any escrows it filled """
+        self.parser.parse(ims=bytearray(raw))
+        self.kvy.processEscrows()
+        if self.tvy is not None:
+            self.tvy.processEscrows()
+
+    def _commit(self, ckp):
+        """ Atomically records ckp as last processed checkpoint """
+        tmp = self.path + CkpExt + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(asdict(ckp), f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path + CkpExt)
+
+
+class ExportDoer(doing.Doer):
+    """ Doer that runs an Exporter one chunk per recur """
+
+    def __init__(self, exporter, resume=False, closers=None, **kwa):
+        """
+        Parameters:
+            exporter (Exporter): configured exporter
+            resume (bool): True means continue from last checkpoint in index
+            closers (list | None): of resources such as Habery or Regery to
+                close on exit
+        """
+        self.exporter = exporter
+        self.resume = resume
+        self.closers = closers if closers is not None else []
+        self.chunks = None
+        super(ExportDoer, self).__init__(**kwa)
+
+    def enter(self):
+        self.chunks = self.exporter.exportIter(resume=self.resume)
+
+    def exit(self):
+        try:
+            if self.chunks is not None:
+                self.chunks.close()
+        finally:
+            for closer in self.closers:
+                closer.close()
+
+    def recur(self, tyme):
+        try:
+            ckp = next(self.chunks)
+        except StopIteration:
+            return True  # done
+
+        logger.info("Exported %s messages through %s %s:%s", ckp.count,
+                    ckp.kind, ckp.pre, ckp.fn)
+        return False
+
+
+class ImportDoer(doing.Doer):
+    """ Doer that runs an Importer one chunk per recur """
+
+    def __init__(self, importer, resume=True, closers=None, **kwa):
+        """
+        Parameters:
+            importer (Importer): configured importer
+            resume (bool): True means skip chunks processed by previous import
+            closers (list | None): of resources such as Habery or Regery to
+                close on exit
+        """
+        self.importer = importer
+        self.resume = resume
+        self.closers = closers if closers is not None else []
+        self.chunks = None
+        super(ImportDoer, self).__init__(**kwa)
+
+    def enter(self):
+        self.chunks = self.importer.loadIter(resume=self.resume)
+
+    def exit(self):
+        try:
+            if self.chunks is not None:
+                self.chunks.close()
+        finally:
+            for closer in self.closers:
+                closer.close()
+
+    def recur(self, tyme):
+        try:
+            ckp = next(self.chunks)
+        except StopIteration:
+            return True  # done
+
+        if ckp is not None:
+            logger.info("Imported %s messages through %s %s:%s", ckp.count,
+                        ckp.kind, ckp.pre, ckp.fn)
+        return False
@@ -12,7 +12,7 @@ from hio.base import doing
 from hio.help import decking
 
 from keri import kering
-from keri.app import forwarding, delegating, agenting
+from keri.app import forwarding, delegating, agenting, scheduling
 from keri.core import coring
 from keri.core.coring import Number
 from keri.db import dbing, basing
@@ -222,9 +222,12 @@ class Counselor(doing.DoDoer):
         self.tock = tock
         _ = (yield self.tock)
 
+        backoff = scheduling.Backoff(dbs=[self.hby.db], high=0.5)
         while True:
-            self.processEscrows()
-            yield 0.5
+            if backoff.due(self.tyme):  # skip scan while nothing changed
+                self.processEscrows()
+                backoff.done(self.tyme)
+            yield self.tock
 
     def processEscrows(self):
         self.processLocalWitnessEscrow()
@@ -702,6 +705,7 @@ class Counselor(doing.DoDoer):
                 print(f"Witness receipts complete, {pre} confirmed.")
                 self.hby.db.gpwe.rem(keys=(pre,))
                 self.hby.db.cgms.put(keys=(pre, seqner.qb64), val=saider)
+                self.hby.db.kews.wake(pre, seqner.sn)  # escrows waiting on completion
 
     def pendingEvents(self, pre):
         """ Return information about any pending events for a given AID
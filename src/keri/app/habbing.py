@@ -22,7 +22,8 @@ from .. import help
 from .. import kering
 from ..core import coring, eventing, parsing, routing
 from ..core.coring import Serder
-from ..db import dbing, basing
+from ..db import dbing, basing, koming
+from ..help import metering
 from ..kering import MissingSignatureError
 
 logger = help.ogler.getLogger()
@@ -185,6 +186,71 @@ def setupHabery(name="who", base="main", temp=False, curls=None, remote="eve", i
             serverDoer, directant]
 
 
+class Habs(koming.LazyMapping):
+    """
+    Habs is a mapping of Hab instances keyed by identifier prefix qb64 that
+    builds each Hab from its .db.habs record on first access instead of all
+    of them at startup.
+
+    Attributes:
+        hby (Habery): environment that builds the Hab instances
+        loaded (dict): Hab instances built so far keyed by prefix
+
+    Properties:
+        names (dict): name of each .db.habs record keyed by prefix
+
+    """
+
+    def __init__(self, hby):
+        """
+        Parameters:
+            hby (Habery): environment that builds the Hab instances
+        """
+        super(Habs, self).__init__()
+        self.hby = hby
+
+    @property
+    def komer(self):
+        return self.hby.db.habs
+
+    @staticmethod
+    def ident(record):
+        return record.hid
+
+    def load(self, name, habord):
+        """ Returns Hab built from habord record of .db.habs at name
+
+        Parameters:
+            name (str): alias of Hab
+            habord (HabitatRecord): record of Hab
+        """
+        hby = self.hby
+        pre = habord.hid
+        if habord.mid:
+            hab = GroupHab(ks=hby.ks, db=hby.db, cf=hby.cf, mgr=hby.mgr,
+                           rtr=hby.rtr, rvy=hby.rvy, kvy=hby.kvy, psr=hby.psr,
+                           name=name, pre=pre, temp=hby.temp, smids=habord.smids)
+        else:
+            hab = Hab(ks=hby.ks, db=hby.db, cf=hby.cf, mgr=hby.mgr,
+                      rtr=hby.rtr, rvy=hby.rvy, kvy=hby.kvy, psr=hby.psr,
+                      name=name, pre=pre, temp=hby.temp)
+
+        # Rules for acceptance
+        #  if its delegated its accepted into its own local KEL even if the
+        #    delegator has not sealed it
+        if not hab.accepted and not habord.mid:
+            raise kering.ConfigurationError(f"Problem loading Hab pre="
+                                            f"{pre} name={name} from db.")
+
+        hab.inited = True
+        self.loaded[pre] = hab
+        if habord.mid:  # participant hab of group
+            hab.mhab = self[habord.mid]
+
+        metering.meter.inc("habery_hab_load_total", kind="group" if habord.mid else "single")
+        return hab
+
+
 class Habery:
     """Habery class provides shared database environments for all its Habitats
     Key controller and identifier controller shared configuration file, keystore
@@ -209,7 +275,7 @@ class Habery:
         kvy (eventing.Kevery): factory for local processing of local event msgs
         psr (parsing.Parser):  parses local messages for .kvy .rvy
 
-        habs (dict): Hab instances keyed by prefix.
+        habs (Habs): Hab instances keyed by prefix, each built on first access.
             To look up Hab by name get prefix from db.habs .prefix field using
             .habByName
 
@@ -303,7 +369,7 @@ class Habery:
         self.kvy = eventing.Kevery(db=self.db, lax=False, local=True, rvy=self.rvy)
         self.kvy.registerReplyRoutes(router=self.rtr)
         self.psr = parsing.Parser(framed=True, kvy=self.kvy, rvy=self.rvy, exc=self.exc)
-        self.habs = {}  # empty .habs
+        self.habs = Habs(hby=self)  # empty .habs
         self._signator = None
         self.inited = False
 
@@ -315,6 +381,7 @@ class Habery:
         if self.db.opened and self.ks.opened:
             self.setup(**self._inits)  # finish setup later
 
+    @metering.measure("habery_setup")
     def setup(self, *, seed=None, aeid=None, bran=None, pidx=None, algo=None,
               salt=None, tier=None, free=False, temp=None, ):
         """
@@ -393,45 +460,15 @@ class Habery:
     def loadHabs(self):
         """Load Habs instance from db
 
-        .db.reopen calls .db.reload which loads .db.kevers from key state in
-        .db.states and loads  associated .db.prefixes.
-        It also removes any bare .habs without key state
-        Thus by now know that .habs are valid so can create Hab instances
+        .db.reopen calls .db.reload which loads .db.prefixes and removes any
+        bare .habs without key state. Hab instances are not built here but by
+        .habs on first access so startup does not grow with the number of
+        Habs. Calling again, such as after a rename, drops the Habs built so
+        far so they are built again from .db.habs.
 
         """
         self.reconfigure()  # pre hab load reconfiguration
-
-        groups = []
-        for name, habord in self.db.habs.getItemIter():
-            name = ".".join(name)  # detupleize the database key name
-            pre = habord.hid
-
-            # create Hab instance and inject dependencies
-            if habord.mid:
-                hab = GroupHab(ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
-                               rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
-                               name=name, pre=pre, temp=self.temp, smids=habord.smids)
-                groups.append(habord)
-            else:
-                hab = Hab(ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
-                          rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
-                          name=name, pre=pre, temp=self.temp)
-
-            # Rules for acceptance
-            #  if its delegated its accepted into its own local KEL even if the
-            #    delegator has not sealed it
-            if not hab.accepted and not habord.mid:
-                raise kering.ConfigurationError(f"Problem loading Hab pre="
-                                                f"{pre} name={name} from db.")
-
-            # read in config file and process any oobis or endpoints for hab
-            hab.inited = True
-            self.habs[hab.pre] = hab
-
-        # Populate the participant hab after loading all habs
-        for habord in groups:
-            self.habs[habord.hid].mhab = self.habs[habord.mid]
-
+        self.habs.reset()
         self.reconfigure()  # post hab load reconfiguration
 
     def makeHab(self, name, **kwa):
@@ -609,7 +646,9 @@ class Habery:
 
         """
         if (habord := self.db.habs.get(name)) is not None:
-            return self.habs[habord.hid] if habord.hid in self.habs else None
+            if habord.hid in self.habs.loaded:
+                return self.habs.loaded[habord.hid]
+            return self.habs.load(name, habord)
         return None
 
     def reconfigure(self):
@@ -3,27 +3,34 @@
 keri.peer.httping module
 
 """
+import cProfile
 import datetime
+import io
 import json
+import pstats
+import random
+import time
 from dataclasses import dataclass
 from urllib import parse
 from urllib.parse import urlparse
 
-import falcon
 from hio.base import doing
-from hio.core import http
 from hio.help import Hict
 
 from keri import help
 from keri import kering
 from keri.core import coring, parsing
 from keri.end import ending
-from keri.help import helping
+from keri.help import helping, metering
+
+falcon = helping.lazyModule("falcon")  # web stack imported on first use
+http = helping.lazyModule("hio.core.http")
 
 logger = help.ogler.getLogger()
 
 CESR_CONTENT_TYPE = "application/cesr+json"
 CESR_ATTACHMENT_HEADER = "CESR-ATTACHMENT"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4"
 
 
 class SignatureValidationComponent(object):
@@ -71,6 +78,201 @@ class SignatureValidationComponent(object):
         return True
 
 
+class MeteringComponent:
+    """
+    Falcon middleware that records per route request metrics in a Metrics
+    registry: latency histograms, request and response sizes, in flight
+    requests and counts by status. Latency of streamed responses covers the
+    handler only and not the streaming.
+
+    With profiling enabled a routed request is profiled when it has the profile
+    header or is sampled at random at rate sample. The profile text of each
+    profiled request is kept in .metrics.profiles. Profiles with pyinstrument
+    when it is installed and profiler is "pyinstrument" else with cProfile.
+
+    """
+
+    ProfileHeader = "KERI-PROFILE"
+
+    def __init__(self, metrics, profiling=False, sample=0.0, profiler="cprofile"):
+        """ Initialize instance
+
+        Parameters:
+            metrics (Metrics): registry to record into
+            profiling (bool): True means allow profiling of requests
+            sample (float): fraction of requests in [0, 1] profiled at random
+                when profiling
+            profiler (str): "cprofile" or "pyinstrument"
+        """
+        self.metrics = metrics
+        self.profiling = profiling
+        self.sample = sample
+        self.profiler = profiler
+
+        metrics.describe("http_request_duration_seconds", "HTTP request handling latency by route",
+                         buckets=metering.LatencyBuckets)
+        metrics.describe("http_request_size_bytes", "HTTP request body size by route",
+                         buckets=metering.SizeBuckets)
+        metrics.describe("http_response_size_bytes", "HTTP response body size by route, not streams",
+                         buckets=metering.SizeBuckets)
+        metrics.describe("http_requests_total", "HTTP requests by route, method and status")
+        metrics.describe("http_requests_in_flight", "HTTP requests being handled")
+
+    def process_request(self, req, resp):
+        """ Starts timing of request
+
+        Parameters:
+            req: Http request object
+            resp: Http response object
+        """
+        self.metrics.add("http_requests_in_flight", 1)
+        req.context.metering = (time.perf_counter(), None)
+
+    def process_resource(self, req, resp, resource, params):
+        """ Starts profiling of request once routed. Falcon only routes requests
+        that all middleware accepted, such as SignatureValidationComponent after
+        this one, so unauthenticated requests are never profiled.
+
+        Parameters:
+            req: Http request object
+            resp: Http response object
+            resource: resource object request was routed to
+            params (dict): parameters of route
+        """
+        started = getattr(req.context, "metering", None)
+        if started is None or resource is None or not self.profiling:
+            return
+        if req.get_header(self.ProfileHeader) is not None or (self.sample and random.random() < self.sample):
+            req.context.metering = (started[0], self.startProfile())
+
+    def process_response(self, req, resp, resource, req_succeeded):
+        """ Records metrics of request and ends its profile
+
+        Parameters:
+            req: Http request object
+            resp: Http response object
+            resource: resource object request was routed to or None
+            req_succeeded (bool): True if no unhandled exception
+        """
+        started = getattr(req.context, "metering", None)
+        if started is None:  # request began before this middleware was added
+            return
+        start, prof = started
+        duration = time.perf_counter() - start
+
+        route = req.uri_template if req.uri_template else "unmatched"
+        status = str(resp.status).split(" ")[0]
+        self.metrics.add("http_requests_in_flight", -1)
+        self.metrics.inc("http_requests_total", method=req.method, route=route, status=status)
+        self.metrics.observe("http_request_duration_seconds", duration, method=req.method, route=route)
+        self.metrics.observe("http_request_size_bytes", req.content_length or 0,
+                             method=req.method, route=route)
+        if resp.stream is None:
+            body = resp.data if resp.data is not None else (resp.text or "")
+            self.metrics.observe("http_response_size_bytes", len(body), method=req.method, route=route)
+
+        if prof is not None:
+            self.metrics.profiles.append(dict(dt=helping.nowIso8601(), method=req.method, route=route,
+                                              path=req.path, duration=duration,
+                                              profile=self.stopProfile(prof)))
+
+    def startProfile(self):
+        """ Returns started profiler """
+        if self.profiler == "pyinstrument":
+            try:
+                import pyinstrument
+            except ImportError:
+                logger.info("pyinstrument not installed, profiling with cProfile")
+            else:
+                prof = pyinstrument.Profiler()
+                prof.start()
+                return prof
+
+        prof = cProfile.Profile()
+        prof.enable()
+        return prof
+
+    @staticmethod
+    def stopProfile(prof):
+        """ Returns str of report of stopped profiler prof """
+        if not isinstance(prof, cProfile.Profile):  # pyinstrument
+            prof.stop()
+            return prof.output_text()
+
+        prof.disable()
+        out = io.StringIO()
+        pstats.Stats(prof, stream=out).sort_stats("cumulative").print_stats(40)
+        return out.getvalue()
+
+
+class MetricsEnd:
+    """ Admin endpoints exposing Metrics in Prometheus text format and recent profiles """
+
+    def __init__(self, metrics):
+        """
+        Parameters:
+            metrics (Metrics): registry to expose
+        """
+        self.metrics = metrics
+
+    def on_get(self, _, rep):
+        """ Metrics GET endpoint
+
+        Parameters:
+            _: falcon.Request HTTP request
+            rep: falcon.Response HTTP response
+
+        ---
+        summary:  Get metrics in Prometheus text format
+        description:  Get request latency, size and count metrics in Prometheus text format
+        tags:
+           - Metrics
+        responses:
+           200:
+              description: Prometheus text exposition
+        """
+        rep.status = falcon.HTTP_200
+        rep.content_type = PROMETHEUS_CONTENT_TYPE
+        rep.data = self.metrics.render().encode("utf-8")
+
+    def on_get_profiles(self, _, rep):
+        """ Profiles GET endpoint
+
+        Parameters:
+            _: falcon.Request HTTP request
+            rep: falcon.Response HTTP response
+
+        ---
+        summary:  Get recent request profiles
+        description:  Get profiles of recently profiled requests, newest last
+        tags:
+           - Metrics
+        responses:
+           200:
+              description: List of request profiles
+        """
+        rep.status = falcon.HTTP_200
+        rep.content_type = "application/json"
+        rep.data = json.dumps(list(self.metrics.profiles)).encode("utf-8")
+
+
+def loadMetricsEnds(app, metrics, prefix=""):
+    """ Adds metrics endpoints to app
+
+    Parameters:
+        app (falcon.App): app to add routes to
+        metrics (Metrics): registry to expose
+        prefix (str): path prefix of routes
+
+    Returns:
+        MetricsEnd: resource
+    """
+    end = MetricsEnd(metrics=metrics)
+    app.add_route(prefix + "/metrics", end)
+    app.add_route(prefix + "/metrics/profiles", end, suffix="profiles")
+    return end
+
+
 @dataclass
 class CesrRequest:
     payload: dict
@@ -204,30 +406,61 @@ def streamCESRRequests(client, ims, path=None):
 
 
 class Clienter(doing.DoDoer):
+    """
+    Clienter provides HTTP clients for one off requests. Clients handed back
+    with .release stay connected in an idle pool of at most .PoolSize clients
+    per host so later requests to the same host reuse their connection.
+
+    """
 
     TimeoutClient = 300
+    TimeoutIdle = 30  # seconds an idle pooled client stays connected
+    PoolSize = 4  # max idle clients per host
 
     def __init__(self):
         self.clients = []
+        self.idle = dict()  # list of (client, doer, released) idle clients by host
         doers = [doing.doify(self.clientDo)]
         super(Clienter, self).__init__(doers=doers)
 
-    def request(self, method, url):
+    @staticmethod
+    def host(purl):
+        """ Returns (scheme, hostname, port) pool key of parsed url purl """
+        return purl.scheme, purl.hostname, purl.port or (443 if purl.scheme == "https" else 80)
+
+    def request(self, method, url, headers=None):
+        """ Returns client with request of method at url queued on an idle
+        pooled client of the host if any else on a new one
+
+        Parameters:
+            method (str): HTTP method
+            url (str): URL of request
+            headers (dict | None): HTTP request headers
+        """
         purl = parse.urlparse(url)
 
-        client = http.clienting.Client(scheme=purl.scheme,
-                                       hostname=purl.hostname,
-                                       port=purl.port,
-                                       portOptional=True)
+        pool = self.idle.get(self.host(purl), [])
+        while pool:
+            client, clientDoer, _ = pool.pop()
+            if client.connector.cutoff:  # closed by server while idle
+                super(Clienter, self).remove([clientDoer])
+                continue
+            break
+        else:
+            client = http.clienting.Client(scheme=purl.scheme,
+                                           hostname=purl.hostname,
+                                           port=purl.port,
+                                           portOptional=True)
+            clientDoer = http.clienting.ClientDoer(client=client)
+            self.extend([clientDoer])
 
         client.request(
             method=method,
             path=purl.path,
             qargs=parse.parse_qs(purl.query),
+            headers=headers,
         )
 
-        clientDoer = http.clienting.ClientDoer(client=client)
-        self.extend([clientDoer])
         self.clients.append((client, clientDoer, helping.nowUTC()))
 
         return client
@@ -242,6 +475,23 @@ class Clienter(doing.DoDoer):
         (_, doer, _) = tup
         super(Clienter, self).remove([doer])
 
+    def release(self, client):
+        """ Returns client whose response has been taken to the idle pool of
+        its host or removes it when the pool is full or it is closed """
+        found = [(c, d, dt) for (c, d, dt) in self.clients if c == client]
+        if not found or client.requests or client.connector.cutoff:
+            self.remove(client)
+            return
+
+        (_, doer, _) = found[0]
+        self.clients.remove(found[0])
+        host = (client.requester.scheme, client.requester.hostname, client.requester.port)
+        pool = self.idle.setdefault(host, [])
+        if len(pool) >= self.PoolSize:
+            super(Clienter, self).remove([doer])
+            return
+        pool.append((client, doer, helping.nowUTC()))
+
     def clientDo(self, tymth, tock=0.0):
         """ Periodically prune stale clients
 
@@ -270,5 +520,13 @@ class Clienter(doing.DoDoer):
             for client in toRemove:
                 self.remove(client)
 
+            now = helping.nowUTC()
+            for host, pool in list(self.idle.items()):  # close long idle clients
+                for entry in [e for e in pool if (now - e[2]) > datetime.timedelta(seconds=self.TimeoutIdle)]:
+                    pool.remove(entry)
+                    super(Clienter, self).remove([entry[1]])
+                if not pool:
+                    del self.idle[host]
+
             yield self.tock
 
@@ -7,19 +7,17 @@ simple indirect mode demo support classes
 """
 import datetime
 
-import falcon
 import time
 import sys
 import traceback
 from ordered_set import OrderedSet as oset
 
 from hio.base import doing
-from hio.core import http
 from hio.core.tcp import serving
 from hio.help import decking
 
 import keri.app.oobiing
-from . import directing, storing, httping, forwarding, agenting, oobiing
+from . import directing, storing, httping, forwarding, agenting, oobiing, scheduling
 from .. import help, kering
 from ..core import eventing, parsing, routing
 from ..core.coring import Ilks
@@ -30,13 +28,26 @@ from ..peer import exchanging
 from ..vdr import verifying, viring
 from ..vdr.eventing import Tevery
 
+falcon = helping.lazyModule("falcon")  # web stack imported on first use
+http = helping.lazyModule("hio.core.http")
+
 logger = help.ogler.getLogger()
 
 
-def setupWitness(hby, alias="witness", mbx=None, tcpPort=5631, httpPort=5632):
+def setupWitness(hby, alias="witness", mbx=None, tcpPort=5631, httpPort=5632, metrics=None,
+                 metricsPort=None):
     """
     Setup witness controller and doers
 
+    Parameters:
+        hby (Habery): identifier environment database
+        alias (str): alias of witness identifier
+        mbx (Mailboxer): optional mailbox storage
+        tcpPort (int): TCP port of witness
+        httpPort (int): HTTP port of witness
+        metrics (Metrics): optional registry of request metrics of HTTP port
+        metricsPort (int): optional port of local only HTTP server of metrics
+
     """
     cues = decking.Deck()
     doers = []
@@ -56,6 +67,8 @@ def setupWitness(hby, alias="witness", mbx=None, tcpPort=5631, httpPort=5632):
     oobiery = keri.app.oobiing.Oobiery(hby=hby, clienter=clienter)
 
     app = falcon.App(cors_enable=True)
+    if metrics is not None:  # public port so no profiling by request header
+        app.add_middleware(httping.MeteringComponent(metrics=metrics))
     ending.loadEnds(app=app, hby=hby, default=hab.pre)
     oobiRes = oobiing.loadEnds(app=app, hby=hby, prefix="/ext")
     rep = storing.Respondant(hby=hby, mbx=mbx)
@@ -98,6 +111,12 @@ def setupWitness(hby, alias="witness", mbx=None, tcpPort=5631, httpPort=5632):
                             kvy=kvy, tvy=tvy, rvy=rvy, exc=exchanger, replies=rep.reps,
                             responses=rep.cues, queries=httpEnd.qrycues)
 
+    if metrics is not None and metricsPort is not None:
+        metricsApp = falcon.App()
+        httping.loadMetricsEnds(metricsApp, metrics=metrics)
+        metricsServer = http.Server(host="127.0.0.1", port=metricsPort, app=metricsApp)
+        doers.append(http.ServerDoer(server=metricsServer))
+
     doers.extend(oobiRes)
     doers.extend([regDoer, exchanger, directant, serverDoer, httpServerDoer, rep, witStart, *oobiery.doers])
 
@@ -182,12 +201,16 @@ class WitnessStart(doing.DoDoer):
         self.tock = tock
         _ = (yield self.tock)
 
+        reger = self.tvy.reger if self.tvy is not None else None
+        backoff = scheduling.Backoff(dbs=[self.hab.db, reger])
         while True:
-            self.kvy.processEscrows()
-            self.rvy.processEscrowReply()
-            if self.tvy is not None:
-                self.tvy.processEscrows()
-            self.exc.processEscrow()
+            if backoff.due(self.tyme):  # skip scan while nothing changed
+                self.kvy.processEscrows()
+                self.rvy.processEscrowReply()
+                if self.tvy is not None:
+                    self.tvy.processEscrows()
+                self.exc.processEscrow()
+                backoff.done(self.tyme)
 
             yield
 
@@ -428,8 +451,11 @@ class Indirector(doing.DoDoer):
         self.tock = tock
         _ = (yield self.tock)
 
+        backoff = scheduling.Backoff(dbs=[self.hab.db])
         while True:
-            self.kevery.processEscrows()
+            if backoff.due(self.tyme):  # skip scan while nothing changed
+                self.kevery.processEscrows()
+                backoff.done(self.tyme)
             yield
 
     def sendMessage(self, msg, label=""):
@@ -499,7 +525,7 @@ class MailboxDirector(doing.DoDoer):
     """
 
     def __init__(self, hby, topics, ims=None, verifier=None, kvy=None, exc=None, rep=None, cues=None, rvy=None,
-                 tvy=None, **kwa):
+                 tvy=None, backlog=1048576, multiplex=False, **kwa):
         """
         Initialize instance.
 
@@ -513,14 +539,22 @@ class MailboxDirector(doing.DoDoer):
             client is TCP Client instance
             direct is Boolean, True means direwct mode process cured receipts
                                False means indirect mode don't process cue'ed receipts
+            backlog (int): max bytes of unparsed messages in .ims before mail is
+                left with the pollers until the parser catches up
+            multiplex (bool): True means poll the mailboxes of all local
+                identifiers that share a witness over one MultiPoller stream
 
         """
         self.hby = hby
+        self.backlog = backlog
+        self.multiplex = multiplex
+        self.muxes = dict()  # MultiPoller by witness prefix when multiplexing
         self.verifier = verifier
         self.exchanger = exc
         self.rep = rep
         self.topics = topics
         self.pollers = list()
+        self.turn = 0  # index of poller to start the next pass of processPollIter
         self.prefixes = oset()
         self.cues = cues if cues is not None else decking.Deck()
 
@@ -555,13 +589,18 @@ class MailboxDirector(doing.DoDoer):
         if self.exchanger is not None:
             doers.extend([doing.doify(self.exchangerDo)])
 
+        vry = self.verifier
+        if self.verifier is not None and self.verifier.workers != 0:  # verify credentials in batches
+            vry = verifying.Collector(creds=self.verifier.creds)
+            doers.extend([doing.doify(self.verifierDo)])
+
         self.parser = parsing.Parser(ims=self.ims,
                                      framed=True,
                                      kvy=self.kvy,
                                      tvy=self.tvy,
                                      exc=self.exchanger,
                                      rvy=self.rvy,
-                                     vry=self.verifier)
+                                     vry=vry)
 
         super(MailboxDirector, self).__init__(doers=doers, **kwa)
 
@@ -602,7 +641,6 @@ class MailboxDirector(doing.DoDoer):
 
             for msg in self.processPollIter():
                 self.ims.extend(msg)
-                _ = (yield self.tock)
             _ = (yield self.tock)
 
     def addPollers(self, hab):
@@ -612,15 +650,16 @@ class MailboxDirector(doing.DoDoer):
             hab (Hab): the Hab of the prefix
 
         """
-        for (_, erole, eid), end in hab.db.ends.getItemIter(keys=(hab.pre, kering.Roles.mailbox)):
-            if end.allowed:
+        eids = [eid for (_, erole, eid), end in
+                hab.db.ends.getItemIter(keys=(hab.pre, kering.Roles.mailbox)) if end.allowed]
+        for eid in eids + list(hab.kever.wits):
+            if not self.multiplex or hab.group:  # group consent needs its members so poll alone
                 poller = Poller(hab=hab, topics=self.topics, witness=eid)
-                self.pollers.append(poller)
-                self.extend([poller])
-
-        wits = hab.kever.wits
-        for wit in wits:
-            poller = Poller(hab=hab, topics=self.topics, witness=wit)
+            elif eid in self.muxes:
+                self.muxes[eid].add(hab)
+                continue
+            else:
+                poller = self.muxes[eid] = MultiPoller(hab=hab, topics=self.topics, witness=eid)
             self.pollers.append(poller)
             self.extend([poller])
 
@@ -628,21 +667,20 @@ class MailboxDirector(doing.DoDoer):
 
     def processPollIter(self):
         """
-        Iterate through cues and yields one or more responses for each cue.
-
-        Parameters:
-            cues is deque of cues
+        Iterate through pollers and yields their messages while .ims is under .backlog
+        bytes, otherwise the parser is behind so the rest is left in the pollers.
+        Each pass starts at the poller after the one the last pass started at so
+        no poller is starved under sustained load.
 
         """
-        mail = []
-        for poller in self.pollers:  # get responses from all behaviors
-            while poller.msgs:
-                msg = poller.msgs.popleft()
-                mail.append(msg)
+        if not self.pollers:
+            return
 
-        while mail:  # iteratively process each response in responses
-            msg = mail.pop(0)
-            yield msg
+        start = self.turn % len(self.pollers)
+        self.turn = start + 1
+        for poller in self.pollers[start:] + self.pollers[:start]:  # get responses from all behaviors
+            while poller.msgs and len(self.ims) < self.backlog:
+                yield poller.msgs.popleft()
 
     def msgDo(self, tymth=None, tock=0.0):
         """
@@ -691,16 +729,43 @@ class MailboxDirector(doing.DoDoer):
         self.tock = tock
         _ = (yield self.tock)
 
+        dbs = [self.hby.db]
+        dbs.extend(sub.reger for sub in (self.tvy, self.verifier) if sub is not None)
+        backoff = scheduling.Backoff(dbs=dbs)
         while True:
-            self.kvy.processEscrows()
-            self.rvy.processEscrowReply()
-            if self.tvy is not None:
-                self.tvy.processEscrows()
-            if self.verifier is not None:
-                self.verifier.processEscrows()
+            if backoff.due(self.tyme):  # skip scan while nothing changed
+                self.kvy.processEscrows()
+                self.rvy.processEscrowReply()
+                if self.tvy is not None:
+                    self.tvy.processEscrows()
+                if self.verifier is not None:
+                    self.verifier.processEscrows()
+                backoff.done(self.tyme)
 
             yield
 
+    def verifierDo(self, tymth=None, tock=0.0):
+        """
+         Returns doifiable Doist compatibile generator method (doer dog) to verify
+            credentials collected by .parser in .verifier.creds as one batch per pass
+
+        Parameters:
+            tymth is injected function wrapper closure returned by .tymen() of
+                Tymist instance. Calling tymth() returns associated Tymist .tyme.
+            tock is injected initial tock value
+
+        Usage:
+            add result of doify on this method to doers list
+        """
+        self.wind(tymth)
+        self.tock = tock
+        _ = (yield self.tock)
+
+        while True:
+            if self.verifier.creds:
+                self.verifier.processMessages()
+            yield
+
     def exchangerDo(self, tymth=None, tock=0.0):
         """
          Returns doifiable Doist compatibile generator method (doer dog) to process
@@ -745,18 +810,34 @@ class Poller(doing.DoDoer):
     """
     Polls remote SSE endpoint for event that are KERI messages to be processed
 
+    Keeps one long lived mailbox query stream open to the witness and only
+    reconnects when the witness closes it, answers with other than a stream
+    or the stream has been open .lifetime seconds. Each new query resumes
+    every topic at the index after the last one received.
+
+    Topic indices are committed to .hab.db.tops in batches of .batch events or
+    after .flush seconds, so a crash may redeliver at most one batch which the
+    parser ignores as duplicates. Stops taking events off the stream while
+    .msgs holds .limit messages not yet taken by the MailboxDirector.
+
     """
 
-    def __init__(self, hab, witness, topics, msgs=None, retry=1000, **kwa):
+    def __init__(self, hab, witness, topics, msgs=None, retry=1000, lifetime=600.0, batch=32,
+                 flush=1.0, limit=256, **kwa):
         """
         Returns doist compatible doing.Doer that polls a witness for mailbox messages
         as SSE events
 
         Parameters:
-            hab:
-            witness:
-            topics:
-            msgs:
+            hab (Hab): Hab of identifier whose mailbox is polled
+            witness (str): qb64 identifier prefix of witness or mailbox
+            topics (list): of topics to poll
+            msgs (Deck): outgoing messages received from the mailbox
+            retry (int): milliseconds to wait before reconnecting
+            lifetime (float): max seconds to keep one stream open, 0 means no max
+            batch (int): max number of received events before committing indices
+            flush (float): max seconds before committing indices of received events
+            limit (int): max number of messages in .msgs before pausing the stream
 
         """
         self.hab = hab
@@ -764,13 +845,88 @@ class Poller(doing.DoDoer):
         self.witness = witness
         self.topics = topics
         self.retry = retry
-        self.msgs = None if msgs is not None else decking.Deck()
+        self.lifetime = lifetime
+        self.batch = batch
+        self.flush = flush
+        self.limit = limit
+        self.msgs = msgs if msgs is not None else decking.Deck()
         self.times = dict()
+        self.witrec = None  # TopicsRecord of topic indices received
+        self.dirty = 0  # number of received events not yet committed
+        self.flushed = 0.0  # tyme of last commit
 
         doers = [doing.doify(self.eventDo)]
 
         super(Poller, self).__init__(doers=doers, **kwa)
 
+    def load(self):
+        """ Loads topic indices received from witness """
+        self.witrec = self.hab.db.tops.get((self.pre, self.witness))
+        if self.witrec is None:
+            self.witrec = basing.TopicsRecord(topics=dict())
+
+    def cursors(self, witrec):
+        """ Returns dict of index of next message of each of .topics after
+        indices of witrec """
+        return {topic: witrec.topics[topic] + 1 if topic in witrec.topics else 0
+                for topic in self.topics}
+
+    def query(self):
+        """ Returns signed mbx query message of .topics starting after indices
+        of .witrec """
+        q = dict(pre=self.pre, topics=self.cursors(self.witrec))
+
+        if self.hab.group:
+            return self.hab.mhab.query(pre=self.pre, src=self.witness, route="mbx", query=q)
+        return self.hab.query(pre=self.pre, src=self.witness, route="mbx", query=q)
+
+    def receive(self, client):
+        """ Moves events received on client into .msgs until .limit and
+        records their topic indices. Returns number received """
+        count = 0
+        while client.events and len(self.msgs) < self.limit:
+            evt = client.events.popleft()
+            if "retry" in evt:
+                self.retry = evt["retry"]
+            if "id" not in evt or "data" not in evt or "name" not in evt:
+                logger.error(f"bad mailbox event: {evt}")
+                continue
+            idx = evt["id"]
+            msg = evt["data"]
+            tpc = evt["name"]
+
+            if not idx or not msg or not tpc:
+                logger.error(f"bad mailbox event: {evt}")
+                continue
+
+            self.msgs.append(msg.encode("utf=8"))
+            self.times[self.record(tpc, int(idx))] = helping.nowUTC()
+            self.dirty += 1
+            count += 1
+
+        return count
+
+    def record(self, tpc, idx):
+        """ Records index idx received of topic tpc and returns topic """
+        self.witrec.topics[tpc] = idx
+        return tpc
+
+    def commit(self):
+        """ Commits topic indices if any received since last commit """
+        if self.dirty:
+            self.hab.db.tops.pin((self.pre, self.witness), self.witrec)
+            self.dirty = 0
+        self.flushed = self.tyme
+
+    def ended(self, client, opened):
+        """ Returns True when stream of client needs a new query """
+        if client.responses:  # response complete so not or no longer a stream
+            client.responses.popleft()
+            return True
+        if client.connector.cutoff:  # closed by witness
+            return True
+        return bool(self.lifetime) and self.tyme - opened >= self.lifetime
+
     def eventDo(self, tymth=None, tock=0.0):
         """
         Returns:
@@ -783,9 +939,7 @@ class Poller(doing.DoDoer):
         self.tock = tock
         _ = (yield self.tock)
 
-        witrec = self.hab.db.tops.get((self.pre, self.witness))
-        if witrec is None:
-            witrec = basing.TopicsRecord(topics=dict())
+        self.load()
 
         while self.retry > 0:
             try:
@@ -796,59 +950,117 @@ class Poller(doing.DoDoer):
                 continue
 
             self.extend([clientDoer])
-
-            topics = dict()
-            q = dict(pre=self.pre, topics=topics)
-            for topic in self.topics:
-                if topic in witrec.topics:
-                    topics[topic] = witrec.topics[topic] + 1
-                else:
-                    topics[topic] = 0
-
-            if self.hab.group:
-                msg = self.hab.mhab.query(pre=self.pre, src=self.witness, route="mbx", query=q)
-            else:
-                msg = self.hab.query(pre=self.pre, src=self.witness, route="mbx", query=q)
-
-            httping.createCESRRequest(msg, client)
+            httping.createCESRRequest(self.query(), client)
 
             while client.requests:
                 yield self.tock
 
-            created = helping.nowUTC()
-            while True:
-
-                now = helping.nowUTC()
-                if now - created > datetime.timedelta(seconds=30):
-                    self.remove([clientDoer])
-                    break
-
-                while client.events:
-                    evt = client.events.popleft()
-                    if "retry" in evt:
-                        self.retry = evt["retry"]
-                    if "id" not in evt or "data" not in evt or "name" not in evt:
-                        logger.error(f"bad mailbox event: {evt}")
-                        continue
-                    idx = evt["id"]
-                    msg = evt["data"]
-                    tpc = evt["name"]
-
-                    if not idx or not msg or not tpc:
-                        logger.error(f"bad mailbox event: {evt}")
-                        continue
-
-                    self.msgs.append(msg.encode("utf=8"))
-                    yield self.tock
-
-                    witrec.topics[tpc] = int(idx)
-                    self.times[tpc] = helping.nowUTC()
-                    self.hab.db.tops.pin((self.pre, self.witness), witrec)
-
-                yield 0.25
+            opened = self.flushed = self.tyme
+            while not self.ended(client, opened):
+                received = self.receive(client)
+                if self.dirty >= self.batch or self.tyme - self.flushed >= self.flush:
+                    self.commit()
+
+                yield self.tock if received else 0.25
+
+            self.commit()
+            self.remove([clientDoer])
             yield self.retry / 1000
 
 
+class MultiPoller(Poller):
+    """
+    Polls one witness for the mailboxes of many local identifiers over a single
+    multiplexed mbx query stream. The query signed by .hab carries the topic
+    cursors of every added identifier in its pres field and the witness tags
+    each event with the identifier prefix as {pre}{topic}. Adding an identifier
+    replaces the stream with one that includes it.
+
+    Each added identifier signs its consent to the signer of the query in its
+    sigs field since the witness only streams mailboxes of identifiers that
+    consented. Group identifiers are polled alone as their consent needs the
+    signatures of their members.
+
+    A witness without multiplexing support streams only the mailbox of .hab
+    with untagged events which are attributed to .hab.
+
+    """
+
+    def __init__(self, hab, witness, topics, **kwa):
+        """
+        Parameters:
+            hab (Hab): Hab of first identifier which signs the queries
+            witness (str): qb64 identifier prefix of witness or mailbox
+            topics (list): of topics to poll for every identifier
+
+        """
+        self.habs = {hab.pre: hab}
+        self.witrecs = dict()  # TopicsRecord of each identifier by prefix
+        self.dirties = set()  # prefixes with indices not yet committed
+        self.stale = False  # True means query lacks added identifiers
+
+        super(MultiPoller, self).__init__(hab=hab, witness=witness, topics=topics, **kwa)
+
+    def add(self, hab):
+        """ Adds mailbox of identifier of hab to the stream """
+        if hab.pre in self.habs:
+            return
+        self.habs[hab.pre] = hab
+        if self.witrec is not None:  # already loaded so load new one and requery
+            self.witrecs[hab.pre] = self.fetch(hab.pre)
+            self.stale = True
+
+    def fetch(self, pre):
+        witrec = self.hab.db.tops.get((pre, self.witness))
+        return witrec if witrec is not None else basing.TopicsRecord(topics=dict())
+
+    def load(self):
+        """ Loads topic indices received from witness of all identifiers """
+        self.witrecs = {pre: self.fetch(pre) for pre in self.habs}
+        self.witrec = self.witrecs[self.pre]
+
+    def query(self):
+        """ Returns signed mbx query message with cursors of all identifiers
+        and the consent of each added identifier to the signer of the query """
+        self.stale = False
+        hab = self.hab.mhab if self.hab.group else self.hab
+        stamp = helping.nowIso8601()
+        ser = eventing.mailboxConsent(signer=hab.pre, src=self.witness, stamp=stamp)
+        q = dict(pre=self.pre, topics=self.cursors(self.witrec),
+                 pres={pre: self.cursors(witrec) for pre, witrec in self.witrecs.items()},
+                 sigs={pre: [siger.qb64 for siger in self.habs[pre].sign(ser)]
+                       for pre in self.witrecs if pre != self.pre})
+
+        return hab.query(pre=self.pre, src=self.witness, route="mbx", query=q, stamp=stamp)
+
+    def record(self, tpc, idx):
+        """ Records index idx received of topic tagged as {pre}{topic} in tpc
+        and returns topic """
+        pre, sep, topic = tpc.partition("/")
+        topic = sep + topic
+        if not pre:  # untagged so from mailbox of .hab
+            pre = self.pre
+        if pre not in self.witrecs:
+            logger.error(f"mailbox event for unknown identifier {pre}")
+            return topic
+        self.witrecs[pre].topics[topic] = idx
+        self.dirties.add(pre)
+        return topic
+
+    def commit(self):
+        """ Commits topic indices of identifiers received since last commit """
+        if self.dirty:
+            for pre in self.dirties:
+                self.hab.db.tops.pin((pre, self.witness), self.witrecs[pre])
+            self.dirties.clear()
+            self.dirty = 0
+        self.flushed = self.tyme
+
+    def ended(self, client, opened):
+        """ Returns True when stream of client needs a new query """
+        return self.stale or super(MultiPoller, self).ended(client, opened)
+
+
 class HttpEnd:
     """
     HTTP handler that accepts and KERI events POSTed as the body of a request with all attachments to
@@ -955,7 +1167,7 @@ class QryRpyMailboxIterable:
                     kin = cue["kin"]
                     if kin == "stream":
                         self.iter = iter(MailboxIterable(mbx=self.mbx, pre=cue["pre"], topics=cue["topics"],
-                                                         retry=self.retry))
+                                                         retry=self.retry, pres=cue.get("pres")))
                 else:
                     self.cues.append(cue)
 
@@ -965,13 +1177,20 @@ class QryRpyMailboxIterable:
 
 
 class MailboxIterable:
+    """
+    Iterable of SSE events of messages in mailbox topics of pre. When pres is
+    given streams the topics of every identifier in pres instead and tags each
+    event as {pre}{topic} for multiplexed mailbox queries.
+
+    """
     TimeoutMBX = 30000000
 
-    def __init__(self, mbx, pre, topics, retry=5000):
+    def __init__(self, mbx, pre, topics, retry=5000, pres=None):
         self.mbx = mbx
         self.pre = pre
         self.topics = topics
         self.retry = retry
+        self.pres = pres
 
     def __iter__(self):
         self.start = self.end = time.perf_counter()
@@ -984,18 +1203,27 @@ class MailboxIterable:
                 return bytearray(f"retry: {self.retry}\n\n".encode("utf-8"))
 
             data = bytearray()
-            for topic, idx in self.topics.items():
-                key = self.pre + topic
-                for fn, _, msg in self.mbx.cloneTopicIter(key, idx):
-                    data.extend(bytearray("id: {}\nevent: {}\nretry: {}\ndata: ".format(fn, topic, self.retry)
-                                          .encode("utf-8")))
-                    data.extend(msg)
-                    data.extend(b'\n\n')
-                    idx = idx + 1
-                    self.start = time.perf_counter()
-
-                self.topics[topic] = idx
+            if self.pres is None:
+                self.stream(data, self.pre, self.topics)
+            else:
+                for pre, topics in self.pres.items():
+                    self.stream(data, pre, topics, tag=pre)
             self.end = time.perf_counter()
             return data
 
         raise StopIteration
+
+    def stream(self, data, pre, topics, tag=""):
+        """ Extends data with events of new messages in topics of pre and
+        advances indices of topics """
+        for topic, idx in topics.items():
+            key = pre + topic
+            for fn, _, msg in self.mbx.cloneTopicIter(key, idx):
+                data.extend(bytearray("id: {}\nevent: {}{}\nretry: {}\ndata: ".format(fn, tag, topic, self.retry)
+                                      .encode("utf-8")))
+                data.extend(msg)
+                data.extend(b'\n\n')
+                idx = idx + 1
+                self.start = time.perf_counter()
+
+            topics[topic] = idx
@@ -0,0 +1,270 @@
+# -*- encoding: utf-8 -*-
+"""
+keri.app.inspecting module
+
+Paginated and streamed inspection of escrows for admin endpoints and the CLI
+
+Escrowed key events are keyed by snKey(pre, sn) so all escrowed events of one
+identifier are a contiguous key range. The Inspector seeks straight to that
+range instead of scanning whole escrow tables, reads escrows in bounded
+chunks so no read transaction is held while events are loaded or written out,
+and renders results as a stream of JSON chunks that can be written as they
+are produced.
+"""
+import base64
+import itertools
+import json
+
+from .. import help
+from ..core import eventing
+from ..db import dbing
+
+logger = help.ogler.getLogger()
+
+# escrows of key events in Baser by name to database attribute
+EventEscrows = {
+    "out-of-order-events": "ooes",
+    "partially-witnessed-events": "pwes",
+    "partially-signed-events": "pses",
+    "likely-duplicitous-events": "ldes",
+}
+
+# escrows of credentials in Reger by name to Suber attribute. Keyed by SAID
+CredentialEscrows = {
+    "missing-registry-escrow": "mre",
+    "missing-issuer-escrow": "mie",
+    "broken-chain-escrow": "mce",
+    "missing-schema-escrow": "mse",
+}
+
+
+def encodeCursor(escrow, key, ion=0):
+    """ Returns str opaque URL safe pagination cursor
+
+    Parameters:
+        escrow (str): name of escrow of item
+        key (bytes): database key of item to resume after or empty to start
+            at first item of escrow
+        ion (int): insertion ordinal of item at key
+    """
+    raw = b"%s|%s|%x" % (escrow.encode("utf-8"), key, ion)
+    return base64.urlsafe_b64encode(raw).decode("utf-8")
+
+
+def decodeCursor(cursor):
+    """ Returns triple (escrow, key, ion) of pagination cursor from encodeCursor
+
+    Raises ValueError if cursor is malformed
+
+    Parameters:
+        cursor (str): cursor as returned by encodeCursor
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("utf-8"))
+        escrow, key, ion = raw.split(b"|")
+        return escrow.decode("utf-8"), key, int(ion, 16)
+    except (TypeError, ValueError, UnicodeError) as ex:
+        raise ValueError(f"invalid cursor {cursor}") from ex
+
+
+class Inspector:
+    """
+    Inspector pages through the key event escrows of a Baser and optionally the
+    credential escrows of a Reger
+
+    Attributes:
+        db (Baser): database of key event escrows
+        reger (Reger | None): database of credential escrows
+        chunk (int): max items read per read transaction
+
+    """
+
+    def __init__(self, db, reger=None, chunk=64):
+        """ Initialize instance
+
+        Parameters:
+            db (Baser): database of key event escrows
+            reger (Reger | None): optional database of credential escrows
+            chunk (int): max items read per read transaction
+
+        """
+        self.db = db
+        self.reger = reger
+        self.chunk = max(1, chunk)
+
+    def names(self, escrow=None, pre=None):
+        """ Returns list of escrow names in order to inspect. Credential
+        escrows are only included with a .reger and without pre because they
+        are not keyed by identifier prefix.
+
+        Parameters:
+            escrow (str | None): name of single escrow or None for all
+            pre (str | None): qb64 identifier prefix filter
+        """
+        names = list(EventEscrows)
+        if self.reger is not None and pre is None:
+            names.extend(CredentialEscrows)
+        if escrow:
+            names = [name for name in names if name == escrow]
+        return names
+
+    def summary(self, escrow=None, pre=None):
+        """ Returns dict of count of escrowed items by escrow name without
+        loading any of them
+
+        Parameters:
+            escrow (str | None): name of single escrow or None for all
+            pre (str | None): qb64 identifier prefix filter
+        """
+        top = self.top(pre)
+        counts = dict()
+        for name in self.names(escrow=escrow, pre=pre):
+            if name in EventEscrows:
+                counts[name] = self.db.cntIoValsTop(getattr(self.db, EventEscrows[name]),
+                                                    top=top)
+            else:
+                counts[name] = self.reger.cnt(getattr(self.reger, CredentialEscrows[name]).sdb)
+        return counts
+
+    @staticmethod
+    def top(pre):
+        """ Returns bytes key space prefix of escrowed events of pre """
+        if not pre:
+            return b""
+        return (pre.encode("utf-8") if hasattr(pre, "encode") else bytes(pre)) + b"."
+
+    def items(self, name, top=b"", after=None):
+        """ Returns generator of (key, ion, val) items of escrow name starting
+        after item (key, ion) read in chunks of .chunk items per transaction
+
+        Parameters:
+            name (str): escrow name
+            top (bytes): key space prefix
+            after (tuple | None): (key, ion) of item to resume after
+        """
+        while True:
+            if name in EventEscrows:
+                itr = self.db.getIoItemsTopIter(getattr(self.db, EventEscrows[name]),
+                                                top=top, after=after)
+            else:
+                itr = self.credItemIter(getattr(self.reger, CredentialEscrows[name]),
+                                        after=after)
+            try:
+                page = list(itertools.islice(itr, self.chunk))
+            finally:
+                itr.close()  # ends read transaction
+
+            yield from page
+            if len(page) < self.chunk:
+                return
+            after = page[-1][:2]
+
+    def credItemIter(self, suber, after=None):
+        """ Returns iterator of (key, ion, said) items of credential escrow
+        suber after item (key, ion)
+        """
+        key = after[0] if after is not None else b""
+        for ekey, _ in self.reger.getAllItemIter(suber.sdb, key=key, split=False):
+            if after is not None and ekey == after[0]:
+                continue
+            yield ekey, 0, ekey
+
+    def load(self, name, key, val):
+        """ Returns dict of escrowed event or credential of item in escrow name.
+        When item can not be loaded returns dict with error instead so that
+        one broken entry does not end a streamed response.
+        """
+        try:
+            if name in EventEscrows:
+                pre, _ = dbing.splitKeySN(key)
+                return eventing.loadEvent(self.db, pre, val)
+            creder, _, _ = self.reger.cloneCred(val.decode("utf-8"))
+            return creder.crd
+        except Exception as ex:
+            return dict(said=bytes(val).decode("utf-8"), error=str(ex))
+
+    def stream(self, escrow=None, pre=None, cursor=None, limit=None, summary=False,
+               indent=None):
+        """ Returns generator of bytes chunks of the JSON object of escrows
+
+        The object maps escrow name to list of escrowed events or to count of
+        items when summary. When limit or cursor is given the object also has
+        field "next" with the cursor to pass to get the next page or None
+        when there are no more items.
+
+        Raises ValueError eagerly for invalid cursor or limit so the caller
+        can reject the request before streaming begins.
+
+        Parameters:
+            escrow (str | None): name of single escrow or None for all
+            pre (str | None): qb64 identifier prefix filter
+            cursor (str | None): cursor of page from "next" of previous page
+            limit (int | None): max number of items in page
+            summary (bool): True means only counts, ignores cursor and limit
+            indent (int | None): indent of each event when pretty printing
+        """
+        if limit is not None and limit < 1:
+            raise ValueError(f"invalid limit {limit}")
+        start = decodeCursor(cursor) if cursor else None
+        names = self.names(escrow=escrow, pre=pre)
+        if start is not None and start[0] not in names:
+            raise ValueError(f"invalid cursor {cursor}")
+
+        if summary:
+            return self._summary(escrow=escrow, pre=pre)
+        return self._pages(names, pre=pre, start=start, limit=limit,
+                           paged=limit is not None or start is not None, indent=indent)
+
+    def _summary(self, escrow=None, pre=None):
+        yield json.dumps(self.summary(escrow=escrow, pre=pre)).encode("utf-8")
+
+    def _pages(self, names, pre=None, start=None, limit=None, paged=False, indent=None):
+        top = self.top(pre)
+        if start is not None:  # skip escrows before cursor
+            names = names[names.index(start[0]):]
+
+        # same layout as json.dumps of whole object with indent
+        if indent:
+            sep, nl0, nl1, nl2 = b",", b"\n", b"\n" + b" " * indent, b"\n" + b" " * (2 * indent)
+        else:
+            sep, nl0, nl1, nl2 = b", ", b"", b"", b""
+
+        count = 0
+        nxt = None
+        first = True
+        yield b"{"
+        for name in names:
+            after = None
+            if start is not None and start[0] == name and start[1]:
+                after = start[1:]
+
+            items = self.items(name, top=top, after=after)
+            if limit is not None and count >= limit:  # page full so peek for more
+                more = next(items, None) is not None
+                items.close()
+                if more:
+                    nxt = encodeCursor(name, b"")  # from start of this escrow
+                    break
+                continue
+
+            yield (b"" if first else sep) + nl1 + json.dumps(name).encode("utf-8") + b": ["
+            first = False
+            last = None
+            for key, ion, val in items:
+                if limit is not None and count >= limit:
+                    nxt = encodeCursor(name, *last)
+                    break
+                raw = json.dumps(self.load(name, key, val), indent=indent).encode("utf-8")
+                yield (b"" if last is None else sep) + nl2 + raw.replace(b"\n", nl2)
+                last = (key, ion)
+                count += 1
+            items.close()
+            yield (b"" if last is None else nl1) + b"]"
+
+            if nxt is not None:
+                break
+
+        if paged:
+            yield (b"" if first else sep) + nl1 + b"\"next\": " + json.dumps(nxt).encode("utf-8")
+            first = False
+        yield (b"" if first else nl0) + b"}"
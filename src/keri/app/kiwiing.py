@@ -4,6 +4,7 @@ KERI
 keri.app.agenting module
 
 """
+import itertools
 import json
 from ordered_set import OrderedSet as oset
 
@@ -15,13 +16,14 @@ from hio.core import http
 from hio.help import decking
 
 import keri.app.oobiing
-from . import grouping, challenging, connecting, notifying, signaling, oobiing
+from . import grouping, challenging, connecting, notifying, signaling, oobiing, inspecting
 from .. import help
 from .. import kering
 from ..app import specing, forwarding, agenting, storing, indirecting, httping, habbing, delegating, booting
 from ..core import coring, eventing
 from ..db import dbing
 from ..db.dbing import dgKey
+from ..help import metering
 from ..peer import exchanging
 from ..vc import proving, protocoling, walleting
 from ..vdr import verifying, credentialing
@@ -63,7 +65,8 @@ class LockEnd(doing.DoDoer):
                       configDir=self.bootConfig["configDir"],
                       insecure=self.bootConfig["insecure"],
                       path=self.bootConfig["staticPath"],
-                      headDirPath=self.bootConfig["headDirPath"])
+                      headDirPath=self.bootConfig["headDirPath"],
+                      workers=self.bootConfig.get("workers", 0))
 
         rep.status = falcon.HTTP_200
         body = dict(msg="locked")
@@ -1076,21 +1079,22 @@ class CredentialEnd(doing.DoDoer):
                        "".format(alias)
             return
 
-        creds = []
-        if typ == "issued":
-            saids = self.rgy.reger.issus.get(keys=hab.pre)
-        elif typ == "received":
-            saids = self.rgy.reger.subjs.get(keys=hab.pre)
-        else:
+        if typ not in ("issued", "received"):
             rep.status = falcon.HTTP_400
             rep.text = f"Invalid type {typ}"
             return
 
-        if schema is not None:
-            scads = self.rgy.reger.schms.get(keys=schema)
-            saids = [saider for saider in saids if saider.qb64 in [saider.qb64 for saider in scads]]
+        with self.rgy.reger.snapshot():  # index and credentials from one consistent view
+            if typ == "issued":
+                saids = self.rgy.reger.issus.get(keys=hab.pre)
+            else:
+                saids = self.rgy.reger.subjs.get(keys=hab.pre)
+
+            if schema is not None:
+                scads = self.rgy.reger.schms.get(keys=schema)
+                saids = [saider for saider in saids if saider.qb64 in [saider.qb64 for saider in scads]]
 
-        creds = self.rgy.reger.cloneCreds(saids)
+            creds = self.rgy.reger.cloneCreds(saids)
 
         rep.status = falcon.HTTP_200
         rep.content_type = "application/json"
@@ -1139,7 +1143,8 @@ class CredentialEnd(doing.DoDoer):
             rep.text = "Invalid alias {} for credentials".format(alias)
             return
 
-        data = self.outputCred(hab, said)
+        with self.hby.db.snapshot(), self.rgy.reger.snapshot():  # one consistent view of chain
+            data = self.outputCred(hab, said)
 
         rep.status = falcon.HTTP_200
         rep.content_type = "application/json+cesr"
@@ -1197,7 +1202,8 @@ class CredentialEnd(doing.DoDoer):
 
         ---
         summary: Perform credential issuance
-        description: Perform credential issuance
+        description: Perform credential issuance of one credential or of a batch of credentials given by
+                     credentials whose issuance events are anchored together
         tags:
            - Credentials
         parameters:
@@ -1239,9 +1245,15 @@ class CredentialEnd(doing.DoDoer):
                     private:
                       type: boolean
                       description: flag to inidicate this credential should support privacy preserving presentations
+                    credentials:
+                      type: array
+                      description: batch of credentials to issue, each with any of recipient, source, rules,
+                                   credentialData and private that default to the ones given above
+                      items:
+                         type: object
         responses:
            200:
-              description: Credential issued.
+              description: Credential issued or list of credentials issued for batch
               content:
                   application/json:
                     schema:
@@ -1265,27 +1277,48 @@ class CredentialEnd(doing.DoDoer):
         data = body.get("credentialData")
         private = body.get("private") is not None and body.get("private") is True
 
-        edges = None
-        if source is not None:
-            try:
-                _, edges = coring.Saider.saidify(sad=source)
-            except KeyError:
-                edges = source
+        batch = body.get("credentials")
+        entries = batch if batch is not None else [dict()]
+        if not isinstance(entries, list) or not all(isinstance(entry, dict) for entry in entries):
+            rep.status = falcon.HTTP_400
+            rep.text = "credentials must be a list of credentials to issue"
+            return
 
         try:
-            creder = self.credentialer.create(regname, recp, schema, edges, rules, data, private=private)
-            self.credentialer.issue(creder=creder)
+            creders = []
+            for entry in entries:
+                edges = None
+                if (esource := entry.get("source", source)) is not None:
+                    try:
+                        _, edges = coring.Saider.saidify(sad=esource)
+                    except KeyError:
+                        edges = esource
 
-        except kering.ConfigurationError as e:
+                eprivate = entry.get("private", private) is True
+                creders.append(self.credentialer.create(regname, entry.get("recipient", recp), schema, edges,
+                                                        entry.get("rules", rules), entry.get("credentialData", data),
+                                                        private=eprivate))
+
+            if batch is None:
+                self.credentialer.issue(creder=creders[0])
+            else:
+                self.credentialer.issueMany(creders=creders)
+
+        except (kering.ConfigurationError, kering.ValidationError) as e:
             rep.status = falcon.HTTP_400
             rep.text = e.args[0]
             return
 
         # cue up an event to send notification when complete
-        self.evts.append(dict(topic="/credential", r="/iss/complete", d=creder.said))
+        for creder in creders:
+            self.evts.append(dict(topic="/credential", r="/iss/complete", d=creder.said))
 
         rep.status = falcon.HTTP_200
-        rep.data = creder.raw
+        if batch is None:
+            rep.data = creders[0].raw
+        else:
+            rep.content_type = "application/json"
+            rep.data = b"[" + b",".join(creder.raw for creder in creders) + b"]"
 
     def on_post_iss(self, req, rep, alias=None):
         """ Initiate a credential issuance from a group multisig identfier
@@ -2888,6 +2921,30 @@ class NotificationEnd:
               type: integer
             required: false
             description: size of the result list.  Defaults to 25
+          - in: query
+            name: cursor
+            schema:
+              type: string
+            required: false
+            description: qb64 random ID of note to page from exclusively, ignored with last
+          - in: query
+            name: reverse
+            schema:
+              type: boolean
+            required: false
+            description: page from newest to oldest
+          - in: query
+            name: read
+            schema:
+              type: boolean
+            required: false
+            description: only return read notifications when true or unread when false
+          - in: query
+            name: route
+            schema:
+              type: string
+            required: false
+            description: only return notifications with this route
         tags:
            - Notifications
 
@@ -2896,25 +2953,136 @@ class NotificationEnd:
               description: List of contact information for remote identifiers
         """
         last = req.params.get("last")
-        limit = req.params.get("limit")
-
-        limit = int(limit) if limit is not None else 25
+        try:
+            limit = int(req.params.get("limit", 25))
+            read = req.get_param_as_bool("read")
+            reverse = req.get_param_as_bool("reverse", default=False)
+        except (ValueError, falcon.HTTPBadRequest):
+            rep.status = falcon.HTTP_400
+            rep.text = "invalid limit, read or reverse query parameter"
+            return
 
         if last is not None:
-            lastNote = self.notifier.get(last)
-            if lastNote is not None:
-                start = lastNote.datetime
-            else:
-                start = ""
+            lastNote = self.notifier.noter.get(last)
+            start = lastNote[0].datetime if lastNote is not None else ""
+            notes = self.notifier.getNotes(start=start, limit=limit)
         else:
-            start = ""
-
-        notes = self.notifier.getNotes(start=start, limit=limit)
+            notes = self.notifier.getNotePage(cursor=req.params.get("cursor"), limit=limit,
+                                              reverse=reverse, read=read,
+                                              route=req.params.get("route"))
         out = [note.pad for note in notes]
 
         rep.status = falcon.HTTP_200
         rep.data = json.dumps(out).encode("utf-8")
 
+    def on_get_counts(self, _, rep):
+        """ Notification counts GET endpoint
+
+        Parameters:
+            _: falcon.Request HTTP request
+            rep: falcon.Response HTTP response
+        ---
+        summary:  Get count of all and of unread notifications
+        description:  Get count of all and of unread notifications without loading them
+        tags:
+           - Notifications
+
+        responses:
+           200:
+              description: Counts of notifications
+        """
+        noter = self.notifier.noter
+        rep.status = falcon.HTTP_200
+        rep.data = json.dumps(dict(total=noter.cntNotes(),
+                                   unread=noter.cntNotes(read=False))).encode("utf-8")
+
+    def on_put(self, req, rep):
+        """ Notifications PUT endpoint to mark many as read
+
+        Parameters:
+            req: falcon.Request HTTP request
+            rep: falcon.Response HTTP response
+        ---
+        summary:  Mark notifications as read
+        description:  Mark many notifications as read in one batch
+        tags:
+           - Notifications
+        requestBody:
+            required: true
+            content:
+              application/json:
+                schema:
+                  type: object
+                  properties:
+                    rids:
+                      type: array
+                      items:
+                         type: string
+                      description: qb64 random IDs of notes to mark as read
+        responses:
+           202:
+              description: Random IDs of notifications marked as read
+           400:
+              description: Missing list of random IDs
+        """
+        rids = self.loadRids(req, rep)
+        if rids is None:
+            return
+
+        rep.status = falcon.HTTP_202
+        rep.data = json.dumps(dict(rids=self.notifier.marMany(rids))).encode("utf-8")
+
+    def on_delete(self, req, rep):
+        """ Notifications DELETE endpoint to delete many
+
+        Parameters:
+            req: falcon.Request HTTP request
+            rep: falcon.Response HTTP response
+        ---
+        summary:  Delete notifications
+        description:  Delete many notifications in one batch
+        tags:
+           - Notifications
+        requestBody:
+            required: true
+            content:
+              application/json:
+                schema:
+                  type: object
+                  properties:
+                    rids:
+                      type: array
+                      items:
+                         type: string
+                      description: qb64 random IDs of notes to delete
+        responses:
+           202:
+              description: Random IDs of notifications deleted
+           400:
+              description: Missing list of random IDs
+        """
+        rids = self.loadRids(req, rep)
+        if rids is None:
+            return
+
+        rep.status = falcon.HTTP_202
+        rep.data = json.dumps(dict(rids=self.notifier.remMany(rids))).encode("utf-8")
+
+    @staticmethod
+    def loadRids(req, rep):
+        """ Returns list of random IDs from rids in request body or None after
+        setting 400 response if missing """
+        try:
+            rids = req.get_media()["rids"]
+            if not isinstance(rids, list) or not all(isinstance(rid, str) for rid in rids):
+                raise ValueError("rids must be list of str")
+        except (ValueError, KeyError, TypeError, falcon.HTTPBadRequest):
+            rep.status = falcon.HTTP_400
+            rep.text = "invalid request, rids list required"
+            return None
+
+        return rids
+
     def on_put_said(self, _, rep, said):
         """ Notification PUT endpoint
 
@@ -3028,23 +3196,36 @@ class ContactEnd:
                type: string
             description: value to search for
             required: false
+          - in: query
+            name: sort
+            schema:
+               type: string
+            description: field name to sort list of all contacts by
+            required: false
+          - in: query
+            name: start
+            schema:
+               type: integer
+            description: number of contacts to skip in list of all contacts
+            required: false
+          - in: query
+            name: limit
+            schema:
+               type: integer
+            description: max number of contacts to return in list of all contacts
+            required: false
         responses:
            200:
               description: List of contact information for remote identifiers
         """
-        # TODO:  Add support for sorting
-
         group = req.params.get("group")
         field = req.params.get("filter_field")
         val = req.params.get("filter_value")
 
         if group is not None:
-            data = dict()
-            values = self.org.values(group, val)
-            for value in values:
-                contacts = self.org.find(group, value)
+            data = self.org.group(group, val)
+            for contacts in data.values():
                 self.authn(contacts)
-                data[value] = contacts
 
             rep.status = falcon.HTTP_200
             rep.data = json.dumps(data).encode("utf-8")
@@ -3062,13 +3243,22 @@ class ContactEnd:
             rep.data = json.dumps(contacts).encode("utf-8")
 
         else:
-            data = []
-            contacts = self.org.list()
+            try:
+                start = int(req.params.get("start", 0))
+                limit = req.params.get("limit")
+                limit = int(limit) if limit is not None else None
+                if start < 0 or (limit is not None and limit < 0):
+                    raise ValueError
+            except ValueError:
+                rep.status = falcon.HTTP_400
+                rep.text = "start and limit must be non negative integers"
+                return
 
-            for contact in contacts:
-                aid = contact["id"]
-                if aid in self.hby.kevers and aid not in self.hby.prefixes:
-                    data.append(contact)
+            stop = start + limit if limit is not None else None
+
+            contacts = (contact for contact in self.org.contactIter(sort=req.params.get("sort"))
+                        if contact["id"] in self.hby.kevers and contact["id"] not in self.hby.prefixes)
+            data = list(itertools.islice(contacts, start, stop))
 
             self.authn(data)
             rep.status = falcon.HTTP_200
@@ -3481,112 +3671,49 @@ class EscrowEnd:
               type: string
             required: false
             description: name of escrow to load, ignoring others
+          - in: query
+            name: limit
+            schema:
+              type: integer
+            required: false
+            description: max number of escrowed events to return, adds next cursor to response
+          - in: query
+            name: cursor
+            schema:
+              type: string
+            required: false
+            description: cursor from next of previous response to get next page
+          - in: query
+            name: summary
+            schema:
+              type: boolean
+            required: false
+            description: only return count of escrowed events in each escrow
         responses:
            200:
               description: Escrow information
-           404:
-              description: Prefix not found in any escrow
+           400:
+              description: Invalid limit or cursor
 
 
         """
         rpre = req.params.get("pre")
-        if rpre is not None:
-            rpre = rpre.encode("utf-8")
         escrow = req.params.get("escrow")
-
-        escrows = dict()
-
-        if (not escrow) or escrow == "out-of-order-events":
-            oots = list()
-            key = ekey = b''  # both start same. when not same means escrows found
-            while True:
-                for ekey, edig in self.db.getOoeItemsNextIter(key=key):
-                    pre, sn = dbing.splitKeySN(ekey)  # get pre and sn from escrow item
-                    if rpre and pre != rpre:
-                        continue
-
-                    try:
-                        oots.append(eventing.loadEvent(self.db, pre, edig))
-                    except ValueError as e:
-                        rep.status = falcon.HTTP_400
-                        rep.text = e.args[0]
-                        return
-
-                if ekey == key:  # still same so no escrows found on last while iteration
-                    break
-                key = ekey  # setup next while iteration, with key after ekey
-
-            escrows["out-of-order-events"] = oots
-
-        if (not escrow) or escrow == "partially-witnessed-events":
-            pwes = list()
-            key = ekey = b''  # both start same. when not same means escrows found
-            while True:  # break when done
-                for ekey, edig in self.db.getPweItemsNextIter(key=key):
-                    pre, sn = dbing.splitKeySN(ekey)  # get pre and sn from escrow item
-                    if rpre and pre != rpre:
-                        continue
-
-                    try:
-                        pwes.append(eventing.loadEvent(self.db, pre, edig))
-                    except ValueError as e:
-                        rep.status = falcon.HTTP_400
-                        rep.text = e.args[0]
-                        return
-
-                if ekey == key:  # still same so no escrows found on last while iteration
-                    break
-                key = ekey  # setup next while iteration, with key after ekey
-
-            escrows["partially-witnessed-events"] = pwes
-
-        if (not escrow) or escrow == "partially-signed-events":
-            pses = list()
-            key = ekey = b''  # both start same. when not same means escrows found
-            while True:  # break when done
-                for ekey, edig in self.db.getPseItemsNextIter(key=key):
-                    pre, sn = dbing.splitKeySN(ekey)  # get pre and sn from escrow item
-                    if rpre and pre != rpre:
-                        continue
-
-                    try:
-                        pses.append(eventing.loadEvent(self.db, pre, edig))
-                    except ValueError as e:
-                        rep.status = falcon.HTTP_400
-                        rep.text = e.args[0]
-                        return
-
-                if ekey == key:  # still same so no escrows found on last while iteration
-                    break
-                key = ekey  # setup next while iteration, with key after ekey
-
-            escrows["partially-signed-events"] = pses
-
-        if (not escrow) or escrow == "likely-duplicitous-events":
-            ldes = list()
-            key = ekey = b''  # both start same. when not same means escrows found
-            while True:  # break when done
-                for ekey, edig in self.db.getLdeItemsNextIter(key=key):
-                    pre, sn = dbing.splitKeySN(ekey)  # get pre and sn from escrow item
-                    if rpre and pre != rpre:
-                        continue
-
-                    try:
-                        ldes.append(eventing.loadEvent(self.db, pre, edig))
-                    except ValueError as e:
-                        rep.status = falcon.HTTP_400
-                        rep.text = e.args[0]
-                        return
-
-                if ekey == key:  # still same so no escrows found on last while iteration
-                    break
-                key = ekey  # setup next while iteration, with key after ekey
-
-            escrows["likely-duplicitous-events"] = ldes
+        summary = req.params.get("summary", "false").lower() in ("true", "1")
+        cursor = req.params.get("cursor")
+        try:
+            limit = req.params.get("limit")
+            limit = int(limit) if limit is not None else None
+            chunks = inspecting.Inspector(db=self.db).stream(escrow=escrow, pre=rpre, cursor=cursor,
+                                                             limit=limit, summary=summary)
+        except ValueError as e:
+            rep.status = falcon.HTTP_400
+            rep.text = e.args[0]
+            return
 
         rep.status = falcon.HTTP_200
         rep.content_type = "application/json"
-        rep.data = json.dumps(escrows, indent=2).encode("utf-8")
+        rep.stream = chunks
 
     def on_get_partial(self, req, rep, pre, dig):
         """
@@ -3836,6 +3963,7 @@ def loadEnds(app, *,
 
     notes = NotificationEnd(notifier=notifier)
     app.add_route("/notifications", notes)
+    app.add_route("/notifications/counts", notes, suffix="counts")
     app.add_route("/notifications/{said}", notes, suffix="said")
 
     schemaEnd = SchemaEnd(db=hby.db)
@@ -3858,7 +3986,8 @@ def loadEnds(app, *,
     return [identifierEnd, registryEnd, oobiEnd, multiIcpEnd, multiEvtEnd, credsEnd, presentationEnd, lockEnd, chacha]
 
 
-def setup(hby, rgy, servery, bootConfig, *, controller="", insecure=False, staticPath="", **kwargs):
+def setup(hby, rgy, servery, bootConfig, *, controller="", insecure=False, staticPath="", metrics=None,
+          workers=0, **kwargs):
     """ Setup and run a KIWI agent
 
     Parameters:
@@ -3869,6 +3998,9 @@ def setup(hby, rgy, servery, bootConfig, *, controller="", insecure=False, stati
         controller (str): qb64 identifier prefix of the controller of this agent
         insecure (bool): allow unsigned HTTP requests to the admin interface (non-production ONLY)
         staticPath (str): path to static content for this agent
+        metrics (Metrics): optional registry of request metrics, served at /metrics
+        workers (int | None): worker processes verifying batches of received
+            credentials, 0 means verify each inline, None means one per CPU
 
     Returns:
         list: Endpoint Doers to execute in Doist for agent.
@@ -3880,7 +4012,7 @@ def setup(hby, rgy, servery, bootConfig, *, controller="", insecure=False, stati
 
     signaler = signaling.Signaler()
     notifier = notifying.Notifier(hby=hby, signaler=signaler)
-    verifier = verifying.Verifier(hby=hby, reger=rgy.reger)
+    verifier = verifying.Verifier(hby=hby, reger=rgy.reger, workers=workers)
     wallet = walleting.Wallet(reger=verifier.reger, name=hby.name)
 
     handlers = []
@@ -3921,10 +4053,15 @@ def setup(hby, rgy, servery, bootConfig, *, controller="", insecure=False, stati
     # Load admin interface
     app = falcon.App(middleware=falcon.CORSMiddleware(
         allow_origins='*', allow_credentials='*', expose_headers=['cesr-attachment', 'cesr-date', 'content-type']))
+    metrics = metrics if metrics is not None else metering.Metrics()
+    # admin interface so allow profiling of requests with profile header once
+    # signature validation below has accepted them
+    app.add_middleware(httping.MeteringComponent(metrics=metrics, profiling=True))
     if not insecure:
         app.add_middleware(httping.SignatureValidationComponent(hby=hby, pre=controller))
     app.req_options.media_handlers.update(media.Handlers())
     app.resp_options.media_handlers.update(media.Handlers())
+    httping.loadMetricsEnds(app, metrics=metrics)
 
     endDoers = loadEnds(app, path=staticPath, hby=hby, rgy=rgy, verifier=verifier,
                         counselor=counselor, registrar=registrar, credentialer=credentialer,
@@ -0,0 +1,282 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.app.loading module
+
+Load generation against in process witnesses for capacity planning
+
+A Loader runs N witnesses from indirecting.setupWitness on localhost ports and
+M witnessed controller identifiers in one process. It drives inceptions,
+rotations and interactions through WitnessReceiptors and /fwd mailbox
+messages through Postmen and a MailboxDirector at a fixed rate and reports
+throughput, latency percentiles, CPU time and LMDB growth.
+"""
+import math
+import time
+
+from hio.base import doing
+from hio.help import decking
+
+from .. import help, kering
+from ..app import agenting, forwarding, habbing, indirecting, storing
+from ..core import coring, eventing, parsing, routing
+from ..peer import exchanging
+
+logger = help.ogler.getLogger()
+
+Kinds = ("icp", "rot", "ixn", "fwd", "mbx")  # kinds of measured operations
+
+
+def percentile(values, q):
+    """ Returns nearest rank percentile q in [0, 100] of sorted values or None
+    when empty """
+    if not values:
+        return None
+    rank = max(0, min(len(values) - 1, math.ceil(q / 100.0 * len(values)) - 1))
+    return values[rank]
+
+
+def dbSize(dbers):
+    """ Returns int bytes in use by all LMDB environments of dbers """
+    size = 0
+    for dber in dbers:
+        if dber.env is None:
+            continue
+        size += (dber.env.info()["last_pgno"] + 1) * dber.env.stat()["psize"]
+    return size
+
+
+def seedWitnessEnds(hby, habs, urls):
+    """ Adds controller end role and http location of each witness Hab in habs
+    at url in urls to the database of hby """
+    rvy = routing.Revery(db=hby.db)
+    kvy = eventing.Kevery(db=hby.db, lax=False, local=True, rvy=rvy)
+    kvy.registerReplyRoutes(router=rvy.rtr)
+    psr = parsing.Parser(framed=True, kvy=kvy, rvy=rvy)
+    for hab, url in zip(habs, urls):
+        msgs = bytearray()
+        msgs.extend(hab.makeEndRole(eid=hab.pre, role=kering.Roles.controller,
+                                    stamp=help.nowIso8601()))
+        msgs.extend(hab.makeLocScheme(url=url, scheme=kering.Schemes.http,
+                                      stamp=help.nowIso8601()))
+        psr.parse(ims=msgs)
+
+
+class PingHandler(doing.Doer):
+    """ Records arrival time of load /fwd mailbox messages by nonce """
+
+    resource = "/load/ping"
+
+    def __init__(self, **kwa):
+        self.msgs = decking.Deck()
+        self.cues = decking.Deck()  # responses sent by Exchanger, always empty
+        self.arrivals = dict()  # perf_counter arrival time keyed by nonce
+        super(PingHandler, self).__init__(**kwa)
+
+    def do(self, tymth, tock=0.0, **opts):
+        self.wind(tymth)
+        self.tock = tock
+        yield self.tock
+
+        while True:
+            while self.msgs:
+                msg = self.msgs.popleft()
+                self.arrivals[msg["payload"]["n"]] = time.perf_counter()
+            yield self.tock
+
+
+class Loader(doing.DoDoer):
+    """
+    Loader generates witness and mailbox load in one process and reports on it.
+
+    Each controller first incepts and waits for all witness receipts. Once all
+    controllers are incepted, each one runs its rotations, interactions and
+    mailbox messages to its neighbour in turn, one operation at a time, while
+    operations of all controllers start no faster than .rate per second.
+
+    Attributes:
+        witnesses (int): number of witnesses
+        controllers (int): number of controllers
+        events (int): number of rotations and interactions per controller
+        messages (int): number of mailbox messages per controller
+        rate (float): max operations started per second over all controllers
+        toad (int): witness threshold of controllers
+        port (int): HTTP port of first witness, TCP port is next one up
+        limit (float): max seconds to run before reporting, 0 means no limit
+        report (dict | None): report once done
+
+    """
+
+    def __init__(self, witnesses=3, controllers=4, events=4, messages=4, rate=10.0, toad=None,
+                 port=5700, limit=0.0, **kwa):
+        self.witnesses = witnesses
+        self.controllers = controllers
+        self.events = events
+        self.messages = messages
+        self.rate = rate
+        self.toad = toad if toad is not None else witnesses
+        self.port = port
+        self.limit = limit
+        self.report = None
+
+        self.latencies = {kind: [] for kind in Kinds}
+        self.pending = dict()  # perf_counter start of mailbox message by nonce
+        self.hbys = []
+        self.mbxs = []
+        self.witDoers = []
+        self.witHabs = []
+        self.habs = []
+
+        for i in range(witnesses):
+            salt = coring.Salter(raw=f"load-witness{i:04d}".encode("utf-8")).qb64
+            whby = habbing.Habery(name=f"load-witness{i}", temp=True, salt=salt)
+            mbx = storing.Mailboxer(name=f"load-witness{i}", temp=True)
+            self.hbys.append(whby)
+            self.mbxs.append(mbx)
+            self.witDoers.extend(indirecting.setupWitness(hby=whby, alias=f"wit{i}", mbx=mbx,
+                                                          httpPort=port + 2 * i,
+                                                          tcpPort=port + 2 * i + 1))
+            self.witHabs.append(whby.habByName(f"wit{i}"))
+
+        self.hby = habbing.Habery(name="load-controller", temp=True,
+                                  salt=coring.Salter(raw=b"load-controllers").qb64)
+        self.hbys.append(self.hby)
+        seedWitnessEnds(self.hby, self.witHabs,
+                        [f"http://127.0.0.1:{port + 2 * i}/" for i in range(witnesses)])
+
+        self.pinger = PingHandler()
+        self.exchanger = exchanging.Exchanger(db=self.hby.db, handlers=[self.pinger])
+        self.director = indirecting.MailboxDirector(hby=self.hby, topics=["/receipt", "/load"],
+                                                    exc=self.exchanger)
+        self.receiptors = [agenting.WitnessReceiptor(hby=self.hby) for _ in range(controllers)]
+        self.postmen = [forwarding.Postman(hby=self.hby) for _ in range(controllers)]
+
+        self.loadDoer = doing.doify(self.loadDo)
+        doers = [*self.witDoers, self.director, self.exchanger, *self.receiptors, *self.postmen,
+                 self.loadDoer]
+        super(Loader, self).__init__(doers=doers, **kwa)
+
+    def plan(self, i):
+        """ Returns list of operation kinds of controller i after inception """
+        ops = ["rot" if j % 2 else "ixn" for j in range(self.events)]
+        step = max(1, len(ops) // max(1, self.messages))
+        for j in range(self.messages):  # spread messages between events
+            ops.insert(min(len(ops), (j + 1) * step + j), "fwd")
+        return ops
+
+    def start(self, i, kind, nonce):
+        """ Starts operation kind of controller i and returns its completion
+        token to match against cues """
+        hab = self.habs[i] if i < len(self.habs) else None
+        if kind == "icp":
+            hab = self.hby.makeHab(name=f"load{i}", wits=[wit.pre for wit in self.witHabs],
+                                   toad=self.toad)
+            self.habs.append(hab)
+            self.receiptors[i].msgs.append(dict(pre=hab.pre, sn=0))
+            return hab.pre, 0
+        if kind in ("rot", "ixn"):
+            if kind == "rot":
+                hab.rotate()
+            else:
+                hab.interact()
+            self.receiptors[i].msgs.append(dict(pre=hab.pre, sn=hab.kever.sn))
+            return hab.pre, hab.kever.sn
+
+        recp = self.habs[(i + 1) % len(self.habs)]
+        serder = exchanging.exchange(route=PingHandler.resource, payload=dict(n=nonce))
+        ims = hab.endorse(serder=serder, last=True, pipelined=False)
+        del ims[:serder.size]
+        self.pending[nonce] = time.perf_counter()
+        self.postmen[i].send(src=hab.pre, dest=recp.pre, topic="load", serder=serder,
+                             attachment=ims)
+        return serder.said
+
+    @staticmethod
+    def token(kind, cue):
+        if kind == "fwd":
+            return cue["said"]
+        return cue["pre"], cue["sn"]
+
+    def loadDo(self, tymth=None, tock=0.0):
+        """ Returns doifiable Doist compatible generator method that runs the
+        load and then removes all doers and closes all databases """
+        self.wind(tymth)
+        self.tock = tock
+        _ = (yield self.tock)
+
+        dbers = [db for hby in self.hbys for db in (hby.db, hby.ks)] + self.mbxs
+        size = dbSize(dbers)
+        cpu = time.process_time()
+        begin = time.perf_counter()
+        due = begin
+
+        plans = [["icp"] for _ in range(self.controllers)]
+        queues = [list(ops) for ops in plans]
+        busy = dict()  # (kind, start, token) of running operation by controller
+        incepted = False
+        nonces = 0
+
+        while True:
+            now = time.perf_counter()
+            if self.limit and now - begin > self.limit:
+                break
+
+            for i, (kind, started, token) in list(busy.items()):  # completed operations
+                cues = self.postmen[i].cues if kind == "fwd" else self.receiptors[i].cues
+                for _ in range(len(cues)):
+                    cue = cues.popleft()
+                    if self.token(kind, cue) == token:
+                        self.latencies[kind].append(now - started)
+                        del busy[i]
+                        break
+                    cues.append(cue)
+
+            for nonce, arrived in list(self.pinger.arrivals.items()):  # delivered messages
+                self.latencies["mbx"].append(arrived - self.pending.pop(nonce))
+                del self.pinger.arrivals[nonce]
+
+            if not incepted and not busy and not any(queues):  # all incepted so go
+                incepted = True
+                queues = [self.plan(i) for i in range(self.controllers)]
+
+            if incepted and not busy and not any(queues) and not self.pending:
+                break
+
+            for i, queue in enumerate(queues):
+                if now < due:
+                    break
+                if i in busy or not queue:
+                    continue
+                kind = queue.pop(0)
+                nonces += 1
+                busy[i] = (kind, time.perf_counter(), self.start(i, kind, f"{nonces}"))
+                due = max(due + 1.0 / self.rate, now - 1.0)  # no catch up burst
+
+            yield self.tock
+
+        elapsed = time.perf_counter() - begin
+        cpu = time.process_time() - cpu
+        self.report = self.summarize(elapsed=elapsed, cpu=cpu, before=size, after=dbSize(dbers),
+                                     incomplete=len(busy) + sum(len(q) for q in queues) + len(self.pending))
+
+        self.remove([doer for doer in self.doers if doer is not self.loadDoer])
+        for mbx in self.mbxs:
+            mbx.close(clear=True)
+        for hby in self.hbys:
+            hby.close(clear=True)
+        return True
+
+    def summarize(self, elapsed, cpu, before, after, incomplete=0):
+        """ Returns dict of report of run """
+        ops = dict()
+        for kind in Kinds:
+            lats = sorted(self.latencies[kind])
+            ops[kind] = dict(count=len(lats),
+                             rate=len(lats) / elapsed if elapsed else 0.0,
+                             p50=percentile(lats, 50),
+                             p99=percentile(lats, 99),
+                             max=lats[-1] if lats else None)
+        return dict(witnesses=self.witnesses, controllers=self.controllers,
+                    elapsed=elapsed, cpu=cpu, cpuPercent=100.0 * cpu / elapsed if elapsed else 0.0,
+                    lmdb=dict(before=before, after=after, growth=after - before),
+                    ops=ops, incomplete=incomplete)
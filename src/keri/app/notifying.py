@@ -194,11 +194,20 @@ class Noter(dbing.LMDBer):
     Noter stores Notifications generated by the agent that are
     intended to be read and dismissed by the controller of the agent.
 
+    Notes are stored in datetime order with secondary indices by read state
+    and by route so that unread notes or the notes of one route are a
+    contiguous key range. Counts of all and of unread notes are maintained on
+    every write so they are available without a scan. Each write of one or
+    many notes, with their signatures, indices and counts, is committed in a
+    single transaction.
+
     """
     TailDirPath = "keri/not"
     AltTailDirPath = ".keri/not"
     TempPrefix = "keri_not_"
 
+    Sep = "\x1f"  # separator of index keys, unit separator never in routes or datetimes
+
     def __init__(self, name="not", headDirPath=None, reopen=True, **kwa):
         """
 
@@ -211,6 +220,9 @@ class Noter(dbing.LMDBer):
         self.notes = None
         self.nidx = None
         self.ncigs = None
+        self.nrdx = None
+        self.nrtx = None
+        self.ncnt = None
 
         super(Noter, self).__init__(name=name, headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -226,8 +238,93 @@ class Noter(dbing.LMDBer):
         self.nidx = subing.Suber(db=self, subkey='nidx.')
         self.ncigs = subing.CesrSuber(db=self, subkey='ncigs.', klas=coring.Cigar)
 
+        # read state index maps (read, dt, rid) to rid where read is "1" or "0"
+        self.nrdx = subing.Suber(db=self, subkey='nrdx.', sep=self.Sep)
+        # route index maps (route, dt, rid) to rid for notes with route attribute
+        self.nrtx = subing.Suber(db=self, subkey='nrtx.', sep=self.Sep)
+        # counts of all notes and of unread notes
+        self.ncnt = subing.Suber(db=self, subkey='ncnt.')
+
+        if self.ncnt.get(keys=("notes",)) is None:  # created before indices
+            self.reindex()
+
         return self.env
 
+    @staticmethod
+    def route(note):
+        """ Returns str route of note or None if it has none """
+        attrs = note.attrs
+        route = attrs.get("r") if isinstance(attrs, dict) else None
+        return route if isinstance(route, str) and route else None
+
+    def reindex(self):
+        """ Rebuilds read state and route indices and counts from notes """
+        with self.env.begin(write=True) as txn:
+            for sub in (self.nrdx, self.nrtx, self.ncnt):
+                txn.drop(sub.sdb, delete=False)
+
+            counts = dict(notes=0, unread=0)
+            for _, raw in txn.cursor(db=self.notes.sdb):
+                self._index(txn, Notice(raw=bytes(raw)), counts)
+            self._count(txn, counts)
+
+    def _index(self, txn, note, counts):
+        """ Writes index entries of note in txn and adds note to counts """
+        dt, rid = note.datetime, note.rid
+        txn.put(self.nrdx._tokey(("1" if note.read else "0", dt, rid)), rid.encode(), db=self.nrdx.sdb)
+        if (route := self.route(note)) is not None:
+            txn.put(self.nrtx._tokey((route, dt, rid)), rid.encode(), db=self.nrtx.sdb)
+        counts["notes"] += 1
+        counts["unread"] += 0 if note.read else 1
+
+    def _unindex(self, txn, note, counts):
+        """ Deletes index entries of note in txn and subtracts note from counts """
+        dt, rid = note.datetime, note.rid
+        txn.delete(self.nrdx._tokey(("1" if note.read else "0", dt, rid)), db=self.nrdx.sdb)
+        if (route := self.route(note)) is not None:
+            txn.delete(self.nrtx._tokey((route, dt, rid)), db=self.nrtx.sdb)
+        counts["notes"] -= 1
+        counts["unread"] -= 0 if note.read else 1
+
+    def _count(self, txn, counts):
+        """ Adds counts deltas to stored counts in txn """
+        for name, delta in counts.items():
+            key = self.ncnt._tokey((name,))
+            cnt = txn.get(key, db=self.ncnt.sdb)
+            cnt = int(bytes(cnt)) if cnt is not None else 0
+            txn.put(key, b"%d" % max(0, cnt + delta), db=self.ncnt.sdb)
+
+    def _fetch(self, txn, rid):
+        """ Returns (note, cigar) of rid read in txn or None """
+        dt = txn.get(self.nidx._tokey((rid,)), db=self.nidx.sdb)
+        if dt is None:
+            return None
+        raw = txn.get(self.notes._tokey((bytes(dt).decode("utf-8"), rid)), db=self.notes.sdb)
+        if raw is None:
+            return None
+        cig = txn.get(self.ncigs._tokey((rid,)), db=self.ncigs.sdb)
+        return Notice(raw=bytes(raw)), coring.Cigar(qb64b=bytes(cig)) if cig is not None else None
+
+    def _write(self, txn, note, cigar, prior, counts):
+        """ Writes note and cigar replacing prior note if any in txn """
+        dt, rid = note.datetime, note.rid
+        if prior is not None:
+            self._unindex(txn, prior, counts)
+            txn.delete(self.notes._tokey((prior.datetime, rid)), db=self.notes.sdb)
+
+        txn.put(self.nidx._tokey((rid,)), dt.encode(), db=self.nidx.sdb)
+        txn.put(self.ncigs._tokey((rid,)), cigar.qb64b, db=self.ncigs.sdb)
+        txn.put(self.notes._tokey((dt, rid)), note.raw, db=self.notes.sdb)
+        self._index(txn, note, counts)
+
+    def _delete(self, txn, note, counts):
+        """ Deletes note with its signature and indices in txn """
+        rid = note.rid
+        self._unindex(txn, note, counts)
+        txn.delete(self.nidx._tokey((rid,)), db=self.nidx.sdb)
+        txn.delete(self.ncigs._tokey((rid,)), db=self.ncigs.sdb)
+        return txn.delete(self.notes._tokey((note.datetime, rid)), db=self.notes.sdb)
+
     def add(self, note, cigar):
         """
         Adds note to database, keyed by the datetime and said of the note.
@@ -237,14 +334,14 @@ class Noter(dbing.LMDBer):
             cigar (Cigar): non-transferable signature over note
 
         """
-        dt = note.datetime
-        rid = note.rid
-        if self.nidx.get(keys=(rid,)) is not None:
-            return False
+        with self.env.begin(write=True) as txn:
+            if txn.get(self.nidx._tokey((note.rid,)), db=self.nidx.sdb) is not None:
+                return False
 
-        self.nidx.pin(keys=(rid,), val=dt.encode())
-        self.ncigs.pin(keys=(rid,), val=cigar)
-        return self.notes.pin(keys=(dt, rid), val=note)
+            counts = dict(notes=0, unread=0)
+            self._write(txn, note, cigar, None, counts)
+            self._count(txn, counts)
+            return True
 
     def update(self, note, cigar):
         """
@@ -255,14 +352,33 @@ class Noter(dbing.LMDBer):
             cigar (Cigar): non-transferable signature over note
 
         """
-        dt = note.datetime
-        rid = note.rid
-        if self.nidx.get(keys=(rid,)) is None:
-            return False
+        return self.updateMany([(note, cigar)]) == 1
+
+    def updateMany(self, items):
+        """
+        Replaces existing notes with updated versions in one transaction.
+        Notes not in database are skipped.
+
+        Parameters:
+            items (Iterable): of (note, cigar) duples of updated Notice and
+                non-transferable signature over it
 
-        self.nidx.pin(keys=(rid,), val=dt.encode())
-        self.ncigs.pin(keys=(rid,), val=cigar)
-        return self.notes.pin(keys=(dt, rid), val=note)
+        Returns:
+            int: number of notes updated
+
+        """
+        updated = 0
+        with self.env.begin(write=True) as txn:
+            counts = dict(notes=0, unread=0)
+            for note, cigar in items:
+                if (res := self._fetch(txn, note.rid)) is None:
+                    continue
+                prior, _ = res
+                self._write(txn, note, cigar, prior, counts)
+                updated += 1
+            self._count(txn, counts)
+
+        return updated
 
     def get(self, rid):
         """
@@ -275,14 +391,24 @@ class Noter(dbing.LMDBer):
             (Notice, Cigar) = couple of notice object and accompanying signature
 
         """
-        dt = self.nidx.get(keys=(rid,))
-        if dt is None:
-            return None
+        with self.env.begin() as txn:
+            return self._fetch(txn, rid)
 
-        note = self.notes.get(keys=(dt, rid))
-        cig = self.ncigs.get(keys=(rid,))
+    def getMany(self, rids):
+        """
+        Returns list of (note, cigar) duples of each rid in rids found in
+        database, read in one transaction
+
+        Parameters:
+            rids (Iterable): of qb64 random IDs of notes to get
 
-        return note, cig
+        """
+        notes = []
+        with self.env.begin() as txn:
+            for rid in rids:
+                if (res := self._fetch(txn, rid)) is not None:
+                    notes.append(res)
+        return notes
 
     def rem(self, rid):
         """
@@ -294,16 +420,103 @@ class Noter(dbing.LMDBer):
         Returns:
             bool:  True if deleted
         """
-        res = self.get(rid)
-        if res is None:
-            return False
+        return len(self.remMany([rid])) == 1
 
-        note, _ = res
-        dt = note.datetime
-        rid = note.rid
-        self.nidx.rem(keys=(rid,))
-        self.ncigs.rem(keys=(rid,))
-        return self.notes.rem(keys=(dt, rid))
+    def remMany(self, rids):
+        """
+        Removes notes from database in one transaction
+
+        Parameters:
+            rids (Iterable): of qb64 random IDs of notes to remove
+
+        Returns:
+            list: of (note, cigar) duples of removed notes
+
+        """
+        removed = []
+        with self.env.begin(write=True) as txn:
+            counts = dict(notes=0, unread=0)
+            for rid in rids:
+                if (res := self._fetch(txn, rid)) is None:
+                    continue
+                if self._delete(txn, res[0], counts):
+                    removed.append(res)
+            self._count(txn, counts)
+
+        return removed
+
+    def cntNotes(self, read=None):
+        """
+        Returns count of notes from stored counts without scanning
+
+        Parameters:
+            read (bool | None): None means all notes, False unread notes only
+                and True read notes only
+
+        """
+        total = int(self.ncnt.get(keys=("notes",)) or 0)
+        if read is None:
+            return total
+        unread = int(self.ncnt.get(keys=("unread",)) or 0)
+        return unread if not read else total - unread
+
+    def getNotePage(self, cursor=None, limit=25, reverse=False, read=None, route=None):
+        """
+        Returns list of (note, cigar) duples of notes in datetime order read in
+        one transaction. Filters by read state or route seek to the matching
+        key range of the index instead of scanning all notes.
+
+        Parameters:
+            cursor (str | None): qb64 random ID of note to page from
+                exclusively, usually the last note of previous page
+            limit (int): max number of notes to return
+            reverse (bool): True means newest to oldest
+            read (bool | None): None means any, True read notes only, False
+                unread notes only
+            route (str | None): route of notes to return
+
+        """
+        if route is not None:
+            sub, parts = self.nrtx, (route,)
+        elif read is not None:
+            sub, parts = self.nrdx, ("1" if read else "0",)
+        else:
+            sub, parts = self.notes, ()
+        top = sub._tokey(parts + ("",)) if parts else b""
+
+        notes = []
+        with self.env.begin() as txn:
+            key = None
+            if cursor is not None:
+                if (res := self._fetch(txn, cursor)) is None:
+                    return notes
+                key = sub._tokey(parts + (res[0].datetime, cursor))
+
+            cur = txn.cursor(db=sub.sdb)
+            if not reverse:
+                found = cur.set_range(key if key is not None else top)
+                if found and key is not None and cur.key() == key:
+                    found = cur.next()
+            else:
+                seek = key
+                if seek is None and top:  # just past end of top branch
+                    seek = top[:-1] + bytes([top[-1] + 1])
+                if seek is not None and cur.set_range(seek):
+                    found = cur.prev()
+                else:
+                    found = cur.last()
+
+            while found and len(notes) < limit:
+                ekey = cur.key()
+                if not ekey.startswith(top):
+                    break
+                rid = sub._tokeys(ekey)[-1]
+                res = self._fetch(txn, rid)
+                if res is not None and (read is None or res[0].read == read):
+                    notes.append(res)
+                found = cur.prev() if reverse else cur.next()
+
+        return notes
 
     def getNoteIter(self, start="", limit=25):
         """
@@ -314,16 +527,7 @@ class Noter(dbing.LMDBer):
             limit (int): number of items to return
 
         """
-        if hasattr(start, "isoformat"):
-            start = start.isoformat()
-
-        res = 0
-        for ((_, _), note) in self.notes.getItemIter(keys=(start,)):
-            cig = self.ncigs.get(keys=(note.rid,))
-            yield note, cig
-            res += 1
-            if res == limit:
-                break
+        yield from self.getNotes(start=start, limit=limit)
 
     def getNotes(self, start="", limit=25):
         """
@@ -336,14 +540,17 @@ class Noter(dbing.LMDBer):
         """
         if hasattr(start, "isoformat"):
             start = start.isoformat()
+        start = start if start else ""
 
         notes = []
-
-        for ((_, _), note) in self.notes.getItemIter(keys=(start,)):
-            cig = self.ncigs.get(keys=(note.rid,))
-            notes.append((note, cig))
-            if len(notes) == limit:
-                break
+        with self.env.begin() as txn:
+            cur = txn.cursor(db=self.notes.sdb)
+            found = cur.set_range(self.notes._tokey((start,)))
+            while found and len(notes) < limit:
+                note = Notice(raw=bytes(cur.value()))
+                cig = txn.get(self.ncigs._tokey((note.rid,)), db=self.ncigs.sdb)
+                notes.append((note, coring.Cigar(qb64b=bytes(cig)) if cig is not None else None))
+                found = cur.next()
 
         return notes
 
@@ -462,6 +669,81 @@ class Notifier:
 
         return False
 
+    def marMany(self, rids):
+        """ Mark many as Read
+
+        Marks the notes identified by the provided random IDs as read with all
+        the updated notes signed and committed in one transaction and one
+        signal for the batch
+
+        Parameters:
+            rids (Iterable): qb64 random IDs of the Notes to mark as read
+
+        Returns:
+            list: of random IDs of notes marked as read, excludes notes missing,
+                already read or with invalid signatures
+
+        """
+        items = []
+        for note, cig in self.noter.getMany(rids):
+            # Verify the data has not been tampered with since saved to the database
+            if note.read or not self.hby.signator.verify(ser=note.raw, cigar=cig):
+                continue
+
+            note.read = True
+            items.append((note, self.hby.signator.sign(ser=note.raw)))
+
+        if not items or not self.noter.updateMany(items):
+            return []
+
+        marked = [note.rid for note, _ in items]
+        signal = dict(
+            action="mar",
+            dt=helping.nowIso8601(),
+            rids=marked,
+        )
+        self.signaler.push(attrs=signal, topic="/notification", ckey="/notification")
+        return marked
+
+    def remMany(self, rids):
+        """ Delete many
+
+        Deletes the notes identified by the provided random IDs in one
+        transaction with one signal for the batch
+
+        Parameters:
+            rids (Iterable): qb64 random IDs of the Notes to delete
+
+        Returns:
+            list: of random IDs of notes deleted
+
+        """
+        removed = [note.rid for note, _ in self.noter.remMany(rids)]
+        if removed:
+            signal = dict(
+                action="rem",
+                dt=helping.nowIso8601(),
+                rids=removed,
+            )
+            self.signaler.push(attrs=signal, topic="/notification", ckey="/notification")
+        return removed
+
+    def getNotePage(self, cursor=None, limit=25, reverse=False, read=None, route=None):
+        """
+        Returns list of notices with verified signatures from one page.
+        See Noter.getNotePage for parameters.
+
+        """
+        notes = []
+        for note, cig in self.noter.getNotePage(cursor=cursor, limit=limit, reverse=reverse,
+                                                read=read, route=route):
+            if not self.hby.signator.verify(ser=note.raw, cigar=cig):
+                raise kering.ValidationError("note stored without valid signature")
+
+            notes.append(note)
+
+        return notes
+
     def getNoteIter(self, start=None, limit=25):
         """
         Returns iterator of notices that have verified signatures over the data stored
@@ -6,11 +6,10 @@ keri.kli.common.oobiing module
 import datetime
 import json
 import logging
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
 from urllib import parse
 from urllib.parse import urlparse
 
-import falcon
 from hio.base import doing
 from hio.help import decking
 from keri.core import coring
@@ -26,6 +25,8 @@ from ..end.ending import OOBI_RE, DOOBI_RE
 from ..help import helping
 from ..peer import exchanging
 
+falcon = helping.lazyModule("falcon")  # web stack imported on first use
+
 logger = help.ogler.getLogger()
 
 Resultage = namedtuple("Resultage", 'resolved failed')  # stream cold start status
@@ -353,9 +354,24 @@ def oobiRequestExn(hab, dest, oobi):
 class Oobiery:
     """ Resolver for OOBIs
 
+    Requests at most .MaxInflight OOBIs at once and at most .MaxHostInflight of
+    them to the same host over pooled connections of the Clienter. A URL is
+    only requested once while in flight. Requests without a response after
+    .TimeoutRequest seconds are retried later.
+
+    Responses with an ETag or Last-Modified header are cached by URL in .cache
+    and requested again conditionally so an unchanged OOBI is not resent.
+    The Parser reports and drops bad messages of a CESR stream itself, so an
+    OOBI is only marked failed when parsing its stream raises, such as on a
+    database error, and the streams of the other OOBIs are still parsed.
+
     """
 
     RetryDelay = 30
+    TimeoutRequest = 60
+    MaxInflight = 16
+    MaxHostInflight = 4
+    CacheSize = 1024  # max number of cached responses
 
     def __init__(self, hby, clienter=None, cues=None):
         """  DoDoer to handle the request and parsing of OOBIs
@@ -377,6 +393,8 @@ class Oobiery:
 
         self.cues = cues if cues is not None else decking.Deck()
         self.clients = dict()
+        self.started = dict()  # datetime request started by url in flight
+        self.cache = OrderedDict()  # least recently used cached response by url
         self.doers = [self.clienter, doing.doify(self.scoobiDo)]
 
     def scoobiDo(self, tymth=None, tock=0.0):
@@ -415,6 +433,14 @@ class Oobiery:
 
         """
         for (url,), obr in self.hby.db.oobis.getItemIter():
+            if url in self.clients:  # same url already in flight so keep its metadata
+                self.merge(url, obr)
+                self.hby.db.oobis.rem(keys=(url,))
+                continue
+
+            if not self.admit(url):  # leave for later pass
+                continue
+
             try:
                 # Don't process OOBIs we've already resolved or are in escrow being retried
                 if ((fnd := self.hby.db.roobi.get(keys=(url,))) is not None and fnd.state == Result.resolved) and \
@@ -467,97 +493,169 @@ class Oobiery:
         """ Process Client responses by parsing the messages and removing the client/doer
 
         """
+        streams = []  # (url, obr, response) of CESR stream responses
         for (url,), obr in self.hby.db.coobi.getItemIter():
-            if url not in self.clients:
-                self.request(url, obr)
+            self.processClient(url, obr, streams)
+
+        for url, obr, response in streams:
+            try:
+                self.parser.parse(ims=bytearray(response["body"]))
+            except Exception as ex:
+                logger.exception("Oobiery: failed to parse OOBI %s: %s", url, ex)
+                self.hby.db.coobi.rem(keys=(url,))
+                obr.state = Result.failed
+                self.hby.db.roobi.put(keys=(url,), val=obr)
+                self.cues.append(dict(kin=obr.state, oobi=url))
                 continue
 
-            client = self.clients[url]
+            if ending.OOBI_AID_HEADER in response["headers"]:
+                obr.cid = response["headers"][ending.OOBI_AID_HEADER]
 
-            if client.responses:
-                response = client.responses.popleft()
-                self.clienter.remove(client)
+            if obr.oobialias is not None and obr.cid:
+                self.org.replace(pre=obr.cid, data=dict(alias=obr.oobialias, oobi=url))
 
-                if response["status"] == 404:
-                    print(f"{url} not found")
-                    self.hby.db.coobi.rem(keys=(url,))
-                    self.hby.db.eoobi.pin(keys=(url,), val=obr)
-                    continue
+            self.hby.db.coobi.rem(keys=(url,))
+            obr.state = Result.resolved
+            self.hby.db.roobi.put(keys=(url,), val=obr)
+            self.cues.append(dict(kin=obr.state, oobi=url))
+
+    def merge(self, url, obr):
+        """ Merges metadata of OOBI record obr into the record of url in flight
+        so an alias or role given with a repeated request is not lost """
+        if (pending := self.hby.db.coobi.get(keys=(url,))) is None:
+            return
+
+        for field in ("oobialias", "said", "cid", "eid", "role"):
+            if (val := getattr(obr, field)) is not None:
+                setattr(pending, field, val)
+
+        self.hby.db.coobi.pin(keys=(url,), val=pending)
+
+    def admit(self, url):
+        """ Returns True if url may be requested now within concurrency limits """
+        if len(self.clients) >= self.MaxInflight:
+            return False
+        host = parse.urlparse(url).netloc
+        return sum(1 for curl in self.clients
+                   if parse.urlparse(curl).netloc == host) < self.MaxHostInflight
+
+    def respond(self, url):
+        """ Returns response of request of url if any, from cache when not modified """
+        client = self.clients[url]
+        if not client.responses:
+            return None
+
+        response = client.responses.popleft()
+        del self.clients[url]
+        del self.started[url]
+        self.clienter.release(client)
+
+        if response["status"] == 304 and url in self.cache:
+            self.cache.move_to_end(url)
+            return self.cache[url]
+
+        if response["status"] == 200 and ("ETag" in response["headers"] or
+                                          "Last-Modified" in response["headers"]):
+            self.cache[url] = response
+            self.cache.move_to_end(url)
+            while len(self.cache) > self.CacheSize:
+                self.cache.popitem(last=False)
+
+        return response
+
+    def processClient(self, url, obr, streams):
+        """ Processes response if any of OOBI url with record obr in flight.
+        Appends CESR stream responses to streams to be parsed by caller
+
+        """
+        if url not in self.clients:
+            if self.admit(url):
+                self.request(url, obr)
+            return
+
+        if helping.nowUTC() - self.started[url] > datetime.timedelta(seconds=self.TimeoutRequest):
+            self.clienter.remove(self.clients.pop(url))  # no response so retry later
+            del self.started[url]
+            self.hby.db.coobi.rem(keys=(url,))
+            obr.date = helping.nowIso8601()
+            self.hby.db.eoobi.pin(keys=(url,), val=obr)
+            return
+
+        if (response := self.respond(url)) is None:
+            return
+
+        if response["status"] == 404:
+            print(f"{url} not found")
+            self.hby.db.coobi.rem(keys=(url,))
+            self.hby.db.eoobi.pin(keys=(url,), val=obr)
+            return
 
-                elif not response["status"] == 200:
-                    print("invalid status for oobi response: {}".format(response["status"]))
-                    self.hby.db.coobi.rem(keys=(url,))
-                    obr.state = Result.failed
-                    self.hby.db.roobi.put(keys=(url,), val=obr)
-
-                elif response["headers"]["Content-Type"] == "application/json+cesr":  # CESR Stream response to OOBI
-                    self.parser.parse(ims=bytearray(response["body"]))
-                    if ending.OOBI_AID_HEADER in response["headers"]:
-                        obr.cid = response["headers"][ending.OOBI_AID_HEADER]
-
-                    if obr.oobialias is not None and obr.cid:
-                        self.org.replace(pre=obr.cid, data=dict(alias=obr.oobialias, oobi=url))
-
-                    self.hby.db.coobi.rem(keys=(url,))
-                    obr.state = Result.resolved
-                    self.hby.db.roobi.put(keys=(url,), val=obr)
-
-                elif response["headers"]["Content-Type"] == "application/schema+json":  # Schema response to data OOBI
-                    try:
-                        schemer = scheming.Schemer(raw=bytearray(response["body"]))
-                        if schemer.said == obr.said:
-                            self.hby.db.schema.pin(keys=(schemer.said,), val=schemer)
-                            result = Result.resolved
-                        else:
-                            result = Result.failed
-
-                    except (kering.ValidationError, ValueError):
-                        result = Result.failed
-
-                    obr.state = result
-                    self.hby.db.coobi.rem(keys=(url,))
-                    self.hby.db.roobi.put(keys=(url,), val=obr)
-
-                elif response["headers"]["Content-Type"].startswith("application/json"):  # Unsigned rpy OOBI or Schema
-
-                    try:
-                        schemer = scheming.Schemer(raw=bytearray(response["body"]))
-                        if schemer.said == obr.said:
-                            self.hby.db.schema.pin(keys=(schemer.said,), val=schemer)
-                            result = Result.resolved
-                        else:
-                            result = Result.failed
-
-                        obr.state = result
-                        self.hby.db.coobi.rem(keys=(url,))
-                        self.hby.db.roobi.put(keys=(url,), val=obr)
-                        continue
-
-                    except (kering.ValidationError, ValueError):
-                        pass
-
-                    serder = eventing.Serder(raw=bytearray(response["body"]))
-                    if not serder.ked['t'] == coring.Ilks.rpy:
-                        obr.state = Result.failed
-                        self.hby.db.coobi.rem(keys=(url,))
-                        self.hby.db.roobi.put(keys=(url,), val=obr)
-
-                    elif serder.ked['r'] in ('/oobi/witness', '/oobi/controller'):
-                        self.processMultiOobiRpy(url, serder, obr)
-
-                    else:
-                        obr.state = Result.failed
-                        self.hby.db.coobi.rem(keys=(url,))
-                        self.hby.db.roobi.put(keys=(url,), val=obr)
+        elif not response["status"] == 200:
+            print("invalid status for oobi response: {}".format(response["status"]))
+            self.hby.db.coobi.rem(keys=(url,))
+            obr.state = Result.failed
+            self.hby.db.roobi.put(keys=(url,), val=obr)
 
+        elif response["headers"]["Content-Type"] == "application/json+cesr":  # CESR Stream response to OOBI
+            streams.append((url, obr, response))  # parsed and resolved by caller
+            return
+
+        elif response["headers"]["Content-Type"] == "application/schema+json":  # Schema response to data OOBI
+            try:
+                schemer = scheming.Schemer(raw=bytearray(response["body"]))
+                if schemer.said == obr.said:
+                    self.hby.db.schema.pin(keys=(schemer.said,), val=schemer)
+                    result = Result.resolved
                 else:
-                    self.hby.db.coobi.rem(keys=(url,))
-                    obr.state = Result.failed
-                    self.hby.db.roobi.put(keys=(url,), val=obr)
-                    logger.error("invalid content type for oobi response: {}"
-                                 .format(response["headers"]["Content-Type"]))
+                    result = Result.failed
 
-                self.cues.append(dict(kin=obr.state, oobi=url))
+            except (kering.ValidationError, ValueError):
+                result = Result.failed
+
+            obr.state = result
+            self.hby.db.coobi.rem(keys=(url,))
+            self.hby.db.roobi.put(keys=(url,), val=obr)
+
+        elif response["headers"]["Content-Type"].startswith("application/json"):  # Unsigned rpy OOBI or Schema
+
+            try:
+                schemer = scheming.Schemer(raw=bytearray(response["body"]))
+                if schemer.said == obr.said:
+                    self.hby.db.schema.pin(keys=(schemer.said,), val=schemer)
+                    result = Result.resolved
+                else:
+                    result = Result.failed
+
+                obr.state = result
+                self.hby.db.coobi.rem(keys=(url,))
+                self.hby.db.roobi.put(keys=(url,), val=obr)
+                return
+
+            except (kering.ValidationError, ValueError):
+                pass
+
+            serder = eventing.Serder(raw=bytearray(response["body"]))
+            if not serder.ked['t'] == coring.Ilks.rpy:
+                obr.state = Result.failed
+                self.hby.db.coobi.rem(keys=(url,))
+                self.hby.db.roobi.put(keys=(url,), val=obr)
+
+            elif serder.ked['r'] in ('/oobi/witness', '/oobi/controller'):
+                self.processMultiOobiRpy(url, serder, obr)
+
+            else:
+                obr.state = Result.failed
+                self.hby.db.coobi.rem(keys=(url,))
+                self.hby.db.roobi.put(keys=(url,), val=obr)
+
+        else:
+            self.hby.db.coobi.rem(keys=(url,))
+            obr.state = Result.failed
+            self.hby.db.roobi.put(keys=(url,), val=obr)
+            logger.error("invalid content type for oobi response: {}"
+                         .format(response["headers"]["Content-Type"]))
+
+        self.cues.append(dict(kin=obr.state, oobi=url))
 
     def processMOOBIs(self):
         """ Process Client responses by parsing the messages and removing the client/doer
@@ -592,8 +690,16 @@ class Oobiery:
                 self.hby.db.oobis.pin(keys=(url,), val=obr)
 
     def request(self, url, obr):
-        client = self.clienter.request("GET", url=url)
+        headers = dict()
+        if (cached := self.cache.get(url)) is not None:  # conditional request
+            if "ETag" in cached["headers"]:
+                headers["If-None-Match"] = cached["headers"]["ETag"]
+            if "Last-Modified" in cached["headers"]:
+                headers["If-Modified-Since"] = cached["headers"]["Last-Modified"]
+
+        client = self.clienter.request("GET", url=url, headers=headers)
         self.clients[url] = client
+        self.started[url] = helping.nowUTC()
         self.hby.db.oobis.rem(keys=(url,))
         self.hby.db.coobi.pin(keys=(url,), val=obr)
 
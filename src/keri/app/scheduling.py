@@ -0,0 +1,496 @@
+# -*- encoding: utf-8 -*-
+"""
+keri.app.scheduling module
+
+Idle aware scheduling of hio doers
+
+A plain real time Doist runs every doer every tock whether or not there is
+anything to do. The Scheduler here is a Doist that backs off exponentially
+while its doers are idle and wakes immediately when work arrives, either from
+a socket becoming ready, a database commit, an append to an in memory queue
+of its doers or an explicit Waker.wake from any thread. Doers that poll
+escrows use a Backoff to skip the scan until the database they depend on
+changes or the backoff delay expires.
+"""
+import select
+import socket
+import time
+from collections import deque
+from dataclasses import dataclass
+
+from hio.base import doing
+from hio.help import decking
+
+from .. import help
+from ..db import dbing
+
+logger = help.ogler.getLogger()
+
+
+def txnids(dbs):
+    """ Returns tuple of last committed transaction ids of LMDBers dbs """
+    return tuple(db.txnid for db in dbs)
+
+
+class Waker:
+    """
+    Waker is a thread safe wake up signal for a Scheduler waiting while idle
+
+    Attributes:
+        gen (int): generation count incremented on each wake
+
+    """
+
+    def __init__(self):
+        """ Initialize instance """
+        self.gen = 0
+        self.rx, self.tx = socket.socketpair()
+        self.rx.setblocking(False)
+        self.tx.setblocking(False)
+
+    def wake(self):
+        """ Signals that there is work to do. Safe to call from any thread. """
+        self.gen += 1
+        try:
+            self.tx.send(b"\x00")
+        except OSError:  # buffer full so already pending or closed
+            pass
+
+    def wait(self, timeout, readers=(), writers=()):
+        """ Waits up to timeout seconds for a wake or for any of the sockets in
+        readers to be readable or in writers to be writable
+
+        Returns:
+            bool: True if woken or a socket is ready, False if timed out
+
+        Parameters:
+            timeout (float): max seconds to wait
+            readers (iterable): of sockets to wait on for incoming data
+            writers (iterable): of sockets to wait on for send buffer space
+        """
+        readers = [s for s in readers if s is not None and s.fileno() >= 0]
+        writers = [s for s in writers if s is not None and s.fileno() >= 0]
+        try:
+            rs, ws, _ = select.select([self.rx] + readers, writers, [], max(0.0, timeout))
+        except (OSError, ValueError):  # socket closed under us so just poll again
+            return True
+
+        if self.rx in rs:
+            self.drain()
+        return bool(rs or ws)
+
+    def drain(self):
+        """ Clears any pending wake bytes """
+        try:
+            while self.rx.recv(4096):
+                pass
+        except OSError:
+            pass
+
+    def close(self):
+        """ Closes wake socket pair """
+        self.rx.close()
+        self.tx.close()
+
+
+class WakeDeck(decking.Deck):
+    """
+    WakeDeck is a Deck that wakes its .waker on each append so a Scheduler
+    waiting while idle runs its doers at once when another thread queues work
+
+    Attributes:
+        waker (Waker | None): wake up signal of Scheduler
+
+    """
+
+    def __init__(self, iterable=(), maxlen=None, waker=None):
+        """ Initialize instance
+
+        Parameters:
+            iterable (Iterable): initial elements
+            maxlen (int | None): max number of elements
+            waker (Waker | None): wake up signal of Scheduler
+        """
+        super(WakeDeck, self).__init__(iterable, maxlen)
+        self.waker = waker
+
+    def append(self, elem):
+        super(WakeDeck, self).append(elem)
+        if self.waker is not None:
+            self.waker.wake()
+
+    def appendleft(self, elem):
+        super(WakeDeck, self).appendleft(elem)
+        if self.waker is not None:
+            self.waker.wake()
+
+    def extend(self, iterable):
+        super(WakeDeck, self).extend(iterable)
+        if self.waker is not None:
+            self.waker.wake()
+
+
+class Backoff:
+    """
+    Backoff gates periodic work such as escrow processing on changes to the
+    databases it depends on. The work is due when any of .dbs has committed a
+    write transaction since the last run or else when the backoff delay has
+    expired. The delay resets when a run changed a database and otherwise
+    grows exponentially from .low up to .high.
+
+    Usage:
+        backoff = Backoff(dbs=[hby.db])
+        while True:
+            if backoff.due(self.tyme):
+                kvy.processEscrows()
+                backoff.done(self.tyme)
+            yield self.tock
+
+    Attributes:
+        dbs (list): of LMDBer whose commits mean there may be new work
+        low (float): min delay in seconds after an idle run
+        high (float): max delay in seconds after successive idle runs
+        factor (float): growth factor of delay per idle run
+        delay (float): current delay in seconds
+        retyme (float | None): tyme when next due regardless of changes
+
+    """
+
+    def __init__(self, dbs=None, low=0.03125, high=1.0, factor=2.0):
+        """ Initialize instance
+
+        Parameters:
+            dbs (Iterable): of LMDBer whose commits mean there may be new work
+            low (float): min delay in seconds after an idle run
+            high (float): max delay in seconds after successive idle runs
+            factor (float): growth factor of delay per idle run
+
+        """
+        self.dbs = [db for db in dbs if db is not None] if dbs is not None else []
+        self.low = low
+        self.high = max(low, high)
+        self.factor = factor
+        self.delay = 0.0
+        self.retyme = None
+        self.marks = None
+
+    def due(self, tyme):
+        """ Returns True if work is due at tyme
+
+        Parameters:
+            tyme (float): current tyme of doer
+        """
+        marks = txnids(self.dbs)
+        if self.retyme is None or tyme >= self.retyme or marks != self.marks:
+            self.marks = marks
+            return True
+        return False
+
+    def done(self, tyme, busy=False):
+        """ Records end of a run at tyme and schedules the next one
+
+        Parameters:
+            tyme (float): current tyme of doer
+            busy (bool): True means run made progress even if no db changed
+        """
+        marks = txnids(self.dbs)
+        if busy or marks != self.marks:  # run changed something so go again asap
+            self.delay = 0.0
+        else:
+            self.delay = min(self.high, max(self.low, self.delay * self.factor))
+        self.marks = marks
+        self.retyme = tyme + self.delay
+
+    def reset(self):
+        """ Makes work due on next check """
+        self.retyme = None
+
+
+@dataclass
+class Account:
+    """
+    Account of run time used by one doer
+
+    Attributes:
+        runs (int): number of times doer was run
+        cpu (float): process CPU seconds spent in doer
+        wall (float): wall clock seconds spent in doer
+    """
+    runs: int = 0
+    cpu: float = 0.0
+    wall: float = 0.0
+
+
+class Probe:
+    """
+    Probe finds the sources of work in a tree of doers and caches them so
+    they are only looked up again when the set of doers in the tree changes.
+
+    Sources are sockets of hio tcp and http servers and clients held as
+    .server or .client, LMDBers held as .db or .reger or by a .hby, .habery
+    or .hab, and in memory queues (deques such as Decks) held by a doer or by
+    one of its attributes.
+
+    Attributes:
+        doers (list): of doers as given to Doist
+        dbs (list): of LMDBer found in tree
+        decks (list): of deque found in tree
+
+    """
+
+    def __init__(self, doers):
+        """ Initialize instance
+
+        Parameters:
+            doers (list): of doers as given to Doist
+        """
+        self.doers = doers
+        self.servers = []
+        self.clients = []
+        self.dbs = []
+        self.decks = []
+        self.key = None
+
+    @staticmethod
+    def tree(doers):
+        """ Returns list of doers in tree of doers walking DoDoers """
+        found = []
+        seen = set()
+        stack = list(doers)
+        while stack:
+            doer = stack.pop()
+            if id(doer) in seen:
+                continue
+            seen.add(id(doer))
+            found.append(doer)
+            if isinstance(doer, doing.DoDoer):
+                stack.extend(doer.doers)
+        return found
+
+    def refresh(self):
+        """ Looks up sources again when the set of doers in the tree changed """
+        doers = self.tree(self.doers)
+        key = tuple(id(doer) for doer in doers)
+        if key == self.key:
+            return
+        self.key = key
+
+        servers, clients, dbs, decks = [], [], {}, {}
+        for doer in doers:
+            if (server := getattr(doer, "server", None)) is not None:
+                servers.append(server)
+            if (client := getattr(doer, "client", None)) is not None:
+                clients.append(client)
+
+            for name in ("db", "reger"):
+                db = getattr(doer, name, None)
+                if isinstance(db, dbing.LMDBer):
+                    dbs[id(db)] = db
+            for name in ("hby", "habery", "hab"):
+                db = getattr(getattr(doer, name, None), "db", None)
+                if isinstance(db, dbing.LMDBer):
+                    dbs[id(db)] = db
+
+            for name, val in getattr(doer, "__dict__", {}).items():
+                if name == "deeds":  # DoDoer schedule not work
+                    continue
+                if isinstance(val, deque):
+                    decks[id(val)] = val
+                elif hasattr(val, "__dict__") and not callable(val):
+                    for item in val.__dict__.values():
+                        if isinstance(item, deque):
+                            decks[id(item)] = item
+
+        self.servers, self.clients = servers, clients
+        self.dbs, self.decks = list(dbs.values()), list(decks.values())
+
+    def sockets(self):
+        """ Returns tuple (readers, writers, busy) of sockets of cached servers
+        and clients and whether any of them has outgoing or in process work """
+        readers, writers = [], []
+        busy = False
+        for server in self.servers:
+            if hasattr(server, "servant"):  # http server wraps tcp server
+                if hasattr(server, "idle") and not server.idle():
+                    busy = True
+                server = server.servant
+            if getattr(server, "ss", None) is not None:
+                readers.append(server.ss)
+            for ix in list(getattr(server, "ixes", {}).values()):
+                readers.append(ix.cs)
+                if ix.txbs:
+                    writers.append(ix.cs)
+
+        for client in self.clients:
+            if hasattr(client, "connector"):  # http client wraps tcp client
+                if client.requests:
+                    busy = True
+                client = client.connector
+            if getattr(client, "cs", None) is not None:
+                readers.append(client.cs)
+                if client.txbs or not getattr(client, "connected", True):
+                    writers.append(client.cs)
+
+        return readers, writers, busy
+
+    def sizes(self):
+        """ Returns tuple of lengths of cached in memory queues """
+        return tuple(len(deck) for deck in self.decks)
+
+
+class Scheduler(doing.Doist):
+    """
+    Scheduler is a Doist that idles adaptively in real time and accounts for
+    the CPU used by each of its doers.
+
+    After a pass over its doers in which nothing happened, no Waker.wake, no
+    database commit, no change to an in memory queue of its doers and no
+    pending socket work, the Scheduler waits longer before the next pass,
+    doubling from .tock up to .idle seconds. The wait ends at once when
+    .waker is woken or a socket of a hio server or client in its doer tree
+    becomes ready, and the next pass runs at full speed. Queues appended from
+    other threads wake the wait when they are a WakeDeck of .waker.
+
+    In real mode .tyme follows the monotonic clock so doers see correct
+    elapsed times across long idle waits. When not real the Scheduler runs
+    like a simulated Doist.
+
+    Attributes:
+        idle (float): max seconds to wait between passes while idle
+        waker (Waker): wake up signal, may be shared with other threads
+        accounts (dict): of Account keyed by doer name
+        pause (float): current wait between passes in seconds
+
+    """
+
+    def __init__(self, idle=1.0, waker=None, **kwa):
+        """ Initialize instance
+
+        Parameters:
+            idle (float): max seconds to wait between passes while idle
+            waker (Waker): optional shared wake up signal
+            kwa (dict): Doist parameters tock, real, limit, doers
+
+        """
+        super(Scheduler, self).__init__(**kwa)
+        self.idle = max(self.tock, idle)
+        self.waker = waker if waker is not None else Waker()
+        self.accounts = dict()
+        self.pause = self.tock
+        self.probe = None
+        self.began = None  # monotonic time last pass began, None before first
+        self.start = None  # monotonic time of .tyme zero
+        self.gen = None  # waker generation when last pass began
+        self.sizes = None  # queue lengths when last pass began
+        self.marks = None  # db transaction ids when last idle
+
+    def enter(self, doers=None):
+        """ Same as Doist.enter but runs each dog under .accounted. When
+        entering .doers also readies the idle wait state for a new run.
+
+        Parameters:
+            doers (list): see Doist.enter
+        """
+        if doers is None:
+            self.probe = Probe(self.doers)
+            self.began = None
+            self.start = time.monotonic() - self.tyme
+            count = len(self.deeds)  # deeds appended by enter are new
+        else:
+            count = 0
+
+        deeds = super(Scheduler, self).enter(doers=doers)
+        for i in range(count, len(deeds)):
+            dog, retyme, doer = deeds[i]
+            dog = self.accounted(dog, doer)
+            next(dog)  # advance to first yield as already entered
+            deeds[i] = (dog, retyme, doer)
+        return deeds
+
+    def accounted(self, dog, doer):
+        """ Returns generator that runs dog adding the time used by each run
+        of doer to .accounts """
+        tock = None
+        try:
+            while True:
+                tyme = yield tock
+                cpu, wall = time.process_time(), time.perf_counter()
+                try:
+                    tock = dog.send(tyme)
+                except StopIteration as ex:
+                    return ex.value
+                finally:
+                    self.account(doer, time.process_time() - cpu, time.perf_counter() - wall)
+        finally:
+            dog.close()  # forced exit of dog when closed
+
+    def recur(self, deeds=None):
+        """ Same as Doist.recur but in real mode first waits out the rest of
+        the idle pause after the last pass
+
+        Parameters:
+            deeds (deque): see Doist.recur
+        """
+        if self.real and self.probe is not None:
+            if self.began is not None:
+                self.rest()
+                self.tyme = max(self.tyme, time.monotonic() - self.start)
+            self.probe.refresh()
+            self.began = time.monotonic()
+            self.gen = self.waker.gen
+            self.sizes = self.probe.sizes()
+
+        super(Scheduler, self).recur(deeds=deeds)
+
+    def rest(self):
+        """ Waits out the rest of the current pause after the last pass began.
+        Backs off when the last pass found no work. """
+        readers, writers, busy = self.probe.sockets()
+        busy = busy or self.gen != self.waker.gen or self.sizes != self.probe.sizes()
+        if not busy:  # only ask dbs when nothing else shows work
+            marks = txnids(self.probe.dbs)
+            busy = marks != self.marks
+            self.marks = marks
+
+        self.wait(self.began, busy, readers, writers)
+
+    def wait(self, began, busy, readers=(), writers=()):
+        """ Waits out the rest of the current pause after pass began
+
+        Parameters:
+            began (float): monotonic time pass began
+            busy (bool): True means last pass did work so do not back off
+            readers (list): of sockets whose incoming data ends the wait
+            writers (list): of sockets whose writability ends the wait
+        """
+        if busy:
+            self.pause = self.tock
+        else:
+            self.pause = min(self.idle, self.pause * 2)
+
+        remaining = began + self.pause - time.monotonic()
+        if remaining <= 0.0:
+            return
+
+        if busy:  # keep to tock, wakes only matter when idle
+            time.sleep(remaining)
+        elif self.waker.wait(remaining, readers=readers, writers=writers):
+            self.pause = self.tock  # woken so work is coming
+
+    def account(self, doer, cpu, wall):
+        """ Adds one run of doer using cpu and wall seconds to .accounts """
+        name = getattr(doer, "__qualname__", None) or type(doer).__qualname__
+        acct = self.accounts.get(name)
+        if acct is None:
+            acct = self.accounts[name] = Account()
+        acct.runs += 1
+        acct.cpu += cpu
+        acct.wall += wall
+
+    def exit(self, deeds=None):
+        """ Exits all deeds then logs CPU accounts """
+        super(Scheduler, self).exit(deeds=deeds)
+        for name, acct in sorted(self.accounts.items(), key=lambda item: item[1].cpu,
+                                 reverse=True):
+            logger.debug("Scheduler doer %s: runs=%d cpu=%.3fs wall=%.3fs", name,
+                         acct.runs, acct.cpu, acct.wall)
@@ -4,15 +4,19 @@ keri.app.signaling module
 
 """
 import datetime
+import heapq
+import itertools
+import threading
 import time
+from collections import OrderedDict
 
-import falcon
 from hio.base import doing
-from hio.help import decking
 
 from keri.core import coring
 from keri.help import helping
 
+falcon = helping.lazyModule("falcon")  # web stack imported on first use
+
 
 def signal(attrs, topic, ckey=None, dt=None):
     """
@@ -87,6 +91,170 @@ class Signal(coring.Dicter):
         return None
 
 
+class Signals:
+    """
+    Signals is a FIFO queue of signals indexed by collapse key with a timing
+    wheel of expiry deadlines.
+
+    Pushing a signal with the collapse key of a queued signal replaces that
+    signal in place in O(1). Each signal gets a monotonic deadline once when
+    queued and is put in the wheel bucket of its deadline, so expiring old
+    signals only visits the buckets that are due instead of parsing the
+    datetime of every queued signal on every pass.
+
+    Supports the parts of the Deck interface used for signals: append,
+    popleft, clear, len, truthiness, iteration and indexing. Thread safe so a
+    threaded HTTP server can wait for new signals.
+
+    Attributes:
+        timeout (float): seconds after which a signal expires
+        resolution (float): seconds of time spanned by each wheel bucket
+        waker (Waker | None): optional scheduling.Waker woken on each append
+
+    """
+
+    def __init__(self, timeout=600.0, resolution=1.0, waker=None):
+        """ Initialize instance
+
+        Parameters:
+            timeout (float): seconds after which a signal expires
+            resolution (float): seconds of time spanned by each wheel bucket
+            waker (Waker | None): optional wake up signal of Scheduler
+
+        """
+        self.timeout = timeout
+        self.resolution = resolution
+        self.waker = waker
+        self.cond = threading.Condition()
+        self.seq = 0  # sequence number of last queued signal
+        self.queue = OrderedDict()  # seq to (signal, deadline) in FIFO order
+        self.ckeys = dict()  # collapse key to seq
+        self.wheel = dict()  # bucket to list of (seq, deadline)
+        self.buckets = []  # heap of bucket numbers in wheel
+
+    def __len__(self):
+        return len(self.queue)
+
+    def __bool__(self):
+        return bool(self.queue)
+
+    def __iter__(self):
+        with self.cond:
+            return iter([sig for sig, _ in self.queue.values()])
+
+    def __getitem__(self, index):
+        with self.cond:
+            if index < 0:
+                index += len(self.queue)
+            if not 0 <= index < len(self.queue):
+                raise IndexError("signal index out of range")
+            return next(itertools.islice(self.queue.values(), index, None))[0]
+
+    def append(self, sig, age=0.0):
+        """ Queues sig or replaces in place the queued signal with same collapse key
+
+        Parameters:
+            sig (Signal): signal to queue
+            age (float): seconds since signal was created
+        """
+        deadline = time.monotonic() - age + self.timeout
+        with self.cond:
+            seq = self.ckeys.get(sig.ckey) if sig.ckey is not None else None
+            if seq is None:
+                self.seq += 1
+                seq = self.seq
+                if sig.ckey is not None:
+                    self.ckeys[sig.ckey] = seq
+            self.queue[seq] = (sig, deadline)  # replacing keeps position
+
+            bucket = int(deadline // self.resolution)
+            if bucket not in self.wheel:
+                self.wheel[bucket] = []
+                heapq.heappush(self.buckets, bucket)
+            self.wheel[bucket].append((seq, deadline))
+            self.cond.notify_all()
+
+        if self.waker is not None:
+            self.waker.wake()
+
+    def popleft(self):
+        """ Returns oldest queued signal. Raises IndexError when empty """
+        with self.cond:
+            if not self.queue:
+                raise IndexError("pop from empty signals")
+            _, (sig, _) = self.queue.popitem(last=False)
+            if sig.ckey is not None:
+                self.ckeys.pop(sig.ckey, None)
+            return sig
+
+    def clear(self):
+        """ Removes all signals """
+        with self.cond:
+            self.queue.clear()
+            self.ckeys.clear()
+            self.wheel.clear()
+            self.buckets.clear()
+
+    def expire(self, now=None):
+        """ Removes signals past their deadline and returns how many
+
+        Parameters:
+            now (float | None): monotonic time, None means current time
+        """
+        now = now if now is not None else time.monotonic()
+        current = int(now // self.resolution)
+        count = 0
+        with self.cond:
+            while self.buckets and self.buckets[0] <= current:
+                bucket = self.buckets[0]
+                entries = self.wheel[bucket]
+                keep = []
+                for seq, deadline in entries:
+                    entry = self.queue.get(seq)
+                    if entry is None or entry[1] != deadline:  # popped or replaced
+                        continue
+                    if deadline > now:  # due later in current bucket
+                        keep.append((seq, deadline))
+                        continue
+                    sig, _ = self.queue.pop(seq)
+                    if sig.ckey is not None:
+                        self.ckeys.pop(sig.ckey, None)
+                    count += 1
+
+                if keep:
+                    self.wheel[bucket] = keep
+                    break
+                del self.wheel[bucket]
+                heapq.heappop(self.buckets)
+
+            # wheel entries of popped or replaced signals are dropped when due
+            # so compact when the wheel outgrows the queue
+            if len(self.buckets) > 2 * len(self.queue) + 64:
+                self._rebuild()
+
+        return count
+
+    def _rebuild(self):
+        """ Rebuilds wheel from queued signals """
+        self.wheel.clear()
+        for seq, (_, deadline) in self.queue.items():
+            self.wheel.setdefault(int(deadline // self.resolution), []).append((seq, deadline))
+        self.buckets = list(self.wheel)
+        heapq.heapify(self.buckets)
+
+    def wait(self, timeout):
+        """ Blocks up to timeout seconds until there are signals
+
+        Returns:
+            bool: True if there are signals
+
+        Parameters:
+            timeout (float): max seconds to wait
+        """
+        with self.cond:
+            return self.cond.wait_for(lambda: bool(self.queue), timeout=timeout)
+
+
 class Signaler(doing.DoDoer):
     """ Class for sending signals to the controller of an agent.
 
@@ -96,12 +264,15 @@ class Signaler(doing.DoDoer):
 
     SignalTimeout = datetime.timedelta(minutes=10)
 
-    def __init__(self, signals=None):
+    def __init__(self, signals=None, waker=None):
         """
 
         Parameters:
+            signals (Signals): optional shared signal queue
+            waker (Waker): optional wake up signal of Scheduler for new signals
         """
-        self.signals = signals if signals is not None else decking.Deck()
+        self.signals = signals if signals is not None else Signals(
+            timeout=self.SignalTimeout.total_seconds(), waker=waker)
         doers = [doing.doify(self.expireDo)]
         super(Signaler, self).__init__(doers=doers)
 
@@ -117,16 +288,19 @@ class Signaler(doing.DoDoer):
         Returns:
 
         """
-        dt = dt if dt is not None else datetime.datetime.now()
+        now = datetime.datetime.now()
+        dt = dt if dt is not None else now
         sig = signal(attrs=attrs, topic=topic, ckey=ckey, dt=dt)
 
-        if sig.ckey is not None:
-            for i, s in enumerate(self.signals):
-                if s.ckey == sig.ckey:
-                    self.signals[i] = sig
-                    return
+        age = 0.0
+        if dt is not now:  # backdated so expires early
+            if not hasattr(dt, "isoformat"):
+                dt = helping.fromIso8601(dt)
+            if dt.tzinfo is not None:
+                now = datetime.datetime.now(dt.tzinfo)
+            age = (now - dt).total_seconds()
 
-        self.signals.append(sig)
+        self.signals.append(sig, age=age)
 
     def expireDo(self, tymth=None, tock=0.0):
         """
@@ -145,31 +319,24 @@ class Signaler(doing.DoDoer):
         self.tock = tock
         _ = (yield self.tock)
 
-        while True:  # loop checking for expired messages
-            now = datetime.datetime.now()
-            toRemove = []
-            for sig in self.signals:
-                if now - helping.fromIso8601(sig.dt) > self.SignalTimeout:  # Expire messages that are too old
-                    toRemove.append(sig)
-                yield self.tock
-
-            for sig in toRemove:
-                self.signals.remove(sig)
-
+        while True:  # expire due wheel buckets, nothing to do until next is due
+            self.signals.expire()
             yield self.tock
 
 
-def loadEnds(app, *, signals=None):
+def loadEnds(app, *, signals=None, wait=0.0):
     """ Load endpoints for agent to controller messages
 
     Args:
         app (falcon.App): falcon.App to register handlers with:
-        signals (Deck): messages for the mailbox stream
+        signals (Signals): messages for the mailbox stream
+        wait (float): seconds an event stream blocks waiting for new signals,
+            only for threaded HTTP servers, 0.0 means return at once
 
     Returns:
 
     """
-    sigEnd = SignalsEnd(signals=signals)
+    sigEnd = SignalsEnd(signals=signals, wait=wait)
     app.add_route("/mbx", sigEnd)
     return sigEnd
 
@@ -183,18 +350,18 @@ class SignalsEnd:
     This also handles `req`, `exn` and `tel` messages that respond with a KEL replay.
     """
 
-    def __init__(self, signals=None):
+    def __init__(self, signals=None, wait=0.0):
         """
         Create the MBX HTTP server from the Habitat with an optional Falcon App to
         register the routes with.
 
         Parameters
-             rxbs (bytearray): output queue of bytes for message processing
-             mbx (Mailboxer): Mailbox storage
-             qrycues (Deck): inbound qry response queues
+             signals (Signals): signals to stream
+             wait (float): seconds an event stream blocks waiting for new signals
 
         """
-        self.signals = signals if signals is not None else decking.Deck()
+        self.signals = signals if signals is not None else Signals()
+        self.wait = wait
 
     def on_post(self, req, rep):
         """
@@ -225,8 +392,7 @@ class SignalsEnd:
 
         rep.set_header('Content-Type', "text/event-stream")
         rep.status = falcon.HTTP_200
-        print(f"get for {self.signals}")
-        rep.stream = SignalIterable(signals=self.signals)
+        rep.stream = SignalIterable(signals=self.signals, wait=self.wait)
 
     def on_get(self, req, rep):
         """
@@ -253,15 +419,26 @@ class SignalsEnd:
         rep.set_header('connection', "close")
         rep.set_header('Content-Type', "text/event-stream")
 
-        rep.stream = SignalIterable(signals=self.signals)
+        rep.stream = SignalIterable(signals=self.signals, wait=self.wait)
 
 
 class SignalIterable:
+    """
+    Iterable of server sent events of signals popped from signals for
+    TimeoutMBX seconds
+
+    When there are no signals and wait is positive each iteration blocks up
+    to wait seconds until a signal is pushed instead of returning an empty
+    chunk at once. Only use wait with HTTP servers that run each response in
+    its own thread since blocking stalls the single threaded hio servers.
+
+    """
     TimeoutMBX = 300
 
-    def __init__(self, signals, retry=5000):
+    def __init__(self, signals, retry=5000, wait=0.0):
         self.signals = signals
         self.retry = retry
+        self.wait = wait
 
     def __iter__(self):
         self.start = self.end = time.perf_counter()
@@ -273,15 +450,22 @@ class SignalIterable:
                 self.end = time.perf_counter()
                 return bytes(f"retry: {self.retry}\n\n".encode("utf-8"))
 
+            if not self.signals and self.wait > 0.0 and hasattr(self.signals, "wait"):
+                remaining = self.TimeoutMBX - (time.perf_counter() - self.start)
+                self.signals.wait(max(0.0, min(self.wait, remaining)))
+
             data = bytearray()
             while self.signals:
-                sig = self.signals.popleft()
+                try:
+                    sig = self.signals.popleft()
+                except IndexError:  # taken by another stream
+                    break
                 topic = sig.topic
                 if topic is not None:
                     data.extend(bytearray("id: {}\nretry: {}\nevent: {}\ndata: ".format(sig.rid, self.retry,
                                                                                         topic).encode("utf-8")))
                 else:
-                    data.extend(bytearray("id: {}\nretry: {}\ndata: ".format(sig.id, self.retry).encode(
+                    data.extend(bytearray("id: {}\nretry: {}\ndata: ".format(sig.rid, self.retry).encode(
                         "utf-8")))
 
                 data.extend(sig.raw)
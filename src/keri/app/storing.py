@@ -28,6 +28,7 @@ class Mailboxer(dbing.LMDBer):
     TailDirPath = "keri/mbx"
     AltTailDirPath = ".keri/mbx"
     TempPrefix = "keri_mbx_"
+    IoSetSubkeys = ((b'tpcs.', b'.'), )  # raw io set sub dbs with separator
 
     def __init__(self, name="mbx", headDirPath=None, reopen=True, **kwa):
         """
@@ -129,7 +130,7 @@ class Mailboxer(dbing.LMDBer):
             topic = topic.encode("utf-8")
 
         for (key, dig) in self.getIoSetItemsIter(self.tpcs, key=topic, ion=fn):
-            topic, ion = dbing.unsuffix(key)
+            topic, ion = self.unsuffix(key)
             if msg := self.msgs.get(keys=dig):
                 yield ion, topic, msg.encode("utf-8")
 
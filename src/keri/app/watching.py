@@ -5,8 +5,8 @@ keri.app.agenting module
 
 """
 import json
+from collections import namedtuple
 from math import ceil
-import falcon
 from hio.base import doing
 from hio.help import decking
 
@@ -14,9 +14,207 @@ from keri.app import keeping, agenting
 from keri.core import coring, eventing, parsing
 from .. import help, kering
 from ..end import ending
+from ..help import helping
+
+falcon = helping.lazyModule("falcon")  # web stack imported on first use
 
 logger = help.ogler.getLogger()
 
+Stateage = namedtuple("Stateage", 'even ahead behind duplicitous')
+
+States = Stateage(even="even", ahead="ahead", behind="behind", duplicitous="duplicitous")
+
+
+class WitnessState:
+    wit: str
+    state: Stateage
+    sn: int
+    dig: str
+
+
+def diffState(wit, preksn, witksn):
+    """ Returns WitnessState of key state notice witksn from witness wit
+    compared to local key state notice preksn
+
+    Parameters:
+        wit (str): qb64 identifier prefix of witness
+        preksn (Serder): local key state notice
+        witksn (Serder): key state notice received from witness
+    """
+    witstate = WitnessState()
+    witstate.wit = wit
+    mysn = preksn.sner.num
+    mydig = preksn.ked['d']
+    witstate.sn = coring.Number(num=witksn.ked["f"]).num
+    witstate.dig = witksn.ked['d']
+
+    # At the same sequence number, check the DIGs
+    if mysn == witstate.sn:
+        if mydig == witstate.dig:
+            witstate.state = States.even
+        else:
+            witstate.state = States.duplicitous
+
+    # This witness is behind and will need to be caught up.
+    elif mysn > witstate.sn:
+        witstate.state = States.behind
+
+    # mysn < witstate.sn - We are behind this witness (multisig or restore situation).
+    # Must ensure that controller approves this event or a recovery rotation is needed
+    else:
+        witstate.state = States.ahead
+
+    return witstate
+
+
+class KeyStateWatcher(doing.DoDoer):
+    """
+    Queries the key state of local AIDs from all of their witnesses at once and
+    compares it to the local key state.
+
+    One pooled witnesser per witness carries the ksn queries of every AID for
+    that witness. A query completes on the keyStateSaved cue of .kvy for its
+    (AID, witness) pair or times out after .witTimeout or when the whole round
+    passes .timeout. As soon as every witness of an AID is done a cue is
+    appended to .cues:
+
+        dict(kin="watched", pre=pre, states=[WitnessState], missing=[wit])
+
+    where missing are the witnesses that timed out or have no endpoint. With
+    .interval None the watcher runs one round, removes its witnessers and is
+    done. Otherwise it starts a new round .interval seconds after the last.
+
+    Attributes:
+        hby (Habery): habery of local AIDs
+        kvy (Kevery): Kevery of mailbox replies. Only consumes keyStateSaved
+            cues of its own queries and leaves all other cues for other consumers
+        pres (list | None): qb64 prefixes to watch, None means all local AIDs
+        timeout (float): max seconds of a round
+        witTimeout (float): max seconds to wait for a witness to respond
+        interval (float | None): seconds between rounds or None for one round
+        cues (Deck): of watched cues
+        witers (dict): pooled witnessers keyed by witness prefix
+
+    """
+
+    def __init__(self, hby, kvy, pres=None, timeout=60.0, witTimeout=10.0, interval=None,
+                 cues=None, **kwa):
+        self.hby = hby
+        self.kvy = kvy
+        self.pres = pres
+        self.timeout = timeout
+        self.witTimeout = witTimeout
+        self.interval = interval
+        self.cues = cues if cues is not None else decking.Deck()
+        self.witers = dict()
+        self.pending = dict()  # start tyme of query keyed by (pre, wit)
+        self.rounds = dict()  # states and missing of AID of round keyed by pre
+        self.late = set()  # (pre, wit) of timed out queries whose response is dropped
+
+        super(KeyStateWatcher, self).__init__(doers=[doing.doify(self.watchDo)], **kwa)
+
+    def witer(self, hab, wit):
+        """ Returns pooled witnesser of wit, creating it when needed """
+        if wit not in self.witers:
+            witer = agenting.witnesser(hab, wit)
+            self.witers[wit] = witer
+            self.extend([witer])
+        return self.witers[wit]
+
+    def start(self):
+        """ Sends ksn queries of all watched AIDs to all their witnesses """
+        pres = self.pres if self.pres is not None else list(self.hby.habs.keys())
+        now = self.tyme
+        for pre in pres:
+            hab = self.hby.habs[pre]
+            self.rounds[pre] = dict(states=[], missing=[], wits=list(hab.kever.wits))
+            for wit in hab.kever.wits:
+                try:
+                    witer = self.witer(hab, wit)
+                except kering.ConfigurationError as ex:
+                    logger.error("Watcher unable to query %s: %s", wit, ex.args[0])
+                    self.rounds[pre]["missing"].append(wit)
+                    continue
+                witer.msgs.append(bytearray(hab.query(pre=pre, src=wit, route="ksn")))
+                self.pending[(pre, wit)] = now
+            self.finish(pre)
+
+    def finish(self, pre):
+        """ Appends watched cue of pre once none of its queries are pending """
+        if pre not in self.rounds or any(key[0] == pre for key in self.pending):
+            return
+        rnd = self.rounds.pop(pre)
+        self.cues.append(dict(kin="watched", pre=pre, states=rnd["states"],
+                              missing=[wit for wit in rnd["wits"] if wit in rnd["missing"]]))
+
+    def complete(self, cue):
+        """ Records witness state of keyStateSaved cue of pending query if any.
+        Returns True when cue answers a query of this watcher else False """
+        serder = cue["serder"]
+        key = (serder.pre, cue.get("aid"))
+        if key in self.late:  # response of timed out query
+            self.late.discard(key)
+            return True
+        if key not in self.pending:
+            return False
+        del self.pending[key]
+        hab = self.hby.habs[serder.pre]
+        self.rounds[serder.pre]["states"].append(diffState(key[1], hab.kever.state(), serder))
+        self.finish(serder.pre)
+        return True
+
+    def consume(self):
+        """ Completes queries from keyStateSaved cues of .kvy and puts back all
+        other cues in order for other consumers of .kvy.cues """
+        for _ in range(len(self.kvy.cues)):
+            cue = self.kvy.cues.popleft()
+            if cue["kin"] == "keyStateSaved" and self.complete(cue):
+                continue
+            self.kvy.cues.append(cue)
+
+    def expire(self, start):
+        """ Times out pending queries past .witTimeout or round past .timeout """
+        now = self.tyme
+        late = now - start >= self.timeout
+        for (pre, wit), sent in list(self.pending.items()):
+            if late or now - sent >= self.witTimeout:
+                del self.pending[(pre, wit)]
+                self.late.add((pre, wit))
+                self.rounds[pre]["missing"].append(wit)
+                self.finish(pre)
+
+    def watchDo(self, tymth, tock=0.0, **opts):
+        """
+        Returns:  doifiable Doist compatible generator method that runs rounds
+        of queries and completes them from cues of .kvy
+        Usage:
+            add result of doify on this method to doers list
+        """
+        self.wind(tymth)
+        self.tock = tock
+        _ = (yield self.tock)
+
+        while True:
+            start = self.tyme
+            self.start()
+            while self.pending:
+                self.consume()
+                self.expire(start)
+                yield self.tock
+
+            if self.interval is None:
+                self.consume()  # late responses already in
+                break
+
+            while self.tyme - start < self.interval:
+                self.consume()  # late responses of finished round
+                yield self.tock
+            self.late.clear()  # new round queries again
+
+        self.remove(list(self.witers.values()))
+        self.witers = dict()
+        return True
+
 
 class KiwiServer(doing.DoDoer):
     """
@@ -5,6 +5,8 @@ keri.core.coring module
 """
 import re
 import json
+import math
+from functools import lru_cache
 from typing import Union
 from collections.abc import Iterable
 
@@ -14,8 +16,6 @@ from base64 import urlsafe_b64encode as encodeB64
 from base64 import urlsafe_b64decode as decodeB64
 from fractions import Fraction
 
-import cbor2 as cbor
-import msgpack
 import pysodium
 import blake3
 import hashlib
@@ -32,6 +32,9 @@ from ..kering import Versionage, Version
 from ..help import helping
 from ..help.helping import sceil, nonStringIterable
 
+cbor = helping.lazyModule("cbor2")  # serializers imported on first use
+msgpack = helping.lazyModule("msgpack")
+
 """
 ilk is short for message type
 icp = incept, inception
@@ -5112,9 +5115,21 @@ class Tholder:
         ._satisfy is method reference of threshold specified verification method
         ._satisfy_numeric is numeric threshold verification method
         ._satisfy_weighted is fractional weighted threshold verification method
-
+        ._lcd is int least common denominator of all weights when weighted else None
+        ._clauses is tuple of clause masks when weighted else None. Each entry
+            is tuple of (mask, pairs) where mask is int bitmask of the key
+            indices covered by the clause and pairs is tuple of (bit, weight)
+            of each non-zero weight in the clause scaled by ._lcd to an int.
+            A clause is satisfied when the sum of scaled weights of its
+            verified bits is at least ._lcd.
+
+    Weighted precomputation (scaled weights and bitmasks) and sith or limen
+    parsing are cached per distinct threshold expression so that Tholders
+    built repeatedly from the same serder fields (e.g. while reprocessing
+    escrows) share the work.
 
     """
+    CacheSize = 1024  # max distinct weighted threshold expressions cached
 
     def __init__(self, *, thold=None , limen=None, sith=None, **kwa):
         """
@@ -5253,8 +5268,8 @@ class Tholder:
             bexter = Bexter(raw=matter.raw, code=matter.code, **kwa)
             t = bexter.bext.replace('s', '/')
             # get clauses
-            thold = [clause.split('c') for clause in t.split('a')]
-            thold = [[self.weight(w) for w in clause] for clause in thold]
+            sith = tuple(tuple(clause.split('c')) for clause in t.split('a'))
+            thold = [list(clause) for clause in self._weights(sith)]
             self._processWeighted(thold=thold)
 
         else:
@@ -5312,11 +5327,9 @@ class Tholder:
 
 
             # replace weight str expression, int str or fractional strings with
-            # int or fraction as appropriate.
-            thold = []
-            for clause in sith:  # convert string fractions to Fractions
-                # append list of weights converted fromnn str expression
-                thold.append([self.weight(w) for w in clause])
+            # int or fraction as appropriate. Cached per distinct sith.
+            sith = tuple(tuple(clause) for clause in sith)
+            thold = [list(clause) for clause in self._weights(sith)]
 
             self._processWeighted(thold=thold)
 
@@ -5337,6 +5350,8 @@ class Tholder:
         self._satisfy = self._satisfy_numeric
         self._number = Number(num=thold)
         self._bexter = None
+        self._lcd = None
+        self._clauses = None
 
 
     def _processWeighted(self, thold=[]):
@@ -5348,22 +5363,76 @@ class Tholder:
                 rational number fraction strings  >= 0 and <= 1
 
         """
+        size, lcd, clauses, bext = self._weighting(tuple(tuple(clause)
+                                                         for clause in thold))
+        self._thold = thold
+        self._weighted = True
+        self._size = size
+        self._satisfy = self._satisfy_weighted
+        self._lcd = lcd
+        self._clauses = clauses
+        self._number = None
+        self._bexter = Bexter(bext=bext)
+
+
+    @staticmethod
+    @lru_cache(maxsize=CacheSize)
+    def _weights(sith: tuple) -> tuple:
+        """Returns tuple of tuples of weights converted from sith weight str
+        expressions. Cached so identical sith expressions are parsed only once.
+
+        Parameters:
+            sith (tuple): tuple of tuples of weight str expressions one per clause
+        """
+        return tuple(tuple(Tholder.weight(w) for w in clause) for clause in sith)
+
+
+    @staticmethod
+    @lru_cache(maxsize=CacheSize)
+    def _weighting(thold: tuple) -> tuple:
+        """Returns tuple (size, lcd, clauses, bext) precomputed from weighted
+        thold else raises ValueError when any clause weight sum is < 1.
+        Cached so identical weighted thresholds are precomputed only once.
+
+        Returns:
+            size (int): number of weights over all clauses
+            lcd (int): least common denominator of all weights
+            clauses (tuple): of (mask, pairs) per clause. mask is int bitmask of
+                key indices in clause. pairs is tuple of (bit, weight) with
+                weight the int numerator scaled by lcd. Zero weights are dropped.
+            bext (str): Bexter bext of thold for limen
+
+        Parameters:
+            thold (tuple): tuple of tuples of weights (int or Fraction) one per clause
+        """
         for clause in thold:  # sum of fractions in clause must be >= 1
             if not (sum(clause) >= 1):
-                raise ValueError(f"Invalid sith clause = {thold}, all "
+                raise ValueError(f"Invalid sith clause = "
+                                 f"{[list(c) for c in thold]}, all "
                                  f"clause weight sums must be >= 1.")
 
-        self._thold = thold
-        self._weighted = True
-        self._size = sum(len(clause) for clause in thold)
-        self._satisfy = self._satisfy_weighted
+        lcd = math.lcm(*(Fraction(w).denominator for clause in thold
+                                                    for w in clause))
+        clauses = []
+        wio = 0  # weight index offset
+        for clause in thold:
+            mask = 0
+            pairs = []
+            for w in clause:
+                bit = 1 << wio
+                mask |= bit
+                if w:  # zero weight never contributes so skip it
+                    pairs.append((bit, int(w * lcd)))
+                wio += 1
+            clauses.append((mask, tuple(pairs)))
+
         # make bext str of thold for .bexter for limen
         bext = [[f"{f.numerator}s{f.denominator}" if (0 < f < 1) else f"{int(f)}"
                                            for f in clause]
                                                            for clause in thold]
         bext = "a".join(["c".join(clause) for clause in bext])
-        self._number = None
-        self._bexter = Bexter(bext=bext)
+
+        return (wio, lcd, tuple(clauses), bext)
 
 
     @staticmethod
@@ -5449,20 +5518,25 @@ class Tholder:
             if not indices:  # empty indices
                 return False
 
-            # remove duplicates with set, sort low to high
-            indices = sorted(set(indices))
-            sats = [False] * self.size  # default all satifactions to False
+            # bitmask of verified signature indices, duplicates collapse
+            sats = 0
             for idx in indices:
-                sats[idx] = True  # set verified signature index to True
+                if not 0 <= idx < self._size:  # index not in key list
+                    return False
+                sats |= 1 << idx
 
-            wio = 0  # weight index offset
-            for clause in self.thold:
-                cw = 0  # init clause weight
-                for w in clause:
-                    if sats[wio]:  # verified signature so weight applies
+            lcd = self._lcd
+            for mask, pairs in self._clauses:
+                verified = sats & mask
+                if not verified:  # no weight applies so clause sum is 0
+                    return False
+                if verified == mask:  # all weights apply and clause sum >= 1
+                    continue
+                cw = 0  # init scaled clause weight
+                for bit, w in pairs:
+                    if verified & bit:  # verified signature so weight applies
                         cw += w
-                    wio += 1
-                if cw < 1:  # each clause must sum to at least 1
+                if cw < lcd:  # each clause must sum to at least 1
                     return False
 
             return True  # all clauses including final one cw >= 1
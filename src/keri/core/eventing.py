@@ -6,6 +6,7 @@ keri.core.eventing module
 import datetime
 import json
 import logging
+import time
 from collections import namedtuple
 from dataclasses import dataclass, astuple
 from urllib.parse import urlsplit
@@ -21,7 +22,7 @@ from .. import help
 from .. import kering
 from ..db import basing, dbing
 from ..db.dbing import dgKey, snKey, fnKey, splitKeySN, splitKey
-from ..help import helping
+from ..help import helping, metering
 from ..kering import (MissingEntryError,
                       ValidationError, MissingSignatureError,
                       MissingWitnessSignatureError, UnverifiedReplyError,
@@ -445,7 +446,7 @@ def validateSN(sn, inceptive=None):
     return sn
 
 
-def verifySigs(raw, sigers, verfers):
+def verifySigs(raw, sigers, verfers, verified=None):
     """
     Returns tuple of (vsigers, vindices) where:
         vsigers is list  of unique verified sigers with assigned verfer
@@ -460,6 +461,10 @@ def verifySigs(raw, sigers, verfers):
         raw (bytes) signed data
         sigers is list of indexed Siger instances (signatures)
         verfers is list of Verfer instance (public keys)
+        verified (set | None): of (verfer.qb64b, siger.raw, raw) triples of
+            signatures already verified elsewhere such as by sharded workers.
+            A matching signature is accepted without verifying again and its
+            triple is removed from verified.
 
     """
     if sigers is None:
@@ -482,6 +487,14 @@ def verifySigs(raw, sigers, verfers):
     vindices = []
     vsigers = []
     for siger in usigers:
+        if verified:
+            triple = (siger.verfer.qb64b, siger.raw, bytes(raw))
+            if triple in verified:
+                verified.discard(triple)
+                vindices.append(siger.index)
+                vsigers.append(siger)
+                continue
+
         if siger.verfer.verify(siger.raw, raw):
             vindices.append(siger.index)
             vsigers.append(siger)
@@ -1223,6 +1236,19 @@ def query(route="",
     return Serder(ked=ked)  # return serialized ked
 
 
+def mailboxConsent(signer, src, stamp):
+    """
+    Returns bytes an identifier signs to consent to the streaming of its
+    mailbox to a multiplexed mbx query signed by another identifier
+
+    Parameters:
+        signer (str): qb64 identifier prefix of signer of query
+        src (str): qb64 identifier prefix of witness or mailbox queried
+        stamp (str): date-time-stamp of query message
+    """
+    return f"{signer}.{src}.{stamp}".encode("utf-8")
+
+
 def reply(route="",
           data=None,
           stamp=None,
@@ -1580,7 +1606,7 @@ class Kever:
     def __init__(self, *, state=None, serder=None, sigers=None, wigers=None,
                  db=None, estOnly=None, seqner=None, saider=None, firner=None, dater=None,
                  cues=None, prefixes=None, local=False,
-                 check=False):
+                 check=False, verified=None):
         """
         Create incepting kever and state from inception serder
         Verify incepting serder against sigers raises ValidationError if not
@@ -1619,6 +1645,8 @@ class Kever:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+            verified (set | None): of (verfer.qb64b, siger.raw, raw) triples of
+                signatures already verified. See verifySigs
         """
         if not (state or (serder and sigers)):
             raise ValueError("Missing required arguments. Need state or serder"
@@ -1665,7 +1693,8 @@ class Kever:
                                                         toader=self.toader,
                                                         wits=self.wits,
                                                         seqner=seqner,
-                                                        saider=saider)
+                                                        saider=saider,
+                                                        verified=verified)
 
         self.delegator = delegator
         if self.delegator is None:
@@ -1871,7 +1900,7 @@ class Kever:
 
 
     def update(self, serder, sigers, wigers=None, seqner=None, saider=None,
-               firner=None, dater=None, check=False):
+               firner=None, dater=None, check=False, verified=None):
         """
         Not an inception event. Verify event serder and indexed signatures
         in sigers and update state
@@ -1899,6 +1928,8 @@ class Kever:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+            verified (set | None): of (verfer.qb64b, siger.raw, raw) triples of
+                signatures already verified. See verifySigs
 
         """
         if not self.transferable:  # not transferable so no events after inception allowed
@@ -1941,7 +1972,8 @@ class Kever:
                                                             toader=toader,
                                                             wits=wits,
                                                             seqner=seqner,
-                                                            saider=saider)
+                                                            saider=saider,
+                                                            verified=verified)
 
 
             # move this out of here to where ntholder threshold is verified
@@ -2046,7 +2078,8 @@ class Kever:
                                                             tholder=self.tholder,
                                                             wigers=wigers,
                                                             toader=self.toader,
-                                                            wits=self.wits)
+                                                            wits=self.wits,
+                                                            verified=verified)
 
             # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
             # all validated above so may add to KEL and FEL logs as first seen
@@ -2205,7 +2238,8 @@ class Kever:
         return tholder, toader, wits, cuts, adds
 
     def valSigsDelWigs(self, serder, sigers, verfers, tholder,
-                       wigers, toader, wits, seqner=None, saider=None):
+                       wigers, toader, wits, seqner=None, saider=None,
+                       verified=None):
         """
         Returns triple (sigers, delegator, wigers) where:
         sigers is unique validated signature verified members of inputed sigers
@@ -2234,6 +2268,8 @@ class Kever:
                 If this event is not delegated then seqner is ignored
             saider is Saider instance of of delegating event said.
                 If this event is not delegated then saider is ignored
+            verified (set | None): of (verfer.qb64b, siger.raw, raw) triples of
+                signatures already verified. See verifySigs
 
         """
         if len(verfers) < tholder.size:
@@ -2243,13 +2279,15 @@ class Kever:
                                             serder.ked))
 
         # get unique verified sigers and indices lists from sigers list
-        sigers, indices = verifySigs(raw=serder.raw, sigers=sigers, verfers=verfers)
+        sigers, indices = verifySigs(raw=serder.raw, sigers=sigers, verfers=verfers,
+                                     verified=verified)
         # sigers  now have .verfer assigned
 
         werfers = [Verfer(qb64=wit) for wit in wits]
 
         # get unique verified wigers and windices lists from wigers list
-        wigers, windices = verifySigs(raw=serder.raw, sigers=wigers, verfers=werfers)
+        wigers, windices = verifySigs(raw=serder.raw, sigers=wigers, verfers=werfers,
+                                      verified=verified)
         # each wiger now has werfer of corresponding wit
 
         # check if fully signed
@@ -2474,35 +2512,37 @@ class Kever:
         fn = None  # None means not a first seen log event so does not return an fn
         dgkey = dgKey(serder.preb, serder.saidb)
         dtsb = helping.nowIso8601().encode("utf-8")
-        self.db.putDts(dgkey, dtsb)  # idempotent do not change dts if already
-        if sigers:
-            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])  # idempotent
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if wits:
-            self.db.wits.put(keys=dgkey, vals=[coring.Prefixer(qb64=w) for w in wits])
-        self.db.putEvt(dgkey, serder.raw)  # idempotent (maybe already excrowed)
-        if first:  # append event dig to first seen database in order
-            if seqner and saider:  # authorized delegated or issued event
-                couple = seqner.qb64b + saider.qb64b
-                self.db.setAes(dgkey, couple)  # authorizer event seal (delegator/issuer)
-            fn = self.db.appendFe(serder.preb, serder.saidb)
-            if firner and fn != firner.sn:  # cloned replay but replay fn not match
-                if self.cues is not None:
-                    self.cues.append(dict(kin="noticeBadCloneFN", serder=serder,
-                                          fn=fn, firner=firner, dater=dater))
-                logger.info("Kever Mismatch Cloned Replay FN: %s First seen "
-                            "ordinal fn %s and clone fn %s \nEvent=\n%s\n",
-                            serder.preb, fn, firner.sn, serder.pretty())
-            if dater:  # cloned replay use original's dts from dater
-                dtsb = dater.dtsb
-            self.db.setDts(dgkey, dtsb)  # first seen so set dts to now
-            self.db.fons.pin(keys=dgkey, val=Seqner(sn=fn))
-            logger.info("Kever state: %s First seen ordinal %s at %s\nEvent=\n%s\n",
-                        serder.preb, fn, dtsb.decode("utf-8"), serder.pretty())
-        self.db.addKe(snKey(serder.preb, serder.sn), serder.saidb)
-        logger.info("Kever state: %s Added to KEL valid event=\n%s\n",
-                    serder.preb, serder.pretty())
+        with self.db.transact():  # all logs of event commit together
+            self.db.putDts(dgkey, dtsb)  # idempotent do not change dts if already
+            if sigers:
+                self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])  # idempotent
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if wits:
+                self.db.wits.put(keys=dgkey, vals=[coring.Prefixer(qb64=w) for w in wits])
+            self.db.putEvt(dgkey, serder.raw)  # idempotent (maybe already excrowed)
+            if first:  # append event dig to first seen database in order
+                if seqner and saider:  # authorized delegated or issued event
+                    couple = seqner.qb64b + saider.qb64b
+                    self.db.setAes(dgkey, couple)  # authorizer event seal (delegator/issuer)
+                fn = self.db.appendFe(serder.preb, serder.saidb)
+                if firner and fn != firner.sn:  # cloned replay but replay fn not match
+                    if self.cues is not None:
+                        self.cues.append(dict(kin="noticeBadCloneFN", serder=serder,
+                                              fn=fn, firner=firner, dater=dater))
+                    logger.info("Kever Mismatch Cloned Replay FN: %s First seen "
+                                "ordinal fn %s and clone fn %s \nEvent=\n%s\n",
+                                serder.preb, fn, firner.sn, serder.pretty())
+                if dater:  # cloned replay use original's dts from dater
+                    dtsb = dater.dtsb
+                self.db.setDts(dgkey, dtsb)  # first seen so set dts to now
+                self.db.fons.pin(keys=dgkey, val=Seqner(sn=fn))
+                self.db.kews.wake(serder.pre, serder.sn)  # escrows anchored by event
+                logger.info("Kever state: %s First seen ordinal %s at %s\nEvent=\n%s\n",
+                            serder.preb, fn, dtsb.decode("utf-8"), serder.pretty())
+            self.db.addKe(snKey(serder.preb, serder.sn), serder.saidb)
+            logger.info("Kever state: %s Added to KEL valid event=\n%s\n",
+                        serder.preb, serder.pretty())
         return (fn, dtsb.decode("utf-8"))  # (fn int, dts str) if first else (None, dts str)
 
     def escrowPSEvent(self, serder, sigers, wigers=None):
@@ -2807,9 +2847,21 @@ class Kevery:
     TimeoutVRE = 3600  # seconds to timeout unverified transferable receipt escrows
     TimeoutKSN = 3600  # seconds to timeout key state notice message escrows
     TimeoutQNF = 300   # seconds to timeout query not found escrows
+    EscrowMeterInterval = 10.0  # seconds between escrow size gauge updates
+    # escrows in order processed by .processEscrows as (name, process method name)
+    Escrows = (("ooes", "processEscrowOutOfOrders"),
+               ("uwes", "processEscrowUnverWitness"),
+               ("ures", "processEscrowUnverNonTrans"),
+               ("vres", "processEscrowUnverTrans"),
+               ("pwes", "processEscrowPartialWigs"),
+               ("pses", "processEscrowPartialSigs"),
+               ("ldes", "processEscrowDuplicitous"),
+               ("ksn", "processEscrowKeyState"),
+               ("qnfs", "processQueryNotFound"))
 
     def __init__(self, *, evts=None, cues=None, db=None, rvy=None,
-                 lax=True, local=False, cloned=False, direct=True, check=False):
+                 lax=True, local=False, cloned=False, direct=True, check=False,
+                 verified=None):
         """
         Initialize instance:
 
@@ -2832,6 +2884,10 @@ class Kevery:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+            verified (set | None): of (verfer.qb64b, siger.raw, raw) triples of
+                signatures already verified such as by keri.core.sharding
+                workers. Consumed by verifySigs so matching signatures are not
+                verified again.
         """
         self.evts = evts if evts is not None else decking.Deck()  # subclass of deque
         self.cues = cues if cues is not None else decking.Deck()  # subclass of deque
@@ -2844,6 +2900,8 @@ class Kevery:
         self.cloned = True if cloned else False  # process as cloned
         self.direct = True if direct else False  # process as direct mode
         self.check = True if check else False  # process as check mode
+        self.verified = verified  # signatures verified by other processes
+        self._escrowsMetered = None  # monotonic time of last escrow size gauges
 
     @property
     def kevers(self):
@@ -2900,6 +2958,7 @@ class Kevery:
         while evts:
             self.processEvent(**evts.pull())
 
+    @metering.measure("kevery_event")
     def processEvent(self, serder, sigers, *, wigers=None,
                      seqner=None, saider=None,
                      firner=None, dater=None):
@@ -2962,7 +3021,8 @@ class Kevery:
                               cues=self.cues,
                               prefixes=self.prefixes,
                               local=self.local,
-                              check=self.check)
+                              check=self.check,
+                              verified=self.verified)
                 self.kevers[pre] = kever  # not exception so add to kevers
 
                 if self.direct or self.lax or pre not in self.prefixes:  # not own event when owned
@@ -3026,7 +3086,8 @@ class Kevery:
                                  seqner=seqner, saider=saider,
                                  firner=firner if self.cloned else None,
                                  dater=dater if self.cloned else None,
-                                 check=self.check)
+                                 check=self.check,
+                                 verified=self.verified)
 
                     if self.direct or self.lax or pre not in self.prefixes:  # not own event when owned
                         # create cue for receipt   direct mode for now
@@ -3801,7 +3862,7 @@ class Kevery:
 
         ksaider = coring.Saider(qb64=diger.qb64)
         self.updateKeyState(aid=aid, serder=kserder, saider=ksaider, dater=dater)
-        self.cues.append(dict(kin="keyStateSaved", serder=kserder))
+        self.cues.append(dict(kin="keyStateSaved", serder=kserder, aid=aid))
 
     def updateEnd(self, keys, saider, allowed=None):
         """
@@ -3940,6 +4001,7 @@ class Kevery:
                                                     tsgs=tsgs, aid=aid)
 
                 except kering.OutOfOrderKeyStateError as ex:
+                    metering.meter.inc("kevery_unescrow_total", escrow="ksn", result="waiting")
                     # still waiting on missing prior event to validate
                     if logger.isEnabledFor(logging.DEBUG):
                         logger.exception("Kevery unescrow attempt failed: %s\n", ex.args[0])
@@ -3947,6 +4009,7 @@ class Kevery:
                         logger.error("Kevery unescrow attempt failed: %s\n", ex.args[0])
 
                 except Exception as ex:  # other error so remove from reply escrow
+                    metering.meter.inc("kevery_unescrow_total", escrow="ksn", result="removed")
                     self.db.knes.remIokey(iokeys=(pre, aid, ion))  # remove escrow
                     self.removeKeyState(saider)
                     if logger.isEnabledFor(logging.DEBUG):
@@ -3955,6 +4018,10 @@ class Kevery:
                         logger.error("Kevery unescrowed due to error: %s\n", ex.args[0])
 
                 else:  # unescrow succeded
+                    metering.meter.inc("kevery_unescrow_total", escrow="ksn", result="succeeded")
+                    metering.meter.observe("kevery_escrow_age_seconds",
+                                           (helping.nowUTC() - dater.datetime).total_seconds(),
+                                           escrow="ksn")
                     self.db.knes.remIokey(iokeys=(pre, aid, ion))  # remove escrow only
                     logger.info("Kevery unescrow succeeded for key state=\n%s\n",
                                 serder.pretty())
@@ -3967,6 +4034,38 @@ class Kevery:
                 else:
                     logger.error("Kevery unescrowed due to error: %s\n", ex.args[0])
 
+    def consentedMailboxes(self, serder, source):
+        """
+        Returns dict of topics of each identifier in pres of multiplexed mbx
+        query serder that may be streamed to source. That is the queried
+        identifier and every other identifier whose controller signed its
+        consent to source in sigs of the query.
+
+        Parameters:
+            serder (Serder): mbx query message with pres
+            source (Prefixer): identifier prefix of signer of query
+        """
+        qry = serder.ked["q"]
+        sigs = qry.get("sigs", {})
+        ser = mailboxConsent(signer=source.qb64, src=qry["src"], stamp=serder.ked["dt"])
+        pres = dict()
+        for mpre, mtopics in qry["pres"].items():
+            if mpre != qry["i"]:
+                if mpre not in self.kevers:
+                    continue
+                kever = self.kevers[mpre]
+                try:
+                    sigers = [siger for siger in (Siger(qb64=sig) for sig in sigs.get(mpre, []))
+                              if siger.index < len(kever.verfers)]
+                except (TypeError, ValueError, kering.KeriError):  # malformed sigs
+                    sigers = []
+                _, indices = verifySigs(ser, sigers, kever.verfers)
+                if not kever.tholder.satisfy(indices):
+                    logger.info("Kevery skipped mailbox of %s without consent to %s", mpre, source.qb64)
+                    continue
+            pres[mpre] = mtopics
+        return pres
+
     def processQuery(self, serder, source=None, sigers=None, cigars=None):
         """
         Process query mode replay message for collective or single element query.
@@ -4051,7 +4150,10 @@ class Kevery:
                 self.escrowQueryNotFoundEvent(serder=serder, prefixer=source, sigers=sigers, cigars=cigars)
                 raise QueryNotFoundError("Query not found error={}.".format(ked))
 
-            self.cues.push(dict(kin="stream", serder=serder, pre=pre, src=src, topics=topics))
+            cue = dict(kin="stream", serder=serder, pre=pre, src=src, topics=topics)
+            if "pres" in qry:  # multiplexed mailboxes
+                cue["pres"] = self.consentedMailboxes(serder=serder, source=source)
+            self.cues.push(cue)
             # if pre in self.kevers:
             #     kever = self.kevers[pre]
             #     if src in kever.wits and src in self.db.prefixes:  # We are a witness for identifier
@@ -4351,15 +4453,16 @@ class Kevery:
         """
 
         try:
-            self.processEscrowOutOfOrders()
-            self.processEscrowUnverWitness()
-            self.processEscrowUnverNonTrans()
-            self.processEscrowUnverTrans()
-            self.processEscrowPartialWigs()
-            self.processEscrowPartialSigs()
-            self.processEscrowDuplicitous()
-            self.processEscrowKeyState()
-            self.processQueryNotFound()
+            metered = metering.meter.enabled
+            if metered:
+                self.meterEscrows()
+
+            for escrow, name in self.Escrows:
+                if metered:
+                    with metering.meter.timer("kevery_escrow_process_seconds", escrow=escrow):
+                        getattr(self, name)()
+                else:
+                    getattr(self, name)()
 
         except Exception as ex:  # log diagnostics errors etc
             if logger.isEnabledFor(logging.DEBUG):
@@ -4368,6 +4471,23 @@ class Kevery:
                 logger.error("Kevery escrow process error: %s\n", ex.args[0])
             raise ex
 
+    def meterEscrows(self):
+        """
+        Sets gauge of number of entries in each escrow at most once every
+        .EscrowMeterInterval seconds since counting walks each escrow
+
+        """
+        now = time.monotonic()
+        if self._escrowsMetered is not None and now - self._escrowsMetered < self.EscrowMeterInterval:
+            return
+        self._escrowsMetered = now
+        for escrow, _ in self.Escrows:
+            if escrow == "ksn":  # key state notices are in a Komer
+                count = self.db.cnt(self.db.knes.sdb)
+            else:
+                count = self.db.cntIoValsTop(getattr(self.db, escrow))
+            metering.meter.set("kevery_escrow_size", count, escrow=escrow)
+
     def processEscrowOutOfOrders(self):
         """
         Process events escrowed by Kever that are recieved out-of-order.
@@ -4478,6 +4598,7 @@ class Kevery:
                     # No error at all means processed successfully so also unescrow.
 
                 except OutOfOrderError as ex:
+                    metering.meter.inc("kevery_unescrow_total", escrow="ooes", result="waiting")
                     # still waiting on missing prior event to validate
                     if logger.isEnabledFor(logging.DEBUG):
                         logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
@@ -4485,6 +4606,7 @@ class Kevery:
                         logger.error("Kevery unescrow failed: %s\n", ex.args[0])
 
                 except Exception as ex:  # log diagnostics errors etc
+                    metering.meter.inc("kevery_unescrow_total", escrow="ooes", result="removed")
                     # error other than out of order so remove from OO escrow
                     self.db.delOoe(snKey(pre, sn), edig)  # removes one escrow at key val
                     if logger.isEnabledFor(logging.DEBUG):
@@ -4493,6 +4615,9 @@ class Kevery:
                         logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
                 else:  # unescrow succeeded, remove from escrow
+                    metering.meter.inc("kevery_unescrow_total", escrow="ooes", result="succeeded")
+                    metering.meter.observe("kevery_escrow_age_seconds", (dtnow - dte).total_seconds(),
+                                           escrow="ooes")
                     # We don't remove all escrows at pre,sn because some might be
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
@@ -4628,6 +4753,7 @@ class Kevery:
                     # No error at all means processed successfully so also unescrow.
 
                 except (MissingSignatureError, MissingDelegationError) as ex:
+                    metering.meter.inc("kevery_unescrow_total", escrow="pses", result="waiting")
                     # still waiting on missing sigs or missing seal to validate
                     if logger.isEnabledFor(logging.DEBUG):
                         logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
@@ -4635,6 +4761,7 @@ class Kevery:
                         logger.error("Kevery unescrow failed: %s\n", ex.args[0])
 
                 except Exception as ex:  # log diagnostics errors etc
+                    metering.meter.inc("kevery_unescrow_total", escrow="pses", result="removed")
                     # error other than waiting on sigs or seal so remove from escrow
                     self.db.delPse(snKey(pre, sn), edig)  # removes one escrow at key val
 
@@ -4647,6 +4774,9 @@ class Kevery:
                         logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
                 else:  # unescrow succeeded, remove from escrow
+                    metering.meter.inc("kevery_unescrow_total", escrow="pses", result="succeeded")
+                    metering.meter.observe("kevery_escrow_age_seconds", (dtnow - dte).total_seconds(),
+                                           escrow="pses")
                     # We don't remove all escrows at pre,sn because some might be
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
@@ -4792,6 +4922,7 @@ class Kevery:
                     # partially witnessed escrow unless they had already validated
 
                 except MissingWitnessSignatureError as ex:
+                    metering.meter.inc("kevery_unescrow_total", escrow="pwes", result="waiting")
                     # still waiting on missing witness sigs
                     if logger.isEnabledFor(logging.DEBUG):
                         logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
@@ -4799,6 +4930,7 @@ class Kevery:
                         logger.error("Kevery unescrow failed: %s\n", ex.args[0])
 
                 except Exception as ex:  # log diagnostics errors etc
+                    metering.meter.inc("kevery_unescrow_total", escrow="pwes", result="removed")
                     # error other than waiting on sigs or seal so remove from escrow
                     self.db.delPwe(snKey(pre, sn), edig)  # removes one escrow at key val
                     if logger.isEnabledFor(logging.DEBUG):
@@ -4807,6 +4939,9 @@ class Kevery:
                         logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
                 else:  # unescrow succeeded, remove from escrow
+                    metering.meter.inc("kevery_unescrow_total", escrow="pwes", result="succeeded")
+                    metering.meter.observe("kevery_escrow_age_seconds", (dtnow - dte).total_seconds(),
+                                           escrow="pwes")
                     # We don't remove all escrows at pre,sn because some might be
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
@@ -4914,6 +5049,7 @@ class Kevery:
                                                             "receipted evt at pre={}  sn={:x}".format(pre, sn))
 
                 except UnverifiedWitnessReceiptError as ex:
+                    metering.meter.inc("kevery_unescrow_total", escrow="uwes", result="waiting")
                     # still waiting on missing prior event to validate
                     # only happens if we process above
                     if logger.isEnabledFor(logging.DEBUG):  # adds exception data
@@ -4922,6 +5058,7 @@ class Kevery:
                         logger.error("Kevery unescrow failed: %s\n", ex.args[0])
 
                 except Exception as ex:  # log diagnostics errors etc
+                    metering.meter.inc("kevery_unescrow_total", escrow="uwes", result="removed")
                     # error other than out of order so remove from OO escrow
                     self.db.delUwe(snKey(pre, sn), ecouple)  # removes one escrow at key val
                     if logger.isEnabledFor(logging.DEBUG):  # adds exception data
@@ -4930,6 +5067,9 @@ class Kevery:
                         logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
                 else:  # unescrow succeeded, remove from escrow
+                    metering.meter.inc("kevery_unescrow_total", escrow="uwes", result="succeeded")
+                    metering.meter.observe("kevery_escrow_age_seconds", (dtnow - dte).total_seconds(),
+                                           escrow="uwes")
                     # We don't remove all escrows at pre,sn because some might be
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
@@ -5087,6 +5227,7 @@ class Kevery:
 
 
                 except UnverifiedReceiptError as ex:
+                    metering.meter.inc("kevery_unescrow_total", escrow="ures", result="waiting")
                     # still waiting on missing prior event to validate
                     # only happens if we process above
                     if logger.isEnabledFor(logging.DEBUG):  # adds exception data
@@ -5095,6 +5236,7 @@ class Kevery:
                         logger.error("Kevery unescrow failed: %s\n", ex.args[0])
 
                 except Exception as ex:  # log diagnostics errors etc
+                    metering.meter.inc("kevery_unescrow_total", escrow="ures", result="removed")
                     # error other than out of order so remove from OO escrow
                     self.db.delUre(snKey(pre, sn), etriplet)  # removes one escrow at key val
                     if logger.isEnabledFor(logging.DEBUG):  # adds exception data
@@ -5103,6 +5245,9 @@ class Kevery:
                         logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
                 else:  # unescrow succeeded, remove from escrow
+                    metering.meter.inc("kevery_unescrow_total", escrow="ures", result="succeeded")
+                    metering.meter.observe("kevery_escrow_age_seconds", (dtnow - dte).total_seconds(),
+                                           escrow="ures")
                     # We don't remove all escrows at pre,sn because some might be
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
@@ -5203,6 +5348,7 @@ class Kevery:
                     self.processQuery(serder=eserder, source=source, sigers=sigers, cigars=cigars)
 
                 except QueryNotFoundError as ex:
+                    metering.meter.inc("kevery_unescrow_total", escrow="qnfs", result="waiting")
                     # still waiting on missing prior event to validate
                     if logger.isEnabledFor(logging.DEBUG):
                         logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
@@ -5210,6 +5356,7 @@ class Kevery:
                         logger.error("Kevery unescrow failed: %s\n", ex.args[0])
 
                 except Exception as ex:  # log diagnostics errors etc
+                    metering.meter.inc("kevery_unescrow_total", escrow="qnfs", result="removed")
                     # error other than out of order so remove from OO escrow
                     self.db.delQnf(dgKey(pre, edig), edig)  # removes one escrow at key val
                     if logger.isEnabledFor(logging.DEBUG):
@@ -5217,6 +5364,9 @@ class Kevery:
                     else:
                         logger.error("Kevery unescrowed: %s\n", ex.args[0])
                 else:  # unescrow succeeded, remove from escrow
+                    metering.meter.inc("kevery_unescrow_total", escrow="qnfs", result="succeeded")
+                    metering.meter.observe("kevery_escrow_age_seconds", (dtnow - dte).total_seconds(),
+                                           escrow="qnfs")
                     # We don't remove all escrows at pre,sn because some might be
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
@@ -5492,6 +5642,7 @@ class Kevery:
 
 
                 except UnverifiedTransferableReceiptError as ex:
+                    metering.meter.inc("kevery_unescrow_total", escrow="vres", result="waiting")
                     # still waiting on missing prior event to validate
                     # only happens if we process above
                     if logger.isEnabledFor(logging.DEBUG):  # adds exception data
@@ -5500,6 +5651,7 @@ class Kevery:
                         logger.error("Kevery unescrow failed: %s\n", ex.args[0])
 
                 except Exception as ex:  # log diagnostics errors etc
+                    metering.meter.inc("kevery_unescrow_total", escrow="vres", result="removed")
                     # error other than out of order so remove from OO escrow
                     self.db.delVre(snKey(pre, sn), equinlet)  # removes one escrow at key val
                     if logger.isEnabledFor(logging.DEBUG):  # adds exception data
@@ -5508,6 +5660,9 @@ class Kevery:
                         logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
                 else:  # unescrow succeeded, remove from escrow
+                    metering.meter.inc("kevery_unescrow_total", escrow="vres", result="succeeded")
+                    metering.meter.observe("kevery_escrow_age_seconds", (dtnow - dte).total_seconds(),
+                                           escrow="vres")
                     # We don't remove all escrows at pre,sn because some might be
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
@@ -5620,6 +5775,7 @@ class Kevery:
                     # No error at all means processed successfully so also unescrow.
 
                 except LikelyDuplicitousError as ex:
+                    metering.meter.inc("kevery_unescrow_total", escrow="ldes", result="waiting")
                     # still can't determine if duplicitous
                     if logger.isEnabledFor(logging.DEBUG):
                         logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
@@ -5627,6 +5783,7 @@ class Kevery:
                         logger.error("Kevery unescrow failed: %s\n", ex.args[0])
 
                 except Exception as ex:  # log diagnostics errors etc
+                    metering.meter.inc("kevery_unescrow_total", escrow="ldes", result="removed")
                     # error other than likely duplicitous so remove from escrow
                     self.db.delLde(snKey(pre, sn), edig)  # removes one escrow at key val
                     if logger.isEnabledFor(logging.DEBUG):
@@ -5635,6 +5792,9 @@ class Kevery:
                         logger.error("Kevery unescrowed: %s\n", ex.args[0])
 
                 else:  # unescrow succeeded, remove from escrow
+                    metering.meter.inc("kevery_unescrow_total", escrow="ldes", result="succeeded")
+                    metering.meter.observe("kevery_escrow_age_seconds", (dtnow - dte).total_seconds(),
+                                           escrow="ldes")
                     # We don't remove all escrows at pre,sn because some might be
                     # duplicitous so we process remaining escrows in spite of found
                     # valid event escrow.
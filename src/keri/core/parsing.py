@@ -14,6 +14,7 @@ from .coring import (Ilks, CtrDex, Counter, Seqner, Siger, Cigar, IdxSigDex,
                      Sadder, )
 from .. import help
 from .. import kering
+from ..help import metering
 from ..vc.proving import Creder
 
 logger = help.ogler.getLogger()
@@ -970,6 +971,10 @@ class Parser:
                                              "attachment group of size={}.".format(pags))
             raise  # no pipeline group so can't preflush, must flush stream
 
+        if metering.meter.enabled:
+            metering.meter.inc("parser_messages_total", ident=sadder.ident)
+            metering.meter.inc("parser_bytes_total", sadder.size, ident=sadder.ident)
+
         if sadder.ident == Idents.keri:
             serder = Serder(sad=sadder)
 
@@ -7,15 +7,16 @@ self-addressing and schema support
 
 import json
 
-import cbor2 as cbor
-import jsonschema
-import msgpack
-
 from . import coring
 from .coring import MtrDex, Serials, Saider, Ids
 from .. import help, kering
+from ..help import helping
 from ..kering import ValidationError, DeserializationError
 
+cbor = helping.lazyModule("cbor2")  # imported on first use
+jsonschema = helping.lazyModule("jsonschema")
+msgpack = helping.lazyModule("msgpack")
+
 logger = help.ogler.getLogger()
 
 
@@ -0,0 +1,274 @@
+# -*- encoding: utf-8 -*-
+"""
+keri.core.sharding module
+
+Sharded validation of KEL events across a process pool by identifier prefix
+
+Events for different identifier prefixes are independent apart from
+delegation and receipt cross references. A Sharder partitions parsed key
+events by prefix and has worker processes do the CPU heavy stateless checks,
+SAID verification and controller and witness signature verification, for
+each shard in event order. The verified signatures are handed back to the
+single writer Kevery in the main process as a memo so that it commits the
+events to the shared Baser without verifying the same signatures again.
+Everything that depends on state outside a shard, such as delegation seals,
+receipts and out of order events, falls through to the regular Kevery
+validation and escrows.
+"""
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from hio.base import doing
+
+from .. import help
+from .. import kering
+from ..core import coring, parsing
+from ..core.coring import Ilks
+
+logger = help.ogler.getLogger()
+
+
+def verifyShards(shards):
+    """ Returns list of (verfer.qb64b, siger.raw, raw) triples of verified
+    signatures from shards. Runs in worker process so only uses picklable
+    inputs and outputs and touches no database.
+
+    Parameters:
+        shards (list): of shard tuples (keys, wits, items) one per prefix where
+            keys (list | None): of qb64 current signing keys of prefix from
+                key state before shard or None when not yet known
+            wits (list | None): of qb64 current witnesses of prefix from key
+                state before shard or None when not yet known
+            items (list): of (raw, sigs, wigs) per event of prefix in order
+                raw (bytes): serialized event
+                sigs (list): of qb64b indexed controller signatures
+                wigs (list): of qb64b indexed witness signatures
+    """
+    triples = []
+    for keys, wits, items in shards:
+        for raw, sigs, wigs in items:
+            try:
+                serder = coring.Serder(raw=raw)
+                ked = serder.ked
+                ilk = ked["t"]
+                if ilk in (Ilks.icp, Ilks.dip):  # prefix may be SAID of event
+                    valid = coring.Prefixer(qb64=ked["i"]).verify(ked=ked, prefixed=True)
+                else:
+                    valid = serder.saider.verify(sad=ked)
+                if not valid:
+                    continue  # invalid prefix or SAID so leave for Kevery to reject
+
+                if serder.est:  # establishment event so sigs are by its own keys
+                    keys = ked["k"]
+                    if ilk in (Ilks.icp, Ilks.dip):
+                        wits = ked["b"]
+                    elif wits is not None:
+                        wits = [wit for wit in wits if wit not in ked["br"]] + ked["ba"]
+
+            except Exception:  # malformed event so leave for Kevery to reject
+                continue
+
+            for sigs, vkeys in ((sigs, keys), (wigs, wits)):
+                if not vkeys:
+                    continue
+                for sig in sigs:
+                    try:
+                        siger = coring.Siger(qb64b=sig)
+                        if siger.index >= len(vkeys):
+                            continue
+                        verfer = coring.Verfer(qb64=vkeys[siger.index])
+                        if verfer.verify(siger.raw, raw):
+                            triples.append((verfer.qb64b, siger.raw, raw))
+                    except Exception:
+                        continue
+
+    return triples
+
+
+class Sharder:
+    """
+    Sharder parses incoming message streams and validates the key events in
+    them sharded by identifier prefix across a pool of worker processes. The
+    results are committed in stream order through the single writer .kvy.
+
+    Sharder stands in for the Kevery of its .parser. It buffers key events
+    and the other KEL messages, such as receipts and queries, in stream order
+    and hands them all to .kvy once the key events are verified so that a
+    receipt of an event earlier in the same stream finds the event accepted.
+
+    Attributes:
+        kvy (Kevery): single writer that validates and commits events. Its
+            .verified memo is created when missing.
+        parser (Parser): parser that routes KEL messages to this Sharder
+        workers (int): number of worker processes
+        pool (ProcessPoolExecutor | None): worker pool, created on first use
+
+    """
+
+    # Kevery handlers of the other KEL messages buffered with the key events
+    Handlers = ("processReceiptCouples", "processReceiptQuadruples", "processReceipt",
+                "processReceiptWitness", "processReceiptTrans", "processQuery")
+
+    def __init__(self, kvy, workers=None, pool=None, parser=None):
+        """ Initialize instance
+
+        Parameters:
+            kvy (Kevery): single writer to shared Baser
+            workers (int | None): number of worker processes, None means one
+                per CPU as for ProcessPoolExecutor
+            pool (ProcessPoolExecutor | None): optional shared worker pool
+            parser (Parser | None): optional parser else makes framed Parser
+
+        """
+        self.kvy = kvy
+        if self.kvy.verified is None:
+            self.kvy.verified = set()
+        self.workers = workers
+        self.pool = pool
+        self.parser = parser if parser is not None else parsing.Parser(framed=True)
+        self.parser.kvy = self
+        self.msgs = []  # buffered (handler name, args, kwa) in stream order
+
+    def __getattr__(self, name):
+        """ Buffers the other Kevery message handlers in .Handlers and routes
+        all other attributes to .kvy """
+        if name in self.Handlers:
+            getattr(self.kvy, name)  # raises AttributeError when .kvy has no handler
+
+            def buffer(*args, **kwa):
+                self.msgs.append((name, args, kwa))
+
+            return buffer
+
+        return getattr(self.kvy, name)
+
+    def processEvent(self, serder, sigers, *, wigers=None, seqner=None, saider=None,
+                     firner=None, dater=None):
+        """ Collects key event for sharded validation """
+        self.msgs.append(("processEvent", (), dict(serder=serder, sigers=sigers, wigers=wigers,
+                                                   seqner=seqner, saider=saider, firner=firner,
+                                                   dater=dater)))
+
+    def close(self):
+        """ Shuts down worker pool if any """
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    def process(self, ims):
+        """ Parses all messages in ims, verifies the collected key events in
+        worker processes sharded by prefix and commits them and the other
+        buffered messages in stream order through .kvy.
+
+        Returns:
+            int: number of key events committed or escrowed
+
+        Parameters:
+            ims (bytes | bytearray): incoming message stream
+        """
+        self.parser.parse(ims=bytearray(ims))
+        msgs, self.msgs = self.msgs, []
+        events = [kwa for name, _, kwa in msgs if name == "processEvent"]
+        triples = self.verify(events) if events else []
+        self.kvy.verified.update(triples)
+        try:
+            for name, args, kwa in msgs:
+                try:
+                    getattr(self.kvy, name)(*args, **kwa)
+                except kering.ValidationError as ex:
+                    # same reporting as Parser for escrowed or invalid messages
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.exception("Sharder msg error: %s\n", ex)
+                    else:
+                        logger.info("Sharder msg error: %s\n", ex)
+                except Exception as ex:
+                    logger.exception("Sharder unexpected msg error: %s\n", ex)
+        finally:
+            # drop memo of sigs not consumed, e.g. of escrowed events
+            self.kvy.verified.difference_update(triples)
+
+        return len(events)
+
+    def shard(self, events):
+        """ Returns list of shard tuples (keys, wits, items), one per prefix, in
+        order of first appearance of prefix in events. See verifyShards.
+
+        Parameters:
+            events (list): of processEvent kwargs dicts in stream order
+        """
+        shards = {}
+        for evt in events:
+            serder = evt["serder"]
+            pre = serder.pre
+            if pre not in shards:
+                keys = wits = None
+                if pre in self.kvy.kevers:  # known state so ixn sigs verifiable
+                    kever = self.kvy.kevers[pre]
+                    keys = [verfer.qb64 for verfer in kever.verfers]
+                    wits = list(kever.wits)
+                shards[pre] = (keys, wits, [])
+
+            shards[pre][2].append((serder.raw,
+                                   [siger.qb64b for siger in evt["sigers"] or []],
+                                   [wiger.qb64b for wiger in evt["wigers"] or []]))
+
+        return list(shards.values())
+
+    def verify(self, events):
+        """ Returns list of verified signature triples for events computed by
+        worker processes with prefix shards balanced across workers
+
+        Parameters:
+            events (list): of processEvent kwargs dicts in stream order
+        """
+        shards = self.shard(events)
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers)
+
+        count = self.workers if self.workers else (os.cpu_count() or 1)
+        buckets = [[] for _ in range(min(count, len(shards)))]
+        sizes = [0] * len(buckets)
+        # largest shards first onto least loaded bucket
+        for shard in sorted(shards, key=lambda s: len(s[2]), reverse=True):
+            i = sizes.index(min(sizes))
+            buckets[i].append(shard)
+            sizes[i] += len(shard[2])
+
+        triples = []
+        for result in self.pool.map(verifyShards, buckets):
+            triples.extend(result)
+        return triples
+
+
+class ShardDoer(doing.Doer):
+    """
+    ShardDoer feeds Sharder from an incoming message stream buffer and runs
+    Kevery escrows after each batch
+
+    Attributes:
+        sharder (Sharder): sharded validator
+        ims (bytearray): incoming message stream of framed messages appended
+            by producers. Consumed whole on each recur.
+    """
+
+    def __init__(self, sharder, ims=None, **kwa):
+        """
+        Parameters:
+            sharder (Sharder): sharded validator
+            ims (bytearray | None): shared incoming message stream buffer
+        """
+        self.sharder = sharder
+        self.ims = ims if ims is not None else bytearray()
+        super(ShardDoer, self).__init__(**kwa)
+
+    def recur(self, tyme):
+        if self.ims:
+            ims = bytearray(self.ims)
+            del self.ims[:]
+            self.sharder.process(ims)
+            self.sharder.kvy.processEscrows()
+        return False
+
+    def exit(self):
+        self.sharder.close()
@@ -30,12 +30,13 @@ from ordered_set import OrderedSet as oset
 
 from hio.base import doing
 
-from . import dbing, koming, subing
+from . import dbing, escrowing, koming, subing
 from .. import kering
 
 from ..core import coring, eventing, parsing
 
 from .. import help
+from ..help import metering
 
 logger = help.ogler.getLogger()
 
@@ -649,6 +650,10 @@ class Baser(dbing.LMDBer):
 
     """
 
+    # raw sub dbs of insertion ordered dups with proems, see LMDBer.migrate
+    IoDupSubkeys = (b'ures.', b'vres.', b'kels.', b'pses.', b'pwes.', b'uwes.',
+                    b'ooes.', b'dels.', b'ldes.', b'qnfs.')
+
     def __init__(self, headDirPath=None, reopen=False, **kwa):
         """
         Setup named sub databases.
@@ -808,6 +813,10 @@ class Baser(dbing.LMDBer):
         self.cgms = subing.CesrSuber(db=self, subkey='cgms.',
                                      klas=coring.Saider)
 
+        # escrows of other databases waiting on KEL events, woken when the
+        # awaited event is accepted or its group multisig completes
+        self.kews = escrowing.Waitlist(db=self, subkey='kews')
+
         # exchange message partial signature escrow
         self.epse = subing.SerderSuber(db=self, subkey="epse.")
 
@@ -924,6 +933,18 @@ class Baser(dbing.LMDBer):
         self.cfld = subing.Suber(db=self,
                                  subkey="cfld.")
 
+        # Index of contact field values for search.  Keyed by field/normalized value/prefix
+        # with the field value as value
+        self.cidx = subing.Suber(db=self,
+                                 subkey="cidx.",
+                                 sep="\x1f")  # Use unit separator, sorts before printable chars so values sort in order.
+
+        # Index of words in contact field values.  Keyed by field/word/prefix with
+        # the field value as value
+        self.ctok = subing.Suber(db=self,
+                                 subkey="ctok.",
+                                 sep="\x1f")  # Use unit separator, sorts before printable chars so values sort in order.
+
         # Global settings for the Habery environment
         self.hbys = subing.Suber(db=self, subkey='hbys.')
         # Signed contact data, keys by prefix
@@ -939,26 +960,38 @@ class Baser(dbing.LMDBer):
 
         return self.env
 
+    @metering.measure("baser_reload")
     def reload(self):
         """
-        Reload stored prefixes and Kevers from .habs
+        Reload stored prefixes from .habs
+
+        Kevers of the prefixes are not built here unless already in memory,
+        such as when reloading after a rollback, otherwise .kevers reads them
+        through from their key state on first access. Either way records whose
+        key state has no KEL event are removed.
 
         """
         removes = []
         for keys, data in self.habs.getItemIter():
             if (state := self.states.get(keys=data.hid)) is not None:
-                try:
-                    kever = eventing.Kever(state=state, db=self,
-                                           prefixes=self.prefixes,
-                                           local=True)
-                except kering.MissingEntryError as ex:  # no kel event for keystate
-                    removes.append(keys)  # remove from .habs
+                if dict.__contains__(self.kevers, data.hid):  # refresh in memory kever
+                    try:
+                        self.kevers[data.hid] = eventing.Kever(state=state, db=self,
+                                                               prefixes=self.prefixes,
+                                                               local=True)
+                    except kering.MissingEntryError:  # no kel event for keystate
+                        removes.append(keys)  # remove from .habs
+                        continue
+                elif self.getEvt(key=dbing.dgKey(pre=data.hid, dig=state.ked['d'])) is None:
+                    removes.append(keys)  # no kel event for keystate so remove from .habs
                     continue
-                self.kevers[kever.prefixer.qb64] = kever
-                self.prefixes.add(kever.prefixer.qb64)
+                self.prefixes.add(data.hid)
             elif data.mid is None:  # in .habs but no corresponding key state and not a group so remove
                 removes.append(keys)  # no key state or KEL event for .hab record
 
+        if self.readonly:  # reader beside writer so leave cleanup to writer
+            return
+
         for keys in removes:  # remove bare .habs records
             self.habs.rem(keys=keys)
 
@@ -1037,7 +1070,7 @@ class Baser(dbing.LMDBer):
             self.prefixes.clear()
             self.prefixes.update(copy.prefixes)
 
-            with reopenDB(db=self, reuse=True):  # make sure can reopen
+            with reopenDB(db=self, reuse=True, readonly=False):  # make sure can reopen
                 if not isinstance(self.env, lmdb.Environment):
                     raise ValueError("Error cloning, unable to reopen."
                                      "".format(self.path))
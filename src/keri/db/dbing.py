@@ -45,9 +45,11 @@ l
 
 """
 
+import base64
 import os
 import shutil
 import stat
+import threading
 from collections import abc
 from contextlib import contextmanager
 from typing import Union
@@ -68,6 +70,21 @@ MaxON = int("f"*32, 16)  # largest possible ordinal number, sequence or first se
 SuffixSize = 32  # does not include trailing separator
 MaxSuffix = int("f"*(SuffixSize), 16)
 
+# Storage formats of insertion ordinals in dup proems and io set key suffixes
+HexFormat = b"hex"  # 32 char hex ordinal and separator, the original layout
+CompactFormat = b"compact"  # fixed width big endian binary ordinal
+CompactSize = 8  # bytes of compact binary ordinal of dup proem
+MaxCompact = (1 << (8 * CompactSize)) - 1
+CompactSuffixSize = 11  # chars of compact Base64 ordinal of io set key suffix
+# Base64 alphabet in ascii order so compact suffixes sort as their ordinals and
+# never contain a key separator
+SortB64 = b"-0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz"
+StdB64 = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+ToSortB64 = bytes.maketrans(StdB64, SortB64)
+FromSortB64 = bytes.maketrans(SortB64, StdB64)
+MetaSubkey = b"__meta."  # named sub db of storage metadata
+FormatKey = b"format"  # key of storage format in meta sub db
+
 def dgKey(pre, dig):
     """
     Returns bytes DB key from concatenation of '.' with qualified Base64 prefix
@@ -256,6 +273,48 @@ def openLMDB(*, cls=None, name="test", temp=True, **kwa):
             lmdber.close(clear=lmdber.temp)  # clears if lmdber.temp
 
 
+class SubTxn:
+    """
+    SubTxn is a view of the shared transaction of an LMDBer session, either a
+    snapshot or a write transaction, that is bound to one sub db. It stands in
+    for the transaction returned by env.begin(db=db) in raw methods so they
+    need not know whether they run inside a session. Exiting its context
+    leaves the shared transaction open.
+
+    Attributes:
+        txn (lmdb.Transaction): shared transaction of session
+        db (lmdb._Database): sub db of operations
+
+    """
+    __slots__ = ("txn", "db")
+
+    def __init__(self, txn, db):
+        self.txn = txn
+        self.db = db
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def get(self, key, default=None):
+        """ Returns value at key in .db or default when none """
+        return self.txn.get(key, default, db=self.db)
+
+    def put(self, key, val, dupdata=True, overwrite=True):
+        """ Returns True if val stored at key in .db """
+        return self.txn.put(key, val, dupdata=dupdata, overwrite=overwrite, db=self.db)
+
+    def delete(self, key, value=b''):
+        """ Returns True if key, or key with value when dupsort, was deleted """
+        return self.txn.delete(key, value, db=self.db)
+
+    def cursor(self):
+        """ Returns cursor of .db in shared transaction """
+        return self.txn.cursor(db=self.db)
+
+
 class LMDBer(filing.Filer):
     """
     LBDBer base class for LMDB manager instances.
@@ -278,7 +337,19 @@ class LMDBer(filing.Filer):
 
     Attributes:
         env (lmdb.env): LMDB main (super) database environment
-        readonly (bool): True means open LMDB env as readonly
+        readonly (bool): True means open LMDB env as readonly. A readonly
+            LMDBer in another process may read beside the writer such as for
+            serving queries. LMDB does not allow the same env to be opened
+            twice in one process.
+        compact (bool): True means insertion ordinals are stored compact as 8
+            byte binary dup proems and 11 char Base64 io set key suffixes.
+            False means the original 32 char hex. Persisted in meta sub db so
+            set on reopen.
+        proemSize (int): size of dup proem in current storage format
+        maxSuffix (int): max insertion ordinal in current storage format
+        ioSets (dict): of separator bytes of io set sub dbs keyed by subkey
+            bytes so .migrate can find them. Registered by IoSetSuber and
+            IoSetKomer
 
     Properties:
 
@@ -306,9 +377,11 @@ class LMDBer(filing.Filer):
     TempSuffix = "_test"
     Perm = stat.S_ISVTX | stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR  # 0o1700==960
     MaxNamedDBs = 96
+    IoDupSubkeys = ()  # subkeys of raw sub dbs of insertion ordered dups
+    IoSetSubkeys = ()  # (subkey, sep) of raw io set sub dbs
 
 
-    def __init__(self, readonly=False, **kwa):
+    def __init__(self, readonly=False, compact=False, **kwa):
         """
         Setup main database directory at .dirpath.
         Create main database environment at .env using .path.
@@ -342,14 +415,22 @@ class LMDBer(filing.Filer):
 
             readonly (bool): True means open database in readonly mode
                                 False means open database in read/write mode
+            compact (bool): True means use compact storage format when the
+                database is created. An existing database keeps its format
+                until migrated with .migrate
 
         """
         self.env = None
         self.readonly = True if readonly else False
+        self.compact = True if compact else False
+        self.proemSize = ProemSize + 1
+        self.maxSuffix = MaxSuffix
+        self.ioSets = dict()  # separators of registered io set sub dbs by subkey
+        self._local = threading.local()  # .txn and .write of session of each thread
         super(LMDBer, self).__init__(**kwa)
 
 
-    def reopen(self, readonly=False, **kwa):
+    def reopen(self, readonly=None, compact=None, **kwa):
         """
         Open if closed or close and reopen if opened or create and open if not
         if not preexistent, directory path for lmdb at .path and then
@@ -371,8 +452,11 @@ class LMDBer(filing.Filer):
                              False means path uses normal tail variant
             mode (str): file open mode when .filed
             fext (str): File extension when .filed
-            readonly (bool): True means open database in readonly mode
+            readonly (bool | None): True means open database in readonly mode
                                 False means open database in read/write mode
+                                None means keep mode of .readonly
+            compact (bool | None): True means use compact storage format if
+                                the database is new. None means use .compact
         """
         opened = super(LMDBer, self).reopen(**kwa)
         if readonly is not None:
@@ -382,10 +466,163 @@ class LMDBer(filing.Filer):
         # creates files data.mdb and lock.mdb in .dbDirPath
         self.env = lmdb.open(self.path, max_dbs=self.MaxNamedDBs, map_size=104857600,
                              mode=self.perm, readonly=self.readonly)
+        self._layout(self.loadFormat(self.compact if compact is None else compact)
+                     == CompactFormat)
         self.opened = True if opened and self.env else False
         return self.opened
 
 
+    def loadFormat(self, compact=False):
+        """
+        Returns storage format of .env from its meta sub db. A new database
+        is marked with compact or hex format as given by compact. An unmarked
+        database that already holds sub dbs predates formats so is hex.
+
+        Parameters:
+            compact (bool): True means mark new database compact
+        """
+        fresh = self.env.stat()["entries"] == 0  # no named sub dbs yet
+        try:
+            meta = self.env.open_db(key=MetaSubkey)
+        except lmdb.ReadonlyError:  # readonly and never marked
+            return HexFormat
+
+        with self.env.begin(db=meta, write=False) as txn:
+            fmt = txn.get(FormatKey)
+        if fmt is None:
+            fmt = CompactFormat if compact and fresh else HexFormat
+            if not self.readonly:
+                with self.env.begin(db=meta, write=True) as txn:
+                    txn.put(FormatKey, fmt)
+        return bytes(fmt)
+
+
+    def _layout(self, compact):
+        """ Sets ordinal layout attributes for compact or hex format """
+        self.compact = compact
+        self.proemSize = CompactSize if compact else ProemSize + 1
+        self.maxSuffix = MaxCompact if compact else MaxSuffix
+
+
+    def proem(self, ion):
+        """
+        Returns bytes of insertion ordering proem of int ion to prepend to a
+        dup value in the storage format of .env
+        """
+        if self.compact:
+            return ion.to_bytes(CompactSize, "big")
+        return b'%032x.' % ion
+
+
+    def unproem(self, val):
+        """
+        Returns int insertion ordinal from proem of dup value val in the
+        storage format of .env
+        """
+        if self.compact:
+            return int.from_bytes(val[:CompactSize], "big")
+        return int(bytes(val[:ProemSize]), 16)
+
+
+    def suffix(self, key, ion, *, sep=b'.'):
+        """
+        Returns iokey bytes of key with insertion ordinal ion suffix in the
+        storage format of .env. See module function suffix.
+        Compact suffix is ion as 11 chars of ascii ordered Base64 so iokeys
+        still sort in insertion order and split cleanly on sep.
+        """
+        if not self.compact:
+            return suffix(key, ion, sep=sep)
+        if isinstance(key, memoryview):
+            key = bytes(key)
+        elif hasattr(key, "encode"):
+            key = key.encode("utf-8")
+        if hasattr(sep, "encode"):
+            sep = sep.encode("utf-8")
+        # leading zero byte pads 64 bits to 72 so drop its first 6 bit char
+        ion = base64.b64encode(ion.to_bytes(CompactSize + 1, "big"))[1:]
+        return key + sep + ion.translate(ToSortB64)
+
+
+    def unsuffix(self, iokey, *, sep=b'.'):
+        """
+        Returns (key, ion) by stripping insertion ordinal suffix in the storage
+        format of .env from iokey. See module function unsuffix.
+        """
+        if not self.compact:
+            return unsuffix(iokey, sep=sep)
+        if isinstance(iokey, memoryview):
+            iokey = bytes(iokey)
+        elif hasattr(iokey, "encode"):
+            iokey = iokey.encode("utf-8")
+        if hasattr(sep, "encode"):
+            sep = sep.encode("utf-8")
+        ion = b"A" + iokey[-CompactSuffixSize:].translate(FromSortB64)
+        return (iokey[:-(CompactSuffixSize + len(sep))],
+                int.from_bytes(base64.b64decode(ion), "big"))
+
+
+    def migrate(self, compact=True):
+        """
+        Rewrites the insertion ordinals of all dup proems in the sub dbs named
+        by .IoDupSubkeys and of all key suffixes in io set sub dbs named by
+        .IoSetSubkeys or registered in .ioSets into compact or hex format and
+        marks the new format, all in one write transaction so the database is
+        never seen half migrated. Migrates an open database in place. Other
+        processes with the database open must reopen it afterwards.
+
+        Returns dict of number of entries rewritten keyed by subkey
+
+        Parameters:
+            compact (bool): True means migrate to compact format
+                            False means migrate back to hex format
+        """
+        if self.readonly:
+            raise lmdb.ReadonlyError("Readonly database can not be migrated.")
+        compact = True if compact else False
+        if compact == self.compact:
+            return dict()
+
+        dups = {subkey: self.env.open_db(key=subkey, dupsort=True)
+                for subkey in self.IoDupSubkeys}
+        seps = dict(self.IoSetSubkeys)
+        seps.update(self.ioSets)
+        sets = {subkey: self.env.open_db(key=subkey) for subkey in seps}
+        counts = dict()
+        prior = self.compact
+
+        with self.env.begin(write=True, buffers=False) as txn:
+            try:
+                olds = dict()  # read everything in prior format
+                for subkey, db in dups.items():
+                    olds[subkey] = [(key, self.unproem(val), val[self.proemSize:])
+                                    for key, val in txn.cursor(db=db).iternext()]
+                for subkey, db in sets.items():
+                    olds[subkey] = [self.unsuffix(iokey, sep=seps[subkey]) + (val,)
+                                    for iokey, val in txn.cursor(db=db).iternext()]
+
+                self._layout(compact)  # write everything in new format
+                for subkey, db in dups.items():
+                    txn.drop(db, delete=False)
+                    txn.cursor(db=db).putmulti([(key, self.proem(ion) + val)
+                                                for key, ion, val in olds[subkey]])
+                    counts[subkey] = len(olds[subkey])
+                for subkey, db in sets.items():
+                    txn.drop(db, delete=False)
+                    items = sorted((self.suffix(key, ion, sep=seps[subkey]), val)
+                                   for key, ion, val in olds[subkey])
+                    txn.cursor(db=db).putmulti(items)
+                    counts[subkey] = len(items)
+
+                meta = self.env.open_db(key=MetaSubkey, txn=txn)
+                txn.put(FormatKey, CompactFormat if compact else HexFormat, db=meta)
+            except Exception:
+                self._layout(prior)
+                raise
+
+        return counts
+
+
     def close(self, clear=False):
         """
         Close lmdb at .env and if clear or .temp then remove lmdb directory at .path
@@ -403,6 +640,202 @@ class LMDBer(filing.Filer):
         return(super(LMDBer, self).close(clear=clear))
 
 
+    @property
+    def txnid(self):
+        """
+        Returns id of last committed write transaction of .env or None when
+        not opened. Changes whenever any writer, in this or another process,
+        commits to the database so comparing successive values is a cheap
+        way to tell whether there may be new work in the database.
+        """
+        if not self.env:
+            return None
+        return self.env.info()["last_txnid"]
+
+
+    @contextmanager
+    def snapshot(self, txn=None):
+        """
+        Context manager of read session that makes all reads of this thread
+        through raw methods and through Suber and Komer sub dbs share one LMDB
+        read transaction. Reads in the session see one consistent view of the
+        database as of its start and pay transaction setup once. Writes
+        commit as usual but are not seen by reads until the session ends.
+        Nested sessions reuse the outer transaction. Read buffers and
+        iterators are only valid inside the session.
+
+        Parameters:
+            txn (lmdb.Transaction | None): open transaction of .env to read
+                with instead of a new one. Caller keeps ownership of it.
+
+        Usage:
+            with baser.snapshot():
+                for msg in baser.cloneAllPreIter():
+                    ...
+        """
+        if txn is None and getattr(self._local, "txn", None) is not None:  # nested
+            yield self
+            return
+
+        if txn is not None:
+            with self._session(txn, write=False):
+                yield self
+            return
+
+        with self.env.begin(write=False, buffers=True) as txn:
+            with self._session(txn, write=False):
+                yield self
+
+
+    def snapshotIter(self, gen):
+        """
+        Returns generator of the items of generator gen whose reads all share
+        one read transaction as in .snapshot. The session is only entered while
+        gen runs so reads of this thread between items are not held to the
+        snapshot. When already in a session gen reads with its transaction.
+
+        Parameters:
+            gen (Generator): of items read from .env, not yet started
+        """
+        if getattr(self._local, "txn", None) is not None:  # nested
+            yield from gen
+            return
+
+        with self.env.begin(write=False, buffers=True) as txn:
+            while True:
+                with self._session(txn, write=False):
+                    try:
+                        item = next(gen)
+                    except StopIteration:
+                        return
+                yield item
+
+
+    @contextmanager
+    def transact(self, txn=None):
+        """
+        Context manager of write session that makes all reads and writes of
+        this thread through raw methods and through Suber and Komer sub dbs
+        share one LMDB write transaction so a batch of updates commits at once
+        or not at all when an exception leaves the context. Reads in the
+        session see its writes. Values read in the session are bytes copies
+        since buffers would not survive later writes in the same transaction.
+        Nested sessions reuse the outer write transaction.
+
+        Yields the shared transaction.
+
+        Parameters:
+            txn (lmdb.Transaction | None): open write transaction of .env to
+                use instead of a new one. Caller keeps ownership of it and
+                commits or aborts it.
+
+        Usage:
+            with baser.transact():
+                baser.putEvt(key, raw)
+                baser.fons.pin(keys=key, val=seqner)
+        """
+        if txn is None and getattr(self._local, "write", False):  # nested
+            yield self._local.txn
+            return
+
+        if txn is not None:
+            with self._session(txn, write=True):
+                yield txn
+            return
+
+        with self.env.begin(write=True, buffers=False) as txn:
+            with self._session(txn, write=True):
+                yield txn
+
+
+    @contextmanager
+    def _session(self, txn, write):
+        """ Binds txn as shared transaction of this thread for the context """
+        prior = (getattr(self._local, "txn", None), getattr(self._local, "write", False))
+        self._local.txn, self._local.write = txn, write
+        try:
+            yield txn
+        finally:
+            self._local.txn, self._local.write = prior
+
+
+    def reader(self, db):
+        """
+        Returns read transaction context for sub db. This is the shared
+        transaction of the session of this thread wrapped in a SubTxn when in
+        a session otherwise a new read transaction of db.
+
+        Parameters:
+            db (lmdb._Database): named sub db
+        """
+        txn = getattr(self._local, "txn", None)
+        if txn is None:
+            return self.env.begin(db=db, write=False, buffers=True)
+        return SubTxn(txn, db)
+
+
+    def writer(self, db):
+        """
+        Returns write transaction context for sub db. This is the shared
+        transaction of the write session of this thread wrapped in a SubTxn
+        when in a write session otherwise a new write transaction of db.
+
+        Parameters:
+            db (lmdb._Database): named sub db
+        """
+        if getattr(self._local, "write", False):
+            return SubTxn(self._local.txn, db)
+        return self.env.begin(db=db, write=True, buffers=True)
+
+
+    # Batches of entries with no duplicate values allowed at each key. (dupsort==False)
+    def putMany(self, db, items, *, overwrite=False):
+        """
+        Write each (key, val) of items to db in one transaction using a cursor
+        putmulti in key order which appends to the B+tree fastest.
+        Returns int number of items written
+
+        Parameters:
+            db (lmdb._Database): instance of named sub db with dupsort==False
+            items (Iterable): of (key, val) duples of bytes
+            overwrite (bool): True means replace val at existing key
+                              False means skip item with existing key
+        """
+        items = sorted(items, key=lambda item: item[0])  # stable so last wins
+        if not items:
+            return 0
+        with self.writer(db) as txn:
+            consumed, added = txn.cursor().putmulti(items, dupdata=False,
+                                                    overwrite=overwrite)
+        return added
+
+
+    def getMany(self, db, keys):
+        """
+        Returns list of vals at each key in keys in one read transaction with
+        None for each key with no entry
+
+        Parameters:
+            db (lmdb._Database): instance of named sub db with dupsort==False
+            keys (Iterable): of bytes keys
+        """
+        with self.reader(db) as txn:
+            return [txn.get(key) for key in keys]
+
+
+    def delMany(self, db, keys):
+        """
+        Deletes entry at each key in keys in one transaction.
+        Returns int number of entries deleted
+
+        Parameters:
+            db (lmdb._Database): instance of named sub db with dupsort==False
+            keys (Iterable): of bytes keys
+        """
+        with self.writer(db) as txn:
+            return sum(1 for key in sorted(keys) if txn.delete(key))
+
+
     # For subdbs with no duplicate values allowed at each key. (dupsort==False)
     def putVal(self, db, key, val):
         """
@@ -416,7 +849,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.writer(db) as txn:
             return (txn.put(key, val, overwrite=False))
 
 
@@ -431,7 +864,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.writer(db) as txn:
             return (txn.put(key, val))
 
 
@@ -445,7 +878,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.reader(db) as txn:
             return( txn.get(key))
 
 
@@ -458,7 +891,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=False
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.writer(db) as txn:
             return (txn.delete(key))
 
 
@@ -469,7 +902,7 @@ class LMDBer(filing.Filer):
         Parameters:
             db is opened named sub db with dupsort=True
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.reader(db) as txn:
             cursor = txn.cursor()
             count = 0
             for _, _ in cursor:
@@ -495,7 +928,7 @@ class LMDBer(filing.Filer):
             split (bool): True means split key at sep before returning
             sep (bytes): separator char for key
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.reader(db) as txn:
             cursor = txn.cursor()
             if not cursor.set_range(key):  #  moves to val at key >= key, first if empty
                 return  # no values end of db
@@ -530,7 +963,7 @@ class LMDBer(filing.Filer):
                         from multiple branches of the key space. If top key is
                         empty then gets all items in database
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.reader(db) as txn:
             cursor = txn.cursor()
             if cursor.set_range(key):  # move to val at key >= key if any
                 for ckey, cval in cursor.iternext():  # get key, val at cursor
@@ -564,7 +997,7 @@ class LMDBer(filing.Filer):
         """
         # when deleting can't use cursor.iternext() because the cursor advances
         # twice (skips one) once for iternext and once for delete.
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.writer(db) as txn:
             result = False
             cursor = txn.cursor()
             if cursor.set_range(key):  # move to val at key >= key if any
@@ -599,7 +1032,7 @@ class LMDBer(filing.Filer):
         # set key with fn at max and then walk backwards to find last entry at pre
         # if any otherwise zeroth entry at pre
         key = onKey(pre, MaxON)
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.writer(db) as txn:
             on = 0  # unless other cases match then zeroth entry at pre
             cursor = txn.cursor()
             if not cursor.set_range(key):  # max is past end of database
@@ -646,7 +1079,7 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix
             on is int ordinal number to resume replay
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.reader(db) as txn:
             cursor = txn.cursor()
             key = onKey(pre, on)  # start replay at this enty 0 is earliest
             if not cursor.set_range(key):  #  moves to val at key >= key
@@ -674,7 +1107,7 @@ class LMDBer(filing.Filer):
             key is key location in db to resume replay,
                    If empty then start at first key in database
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.reader(db) as txn:
             cursor = txn.cursor()
             if not cursor.set_range(key):  #  moves to val at key >= key, first if empty
                 return  # no values end of db
@@ -711,14 +1144,14 @@ class LMDBer(filing.Filer):
         """
         result = False
         vals = oset(vals)  # make set
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.writer(db) as txn:
             ion = 0
-            iokey = suffix(key, ion, sep=sep)  # start zeroth entry if any
+            iokey = self.suffix(key, ion, sep=sep)  # start zeroth entry if any
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 pvals = oset()  # pre-existing vals at key
                 for iokey, val in cursor.iternext():  # get iokey, val at cursor
-                    ckey, cion = unsuffix(iokey, sep=sep)
+                    ckey, cion = self.unsuffix(iokey, sep=sep)
                     if ckey == key:
                         pvals.add(val)  # another entry at key
                         ion = cion + 1  # ion to add at is increment of cion
@@ -727,7 +1160,7 @@ class LMDBer(filing.Filer):
                 vals -= pvals  # remove vals already in pvals
 
             for i, val in enumerate(vals):
-                iokey = suffix(key, ion+i, sep=sep)  # ion is at add on amount
+                iokey = self.suffix(key, ion+i, sep=sep)  # ion is at add on amount
                 result = cursor.put(iokey,
                                     val,
                                     dupdata=False,
@@ -751,14 +1184,14 @@ class LMDBer(filing.Filer):
             val (bytes): serialized value to add
 
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.writer(db) as txn:
             vals = oset()
             ion = 0
-            iokey = suffix(key, ion, sep=sep)  # start zeroth entry if any
+            iokey = self.suffix(key, ion, sep=sep)  # start zeroth entry if any
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, cval in cursor.iternext():  # get iokey, val at cursor
-                    ckey, cion = unsuffix(iokey, sep=sep)
+                    ckey, cion = self.unsuffix(iokey, sep=sep)
                     if ckey == key:
                         vals.add(cval)  # another entry at key
                         ion = cion + 1 # ion to add at is increment of cion
@@ -768,7 +1201,7 @@ class LMDBer(filing.Filer):
             if val in vals:  # already in set
                 return False
 
-            iokey = suffix(key, ion, sep=sep)  # ion is at add on amount
+            iokey = self.suffix(key, ion, sep=sep)  # ion is at add on amount
             return cursor.put(iokey, val, dupdata=False, overwrite=False)
 
 
@@ -790,9 +1223,9 @@ class LMDBer(filing.Filer):
         self.delIoSetVals(db=db, key=key, sep=sep)
         result = False
         vals = oset(vals)  # make set
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.writer(db) as txn:
             for i, val in enumerate(vals):
-                iokey = suffix(key, i, sep=sep)  # ion is at add on amount
+                iokey = self.suffix(key, i, sep=sep)  # ion is at add on amount
                 result = txn.put(iokey, val, dupdata=False, overwrite=True) or result
             return result
 
@@ -813,8 +1246,8 @@ class LMDBer(filing.Filer):
             val (bytes): value to append
         """
         ion = 0  # default is zeroth insertion at key
-        iokey = suffix(key, ion=MaxSuffix, sep=sep)  # make iokey at max and walk back
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        iokey = self.suffix(key, ion=self.maxSuffix, sep=sep)  # make iokey at max and walk back
+        with self.writer(db) as txn:
             cursor = txn.cursor()  # create cursor to walk back
             if not cursor.set_range(iokey):  # max is past end of database
                 # Three possibilities for max past end of database
@@ -822,14 +1255,14 @@ class LMDBer(filing.Filer):
                 # 2. last entry in db is for other key before key
                 # 3. database is empty
                 if cursor.last():  # not 3. empty db, so either 1. or 2.
-                    ckey, cion = unsuffix(cursor.key(), sep=sep)
+                    ckey, cion = self.unsuffix(cursor.key(), sep=sep)
                     if ckey == key:  # 1. last is last entry for same key
                         ion = cion + 1  # so set ion to the increment of cion
             else:  # max is not past end of database
                 # Two possibilities for max not past end of databseso
                 # 1. cursor at max entry at key
                 # 2. other key after key with entry in database
-                ckey, cion = unsuffix(cursor.key(), sep=sep)
+                ckey, cion = self.unsuffix(cursor.key(), sep=sep)
                 if ckey == key:  # 1. last entry for key is already at max
                     raise ValueError("Number part of key {} at maximum"
                                      " size.".format(ckey))
@@ -839,11 +1272,11 @@ class LMDBer(filing.Filer):
                         # 2. prior entry with two possiblities:
                         # 1. same key
                         # 2. other key before key
-                        ckey, cion = unsuffix(cursor.key(), sep=sep)
+                        ckey, cion = self.unsuffix(cursor.key(), sep=sep)
                         if ckey == key:  # prior (last) entry at key
                             ion = cion + 1  # so set ion to the increment of cion
 
-            iokey = suffix(key, ion=ion, sep=sep)
+            iokey = self.suffix(key, ion=ion, sep=sep)
             if not cursor.put(iokey, val, overwrite=False):
                 raise  ValueError("Failed appending {} at {}.".format(val, key))
 
@@ -864,13 +1297,13 @@ class LMDBer(filing.Filer):
             ion (int): starting ordinal value, default 0
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.reader(db) as txn:
             vals = []
-            iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
+            iokey = self.suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, val in cursor.iternext():  # get iokey, val at cursor
-                    ckey, cion = unsuffix(iokey, sep=sep)
+                    ckey, cion = self.unsuffix(iokey, sep=sep)
                     if ckey != key:  # prev entry if any was the last entry for key
                         break  # done
                     vals.append(val)  # another entry at key
@@ -892,12 +1325,12 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             ion (int): starting ordinal value, default 0
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
+        with self.reader(db) as txn:
+            iokey = self.suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, val in cursor.iternext():  # get key, val at cursor
-                    ckey, cion = unsuffix(iokey, sep=sep)
+                    ckey, cion = self.unsuffix(iokey, sep=sep)
                     if ckey != key: #  prev entry if any was the last entry for key
                         break  # done
                     yield (val)  # another entry at key
@@ -919,8 +1352,8 @@ class LMDBer(filing.Filer):
         """
         val = None
         ion = None  # no last value
-        iokey = suffix(key, ion=MaxSuffix, sep=sep)  # make iokey at max and walk back
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        iokey = self.suffix(key, ion=self.maxSuffix, sep=sep)  # make iokey at max and walk back
+        with self.reader(db) as txn:
             cursor = txn.cursor()  # create cursor to walk back
             if not cursor.set_range(iokey):  # max is past end of database
                 # Three possibilities for max past end of database
@@ -928,14 +1361,14 @@ class LMDBer(filing.Filer):
                 # 2. last entry in db is for other key before key
                 # 3. database is empty
                 if cursor.last():  # not 3. empty db, so either 1. or 2.
-                    ckey, cion = unsuffix(cursor.key(), sep=sep)
+                    ckey, cion = self.unsuffix(cursor.key(), sep=sep)
                     if ckey == key:  # 1. last is last entry for same key
                         ion = cion  # so set ion to cion
             else:  # max is not past end of database
                 # Two possibilities for max not past end of databseso
                 # 1. cursor at max entry at key
                 # 2. other key after key with entry in database
-                ckey, cion = unsuffix(cursor.key(), sep=sep)
+                ckey, cion = self.unsuffix(cursor.key(), sep=sep)
                 if ckey == key:  # 1. last entry for key is already at max
                     ion = cion
                 else:  # 2. other key after key so backup one entry
@@ -944,12 +1377,12 @@ class LMDBer(filing.Filer):
                         # 2. prior entry with two possiblities:
                         # 1. same key
                         # 2. other key before key
-                        ckey, cion = unsuffix(cursor.key(), sep=sep)
+                        ckey, cion = self.unsuffix(cursor.key(), sep=sep)
                         if ckey == key:  # prior (last) entry at key
                             ion = cion  # so set ion to the cion
 
             if ion is not None:
-                iokey = suffix(key, ion=ion, sep=sep)
+                iokey = self.suffix(key, ion=ion, sep=sep)
                 val = cursor.get(iokey)
 
             return val
@@ -986,13 +1419,13 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
         """
         result = False
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            iokey = suffix(key, 0, sep=sep)  # start at zeroth value for key
+        with self.writer(db) as txn:
+            iokey = self.suffix(key, 0, sep=sep)  # start at zeroth value for key
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 iokey, cval = cursor.item()
                 while iokey:  # end of database iokey == b'' cant internext.
-                    ckey, cion = unsuffix(iokey, sep=sep)
+                    ckey, cion = self.unsuffix(iokey, sep=sep)
                     if ckey != key:  # past key
                         break
                     result = cursor.delete() or result  # delete moves cursor to next item
@@ -1029,12 +1462,12 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             val (bytes): value to delete
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
-            iokey = suffix(key, 0, sep=sep)  # start zeroth value for key
+        with self.writer(db) as txn:
+            iokey = self.suffix(key, 0, sep=sep)  # start zeroth value for key
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, cval in cursor.iternext():  # get iokey, val at cursor
-                    ckey, cion = unsuffix(iokey, sep=sep)
+                    ckey, cion = self.unsuffix(iokey, sep=sep)
                     if ckey != key:  # prev entry if any was the last entry for key
                         break  # done
                     if val == cval:
@@ -1055,13 +1488,13 @@ class LMDBer(filing.Filer):
             ion (int): starting ordinal value, default 0
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.reader(db) as txn:
             items = []
-            iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
+            iokey = self.suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, val in cursor.iternext():  # get iokey, val at cursor
-                    ckey, cion = unsuffix(iokey, sep=sep)
+                    ckey, cion = self.unsuffix(iokey, sep=sep)
                     if ckey != key:  # prev entry if any was the last entry for key
                         break  # done
                     items.append((iokey, val))  # another entry at key
@@ -1083,12 +1516,12 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             ion (int): starting ordinal value, default 0
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
-            iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
+        with self.reader(db) as txn:
+            iokey = self.suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
                 for iokey, val in cursor.iternext():  # get key, val at cursor
-                    ckey, cion = unsuffix(iokey, sep=sep)
+                    ckey, cion = self.unsuffix(iokey, sep=sep)
                     if ckey != key: #  prev entry if any was the last entry for key
                         break  # done
                     yield (iokey, val)  # another entry at key
@@ -1107,7 +1540,7 @@ class LMDBer(filing.Filer):
             db (lmdb._Database): instance of named sub db with dupsort==False
             iokey (bytes): actual key with ordinal key suffix
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.writer(db) as txn:
             return txn.delete(iokey)
 
 
@@ -1128,7 +1561,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             vals is list of bytes of values to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.writer(db) as txn:
             result = True
             for val in vals:
                 result = result and txn.put(key, val, dupdata=True)
@@ -1157,7 +1590,7 @@ class LMDBer(filing.Filer):
         dups = set(self.getVals(db, key))  #get preexisting dups if any
         result = False
         if val not in dups:
-            with self.env.begin(db=db, write=True, buffers=True) as txn:
+            with self.writer(db) as txn:
                 result = txn.put(key, val, dupdata=True)
         return result
 
@@ -1174,7 +1607,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.reader(db) as txn:
             cursor = txn.cursor()
             vals = []
             if cursor.set_key(key):  # moves to first_dup
@@ -1193,7 +1626,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.reader(db) as txn:
             cursor = txn.cursor()
             val = None
             if cursor.set_key(key):  # move to first_dup
@@ -1213,7 +1646,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.reader(db) as txn:
             cursor = txn.cursor()
             vals = []
             if cursor.set_key(key):  # moves to first_dup
@@ -1229,7 +1662,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.reader(db) as txn:
             cursor = txn.cursor()
             count = 0
             if cursor.set_key(key):  # moves to first_dup
@@ -1248,7 +1681,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db
             pre is bytes of key within sub db's keyspace pre.on
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.reader(db) as txn:
             cursor = txn.cursor()
             key = onKey(pre, on)  # start replay at this enty 0 is earliest
             count = 0
@@ -1274,7 +1707,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of dup val at key to delete
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.writer(db) as txn:
             return (txn.delete(key, val))
 
 
@@ -1291,7 +1724,7 @@ class LMDBer(filing.Filer):
         Because lmdb is lexocographic an insertion ordering proem is prepended to
         all values that makes lexocographic order that same as insertion order
         Duplicates are ordered as a pair of key plus value so prepending proem
-        to each value changes duplicate ordering. Proem is 33 characters long.
+        to each value changes duplicate ordering. Proem is .proemSize long.
         With 32 character hex string followed by '.' for essentiall unlimited
         number of values which will be limited by memory.
         With prepended proem ordinal must explicity check for duplicate values
@@ -1306,16 +1739,16 @@ class LMDBer(filing.Filer):
 
         result = False
         dups = set(self.getIoVals(db, key))  #get preexisting dups if any
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.writer(db) as txn:
             idx = 0
             cursor = txn.cursor()
             if cursor.set_key(key): # move to key if any
                 if cursor.last_dup(): # move to last dup
-                    idx = 1 + int(bytes(cursor.value()[:32]), 16)  # get last index as int
+                    idx = 1 + self.unproem(cursor.value())  # get last index as int
 
             for val in vals:
                 if val not in dups:
-                    val = (b'%032x.' % (idx)) +  val  # prepend ordering proem
+                    val = self.proem(idx) + val  # prepend ordering proem
                     txn.put(key, val, dupdata=True)
                     idx += 1
                     result = True
@@ -1350,12 +1783,12 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.reader(db) as txn:
             cursor = txn.cursor()
             vals = []
             if cursor.set_key(key):  # moves to first_dup
                 # slice off prepended ordering proem
-                vals = [val[33:] for val in cursor.iternext_dup()]
+                vals = [val[self.proemSize:] for val in cursor.iternext_dup()]
             return vals
 
 
@@ -1371,12 +1804,12 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.reader(db) as txn:
             cursor = txn.cursor()
             vals = []
             if cursor.set_key(key):  # moves to first_dup
                 for val in cursor.iternext_dup():
-                    yield val[33:]  # slice off prepended ordering proem
+                    yield val[self.proemSize:]  # slice off prepended ordering proem
 
 
     def getIoValLast(self, db, key):
@@ -1391,12 +1824,12 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.reader(db) as txn:
             cursor = txn.cursor()
             val = None
             if cursor.set_key(key):  # move to first_dup
                 if cursor.last_dup(): # move to last_dup
-                    val = cursor.value()[33:]  # slice off prepended ordering proem
+                    val = cursor.value()[self.proemSize:]  # slice off prepended ordering proem
             return val
 
 
@@ -1421,7 +1854,7 @@ class LMDBer(filing.Filer):
                     Othewise don't skip for first pass
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.reader(db) as txn:
             cursor = txn.cursor()
             items = []
             if cursor.set_range(key):  # moves to first_dup at key
@@ -1430,7 +1863,7 @@ class LMDBer(filing.Filer):
                     found = cursor.next_nodup()  # skip to next key not dup if any
                 if found:
                     # slice off prepended ordering prefix on value in item
-                    items = [(key, val[33:]) for key, val in cursor.iternext_dup(keys=True)]
+                    items = [(key, val[self.proemSize:]) for key, val in cursor.iternext_dup(keys=True)]
             return items
 
 
@@ -1455,7 +1888,7 @@ class LMDBer(filing.Filer):
                     Othewise don't skip for first pass
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.reader(db) as txn:
             cursor = txn.cursor()
             if cursor.set_range(key):  # moves to first_dup at key
                 found = True
@@ -1463,7 +1896,74 @@ class LMDBer(filing.Filer):
                     found = cursor.next_nodup()  # skip to next key not dup if any
                 if found:
                     for key, val in cursor.iternext_dup(keys=True):
-                        yield (key, val[33:]) # slice off prepended ordering prefix
+                        yield (key, val[self.proemSize:]) # slice off prepended ordering prefix
+
+
+    def getIoItemsTopIter(self, db, top=b"", after=None):
+        """
+        Returns iterator of triples (key, ion, val) of all dup items at all keys
+        in db that start with top in key order and then insertion order.
+        ion is int insertion ordinal from proem and val has proem stripped.
+        When top is empty iterates over whole db.
+
+        Seeks directly to the first key at or after top so a prefix such as
+        pre + b'.' only visits the items of that prefix. When after is given
+        the iteration resumes just after the item at after = (key, ion) so a
+        (key, ion) of a returned item is a cursor for pagination.
+
+        Holds a read transaction until exhausted or closed so callers that
+        pause between items should take bounded slices and close it.
+
+        Assumes DB opened with dupsort=True
+
+        Parameters:
+            db (lmdb._Database): opened named sub db with dupsort=True
+            top (bytes): truncated top key, a key space prefix
+            after (tuple | None): (key, ion) of item to resume after
+        """
+        with self.reader(db) as txn:
+            cursor = txn.cursor()
+            if after is not None:
+                key, ion = after
+                proem = self.proem(ion)
+                found = cursor.set_range_dup(key, proem)
+                if found and bytes(cursor.value()[:self.proemSize]) == proem:
+                    found = cursor.next()  # next dup or first dup of next key
+                if not found:  # no dups at or after ion so start at next key
+                    found = cursor.set_range(key)
+                    if found and bytes(cursor.key()) == key:
+                        found = cursor.next_nodup()
+            else:
+                found = cursor.set_range(top)
+
+            while found:
+                key = bytes(cursor.key())
+                if not key.startswith(top):
+                    break
+                val = cursor.value()
+                yield (key, self.unproem(val), bytes(val[self.proemSize:]))
+                found = cursor.next()
+
+    def cntIoValsTop(self, db, top=b""):
+        """
+        Returns count of all dup values at all keys in db that start with top.
+        Counts dups per key without reading values.
+        Assumes DB opened with dupsort=True
+
+        Parameters:
+            db (lmdb._Database): opened named sub db with dupsort=True
+            top (bytes): truncated top key, a key space prefix
+        """
+        with self.reader(db) as txn:
+            cursor = txn.cursor()
+            count = 0
+            found = cursor.set_range(top)
+            while found:
+                if not bytes(cursor.key()).startswith(top):
+                    break
+                count += cursor.count()
+                found = cursor.next_nodup()
+            return count
 
 
     def cntIoVals(self, db, key):
@@ -1476,7 +1976,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.reader(db) as txn:
             cursor = txn.cursor()
             count = 0
             if cursor.set_key(key):  # moves to first_dup
@@ -1494,7 +1994,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.writer(db) as txn:
             return (txn.delete(key))
 
 
@@ -1509,7 +2009,7 @@ class LMDBer(filing.Filer):
         Because lmdb is lexocographic an insertion ordering proem is prepended to
         all values that makes lexocographic order that same as insertion order
         Duplicates are ordered as a pair of key plus value so prepending proem
-        to each value changes duplicate ordering. Proem is 33 characters long.
+        to each value changes duplicate ordering. Proem is .proemSize long.
         With 32 character hex string followed by '.' for essentially unlimited
         number of values which will be limited by memory.
 
@@ -1527,11 +2027,11 @@ class LMDBer(filing.Filer):
             val is bytes of value to be deleted without intersion ordering proem
         """
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.writer(db) as txn:
             cursor = txn.cursor()
             if cursor.set_key(key):  # move to first_dup
                 for proval in cursor.iternext_dup():  #  value with proem
-                    if val == proval[33:]:  #  strip of proem
+                    if val == proval[self.proemSize:]:  #  strip of proem
                         return cursor.delete()
         return False
 
@@ -1554,13 +2054,13 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.reader(db) as txn:
             cursor = txn.cursor()
             key = snKey(pre, cnt:=0)
             while cursor.set_key(key):  # moves to first_dup
                 for val in cursor.iternext_dup():
                     # slice off prepended ordering prefix
-                    yield val[33:]
+                    yield val[self.proemSize:]
                 key = snKey(pre, cnt:=cnt+1)
 
     def getIoValsAllPreBackIter(self, db, pre, fn):
@@ -1583,14 +2083,14 @@ class LMDBer(filing.Filer):
                 within sub db's keyspace
             fn is first
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.reader(db) as txn:
             cursor = txn.cursor()
             key = snKey(pre, cnt := fn)
             # set_key returns True if exact key else false
             while cursor.set_key(key):  # moves to first_dup if valid key
                 for val in cursor.iternext_dup():
                     # slice off prepended ordering prefix
-                    yield val[33:]
+                    yield val[self.proemSize:]
                 key = snKey(pre, cnt:=cnt-1)
 
 
@@ -1613,12 +2113,12 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.reader(db) as txn:
             cursor = txn.cursor()
             key = snKey(pre, cnt:=0)
             while cursor.set_key(key):  # moves to first_dup
                 if cursor.last_dup(): # move to last_dup
-                    yield cursor.value()[33:]  # slice off prepended ordering prefix
+                    yield cursor.value()[self.proemSize:]  # slice off prepended ordering prefix
                 key = snKey(pre, cnt:=cnt+1)
 
 
@@ -1645,7 +2145,7 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.reader(db) as txn:
             cursor = txn.cursor()
             key = snKey(pre, cnt:=0)
             while cursor.set_range(key):  #  moves to first dup of key >= key
@@ -1654,7 +2154,7 @@ class LMDBer(filing.Filer):
                 if front != pre:
                     break
                 for val in cursor.iternext_dup():
-                    yield val[33:]  # slice off prepended ordering prefix
+                    yield val[self.proemSize:]  # slice off prepended ordering prefix
                 cnt = int(back, 16)
                 key = snKey(pre, cnt:=cnt+1)
 
@@ -193,3 +193,94 @@ class Broker:
             self.cigardb.rem(keys=keys)
             self.serderdb.rem(keys=keys)
             self.daterdb.rem(keys=keys)
+
+
+class Waitlist:
+    """
+    Waitlist indexes entries of escrows by the event or other item they await so
+    escrow processing revisits an entry only once what it awaits has arrived
+    instead of walking the whole escrow on every pass.
+
+    An entry waits on the prefix and optional sequence number of what it awaits.
+    Whoever accepts that item calls .wake which moves all entries waiting on it
+    to the woken set of their escrow. Escrow processing then takes the woken keys
+    of its escrow and waits them again when they are still not ready. Both are
+    persisted so waits and wakes survive a restart.
+
+    Attributes:
+        waits (IoSetSuber): escrow entry tokens keyed by awaited (pre, sn)
+        woken (IoSetSuber): escrow entry keys keyed by escrow name
+
+    """
+
+    def __init__(self, db, subkey):
+        """ Initialize instance
+
+        Parameters:
+            db (LMDBer): database of escrows
+            subkey (str): prefix of subkeys of sub dbs of waitlist
+
+        """
+        self.waits = subing.IoSetSuber(db=db, subkey=subkey + '-wts.')
+        self.woken = subing.IoSetSuber(db=db, subkey=subkey + '-wkn.')
+
+    @staticmethod
+    def awaited(pre, sn=None):
+        """ Returns keys of awaited item at pre and optional int sn """
+        return (pre,) if sn is None else (pre, f"{sn:032x}")
+
+    def wait(self, escrow, keys, pre, sn=None):
+        """ Makes entry at keys of escrow wait on item at pre and sn
+
+        Parameters:
+            escrow (str): name of escrow of entry
+            keys (tuple): of str keys of entry in escrow
+            pre (str): qb64 prefix of awaited item
+            sn (int | None): sequence number of awaited event if any
+
+        """
+        self.waits.add(keys=self.awaited(pre, sn), val=".".join((escrow, *keys)))
+
+    def wake(self, pre, sn=None):
+        """ Wakes all entries waiting on item at pre and sn. Returns number woken
+
+        Parameters:
+            pre (str): qb64 prefix of accepted item
+            sn (int | None): sequence number of accepted event if any
+
+        """
+        awaited = self.awaited(pre, sn)
+        tokens = self.waits.get(keys=awaited)
+        for token in tokens:
+            escrow, _, keys = token.partition(".")
+            self.woken.add(keys=(escrow,), val=keys)
+        if tokens:
+            self.waits.rem(keys=awaited)
+        return len(tokens)
+
+    def rouse(self, escrow, keys):
+        """ Wakes entry at keys of escrow regardless of what it waits on """
+        self.woken.add(keys=(escrow,), val=".".join(keys))
+
+    def take(self, escrow):
+        """ Returns list of key tuples of woken entries of escrow and clears them """
+        vals = self.woken.get(keys=(escrow,))
+        if vals:
+            self.woken.rem(keys=(escrow,))
+        return [tuple(val.split(".")) for val in vals]
+
+    def items(self, escrow, suber):
+        """ Returns list of (keys, val) items of woken entries of escrow in suber
+
+        Parameters:
+            escrow (str): name of escrow
+            suber (SuberBase): sub db of escrow entries with one or a set of vals
+        """
+        items = []
+        for keys in self.take(escrow):
+            vals = suber.get(keys=keys)
+            if vals is None:  # entry gone
+                continue
+            for val in (vals if isinstance(vals, list) else [vals]):
+                items.append((keys, val))
+        return items
@@ -8,10 +8,8 @@ import types
 import json
 from dataclasses import dataclass
 from typing import Type, Union
-from collections.abc import Iterable
+from collections.abc import Iterable, MutableMapping
 
-import cbor2
-import msgpack
 import lmdb
 
 
@@ -20,6 +18,9 @@ from .. import help
 from ..core import coring
 from ..help import helping
 
+cbor2 = helping.lazyModule("cbor2")  # serializers imported on first use
+msgpack = helping.lazyModule("msgpack")
+
 logger = help.ogler.getLogger()
 
 
@@ -128,6 +129,68 @@ class KomerBase:
             yield (self._tokeys(key), self.deserializer(val))
 
 
+    def putMany(self, items: Iterable, *, txn=None):
+        """
+        Puts each item of items as .put would but all in one transaction.
+        Does not overwrite.
+
+        Parameters:
+            items (Iterable): of (keys, val) duples where val is as given to .put
+            txn (lmdb.Transaction): optional open write transaction to use
+
+        Returns:
+            count (int): number of items put
+        """
+        with self.db.transact(txn=txn):
+            return sum(1 for keys, val in items if self.put(keys, val))
+
+
+    def pinMany(self, items: Iterable, *, txn=None):
+        """
+        Pins (sets) each item of items as .pin would but all in one
+        transaction. Overwrites.
+
+        Parameters:
+            items (Iterable): of (keys, val) duples where val is as given to .pin
+            txn (lmdb.Transaction): optional open write transaction to use
+
+        Returns:
+            count (int): number of items pinned
+        """
+        with self.db.transact(txn=txn):
+            return sum(1 for keys, val in items if self.pin(keys, val))
+
+
+    def getMany(self, keyses: Iterable, *, txn=None):
+        """
+        Gets each as .get would but all in one read transaction
+
+        Parameters:
+            keyses (Iterable): of keys as given to .get
+            txn (lmdb.Transaction): optional open transaction to use
+
+        Returns:
+            vals (list): of result of .get for each keys in keyses
+        """
+        with self.db.snapshot(txn=txn):
+            return [self.get(keys) for keys in keyses]
+
+
+    def remMany(self, keyses: Iterable, *, txn=None):
+        """
+        Removes all entries at each keys in keyses in one transaction
+
+        Parameters:
+            keyses (Iterable): of keys as given to .rem
+            txn (lmdb.Transaction): optional open write transaction to use
+
+        Returns:
+            count (int): number of keys with entries removed
+        """
+        with self.db.transact(txn=txn):
+            return sum(1 for keys in keyses if self.rem(keys))
+
+
     def _serializer(self, kind):
         """
         Parameters:
@@ -295,6 +358,60 @@ class Komer(KomerBase):
         return (self.db.delVal(db=self.sdb, key=self._tokey(keys)))
 
 
+    def putMany(self, items: Iterable, *, txn=None):
+        """
+        Puts each val at key made from keys of (keys, val) items in one
+        transaction with a cursor putmulti in key order. Does not overwrite.
+
+        Parameters:
+            items (Iterable): of (keys, val) duples where val is dataclass
+                instance of type self.schema
+            txn (lmdb.Transaction): optional open write transaction to use
+
+        Returns:
+            count (int): number of items put. Items at existing keys are skipped
+        """
+        with self.db.transact(txn=txn):
+            return self.db.putMany(db=self.sdb,
+                                   items=[(self._tokey(keys), self.serializer(val))
+                                          for keys, val in items])
+
+
+    def pinMany(self, items: Iterable, *, txn=None):
+        """
+        Pins (sets) each val at key made from keys of (keys, val) items in one
+        transaction with a cursor putmulti in key order. Overwrites.
+
+        Parameters:
+            items (Iterable): of (keys, val) duples where val is dataclass
+                instance of type self.schema
+            txn (lmdb.Transaction): optional open write transaction to use
+
+        Returns:
+            count (int): number of items pinned
+        """
+        with self.db.transact(txn=txn):
+            return self.db.putMany(db=self.sdb,
+                                   items=[(self._tokey(keys), self.serializer(val))
+                                          for keys, val in items],
+                                   overwrite=True)
+
+
+    def remMany(self, keyses: Iterable, *, txn=None):
+        """
+        Removes entry at each keys in keyses in one transaction
+
+        Parameters:
+            keyses (Iterable): of keys tuples or strs
+            txn (lmdb.Transaction): optional open write transaction to use
+
+        Returns:
+            count (int): number of entries removed
+        """
+        with self.db.transact(txn=txn):
+            return self.db.delMany(db=self.sdb, keys=[self._tokey(keys) for keys in keyses])
+
+
     def trim(self, keys: Union[str, Iterable]=b""):
         """
         Removes all entries whose keys startswith keys. Enables removal of whole
@@ -369,6 +486,7 @@ class IoSetKomer(KomerBase):
         """
         super(IoSetKomer, self).__init__(db=db, subkey=subkey, schema=schema,
                                        kind=kind, dupsort=False, **kwa)
+        self.db.ioSets[subkey.encode("utf-8")] = self.sep.encode("utf-8")  # for migrate
 
 
     def put(self, keys: Union[str, Iterable], vals: list):
@@ -548,7 +666,7 @@ class IoSetKomer(KomerBase):
 
         """
         for iokey, val in self.db.getTopItemIter(db=self.sdb, key=self._tokey(keys)):
-            key, ion = dbing.unsuffix(iokey, sep=self.sep)
+            key, ion = self.db.unsuffix(iokey, sep=self.sep)
             yield (self._tokeys(key), self.deserializer(val))
 
 
@@ -806,3 +924,88 @@ class DupKomer(KomerBase):
             val = b''
         return (self.db.delVals(db=self.sdb, key=self._tokey(keys), val=val))
 
+
+class LazyMapping(MutableMapping):
+    """
+    LazyMapping is a base class for mappings of instances keyed by identifier
+    qb64 that build each instance from its Komer record on first access instead
+    of all of them at startup. Subclasses provide the Komer of the records, the
+    identifier of a record and the .load of an instance from its record.
+
+    Attributes:
+        loaded (dict): instances built so far keyed by identifier
+
+    Properties:
+        komer (Komer): records of instances keyed by name
+        names (dict): name of each record of .komer keyed by identifier. Read
+            from .komer on first use so lookups by name alone never need it.
+
+    """
+
+    def __init__(self):
+        self.loaded = dict()
+        self._names = None
+
+    @property
+    def komer(self):
+        """ Returns Komer of records of instances keyed by name """
+        raise NotImplementedError
+
+    @staticmethod
+    def ident(record):
+        """ Returns identifier qb64 of instance of record """
+        raise NotImplementedError
+
+    def load(self, name, record):
+        """ Returns instance built from record of .komer at name and adds it to .loaded
+
+        Parameters:
+            name (str): name of instance
+            record (dataclass): record of instance
+        """
+        raise NotImplementedError
+
+    @property
+    def names(self):
+        """ Returns dict of name of each record of .komer keyed by identifier """
+        if self._names is None:
+            self._names = {self.ident(record): ".".join(keys)
+                           for keys, record in self.komer.getItemIter()}
+        return self._names
+
+    def reset(self):
+        """ Forgets built instances and names so they are read again from .komer """
+        self.loaded = dict()
+        self._names = None
+
+    def __getitem__(self, key):
+        if key in self.loaded:
+            return self.loaded[key]
+
+        if ((name := self.names.get(key)) is None
+                or (record := self.komer.get(keys=name)) is None
+                or self.ident(record) != key):
+            raise KeyError(key)
+        return self.load(name, record)
+
+    def __setitem__(self, key, val):
+        self.loaded[key] = val
+        if self._names is not None:
+            self._names[key] = val.name
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self.loaded.pop(key, None)
+        self.names.pop(key, None)
+
+    def __contains__(self, key):
+        return key in self.loaded or key in self.names
+
+    def __iter__(self):
+        names = self.names
+        yield from list(names)
+        yield from [key for key in self.loaded if key not in names]
+
+    def __len__(self):
+        return len(self.names.keys() | self.loaded.keys())
@@ -188,6 +188,68 @@ class SuberBase():
         return(self.db.delTopVal(db=self.sdb, key=self._tokey(keys)))
 
 
+    def putMany(self, items: Iterable, *, txn=None):
+        """
+        Puts each item of items as .put would but all in one transaction.
+        Does not overwrite.
+
+        Parameters:
+            items (Iterable): of (keys, val) duples where val is as given to .put
+            txn (lmdb.Transaction): optional open write transaction to use
+
+        Returns:
+            count (int): number of items put
+        """
+        with self.db.transact(txn=txn):
+            return sum(1 for keys, val in items if self.put(keys, val))
+
+
+    def pinMany(self, items: Iterable, *, txn=None):
+        """
+        Pins (sets) each item of items as .pin would but all in one
+        transaction. Overwrites.
+
+        Parameters:
+            items (Iterable): of (keys, val) duples where val is as given to .pin
+            txn (lmdb.Transaction): optional open write transaction to use
+
+        Returns:
+            count (int): number of items pinned
+        """
+        with self.db.transact(txn=txn):
+            return sum(1 for keys, val in items if self.pin(keys, val))
+
+
+    def getMany(self, keyses: Iterable, *, txn=None):
+        """
+        Gets each as .get would but all in one read transaction
+
+        Parameters:
+            keyses (Iterable): of keys as given to .get
+            txn (lmdb.Transaction): optional open transaction to use
+
+        Returns:
+            vals (list): of result of .get for each keys in keyses
+        """
+        with self.db.snapshot(txn=txn):
+            return [self.get(keys) for keys in keyses]
+
+
+    def remMany(self, keyses: Iterable, *, txn=None):
+        """
+        Removes all entries at each keys in keyses in one transaction
+
+        Parameters:
+            keyses (Iterable): of keys as given to .rem
+            txn (lmdb.Transaction): optional open write transaction to use
+
+        Returns:
+            count (int): number of keys with entries removed
+        """
+        with self.db.transact(txn=txn):
+            return sum(1 for keys in keyses if self.rem(keys))
+
+
 class Suber(SuberBase):
     """
     Sub DB of LMDBer. Subclass of SuberBase
@@ -272,6 +334,57 @@ class Suber(SuberBase):
         return(self.db.delVal(db=self.sdb, key=self._tokey(keys)))
 
 
+    def putMany(self, items: Iterable, *, txn=None):
+        """
+        Puts each val at key made from keys of (keys, val) items in one
+        transaction with a cursor putmulti in key order. Does not overwrite.
+
+        Parameters:
+            items (Iterable): of (keys, val) duples
+            txn (lmdb.Transaction): optional open write transaction to use
+
+        Returns:
+            count (int): number of items put. Items at existing keys are skipped
+        """
+        with self.db.transact(txn=txn):
+            return self.db.putMany(db=self.sdb,
+                                   items=[(self._tokey(keys), self._ser(val))
+                                          for keys, val in items])
+
+
+    def pinMany(self, items: Iterable, *, txn=None):
+        """
+        Pins (sets) each val at key made from keys of (keys, val) items in one
+        transaction with a cursor putmulti in key order. Overwrites.
+
+        Parameters:
+            items (Iterable): of (keys, val) duples
+            txn (lmdb.Transaction): optional open write transaction to use
+
+        Returns:
+            count (int): number of items pinned
+        """
+        with self.db.transact(txn=txn):
+            return self.db.putMany(db=self.sdb,
+                                   items=[(self._tokey(keys), self._ser(val))
+                                          for keys, val in items],
+                                   overwrite=True)
+
+
+    def remMany(self, keyses: Iterable, *, txn=None):
+        """
+        Removes entry at each keys in keyses in one transaction
+
+        Parameters:
+            keyses (Iterable): of keys tuples or strs
+            txn (lmdb.Transaction): optional open write transaction to use
+
+        Returns:
+            count (int): number of entries removed
+        """
+        with self.db.transact(txn=txn):
+            return self.db.delMany(db=self.sdb, keys=[self._tokey(keys) for keys in keyses])
+
 
 class CesrSuberBase(SuberBase):
     """
@@ -478,6 +591,7 @@ class IoSetSuber(SuberBase):
                        default is self.Sep == '.'
         """
         super(IoSetSuber, self).__init__(db=db, subkey=subkey, dupsort=False, **kwa)
+        self.db.ioSets[subkey.encode("utf-8")] = self.sep.encode("utf-8")  # for migrate
 
 
     def put(self, keys: Union[str, Iterable], vals: Iterable):
@@ -656,7 +770,7 @@ class IoSetSuber(SuberBase):
 
         """
         for iokey, val in self.db.getTopItemIter(db=self.sdb, key=self._tokey(keys)):
-            key, ion = dbing.unsuffix(iokey, sep=self.sep)
+            key, ion = self.db.unsuffix(iokey, sep=self.sep)
             yield (self._tokeys(key), self._des(val))
 
 
@@ -972,6 +1086,42 @@ class CryptSignerSuber(SignerSuber):
 
 
 
+    def putMany(self, items: Iterable, *, encrypter: coring.Encrypter = None, txn=None):
+        """
+        Puts qb64 of each Matter instance val of (keys, val) items in one
+        transaction. Does not overwrite. If encrypter provided then encrypts first
+
+        Parameters:
+            items (Iterable): of (keys, val) duples where val is instance of self.klas
+            encrypter (coring.Encrypter): optional
+            txn (lmdb.Transaction): optional open write transaction to use
+
+        Returns:
+            count (int): number of items put
+        """
+        if encrypter:
+            items = [(keys, encrypter.encrypt(matter=val)) for keys, val in items]
+        return super(CryptSignerSuber, self).putMany(items, txn=txn)
+
+
+    def pinMany(self, items: Iterable, *, encrypter: coring.Encrypter = None, txn=None):
+        """
+        Pins (sets) qb64 of each Matter instance val of (keys, val) items in one
+        transaction. Overwrites. If encrypter provided then encrypts first
+
+        Parameters:
+            items (Iterable): of (keys, val) duples where val is instance of self.klas
+            encrypter (coring.Encrypter): optional
+            txn (lmdb.Transaction): optional open write transaction to use
+
+        Returns:
+            count (int): number of items pinned
+        """
+        if encrypter:
+            items = [(keys, encrypter.encrypt(matter=val)) for keys, val in items]
+        return super(CryptSignerSuber, self).pinMany(items, txn=txn)
+
+
     def get(self, keys: Union[str, Iterable], decrypter: coring.Decrypter = None):
         """
         Gets Signer instance at keys. If decrypter then assumes value in db was
@@ -1054,6 +1204,18 @@ class SerderSuber(Suber):
         """
         super(SerderSuber, self).__init__(*pa, **kwa)
 
+    def _ser(self, val: coring.Serder):
+        """
+        Serialize Serder val to its raw bytes to store in db
+        """
+        return val.raw
+
+    def _des(self, val: Union[memoryview, bytes]):
+        """
+        Deserialize raw bytes val to Serder instance
+        """
+        return coring.Serder(raw=bytes(val))
+
 
     def put(self, keys: Union[str, Iterable], val: coring.Serder):
         """
@@ -1157,6 +1319,18 @@ class SchemerSuber(Suber):
         """
         super(SchemerSuber, self).__init__(*pa, **kwa)
 
+    def _ser(self, val: scheming.Schemer):
+        """
+        Serialize Schemer val to its raw bytes to store in db
+        """
+        return val.raw
+
+    def _des(self, val: Union[memoryview, bytes]):
+        """
+        Deserialize raw bytes val to Schemer instance
+        """
+        return scheming.Schemer(raw=bytes(val))
+
     def put(self, keys: Union[str, Iterable], val: scheming.Schemer):
         """
         Puts val at key made from keys. Does not overwrite
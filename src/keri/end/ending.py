@@ -14,14 +14,18 @@ from ordered_set import OrderedSet as oset
 from collections import namedtuple
 from collections.abc import Mapping
 
-import falcon
 from hio import base
-from hio.core import http, wiring
+from hio.core import wiring
 
 from .. import help
 from .. import kering
 from ..app import habbing
 from ..core import coring
+from ..db import dbing
+from ..help import helping
+
+falcon = helping.lazyModule("falcon")  # web stack imported on first use
+http = helping.lazyModule("hio.core.http")
 
 logger = help.ogler.getLogger()
 
@@ -410,6 +414,33 @@ class OOBIEnd:
         self.hby = hby
         self.default = default
 
+    def etag(self, kever, role=None, eid=None):
+        """ Returns quoted entity tag of OOBI response for identifier of kever.
+
+        Replies in OOBI responses are signed anew with a fresh timestamp on
+        each request so the tag digests what they attest to instead: the latest
+        event and its witness receipts and the accepted end role and location
+        replies of the identifier and its endpoints.
+
+        Parameters:
+            kever (Kever): key state of identifier of OOBI
+            role (str | None): requested role of OOBI
+            eid (str | None): qb64 identifier prefix of participant in role
+
+        """
+        aid = kever.prefixer.qb64
+        dig = kever.serder.said
+        parts = [aid, role or "", eid or "", dig, str(self.hby.db.cntWigs(dbing.dgKey(aid, dig)))]
+        eids = oset(kever.wits)
+        for (_, _, reid), saider in self.hby.db.eans.getItemIter(keys=(aid, "")):
+            parts.append(saider.qb64)
+            eids.add(reid)
+        for reid in eids:
+            for _, saider in self.hby.db.lans.getItemIter(keys=(reid, "")):
+                parts.append(saider.qb64)
+
+        return f'"{coring.Diger(ser=".".join(parts).encode("utf-8")).qb64}"'
+
     def on_get(self, req, rep, aid=None, role=None, eid=None):
         """  GET endoint for OOBI resource
 
@@ -455,8 +486,14 @@ class OOBIEnd:
             msgs.extend(hab.replay(aid))
 
         if msgs:
-            rep.status = falcon.HTTP_200  # This is the default status
+            etag = self.etag(kever, role=role, eid=eid)  # lets resolvers cache responses
+            rep.set_header("ETag", etag)
             rep.set_header(OOBI_AID_HEADER, aid)
+            if req.get_header("If-None-Match") == etag:
+                rep.status = falcon.HTTP_NOT_MODIFIED
+                return
+
+            rep.status = falcon.HTTP_200  # This is the default status
             rep.content_type = "application/json+cesr"
             rep.data = bytes(msgs)
 
@@ -6,7 +6,9 @@ keri.help.helping module
 import base64
 import dataclasses
 import datetime
+import importlib.util
 import re
+import sys
 from collections.abc import Iterable, Sequence, Mapping
 
 import pysodium
@@ -155,6 +157,30 @@ def verify64uEd25519(signature, message, verkey):
     return (verifyEd25519(sig, msg, vk))
 
 
+def lazyModule(name):
+    """
+    Returns:
+        module (ModuleType): module name that is only imported on first access
+            of one of its attributes so heavy dependencies only cost import time
+            when used. Module already imported is returned as is.
+
+    Parameters:
+        name (str): fully qualified module name such as "falcon"
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
 def nonStringIterable(obj):
     """
     Returns:
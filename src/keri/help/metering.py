@@ -0,0 +1,384 @@
+# -*- encoding: utf-8 -*-
+"""
+keri.help.metering module
+
+Registry of counters, gauges and histograms rendered in Prometheus text format
+
+Hot paths such as Kevery, Tevery and the Parser record to the module level
+meter which is a NullMetrics that does nothing until a Metrics or
+StatsdMetrics sink is installed with install().
+"""
+import bisect
+import contextlib
+import functools
+import socket
+import threading
+import time
+from collections import deque
+
+# default histogram bucket upper bounds
+LatencyBuckets = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                  1.0, 2.5, 5.0, 10.0)  # seconds
+SizeBuckets = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)  # bytes
+
+
+class Histogram:
+    """
+    Histogram of observed values counted in cumulative buckets
+
+    Attributes:
+        buckets (tuple): of sorted bucket upper bounds, +Inf is implicit
+        counts (list): of count of values in each bucket, last is +Inf
+        sum (float): sum of all observed values
+        count (int): number of observed values
+
+    """
+
+    def __init__(self, buckets=LatencyBuckets):
+        """ Initialize instance
+
+        Parameters:
+            buckets (Iterable): of bucket upper bounds
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        """ Adds value to histogram """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q):
+        """ Returns upper bound of bucket containing quantile q in [0, 1] of
+        observed values, inf when in +Inf bucket or None when empty
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        total = 0
+        for i, count in enumerate(self.counts):
+            total += count
+            if total >= rank and count:
+                return self.buckets[i] if i < len(self.buckets) else float("inf")
+        return float("inf")
+
+
+def escape(value):
+    """ Returns label value escaped for Prometheus text format """
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def labeled(name, labels, extra=()):
+    """ Returns str of metric name with labels in Prometheus text format
+
+    Parameters:
+        name (str): full metric name
+        labels (tuple): of (label, value) duples
+        extra (tuple): of more (label, value) duples such as le of bucket
+    """
+    pairs = tuple(labels) + tuple(extra)
+    if not pairs:
+        return name
+    return name + "{" + ",".join(f'{key}="{escape(val)}"' for key, val in pairs) + "}"
+
+
+class Timing:
+    """ Context manager that observes elapsed seconds into histogram of Metrics """
+
+    def __init__(self, metrics, name, labels):
+        self.metrics = metrics
+        self.name = name
+        self.labels = labels
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.metrics.observe(self.name, time.perf_counter() - self.start, **self.labels)
+
+
+class Metrics:
+    """
+    Metrics is a thread safe registry of labeled counters, gauges and histograms
+    that renders them in Prometheus text exposition format. It also keeps the
+    most recent request profiles for inspection.
+
+    Usage:
+        metrics = Metrics()
+        metrics.inc("requests_total", route="/oobi")
+        with metrics.timer("request_duration_seconds", route="/oobi"):
+            handle()
+        text = metrics.render()
+
+    Attributes:
+        prefix (str): prefix of all metric names in rendered output
+        counters (dict): of counter values keyed by (name, labels)
+        gauges (dict): of gauge values keyed by (name, labels)
+        histograms (dict): of Histogram keyed by (name, labels)
+        helps (dict): of help text keyed by name
+        bounds (dict): of histogram bucket bounds keyed by name
+        profiles (deque): of recent profile dicts, newest last
+
+    """
+    enabled = True
+
+    def __init__(self, prefix="keri", profiles=16):
+        """ Initialize instance
+
+        Parameters:
+            prefix (str): prefix of all metric names
+            profiles (int): max number of recent profiles kept
+        """
+        self.prefix = prefix
+        self.lock = threading.Lock()
+        self.counters = dict()
+        self.gauges = dict()
+        self.histograms = dict()
+        self.helps = dict()
+        self.bounds = dict()
+        self.profiles = deque(maxlen=profiles)
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted(labels.items()))
+
+    def describe(self, name, text, buckets=None):
+        """ Sets help text of metric name and bucket bounds when histogram
+
+        Parameters:
+            name (str): metric name without prefix
+            text (str): help text
+            buckets (Iterable | None): histogram bucket upper bounds
+        """
+        self.helps[name] = text
+        if buckets is not None:
+            self.bounds[name] = tuple(buckets)
+
+    def inc(self, name, value=1, **labels):
+        """ Increments counter name with labels by value """
+        key = self._key(name, labels)
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def add(self, name, value, **labels):
+        """ Adds value, which may be negative, to gauge name with labels """
+        key = self._key(name, labels)
+        with self.lock:
+            self.gauges[key] = self.gauges.get(key, 0) + value
+
+    def set(self, name, value, **labels):
+        """ Sets gauge name with labels to value """
+        key = self._key(name, labels)
+        with self.lock:
+            self.gauges[key] = value
+
+    def observe(self, name, value, **labels):
+        """ Adds value to histogram name with labels """
+        key = self._key(name, labels)
+        with self.lock:
+            hist = self.histograms.get(key)
+            if hist is None:
+                hist = self.histograms[key] = Histogram(self.bounds.get(name, LatencyBuckets))
+            hist.observe(value)
+
+    def timer(self, name, **labels):
+        """ Returns context manager that observes its elapsed seconds into
+        histogram name with labels """
+        return Timing(self, name, labels)
+
+    def get(self, name, **labels):
+        """ Returns value of counter or gauge or Histogram of name with labels
+        or None if none """
+        key = self._key(name, labels)
+        with self.lock:
+            for store in (self.counters, self.gauges, self.histograms):
+                if key in store:
+                    return store[key]
+        return None
+
+    def render(self):
+        """ Returns str of all metrics in Prometheus text exposition format """
+        lines = []
+        with self.lock:
+            for kind, store in (("counter", self.counters), ("gauge", self.gauges),
+                                ("histogram", self.histograms)):
+                names = dict()
+                for (name, labels) in sorted(store):
+                    names.setdefault(name, []).append(labels)
+
+                for name, labelses in names.items():
+                    full = f"{self.prefix}_{name}" if self.prefix else name
+                    if name in self.helps:
+                        lines.append(f"# HELP {full} {self.helps[name]}")
+                    lines.append(f"# TYPE {full} {kind}")
+                    for labels in labelses:
+                        val = store[(name, labels)]
+                        if kind != "histogram":
+                            lines.append(f"{labeled(full, labels)} {val}")
+                            continue
+
+                        total = 0
+                        for bound, count in zip(val.buckets + (float("inf"),), val.counts):
+                            total += count
+                            le = "+Inf" if bound == float("inf") else repr(bound)
+                            lines.append(f"{labeled(full + '_bucket', labels, (('le', le),))} {total}")
+                        lines.append(f"{labeled(full + '_sum', labels)} {val.sum}")
+                        lines.append(f"{labeled(full + '_count', labels)} {val.count}")
+
+        return "\n".join(lines) + "\n"
+
+
+class NullMetrics:
+    """
+    NullMetrics is the no-op metrics backend. Instrumented code checks .enabled
+    before doing any work that is only needed to record a metric.
+
+    """
+    enabled = False
+    Null = contextlib.nullcontext()
+
+    def describe(self, name, text, buckets=None):
+        """ Does nothing """
+
+    def inc(self, name, value=1, **labels):
+        """ Does nothing """
+
+    def add(self, name, value, **labels):
+        """ Does nothing """
+
+    def set(self, name, value, **labels):
+        """ Does nothing """
+
+    def observe(self, name, value, **labels):
+        """ Does nothing """
+
+    def timer(self, name, **labels):
+        """ Returns shared context manager that does nothing """
+        return self.Null
+
+
+class StatsdMetrics:
+    """
+    StatsdMetrics sends each metric as it is recorded to a StatsD agent over
+    UDP with labels as DogStatsD style tags. Sends never block and send errors
+    are dropped since metrics must never fail the code being measured.
+
+    Attributes:
+        prefix (str): prefix of all metric names
+        address (tuple): (host, port) of StatsD agent
+
+    """
+    enabled = True
+
+    def __init__(self, host="127.0.0.1", port=8125, prefix="keri"):
+        """ Initialize instance
+
+        Parameters:
+            host (str): host of StatsD agent
+            port (int): UDP port of StatsD agent
+            prefix (str): prefix of all metric names
+        """
+        self.prefix = prefix
+        self.address = (host, port)
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setblocking(False)
+
+    def close(self):
+        """ Closes socket """
+        self.sock.close()
+
+    def line(self, name, value, kind, labels):
+        """ Returns bytes of one StatsD line """
+        full = f"{self.prefix}.{name}" if self.prefix else name
+        line = f"{full}:{value}|{kind}"
+        if labels:
+            line += "|#" + ",".join(f"{key}:{val}" for key, val in sorted(labels.items()))
+        return line.encode("utf-8")
+
+    def send(self, name, value, kind, labels):
+        try:
+            self.sock.sendto(self.line(name, value, kind, labels), self.address)
+        except OSError:
+            pass
+
+    def describe(self, name, text, buckets=None):
+        """ Does nothing since StatsD has no metadata """
+
+    def inc(self, name, value=1, **labels):
+        """ Sends counter increment """
+        self.send(name, value, "c", labels)
+
+    def add(self, name, value, **labels):
+        """ Sends signed gauge delta """
+        self.send(name, f"{value:+}", "g", labels)
+
+    def set(self, name, value, **labels):
+        """ Sends gauge value """
+        self.send(name, value, "g", labels)
+
+    def observe(self, name, value, **labels):
+        """ Sends histogram value """
+        self.send(name, value, "h", labels)
+
+    def timer(self, name, **labels):
+        """ Returns context manager that sends its elapsed seconds as
+        histogram value """
+        return Timing(self, name, labels)
+
+
+meter = NullMetrics()  # installed metrics backend of instrumented hot paths
+
+
+def install(metrics=None):
+    """ Installs metrics as the backend of instrumented hot paths and returns
+    the one it replaces
+
+    Parameters:
+        metrics (Metrics | StatsdMetrics | None): backend or None to restore
+            the no-op NullMetrics
+    """
+    global meter
+    old = meter
+    meter = metrics if metrics is not None else NullMetrics()
+    return old
+
+
+def measure(name):
+    """ Returns decorator that records duration in histogram name_seconds and
+    count of calls by result in counter name_total of each call of the
+    decorated function. Result is "ok" or the class name of the raised
+    exception. Adds a single attribute check per call while meter is the
+    NullMetrics.
+
+    Parameters:
+        name (str): base metric name
+    """
+    def decorator(func):
+        seconds = f"{name}_seconds"
+        total = f"{name}_total"
+
+        @functools.wraps(func)
+        def wrapper(*pa, **kwa):
+            metrics = meter
+            if not metrics.enabled:
+                return func(*pa, **kwa)
+
+            result = "ok"
+            start = time.perf_counter()
+            try:
+                return func(*pa, **kwa)
+            except Exception as ex:
+                result = ex.__class__.__name__
+                raise
+            finally:
+                metrics.observe(seconds, time.perf_counter() - start)
+                metrics.inc(total, result=result)
+
+        return wrapper
+
+    return decorator
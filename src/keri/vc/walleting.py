@@ -6,7 +6,7 @@ keri.vc.walleting module
 from hio.base import doing
 
 from .. import help
-from ..app import agenting
+from ..app import agenting, scheduling
 from ..vdr import viring
 
 logger = help.ogler.getLogger()
@@ -92,8 +92,11 @@ class WalletDoer(doing.DoDoer):
         self.tock = tock
         yield self.tock
 
+        backoff = scheduling.Backoff(dbs=[self.verifier.hby.db, self.verifier.reger])
         while True:
-            self.verifier.processEscrows()
+            if backoff.due(self.tyme):  # skip scan while nothing changed
+                self.verifier.processEscrows()
+                backoff.done(self.tyme)
             yield self.tock
 
     def verifierDo(self, tymth, tock=0.0):
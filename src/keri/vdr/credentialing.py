@@ -5,6 +5,7 @@ keri.vdr.credentialing module
 
 VC issuer support
 """
+
 from ordered_set import OrderedSet as oset
 
 from hio.base import doing
@@ -12,12 +13,13 @@ from hio.help import decking
 
 from keri.vdr import viring
 from .. import kering, help
-from ..app import agenting, signing, forwarding
+from ..app import agenting, signing, forwarding, scheduling
 from ..core import parsing, coring, scheming
 from ..core.coring import Seqner, MtrDex, Serder
 from ..core.eventing import SealEvent, TraitDex
-from ..db import dbing
+from ..db import dbing, koming
 from ..db.dbing import snKey, dgKey
+from ..help import metering
 from ..vc import proving, protocoling
 from ..vdr import eventing
 from ..vdr.viring import Reger
@@ -25,6 +27,57 @@ from ..vdr.viring import Reger
 logger = help.ogler.getLogger()
 
 
+class Registries(koming.LazyMapping):
+    """
+    Registries is a mapping of Registry instances keyed by registry identifier
+    qb64 that builds each Registry, and so its issuer Hab, from its .reger.regs
+    record on first access instead of all of them at startup.
+
+    Attributes:
+        rgy (Regery): environment that builds the Registry instances
+        loaded (dict): Registry instances built so far keyed by registry identifier
+
+    Properties:
+        names (dict): name of each .reger.regs record keyed by registry identifier
+
+    """
+
+    def __init__(self, rgy):
+        """
+        Parameters:
+            rgy (Regery): environment that builds the Registry instances
+        """
+        super(Registries, self).__init__()
+        self.rgy = rgy
+
+    @property
+    def komer(self):
+        return self.rgy.reger.regs
+
+    @staticmethod
+    def ident(record):
+        return record.registryKey
+
+    def load(self, name, regord):
+        """ Returns Registry built from regord record of .reger.regs at name
+
+        Parameters:
+            name (str): name of Registry
+            regord (RegistryRecord): record of Registry
+        """
+        rgy = self.rgy
+        pre = regord.prefix
+        if pre not in rgy.hby.habs:
+            raise kering.ConfigurationError(f"Unknown prefix {pre} for creating Registry {name}")
+
+        reg = Registry(hab=rgy.hby.habs[pre], reger=rgy.reger, tvy=rgy.tvy, psr=rgy.psr,
+                       name=name, regk=regord.registryKey, cues=rgy.cues)
+        reg.inited = True
+        self.loaded[reg.regk] = reg
+        metering.meter.inc("regery_registry_load_total")
+        return reg
+
+
 class Regery:
 
     def __init__(self, hby, name="test", base="", reger=None, temp=False, cues=None):
@@ -40,12 +93,13 @@ class Regery:
         self.tvy = eventing.Tevery(reger=self.reger, db=self.hby.db, local=True, lax=True)
         self.psr = parsing.Parser(framed=True, kvy=self.hby.kvy, tvy=self.tvy)
 
-        self.regs = {}  # List of local registries
+        self.regs = Registries(rgy=self)  # local registries each built on first access
         self.inited = False
 
         if self.reger.opened:
             self.setup()
 
+    @metering.measure("regery_setup")
     def setup(self):
         if not self.reger.opened:
             raise kering.ClosedError("Attempt to setup Regery with closed "
@@ -54,24 +108,13 @@ class Regery:
         self.inited = True
 
     def loadRegistries(self):
-        """ Load Registry objects for each entry in the .regs database
+        """ Load local registry identifiers and names for each entry in the .regs
+        database. Registry objects and their Habs are built by .regs on first
+        access.
 
         """
-
-        for name, regord in self.reger.regs.getItemIter():
-            name, = name
-            regk = regord.registryKey
-            pre = regord.prefix
-
-            hab = self.hby.habs[pre]
-            if hab is None:
-                raise kering.ConfigurationError(f"Unknown prefix {pre} for creating Registry {name}")
-
-            reg = Registry(hab=hab, reger=self.reger, tvy=self.tvy, psr=self.psr,
-                           name=name, regk=regk, cues=self.cues)
-
-            reg.inited = True
-            self.regs[regk] = reg
+        self.regs.reset()
+        for regk in self.regs.names:  # reads names of .reger.regs
             self.reger.registries.add(regk)
 
     def makeRegistry(self, name, prefix, **kwa):
@@ -88,7 +131,9 @@ class Regery:
 
     def registryByName(self, name):
         if regrec := self.reger.regs.get(name):
-            return self.regs[regrec.registryKey] if regrec.registryKey in self.regs else None
+            if regrec.registryKey in self.regs.loaded:
+                return self.regs.loaded[regrec.registryKey]
+            return self.regs.load(name, regrec)
         return None
 
     @property
@@ -357,10 +402,13 @@ class Registry:
         key = dgKey(pre, regd)
         sealet = seqner.qb64b + saider.qb64b
         self.reger.putAnc(key, sealet)
+        self.hab.db.kews.wake(regd)  # anchorless event now anchored
 
 
 class Registrar(doing.DoDoer):
 
+    MaxSeals = 1000  # max TEL event seals anchored in one KEL event by batch issuance
+
     def __init__(self, hby, rgy, counselor):
         self.hby = hby
         self.rgy = rgy
@@ -368,6 +416,8 @@ class Registrar(doing.DoDoer):
         self.witDoer = agenting.WitnessReceiptor(hby=self.hby)
         self.witPub = agenting.WitnessPublisher(hby=self.hby)
 
+        self.swept = False  # True once all escrowed events were processed once
+
         doers = [self.witDoer, self.witPub, doing.doify(self.escrowDo)]
 
         super(Registrar, self).__init__(doers=doers)
@@ -412,6 +462,8 @@ class Registrar(doing.DoDoer):
 
             self.rgy.reger.tpwe.add(keys=(registry.regk, rseq.qb64), val=(hab.kever.prefixer, seqner, saider))
 
+            self.hby.db.kews.rouse("tpwe", (registry.regk, rseq.qb64))
+
         else:
             s, r = hab.members()
             smids = smids if smids is not None else s
@@ -422,6 +474,7 @@ class Registrar(doing.DoDoer):
 
             print("Waiting for TEL registry vcp event mulisig anchoring event")
             self.rgy.reger.tmse.add(keys=(registry.regk, rseq.qb64, registry.regd), val=(prefixer, seqner, saider))
+            self.hby.db.kews.rouse("tmse", (registry.regk, rseq.qb64, registry.regd))
 
         return registry
 
@@ -463,6 +516,8 @@ class Registrar(doing.DoDoer):
             self.witDoer.msgs.append(dict(pre=hab.pre, sn=seqner.sn))
 
             self.rgy.reger.tpwe.add(keys=(vcid, rseq.qb64), val=(hab.kever.prefixer, seqner, saider))
+
+            self.hby.db.kews.rouse("tpwe", (vcid, rseq.qb64))
             return vcid, rseq.sn
 
         else:  # multisig group hab
@@ -475,6 +530,7 @@ class Registrar(doing.DoDoer):
 
             print(f"Waiting for TEL iss event mulisig anchoring event {seqner.sn}")
             self.rgy.reger.tmse.add(keys=(vcid, rseq.qb64, iserder.said), val=(prefixer, seqner, saider))
+            self.hby.db.kews.rouse("tmse", (vcid, rseq.qb64, iserder.said))
             return vcid, rseq.sn
 
     def revoke(self, regk, said, dt=None, smids=None, rmids=None):
@@ -518,6 +574,8 @@ class Registrar(doing.DoDoer):
             self.witDoer.msgs.append(dict(pre=hab.pre, sn=seqner.sn))
 
             self.rgy.reger.tpwe.add(keys=(vcid, rseq.qb64), val=(hab.kever.prefixer, seqner, saider))
+
+            self.hby.db.kews.rouse("tpwe", (vcid, rseq.qb64))
             return vcid, rseq.sn
         else:
             s, r = hab.members()
@@ -529,12 +587,136 @@ class Registrar(doing.DoDoer):
 
             print(f"Waiting for TEL rev event mulisig anchoring event {seqner.sn}")
             self.rgy.reger.tmse.add(keys=(vcid, rseq.qb64, rserder.said), val=(prefixer, seqner, saider))
+            self.hby.db.kews.rouse("tmse", (vcid, rseq.qb64, rserder.said))
             return vcid, rseq.sn
 
 
+    def issueMany(self, regk, saids, dts=None, smids=None, rmids=None):
+        """
+        Create and process the credential issuance TEL events of a batch of credentials on the
+        given registry anchoring their seals in one KEL event per .MaxSeals credentials
+
+        Parameters:
+            regk (str): qb64 identifier prefix of the credential registry
+            saids (list): qb64 SAIDs of the credentials to issue
+            dts (list | None): iso8601 formatted date string of issuance date of each credential
+            smids (list): group signing member ids qb64 in the anchoring events
+                need to contribute current signing key
+            rmids (list): group rotating member ids qb64 in the anchoring events
+                need to contribute digest of next rotating key
+
+        Returns:
+            list: of (vcid, sn) of TEL event of each credential in order of saids
+
+        Raises:
+            ValidationError: when registry of multisig group and more than .MaxSeals saids
+        """
+        registry = self.rgy.regs[regk]
+        self.batchable(registry, len(saids))
+        dts = dts if dts is not None else [None] * len(saids)
+        serders = [registry.issue(said=said, dt=dt) for said, dt in zip(saids, dts)]
+        return self.anchorMany(registry, serders, smids=smids, rmids=rmids)
+
+    def revokeMany(self, regk, saids, dt=None, smids=None, rmids=None):
+        """
+        Create and process the credential revocation TEL events of a batch of credentials on the
+        given registry anchoring their seals in one KEL event per .MaxSeals credentials
+
+        Parameters:
+            regk (str): qb64 identifier prefix of the credential registry
+            saids (list): qb64 SAIDs of the credentials to revoke
+            dt (str): iso8601 formatted date string of revocation date
+            smids (list): group signing member ids qb64 in the anchoring events
+                need to contribute current signing key
+            rmids (list): group rotating member ids qb64 in the anchoring events
+                need to contribute digest of next rotating key
+
+        Returns:
+            list: of (vcid, sn) of TEL event of each credential in order of saids
+
+        Raises:
+            ValidationError: when registry of multisig group and more than .MaxSeals saids
+        """
+        registry = self.rgy.regs[regk]
+        self.batchable(registry, len(saids))
+        for said in saids:
+            state = registry.tever.vcState(vci=said)
+            if state is None or state.ked["et"] not in (coring.Ilks.iss, coring.Ilks.rev):
+                raise kering.ValidationError(f"credential {said} not is correct state for revocation")
+
+        serders = [registry.revoke(said=said, dt=dt) for said in saids]
+        return self.anchorMany(registry, serders, smids=smids, rmids=rmids)
+
+    def batchable(self, registry, count):
+        """ Raises ValidationError when a batch of count TEL events of registry
+        can not be anchored at once. A multisig group can only anchor one chunk
+        of .MaxSeals at a time since the next group event can not be made until
+        the group has signed the last one.
+        """
+        if registry.hab.group and count > self.MaxSeals:
+            raise kering.ValidationError(f"batch of {count} TEL events exceeds {self.MaxSeals} "
+                                         f"seals of one multisig anchoring event")
+
+    def anchorMany(self, registry, serders, smids=None, rmids=None):
+        """
+        Anchor TEL events serders of registry in chunks of .MaxSeals seals per KEL event
+        and escrow each TEL event until its chunk is witnessed or its multisig completes
+
+        Parameters:
+            registry (Registry): registry of TEL events
+            serders (list): of Serder TEL events
+            smids (list): group signing member ids qb64 in the anchoring events
+            rmids (list): group rotating member ids qb64 in the anchoring events
+
+        Returns:
+            list: of (vcid, sn) of each TEL event in serders
+        """
+        hab = registry.hab
+        if hab.group:
+            s, r = hab.members()
+            smids = smids if smids is not None else s
+            rmids = rmids if rmids is not None else r
+
+        for i in range(0, len(serders), self.MaxSeals):
+            chunk = serders[i:i + self.MaxSeals]
+            rseals = [dict(i=serder.pre, s=serder.ked["s"], d=serder.said) for serder in chunk]
+
+            if not hab.group:
+                if registry.estOnly:
+                    hab.rotate(data=rseals)
+                else:
+                    hab.interact(data=rseals)
+
+                prefixer = hab.kever.prefixer
+                seqner = coring.Seqner(sn=hab.kever.sner.num)
+                saider = hab.kever.serder.saider
+                for serder in chunk:
+                    registry.anchorMsg(pre=serder.pre, regd=serder.said, seqner=seqner, saider=saider)
+
+                print(f"Waiting for witness receipts of batch of {len(chunk)} TEL events")
+                self.witDoer.msgs.append(dict(pre=hab.pre, sn=seqner.sn))
+                for serder in chunk:
+                    rseq = coring.Seqner(snh=serder.ked["s"])
+                    self.rgy.reger.tpwe.add(keys=(serder.pre, rseq.qb64), val=(prefixer, seqner, saider))
+                    self.hby.db.kews.rouse("tpwe", (serder.pre, rseq.qb64))
+
+            else:
+                prefixer, seqner, saider = self.multisigIxn(hab, *rseals)
+                self.counselor.start(prefixer=prefixer, seqner=seqner, saider=saider,
+                                     mid=hab.mhab.pre, smids=smids, rmids=rmids)
+
+                print(f"Waiting for mulisig anchoring event {seqner.sn} of batch of {len(chunk)} TEL events")
+                for serder in chunk:
+                    rseq = coring.Seqner(snh=serder.ked["s"])
+                    self.rgy.reger.tmse.add(keys=(serder.pre, rseq.qb64, serder.said),
+                                            val=(prefixer, seqner, saider))
+                    self.hby.db.kews.rouse("tmse", (serder.pre, rseq.qb64, serder.said))
+
+        return [(serder.pre, int(serder.ked["s"], 16)) for serder in serders]
+
     @staticmethod
-    def multisigIxn(hab, rseal):
-        ixn = hab.interact(data=[rseal])
+    def multisigIxn(hab, *rseals):
+        ixn = hab.interact(data=list(rseals))
         gserder = coring.Serder(raw=ixn)
 
         sn = gserder.sn
@@ -574,9 +756,12 @@ class Registrar(doing.DoDoer):
         self.tock = tock
         _ = (yield self.tock)
 
+        backoff = scheduling.Backoff(dbs=[self.hby.db, self.rgy.reger], high=0.5)
         while True:
-            self.processEscrows()
-            yield 0.5
+            if backoff.due(self.tyme):  # skip scan while nothing changed
+                self.processEscrows()
+                backoff.done(self.tyme)
+            yield self.tock
 
 
     def processEscrows(self):
@@ -587,6 +772,12 @@ class Registrar(doing.DoDoer):
         self.processWitnessEscrow()
         self.processMultisigEscrow()
         self.processDiseminationEscrow()
+        self.swept = True
+
+    def escrowed(self, escrow, suber, waits):
+        """ Returns items of escrow suber to process. All of them on the first pass
+        and after that only those woken in waitlist waits """
+        return suber.getItemIter() if not self.swept else waits.items(escrow, suber)
 
 
     def processWitnessEscrow(self):
@@ -596,7 +787,11 @@ class Registrar(doing.DoDoer):
         that the event is complete.
 
         """
-        for (regk, snq), (prefixer, seqner, saider) in self.rgy.reger.tpwe.getItemIter():  # partial witness escrow
+        for cue in self.witDoer.cues:  # wake escrowed events once witnessed
+            self.hby.db.kews.wake(cue["pre"], cue["sn"])
+
+        for (regk, snq), (prefixer, seqner, saider) in self.escrowed("tpwe", self.rgy.reger.tpwe,
+                                                                     self.hby.db.kews):  # partial witness escrow
             kever = self.hby.kevers[prefixer.qb64]
             dgkey = dbing.dgKey(prefixer.qb64b, saider.qb64)
 
@@ -611,8 +806,10 @@ class Registrar(doing.DoDoer):
                             witnessed = True
 
                     if not witnessed:
+                        self.hby.db.kews.wait("tpwe", (regk, snq), prefixer.qb64, seqner.sn)
                         continue
                 else:
+                    self.hby.db.kews.wait("tpwe", (regk, snq), prefixer.qb64, seqner.sn)
                     continue
 
             rseq = coring.Seqner(qb64=snq)
@@ -620,6 +817,8 @@ class Registrar(doing.DoDoer):
 
             self.rgy.reger.tede.add(keys=(regk, rseq.qb64), val=(prefixer, seqner, saider))
 
+            self.rgy.reger.tews.rouse("tede", (regk, rseq.qb64))
+
     def processMultisigEscrow(self):
         """
         Process escrow of group multisig events that do not have a full compliment of receipts
@@ -627,9 +826,11 @@ class Registrar(doing.DoDoer):
         that the event is complete.
 
         """
-        for (regk, snq, regd), (prefixer, seqner, saider) in self.rgy.reger.tmse.getItemIter():  # multisig escrow
+        for (regk, snq, regd), (prefixer, seqner, saider) in self.escrowed("tmse", self.rgy.reger.tmse,
+                                                                           self.hby.db.kews):  # multisig escrow
             try:
                 if not self.counselor.complete(prefixer, seqner, saider):
+                    self.hby.db.kews.wait("tmse", (regk, snq, regd), prefixer.qb64, seqner.sn)
                     continue
             except kering.ValidationError:
                 self.rgy.reger.tmse.rem(keys=(regk, snq, regd))
@@ -641,15 +842,19 @@ class Registrar(doing.DoDoer):
             key = dgKey(regk, regd)
             sealet = seqner.qb64b + saider.qb64b
             self.rgy.reger.putAnc(key, sealet)
+            self.hby.db.kews.wake(regd)  # anchorless event now anchored
 
             self.rgy.reger.tmse.rem(keys=(regk, snq, regd))
             self.rgy.reger.tede.add(keys=(regk, rseq.qb64), val=(prefixer, seqner, saider))
+            self.rgy.reger.tews.rouse("tede", (regk, rseq.qb64))
 
     def processDiseminationEscrow(self):
-        for (regk, snq), (prefixer, seqner, saider) in self.rgy.reger.tede.getItemIter():  # group multisig escrow
+        for (regk, snq), (prefixer, seqner, saider) in self.escrowed("tede", self.rgy.reger.tede,
+                                                                     self.rgy.reger.tews):  # group multisig escrow
             rseq = coring.Seqner(qb64=snq)
             dig = self.rgy.reger.getTel(key=snKey(pre=regk, sn=rseq.sn))
             if dig is None:
+                self.rgy.reger.tews.wait("tede", (regk, snq), regk, rseq.sn)
                 continue
 
             self.rgy.reger.tede.rem(keys=(regk, snq))
@@ -663,6 +868,7 @@ class Registrar(doing.DoDoer):
             # to determine when the Witnesses have received the TEL events.
             self.witPub.msgs.append(dict(pre=prefixer.qb64, msg=tevt))
             self.rgy.reger.ctel.put(keys=(regk, rseq.qb64), val=saider)  # idempotent
+            self.rgy.reger.tews.wake(regk, rseq.sn)  # credentials waiting on complete event
 
 
 class Credentialer(doing.DoDoer):
@@ -673,6 +879,8 @@ class Credentialer(doing.DoDoer):
         self.registrar = registrar
         self.verifier = verifier
         self.postman = forwarding.Postman(hby=hby)
+        self.swept = False  # True once all escrowed credentials were processed once
+
         doers = [self.postman, doing.doify(self.escrowDo)]
 
         super(Credentialer, self).__init__(doers=doers)
@@ -760,6 +968,66 @@ class Credentialer(doing.DoDoer):
         vcid, seq = self.registrar.issue(regk=registry.regk, said=creder.said,
                                          dt=dt, smids=smids, rmids=rmids)
 
+        self.escrowIssued(creder, hab=hab, seq=seq, smids=smids, rmids=rmids)
+
+    def issueMany(self, creders, smids=None, rmids=None):
+        """ Issue a batch of credentials anchoring the issuance events of all credentials of
+        the same registry together and handle witness propagation and communication of each
+
+        Args:
+            creders (list[Creder]): Credential objects to issue
+            smids (list[str] | None): optional group signing member ids for multisig
+                need to contributed current signing key
+            rmids (list[str] | None): optional group rotating member ids for multisig
+                need to contribute digest of next rotating key
+
+        Raises:
+            ValidationError: when a batch of a multisig group spans more than one registry or
+                exceeds .MaxSeals of the Registrar, before any TEL event is created
+        """
+        batches = dict()  # creders by registry in order
+        for creder in creders:
+            batches.setdefault(creder.crd["ri"], []).append(creder)
+
+        groups = dict()  # registries by multisig group hab
+        for regk, batch in batches.items():
+            registry = self.rgy.regs[regk]
+            self.registrar.batchable(registry, len(batch))
+            if registry.hab.group:
+                groups.setdefault(registry.hab.pre, []).append(regk)
+
+        for pre, regks in groups.items():
+            if len(regks) > 1:
+                raise kering.ValidationError(f"batch of multisig group {pre} spans {len(regks)} "
+                                             f"registries, only one anchoring event can be made at once")
+
+        for regk, batch in batches.items():
+            registry = self.rgy.regs[regk]
+            hab = registry.hab
+            msmids, mrmids = smids, rmids
+            if hab.group:
+                s, r = hab.members()
+                msmids = smids if smids is not None else s
+                mrmids = rmids if rmids is not None else r
+
+            dts = [creder.subject["dt"] if "dt" in creder.subject else None for creder in batch]
+            issued = self.registrar.issueMany(regk=regk, saids=[creder.said for creder in batch],
+                                              dts=dts, smids=msmids, rmids=mrmids)
+
+            for creder, (vcid, seq) in zip(batch, issued):
+                self.escrowIssued(creder, hab=hab, seq=seq, smids=msmids, rmids=mrmids)
+
+    def escrowIssued(self, creder, hab, seq, smids=None, rmids=None):
+        """ Sign credential creder whose issuance event is anchored and escrow it until the
+        registry anchors are complete, after collecting the signatures of other group members if any
+
+        Args:
+            creder (Creder): Credential object issued
+            hab (Hab): issuer environment
+            seq (int): sequence number of issuance TEL event
+            smids (list[str] | None): group signing member ids for multisig
+            rmids (list[str] | None): group rotating member ids for multisig
+        """
         rseq = coring.Seqner(sn=seq)
         if hab.group:
             craw = signing.ratify(hab=hab, serder=creder)
@@ -773,22 +1041,25 @@ class Credentialer(doing.DoDoer):
 
             # escrow waiting for other signatures
             self.rgy.reger.cmse.put(keys=(creder.said, rseq.qb64), val=creder)
+            self.rgy.reger.tews.rouse("cmse", (creder.said, rseq.qb64))
         else:
             craw = signing.ratify(hab=hab, serder=creder)
 
             # escrow waiting for registry anchors to be complete
             self.rgy.reger.crie.put(keys=(creder.said, rseq.qb64), val=creder)
+            self.rgy.reger.tews.rouse("crie", (creder.said, rseq.qb64))
 
         parsing.Parser().parse(ims=craw, vry=self.verifier)
 
 
     def processCredentialMissingSigEscrow(self):
-        for (said, snq), creder in self.rgy.reger.cmse.getItemIter():
+        for (said, snq), creder in self.escrowed("cmse", self.rgy.reger.cmse, self.rgy.reger.tews):
             rseq = coring.Seqner(qb64=snq)
 
             # Look for the saved saider
             saider = self.rgy.reger.saved.get(keys=said)
             if saider is None:
+                self.rgy.reger.tews.wait("cmse", (said, snq), said)
                 continue
 
             # Remove from this escrow
@@ -798,17 +1069,20 @@ class Credentialer(doing.DoDoer):
             kever = hab.kever
             # place in escrow to diseminate to other if witnesser and if there is an issuee
             self.rgy.reger.crie.put(keys=(creder.said, rseq.qb64), val=creder)
+            self.rgy.reger.tews.rouse("crie", (creder.said, rseq.qb64))
 
 
     def processCredentialIssuedEscrow(self):
-        for (said, snq), creder in self.rgy.reger.crie.getItemIter():
+        for (said, snq), creder in self.escrowed("crie", self.rgy.reger.crie, self.rgy.reger.tews):
             rseq = coring.Seqner(qb64=snq)
 
             if not self.registrar.complete(pre=said, sn=rseq.sn):
+                self.rgy.reger.tews.wait("crie", (said, snq), said, rseq.sn)
                 continue
 
             saider = self.rgy.reger.saved.get(keys=said)
             if saider is None:
+                self.rgy.reger.tews.wait("crie", (said, snq), said)
                 continue
 
             issr = creder.issuer
@@ -942,9 +1216,12 @@ class Credentialer(doing.DoDoer):
         self.tock = tock
         _ = (yield self.tock)
 
+        backoff = scheduling.Backoff(dbs=[self.hby.db, self.rgy.reger], high=0.5)
         while True:
-            self.processEscrows()
-            yield 0.5
+            if backoff.due(self.tyme):  # skip scan while nothing changed
+                self.processEscrows()
+                backoff.done(self.tyme)
+            yield self.tock
 
 
     def processEscrows(self):
@@ -955,6 +1232,12 @@ class Credentialer(doing.DoDoer):
         self.processCredentialIssuedEscrow()
         self.processCredentialMissingSigEscrow()
         self.processCredentialSentEscrow()
+        self.swept = True
+
+    def escrowed(self, escrow, suber, waits):
+        """ Returns items of escrow suber to process. All of them on the first pass
+        and after that only those woken in waitlist waits """
+        return suber.getItemIter() if not self.swept else waits.items(escrow, suber)
 
 
 def sendCredential(hby, hab, reger, postman, creder, recp):
@@ -22,7 +22,7 @@ from ..core.coring import (MtrDex, Serder, Serials, versify, Prefixer,
 from ..core.eventing import SealEvent, ample, TraitDex, verifySigs, validateSN
 from ..db import basing, dbing
 from ..db.dbing import dgKey, snKey
-from ..help import helping
+from ..help import helping, metering
 from ..kering import (MissingWitnessSignatureError, Version,
                       MissingAnchorError, ValidationError, OutOfOrderError, LikelyDuplicitousError)
 from ..vdr.viring import Reger
@@ -1291,6 +1291,7 @@ class Tever:
         self.reger.tets.pin(keys=(pre.decode("utf-8"), dig.decode("utf-8")), val=coring.Dater())
         self.reger.putTvt(key, serder.raw)
         self.reger.putTel(snKey(pre, sn), dig)
+        self.reger.tews.wake(pre.decode("utf-8"), sn)  # escrows waiting on event
         logger.info("Tever state: %s Added to TEL valid event=\n%s\n",
                     pre, json.dumps(serder.ked, indent=1))
 
@@ -1354,8 +1355,8 @@ class Tever:
     def verifyAnchor(self, serder, seqner=None, saider=None):
         """ Retrieve specified anchoring event and verify seal
 
-        Retrieve event from db using anchor, get seal from event eserder and
-        verify pre, sn and dig against serder
+        Retrieve event from db using anchor and find seal among the seals of
+        event eserder that matches pre, sn and dig of serder
 
         Parameters:
             serder (Serder): anchored TEL event
@@ -1389,18 +1390,14 @@ class Tever:
         if eserder.said != saider.qb64:
             return False
 
-        seal = eserder.ked["a"]
-        if seal is None or len(seal) != 1:
+        seals = eserder.ked["a"]
+        if not seals:
             return False
 
-        seal = seal[0]
-        spre = seal["i"]
-        ssn = seal["s"]
-        sdig = seal["d"]
-
-        if spre == serder.ked["i"] and ssn == serder.ked["s"] \
-                and serder.said == sdig:
-            return True
+        for seal in seals:  # batch anchors may seal many TEL events
+            if seal.get("i") == serder.ked["i"] and seal.get("s") == serder.ked["s"] \
+                    and seal.get("d") == serder.said:
+                return True
 
         return False
 
@@ -1447,6 +1444,11 @@ class Tever:
             self.reger.delBaks(key)
             self.reger.putBaks(key, [bak.encode("utf-8") for bak in baks])
         self.reger.putTvt(key, serder.raw)
+        keys = (serder.pre, f"{serder.sn:032x}")
+        if seqner and saider:  # wait on anchoring event
+            self.db.kews.wait("taes", keys, self.pre, seqner.sn)
+        else:  # wait on anchor to be attached
+            self.db.kews.wait("taes", keys, serder.said)
         logger.info("Tever state: Escrowed anchorless event "
                     "event = %s\n", serder.ked)
         return self.reger.putTae(snKey(serder.preb, serder.sn), serder.saidb)
@@ -1524,6 +1526,7 @@ class Tevery:
         self.local = True if local else False  # local vs nonlocal restrictions
         self.lax = True if lax else False
         self.cues = cues if cues is not None else decking.Deck()
+        self.swept = False  # True once all escrowed events were processed once
 
     @property
     def tevers(self):
@@ -1543,6 +1546,7 @@ class Tevery:
 
         return self.reger.registries
 
+    @metering.measure("tevery_event")
     def processEvent(self, serder, seqner=None, saider=None, wigers=None):
         """ Process one event serder with attached indexde signatures sigers
 
@@ -2043,6 +2047,11 @@ class Tevery:
         sealet = seqner.qb64b + saider.qb64b
         self.reger.putAnc(key, sealet)
         self.reger.putOot(snKey(serder.preb, serder.sn), serder.saidb)
+        regk = self.registryKey(serder)
+        if regk not in self.tevers:  # wait on registry inception
+            self.reger.tews.wait("oots", (serder.pre, f"{serder.sn:032x}"), regk, 0)
+        else:  # wait on prior event
+            self.reger.tews.wait("oots", (serder.pre, f"{serder.sn:032x}"), serder.pre, serder.sn - 1)
         logger.info("Tever state: Escrowed our of order TEL event "
                     "event = %s\n", serder.ked)
 
@@ -2052,6 +2061,7 @@ class Tevery:
         try:
             self.processEscrowAnchorless()
             self.processEscrowOutOfOrders()
+            self.swept = True
             self.reger.txnsb.processEscrowState(typ="credential-mre", processReply=self.processReplyCredentialTxnState,
                                                 extype=kering.MissingRegistryError)
             self.reger.txnsb.processEscrowState(typ="credential-mae", processReply=self.processReplyCredentialTxnState,
@@ -2069,18 +2079,40 @@ class Tevery:
             else:
                 logger.error("Tevery escrow process error: %s\n", ex.args[0])
 
+    def escrowed(self, escrow, waits, getter, iterer):
+        """ Returns iterator of (pre, snh, dig) of events in escrow to process.
+        All escrowed events on the first pass and after that only those woken
+        by acceptance of what they wait on.
+
+        Parameters:
+            escrow (str): name of escrow in waitlist
+            waits (Waitlist): waitlist of escrow
+            getter (function): returns dig of escrowed event at snKey or None
+            iterer (function): returns iterator of all escrowed events
+        """
+        if not self.swept:
+            return iterer()
+
+        items = []
+        for pre, snh in waits.take(escrow):
+            # copy out of read transaction since later writes may reuse its buffer
+            if (dig := getter(snKey(pre, int(snh, 16)))) is not None:
+                items.append((pre, snh, bytes(dig)))
+        return items
+
     def processEscrowOutOfOrders(self):
         """ Loop through out of order escrow:
 
          Process out of order events in the following way:
-           1. loop over event digests saved in oots
+           1. loop over event digests saved in oots that may now be in order
            2. deserialize event out of tvts
            3. read anchor information out of .ancs
            4. perform process event
            5. Remove event digest from oots if processed successfully or a non-out-of-order event occurs.
 
         """
-        for (pre, snb, digb) in self.reger.getOotItemIter():
+        for (pre, snb, digb) in self.escrowed("oots", self.reger.tews, self.reger.getOot,
+                                              self.reger.getOotItemIter):
             try:
                 sn = int(snb, 16)
                 dgkey = dgKey(pre, digb)
@@ -2139,7 +2171,7 @@ class Tevery:
         """ Process escrow of TEL events received before the anchoring KEL event.
 
         Process anchorless events in the following way:
-           1. loop over event digests saved in taes
+           1. loop over event digests saved in taes that may now be anchored
            2. deserialize event out of tvts
            3. load backer signatures out of tibs
            4. read anchor information out of ancs
@@ -2147,7 +2179,8 @@ class Tevery:
            6. Remove event digest from oots if processed successfully or a non-anchorless event occurs.
 
         """
-        for (pre, snb, digb) in self.reger.getTaeItemIter():
+        for (pre, snb, digb) in self.escrowed("taes", self.db.kews, self.reger.getTae,
+                                              self.reger.getTaeItemIter):
             sn = int(snb, 16)
             try:
                 dgkey = dgKey(pre, digb)
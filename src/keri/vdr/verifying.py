@@ -7,6 +7,9 @@ VC verifier support
 """
 import datetime
 import logging
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import Type
 
 from hio.help import decking
@@ -15,24 +18,101 @@ from .. import help, kering
 from ..app import signing
 from ..core import parsing, coring, scheming
 from .. import core
-from ..help import helping
+from ..help import helping, metering
+from ..vc import proving
 from ..vdr import eventing
 from ..vdr.viring import Reger
 
 logger = help.ogler.getLogger()
 
 
+def verifyCredentials(items):
+    """ Returns tuple (checked, triples) of the CPU heavy stateless checks of
+    credentials in items. Runs in worker process so only uses picklable inputs
+    and outputs and touches no database.
+
+    checked (list): of raw credentials whose SAID and schema verified
+    triples (list): of (verfer.qb64b, sig raw, raw) triples of verified
+        signatures and cigars
+
+    Parameters:
+        items (list): of (raw, scraw, cigs, sigs) tuples one per credential where
+            raw (bytes): serialized credential
+            scraw (bytes | None): schema of credential or None when not cached
+            cigs (list): of (verfer qb64b, cigar raw) nontransferable signatures
+            sigs (list): of (keys, sigers) root signatures where keys is list
+                of qb64 signing keys of signing event and sigers is list of
+                qb64b indexed signatures
+    """
+    checked = []
+    triples = []
+    for raw, scraw, cigs, sigs in items:
+        try:
+            creder = proving.Creder(raw=raw)
+            if scraw is not None and creder.saider.verify(sad=creder.crd, prefixed=True):
+                scheming.Schemer(raw=scraw).verify(raw)
+                checked.append(raw)
+        except Exception:  # invalid so leave for Verifier to reject
+            pass
+
+        for verferb, sig in cigs:
+            try:
+                if coring.Verfer(qb64b=verferb).verify(sig, raw):
+                    triples.append((verferb, sig, raw))
+            except Exception:
+                continue
+
+        for keys, sigers in sigs:
+            for sig in sigers:
+                try:
+                    siger = coring.Siger(qb64b=sig)
+                    if siger.index >= len(keys):
+                        continue
+                    verfer = coring.Verfer(qb64=keys[siger.index])
+                    if verfer.verify(siger.raw, raw):
+                        triples.append((verfer.qb64b, siger.raw, raw))
+                except Exception:
+                    continue
+
+    return checked, triples
+
+
+class Collector:
+    """ Collector stands in for the Verifier of a Parser and collects parsed
+    credentials into .creds for batch verification by Verifier.processMessages
+
+    """
+
+    def __init__(self, creds=None):
+        """
+        Parameters:
+            creds (decking.Deck): collected credentials as .processCredential kwargs
+        """
+        self.creds = creds if creds is not None else decking.Deck()
+
+    def processCredential(self, creder, sadsigers=None, sadcigars=None):
+        """ Collects credential for batch verification """
+        self.creds.append(dict(creder=creder, sadsigers=sadsigers, sadcigars=sadcigars))
+
+
 class Verifier:
     """
     Verifier class accepts and validates TEL events.
 
+    A batch of credentials from .processMessages is verified as a pipeline.
+    Worker processes verify SAIDs, schemas and signatures of all of them up
+    front and return the results as memos .checked and .verified. The
+    credentials are then committed in order on the calling thread by
+    .processCredential which trusts the memos instead of verifying again.
+    Chain lookups are memoized in .chains for the duration of the batch.
+
     """
     TimeoutPSE = 3600  # seconds to timeout partially signed credential escrow
     TimeoutMRE = 3600  # seconds to timeout missing registry escrows
     TimeoutMRI = 3600  # seconds to timeout missing issuer escrows
     TimeoutBCE = 3600  # seconds to timeout missing issuer escrows
 
-    def __init__(self, hby, reger=None, creds=None, cues=None, expiry=36000000000):
+    def __init__(self, hby, reger=None, creds=None, cues=None, expiry=36000000000, workers=0, pool=None):
         """
         Initialize Verifier instance
 
@@ -41,6 +121,9 @@ class Verifier:
             reger (Reger): database instance
             creds (decking.Deck): inbound credentials for handler
             cues (decking.Deck): outbound cue messages from handler
+            workers (int | None): number of worker processes for batches, 0
+                means verify inline, None means one per CPU
+            pool (ProcessPoolExecutor | None): optional shared worker pool
 
         """
         self.hby = hby
@@ -48,6 +131,11 @@ class Verifier:
         self.creds = creds if creds is not None else decking.Deck()  # subclass of deque
         self.cues = cues if cues is not None else decking.Deck()  # subclass of deque
         self.CredentialExpiry = expiry
+        self.workers = workers
+        self.pool = pool
+        self.checked = set()  # raw credentials with SAID and schema verified by workers
+        self.verified = set()  # (verfer.qb64b, sig raw, raw) triples verified by workers
+        self.chains = None  # chain node state by SAID memo of current batch
 
         self.inited = False
         self.tvy = None
@@ -76,8 +164,17 @@ class Verifier:
         """
         return self.reger.tevers
 
+    def close(self):
+        """ Shuts down worker pool if any """
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
     def processMessages(self, creds=None):
-        """ Process message dicts in msgs or if msgs is None in .msgs
+        """ Process message dicts in msgs or if msgs is None in .msgs as one batch.
+        Errors of individual credentials are logged so the rest of the batch
+        is still processed. processCredential raises KeriError, such as
+        ValidationError, after escrowing those that may become valid later.
 
         Parameters:
             creds (decking.Deck): each entry is dict that matches call signature of
@@ -86,9 +183,86 @@ class Verifier:
         if creds is None:
             creds = self.creds
 
+        batch = []
         while creds:
-            self.processCredential(**creds.pull())
+            batch.append(creds.pull())
+        if not batch:
+            return
+
+        if self.workers != 0 and len(batch) > 1:
+            checked, triples = self.verify(batch)
+            self.checked.update(checked)
+            self.verified.update(triples)
+
+        self.chains = dict()
+        try:
+            for cred in batch:
+                try:
+                    self.processCredential(**cred)
+                except kering.KeriError as ex:  # invalid or escrowed by processCredential
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.exception("Verifier credential error: %s\n", ex)
+                    else:
+                        logger.info("Verifier credential error: %s\n", ex)
+                except Exception as ex:  # unexpected so log diagnostics and go on with batch
+                    logger.exception("Verifier credential failure: %s\n", ex)
+        finally:
+            # drop memos not consumed, e.g. of escrowed credentials
+            self.checked.clear()
+            self.verified.clear()
+            self.chains = None
+
+    def items(self, batch):
+        """ Returns list of verifyCredentials items for credentials in batch with
+        schemas and signing keys looked up from the database
+
+        Parameters:
+            batch (list): of .processCredential kwargs dicts
+        """
+        items = []
+        for cred in batch:
+            creder = cred["creder"]
+            scraw = self.resolver.resolve(creder.schema)
+            cigs = [(cigar.verfer.qb64b, cigar.raw) for (_, cigar) in cred.get("sadcigars") or []]
+
+            sigs = []
+            for (pather, prefixer, seqner, saider, sigers) in cred.get("sadsigers") or []:
+                if pather.bext != "-":
+                    continue
+                # .get misses kevers not yet read through from key state
+                if prefixer.qb64 not in self.hby.kevers or self.hby.kevers[prefixer.qb64].sn < seqner.sn:
+                    continue  # issuer not known yet
+                try:
+                    _, verfers = self.hby.db.resolveVerifiers(pre=prefixer.qb64, sn=seqner.sn, dig=saider.qb64)
+                except kering.ValidationError:
+                    continue
+                sigs.append(([verfer.qb64 for verfer in verfers], [siger.qb64b for siger in sigers]))
+
+            items.append((creder.raw, bytes(scraw) if scraw else None, cigs, sigs))
+        return items
+
+    def verify(self, batch):
+        """ Returns tuple (checked, triples) of verifyCredentials results for
+        credentials in batch computed by worker processes
 
+        Parameters:
+            batch (list): of .processCredential kwargs dicts
+        """
+        items = self.items(batch)
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers)
+
+        count = self.workers if self.workers else (os.cpu_count() or 1)
+        size = math.ceil(len(items) / count)
+        checked = []
+        triples = []
+        for rchecked, rtriples in self.pool.map(verifyCredentials,
+                                                [items[i:i + size] for i in range(0, len(items), size)]):
+            checked.extend(rchecked)
+            triples.extend(rtriples)
+        return checked, triples
+
+    @metering.measure("verifier_credential")
     def processCredential(self, creder, sadsigers=None, sadcigars=None):
         """ Credential data and signature(s) verification
 
@@ -138,17 +312,26 @@ class Verifier:
                 self.cues.append(dict(kin="query", q=dict(r="schema", said=schema)))
             raise kering.MissingSchemaError("schema {} not in cache".format(schema))
 
-        schemer = scheming.Schemer(raw=scraw)
-        try:
-            schemer.verify(creder.raw)
-        except kering.ValidationError as ex:
-            print("Credential {} is not valid against schema {}: {}"
-                  .format(creder.said, schema, ex))
-            raise kering.FailedSchemaValidationError("Credential {} is not valid against schema {}: {}"
-                                                     .format(creder.said, schema, ex))
+        if creder.raw in self.checked:  # SAID and schema verified by worker
+            self.checked.discard(creder.raw)
+        else:
+            if not creder.saider.verify(sad=creder.crd, prefixed=True):
+                raise kering.ValidationError("Invalid SAID {} of credential".format(vcid))
+
+            schemer = scheming.Schemer(raw=scraw)
+            try:
+                schemer.verify(creder.raw)
+            except kering.ValidationError as ex:
+                print("Credential {} is not valid against schema {}: {}"
+                      .format(creder.said, schema, ex))
+                raise kering.FailedSchemaValidationError("Credential {} is not valid against schema {}: {}"
+                                                         .format(creder.said, schema, ex))
 
         for (pather, cigar) in sadcigars:
-            if not cigar.verfer.verify(cigar.raw, creder.raw):  # cig not verify
+            triple = (cigar.verfer.qb64b, cigar.raw, creder.raw)
+            if triple in self.verified:  # verified by worker
+                self.verified.discard(triple)
+            elif not cigar.verfer.verify(cigar.raw, creder.raw):  # cig not verify
                 self.escrowPSC(creder, sadsigers, sadcigars)
                 raise kering.MissingSignatureError("Failure satisfying credential on sigs for {}"
                                                    " for evt = {}.".format(cigar,
@@ -167,7 +350,7 @@ class Verifier:
 
             # Verify the signatures are valid and that the signature threshold as of the signing event is met
             tholder, verfers = self.hby.db.resolveVerifiers(pre=prefixer.qb64, sn=seqner.sn, dig=saider.qb64)
-            _, indices = core.eventing.verifySigs(creder.raw, sigers, verfers)
+            _, indices = core.eventing.verifySigs(creder.raw, sigers, verfers, verified=self.verified)
 
             if not tholder.satisfy(indices):  # We still don't have all the sigers, need to escrow
                 self.escrowPSC(creder, sadsigers, sadcigars)
@@ -293,10 +476,17 @@ class Verifier:
         return self.reger.mse.put(keys=key, val=coring.Dater())
 
     def processEscrows(self):
-        """ Process all escrows once each
+        """ Process all escrows once each with chain lookups memoized
 
         """
+        self.chains = dict()
+        try:
+            self._processEscrows()
+        finally:
+            self.chains = None
 
+    def _processEscrows(self):
+        """ Process all escrows once each """
         self._processEscrow(self.reger.mce, self.TimeoutMRI, kering.MissingChainError)
         self._processEscrow(self.reger.mse, self.TimeoutMRI, kering.MissingSchemaError)
         self._processEscrow(self.reger.pse, self.TimeoutPSE, kering.MissingSignatureError)
@@ -363,6 +553,7 @@ class Verifier:
         # Look up indicies
         saider = creder.saider
         self.reger.saved.pin(keys=saider.qb64b, val=saider)
+        self.reger.tews.wake(saider.qb64)  # issuance escrows waiting on credential
         self.reger.issus.add(keys=issuer, val=saider)
         self.reger.schms.add(keys=schema, val=saider)
 
@@ -390,6 +581,16 @@ class Verifier:
             Serder: transaction event state notification message
 
         """
+        if self.chains is not None and nodeSaid in self.chains:
+            return self.chains[nodeSaid]
+
+        state = self._verifyChain(nodeSaid)
+        if self.chains is not None and state is not None:  # only found nodes stay found
+            self.chains[nodeSaid] = state
+        return state
+
+    def _verifyChain(self, nodeSaid):
+        """ Returns state of node credential nodeSaid or None, see .verifyChain """
         said = self.reger.saved.get(keys=nodeSaid)
         if said is None:
             return None
@@ -172,6 +172,7 @@ class Reger(dbing.LMDBer):
     TailDirPath = "keri/reg"
     AltTailDirPath = ".keri/reg"
     TempPrefix = "keri_reg_"
+    IoDupSubkeys = (b'baks.', )  # raw sub dbs of insertion ordered dups
 
     def __init__(self, headDirPath=None, reopen=True, **kwa):
         """
@@ -282,6 +283,10 @@ class Reger(dbing.LMDBer):
         # Collection of sub-dbs for persisting Registry Txn State Notices
         self.txnsb = escrowing.Broker(db=self, subkey="txn.")
 
+        # escrows waiting on TEL events or saved credentials, woken when the
+        # awaited event is accepted, disseminated or the credential saved
+        self.tews = escrowing.Waitlist(db=self, subkey="tews")
+
         # registry keys keyed by Registry name
         self.regs = koming.Komer(db=self,
                                  subkey='regs.',
@@ -327,40 +332,41 @@ class Reger(dbing.LMDBer):
             list: fully hydrated credentials with full chains provided
 
         """
-        creds = []
-        for saider in saids:
-            key = saider.qb64
-            creder, sadsigers, sadcigars = self.cloneCred(said=key)
-
-            chainSaids = []
-            for k, p in creder.chains.items():
-                if k == "d":
-                    continue
-
-                if not isinstance(p, dict):
-                    continue
-
-                chainSaids.append(coring.Saider(qb64=p["n"]))
-            chains = self.cloneCreds(chainSaids)
-
-            regk = creder.status
-            status = self.tevers[regk].vcState(saider.qb64)
-            cred = dict(
-                sad=creder.crd,
-                pre=creder.issuer,
-                sadsigers=[dict(
-                    path=pather.bext,
-                    pre=prefixer.qb64,
-                    sn=seqner.sn,
-                    d=saider.qb64
-                ) for (pather, prefixer, seqner, saider, sigers) in sadsigers],
-                sadcigars=[dict(path=pather.bext, cigar=cigar.qb64) for (pather, cigar) in sadcigars],
-                chains=chains,
-                status=status.ked,
-            )
-
-            creds.append(cred)
-        return creds
+        with self.snapshot():  # one consistent view of all chained credentials
+            creds = []
+            for saider in saids:
+                key = saider.qb64
+                creder, sadsigers, sadcigars = self.cloneCred(said=key)
+
+                chainSaids = []
+                for k, p in creder.chains.items():
+                    if k == "d":
+                        continue
+
+                    if not isinstance(p, dict):
+                        continue
+
+                    chainSaids.append(coring.Saider(qb64=p["n"]))
+                chains = self.cloneCreds(chainSaids)
+
+                regk = creder.status
+                status = self.tevers[regk].vcState(saider.qb64)
+                cred = dict(
+                    sad=creder.crd,
+                    pre=creder.issuer,
+                    sadsigers=[dict(
+                        path=pather.bext,
+                        pre=prefixer.qb64,
+                        sn=seqner.sn,
+                        d=saider.qb64
+                    ) for (pather, prefixer, seqner, saider, sigers) in sadsigers],
+                    sadcigars=[dict(path=pather.bext, cigar=cigar.qb64) for (pather, cigar) in sadcigars],
+                    chains=chains,
+                    status=status.ked,
+                )
+
+                creds.append(cred)
+            return creds
 
     def logCred(self, creder, sadsigers=None, sadcigars=None):
         """ Save the base credential and seals (est evt+sigs quad) with no indices.
@@ -372,17 +378,16 @@ class Reger(dbing.LMDBer):
 
         """
         key = creder.saider.qb64b
-        self.creds.put(keys=key, val=creder)
-
-        if sadcigars:
-            for (pather, cigar) in sadcigars:
-                keys = (creder.saider.qb64, pather.qb64)
-                self.spcgs.put(keys=keys, vals=[(cigar.verfer, cigar)])
-        if sadsigers:  # want sn in numerical order so use hex
-            for (pather, prefixer, seqner, saider, sigers) in sadsigers:
-                quinkeys = (creder.saider.qb64, pather.qb64, prefixer.qb64, f"{seqner.sn:032x}", saider.qb64)
-                for siger in sigers:
-                    self.spsgs.add(keys=quinkeys, val=siger)
+        with self.transact():  # credential and its signatures commit together
+            self.creds.put(keys=key, val=creder)
+
+            if sadcigars:
+                self.spcgs.putMany([((creder.saider.qb64, pather.qb64), [(cigar.verfer, cigar)])
+                                    for (pather, cigar) in sadcigars])
+            if sadsigers:  # want sn in numerical order so use hex
+                self.spsgs.putMany([((creder.saider.qb64, pather.qb64, prefixer.qb64,
+                                      f"{seqner.sn:032x}", saider.qb64), sigers)
+                                    for (pather, prefixer, seqner, saider, sigers) in sadsigers])
 
     def cloneCred(self, said, root=None):
         """ Load base credential and CESR proof signatures from database.
@@ -451,37 +456,73 @@ class Reger(dbing.LMDBer):
         if hasattr(pre, 'encode'):
             pre = pre.encode("utf-8")
 
-        for fn, dig in self.getTelItemPreIter(pre, fn=fn):
-            msg = bytearray()  # message
-            atc = bytearray()  # attachments
-            dgkey = dbing.dgKey(pre, dig)  # get message
-            if not (raw := self.getTvt(key=dgkey)):
-                raise kering.MissingEntryError("Missing event for dig={}.".format(dig))
-            msg.extend(raw)
-
-            # add indexed backer signatures to attachments
-            if tibs := self.getTibs(key=dgkey):
-                atc.extend(coring.Counter(code=coring.CtrDex.WitnessIdxSigs,
-                                          count=len(tibs)).qb64b)
-                for tib in tibs:
-                    atc.extend(tib)
-
-            # add authorizer (delegator/issure) source seal event couple to attachments
-            couple = self.getAnc(dgkey)
-            if couple is not None:
-                atc.extend(coring.Counter(code=coring.CtrDex.SealSourceCouples,
-                                          count=1).qb64b)
-                atc.extend(couple)
-
-            # prepend pipelining counter to attachments
-            if len(atc) % 4:
-                raise ValueError("Invalid attachments size={}, nonintegral"
-                                 " quadlets.".format(len(atc)))
-            pcnt = coring.Counter(code=coring.CtrDex.AttachedMaterialQuadlets,
-                                  count=(len(atc) // 4)).qb64b
-            msg.extend(pcnt)
-            msg.extend(atc)
-            yield msg
+        def clones():
+            for _, dig in self.getTelItemPreIter(pre, fn=fn):
+                yield self.cloneTvt(pre=pre, dig=dig)
+
+        yield from self.snapshotIter(clones())  # one consistent view of TEL
+
+    def cloneAllPreIter(self, key=b''):
+        """ Iterator of first seen event messages of all TELs
+
+        Returns iterator of first seen event messages with attachments for all
+        TEL prefixes starting at key. If key == b'' then start at first key in
+        database. Use key to resume replay.
+
+        Parameters:
+            key (bytes): fnKey(pre, fn)
+
+        Returns:
+            iterator: bytearray per serializeed event msg
+
+        """
+        def clones():
+            for pre, _, dig in self.getTelItemAllPreIter(key=key):
+                yield self.cloneTvt(pre=pre, dig=dig)
+
+        yield from self.snapshotIter(clones())  # one consistent view of all TELs
+
+    def cloneTvt(self, pre, dig):
+        """ Clones TEL event as serialized CESR message with attachments
+
+        Parameters:
+            pre (bytes): qb64 identifier prefix of registry state TEL
+            dig (bytes): digest of event
+
+        Returns:
+            bytearray: message body with pipelined attachments
+
+        """
+        msg = bytearray()  # message
+        atc = bytearray()  # attachments
+        dgkey = dbing.dgKey(pre, dig)  # get message
+        if not (raw := self.getTvt(key=dgkey)):
+            raise kering.MissingEntryError("Missing event for dig={}.".format(dig))
+        msg.extend(raw)
+
+        # add indexed backer signatures to attachments
+        if tibs := self.getTibs(key=dgkey):
+            atc.extend(coring.Counter(code=coring.CtrDex.WitnessIdxSigs,
+                                      count=len(tibs)).qb64b)
+            for tib in tibs:
+                atc.extend(tib)
+
+        # add authorizer (delegator/issure) source seal event couple to attachments
+        couple = self.getAnc(dgkey)
+        if couple is not None:
+            atc.extend(coring.Counter(code=coring.CtrDex.SealSourceCouples,
+                                      count=1).qb64b)
+            atc.extend(couple)
+
+        # prepend pipelining counter to attachments
+        if len(atc) % 4:
+            raise ValueError("Invalid attachments size={}, nonintegral"
+                             " quadlets.".format(len(atc)))
+        pcnt = coring.Counter(code=coring.CtrDex.AttachedMaterialQuadlets,
+                              count=(len(atc) // 4)).qb64b
+        msg.extend(pcnt)
+        msg.extend(atc)
+        return msg
 
     def sources(self, db, creder):
         """ Returns raw bytes of any source ('e') credential that is in our database
@@ -603,6 +644,21 @@ class Reger(dbing.LMDBer):
         """
         return self.getAllOrdItemPreIter(db=self.tels, pre=pre, on=fn)
 
+    def getTelItemAllPreIter(self, key=b''):
+        """
+        Returns iterator of all (pre, fn, dig) triples in first seen order for
+        all events for all prefixes in database. Items are sorted by
+        fnKey(pre, fn) where fn is first seen order number int.
+        Returns all Transaction Event Logs TELs.
+
+        Raises StopIteration Error when empty.
+
+        Parameters:
+            key is key location in db to resume replay, If empty then start at
+                first key in database
+        """
+        return self.getAllOrdItemAllPreIter(db=self.tels, key=key)
+
     def cntTels(self, pre, fn=0):
         """
         Returns count of all (fn, dig)  for all events
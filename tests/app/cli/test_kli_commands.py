@@ -292,3 +292,48 @@ def test_incept_and_rotate_opts(helpers, capsys):
 
 
 
+
+
+def test_kli_lazy_parser():
+    from keri.app.cli import kli
+
+    parser = kli.loadParser(["version"])
+    args = parser.parse_args(["version"])
+    assert args.handler is not None
+
+    args = kli.loadParser(["vc", "registry", "list", "--name", "x"]).parse_args(
+        ["vc", "registry", "list", "--name", "x"])
+    assert args.name == "x"
+    assert args.handler is not None
+
+    # help and unknown commands get the parser of all commands
+    parser = kli.loadParser(["--help"])
+    args = parser.parse_args(["incept", "--name", "x", "--alias", "y"])
+    assert args.alias == "y"
+    assert not hasattr(parser.parse_args([]), "handler")
+
+
+# generous bound of summed self import microseconds of incept parser to catch regressions
+IMPORT_BUDGET = 1_500_000
+
+
+def test_kli_importtime():
+    import subprocess
+    import sys
+
+    code = "from keri.app.cli import kli; kli.loadParser(['incept', '--name', 'x'])"
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                         capture_output=True, text=True, check=True)
+
+    modules = {}
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        us, _, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(us)
+
+    assert "keri.app.cli.common.incepting" in modules  # imported by selected incept command
+    for name in ("falcon", "jsonschema", "keri.app.kiwiing", "keri.app.booting",
+                 "keri.app.cli.commands.vc"):
+        assert name not in modules
+    assert sum(modules.values()) < IMPORT_BUDGET
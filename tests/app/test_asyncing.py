@@ -0,0 +1,176 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.app.asyncing module
+
+"""
+import asyncio
+
+from hio.base import doing
+
+from keri.app import asyncing, habbing, httping
+from keri.core import eventing
+from keri.db import dbing
+
+
+def test_doer_host():
+    """ Test DoerHost runs hio doers and wakes on demand """
+    ran = []
+
+    def counter(tymth=None, tock=0.0, **opts):
+        yield  # enter context
+        for i in range(3):
+            ran.append(i)
+            yield 10.0  # long tock so only wake makes it run again
+        return True
+
+    doer = doing.doify(counter, tock=10.0)
+    host = asyncing.DoerHost(doers=[doer], tock=10.0)
+
+    async def main():
+        task = asyncio.create_task(host.run(limit=0.25))
+        for i in range(3):
+            await asyncio.sleep(0.01)
+            host.wake()
+        await asyncio.sleep(0.01)
+        return await task
+
+    asyncio.run(main())
+    assert ran == [0, 1, 2]  # each wake recurs doer before its retyme is due
+    assert doer.done is True
+
+    ran.clear()
+    doer = doing.doify(counter, tock=10.0)
+    host = asyncing.DoerHost(doers=[doer], tock=10.0)
+    asyncio.run(host.run(limit=0.05))
+    assert ran == [0]  # never woken so retyme not yet due
+    assert doer.done is False  # forced exit at limit
+
+    ran.clear()
+    def quick(tymth=None, tock=0.0, **opts):
+        yield
+        for i in range(3):
+            ran.append(i)
+            yield
+        return True
+
+    doer = doing.doify(quick)
+    host = asyncing.DoerHost(doers=[doer], tock=0.001)
+    asyncio.run(host.run(limit=5.0))
+    assert ran == [0, 1, 2]
+    assert doer.done is True
+
+
+def test_server_clienter():
+    """ Test asyncio TCP server receipts events sent by pooled client """
+    with habbing.openHby(name="wes", base="test") as wesHby, \
+            habbing.openHby(name="eve", base="test") as eveHby:
+        wesHab = wesHby.makeHab(name="wes", transferable=False)
+        eveHab = eveHby.makeHab(name="eve", isith="1", icount=1)
+        eveHab.interact()
+
+        async def reply(reader):
+            return await reader.read(65536)
+
+        async def main():
+            server = asyncing.Server(hab=wesHab, port=0)
+            await server.start()
+            clienter = asyncing.Clienter()
+            try:
+                rxs = []
+                for msg in eveHby.db.clonePreIter(pre=eveHab.pre):
+                    rxs.append(await clienter.exchange("127.0.0.1", server.port, msg, reply))
+                assert len(clienter._idle[("127.0.0.1", server.port)]) == 1  # reused
+                return rxs
+            finally:
+                await clienter.close()
+                await server.close()
+
+        rxs = asyncio.run(main())
+        assert eveHab.pre in wesHby.db.kevers
+        assert wesHby.db.kevers[eveHab.pre].sn == 1
+
+        # feeding responses to eve stores wes receipts
+        feeder = asyncing.Feeder(kvy=eventing.Kevery(db=eveHby.db, lax=False, local=False))
+        half = len(rxs[0]) // 2
+        assert feeder.feed(rxs[0][:half]) < half  # partial message waits
+        assert feeder.feed(rxs[0][half:]) > 0
+        assert not feeder.ims
+        assert wesHab.pre in eveHby.db.kevers
+        key = dbing.dgKey(eveHab.pre, eveHab.iserder.said)
+        assert eveHby.db.cntRcts(key=key) == 1
+
+
+def test_clienter_request():
+    """ Test keep-alive HTTP requests and CESR posts """
+    received = []
+
+    async def handle(reader, writer):
+        while line := await reader.readline():
+            headers = {}
+            while (hline := await reader.readline()) not in (b"\r\n", b""):
+                name, _, value = hline.decode().partition(":")
+                headers[name.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers.get("content-length", 0)))
+            received.append((line.split()[:2], headers, body))
+            writer.write(b"HTTP/1.1 204 No Content\r\nContent-Length: 0\r\n\r\n")
+            await writer.drain()
+        writer.close()
+
+    with habbing.openHby(name="eve", base="test") as eveHby:
+        eveHab = eveHby.makeHab(name="eve", isith="1", icount=1)
+        eveHab.interact()
+        msgs = eveHab.replay()
+
+        async def main():
+            server = await asyncio.start_server(handle, host="127.0.0.1", port=0)
+            port = server.sockets[0].getsockname()[1]
+            clienter = asyncing.Clienter()
+            try:
+                statuses = await clienter.postCESR(f"http://127.0.0.1:{port}/", msgs)
+                assert len(clienter._idle[("127.0.0.1", port)]) == 1
+                return statuses
+            finally:
+                await clienter.close()
+                server.close()
+                await server.wait_closed()
+
+        assert asyncio.run(main()) == [204, 204]
+
+    rebuilt = bytearray()
+    for (method, path), headers, body in received:
+        assert (method, path) == (b"POST", b"/")
+        assert headers["content-type"] == httping.CESR_CONTENT_TYPE
+        rebuilt.extend(body)
+        rebuilt.extend(headers[httping.CESR_ATTACHMENT_HEADER.lower()].encode())
+    assert rebuilt == msgs
+
+
+def test_http_server():
+    """ Test asyncio HTTP server accepts CESR posts over keep-alive connection """
+    with habbing.openHby(name="wes", base="test") as wesHby, \
+            habbing.openHby(name="eve", base="test") as eveHby:
+        wesHab = wesHby.makeHab(name="wes", transferable=False)
+        eveHab = eveHby.makeHab(name="eve", isith="1", icount=1)
+        eveHab.interact()
+
+        async def main():
+            server = asyncing.HttpServer(hab=wesHab, port=0)
+            await server.start()
+            clienter = asyncing.Clienter()
+            try:
+                url = f"http://127.0.0.1:{server.port}/"
+                statuses = await clienter.postCESR(url, eveHab.replay())
+                assert len(clienter._idle[("127.0.0.1", server.port)]) == 1  # reused
+                status, _, _ = await clienter.request("GET", url)
+                assert status == 405
+                status, _, _ = await clienter.request("POST", url, body=b"{}",
+                                                      headers={"Content-Type": "application/json"})
+                assert status == 406
+                return statuses
+            finally:
+                await clienter.close()
+                await server.close()
+
+        assert asyncio.run(main()) == [204, 204]
+        assert eveHab.pre in wesHby.db.kevers
+        assert wesHby.db.kevers[eveHab.pre].sn == 1
@@ -155,6 +155,80 @@ def test_organizer():
             org.find(field="company", val="GLEIF")
 
 
+def test_organizer_index():
+    joe = "EtyPSuUjLyLdXAtGMrsTt0-ELyWeU8fJcymHiGOfuaSA"
+    bob = "EuEQX8At31X96iDVpigv-rTdOKvFiWFunbJ1aDfq89IQ"
+    ken = "EFC7f_MEPE5dboc_E4yG15fnpMD34YaU3ue6vnDLodJU"
+
+    with habbing.openHby(name="test", temp=True) as hby:
+        org = connecting.Organizer(hby=hby)
+        org.replace(pre=joe, data=dict(first="Joe", last="Jury", company="HCF", address="9934 Glen Creek St."))
+        org.replace(pre=bob, data=dict(first="Bob", last="Burns", company="HCF Inc.", address="37 East Shadow Brook"))
+        org.replace(pre=ken, data=dict(first="Ken", last="Knight", company="GLEIF", address="28 Glen Ave."))
+
+        # exact match ignores case and does not match longer values
+        assert [c["id"] for c in org.lookup(field="company", val="hcf")] == [joe]
+        assert [c["id"] for c in org.lookup(field="company", val="HCF Inc.")] == [bob]
+        assert org.lookup(field="last", val="Jur") == []
+
+        # word prefix search
+        assert [c["id"] for c in org.search(field="address", text="glen")] == [ken, joe]
+        assert [c["id"] for c in org.search(field="address", text="Gl cr")] == [joe]
+        assert org.search(field="address", text="glen shadow") == []
+
+        grouped = org.group(field="company")
+        assert list(grouped) == ["GLEIF", "HCF", "HCF Inc."]
+        assert [c["id"] for c in grouped["HCF"]] == [joe]
+        assert list(org.group(field="company", val="inc")) == ["HCF Inc."]
+
+        # substring find treats val literally
+        assert [c["id"] for c in org.find(field="company", val="f inc.")] == [bob]
+        assert org.find(field="company", val="HCF.Inc") == []
+        assert org.find(field="address", val="(") == []
+        assert org.values(field="company", val="c.") == ["HCF Inc."]
+
+        # index follows updates and removals
+        org.update(pre=joe, data=dict(company="GLEIF"))
+        assert org.lookup(field="company", val="HCF") == []
+        assert [c["id"] for c in org.lookup(field="company", val="GLEIF")] == [ken, joe]
+        org.set(pre=bob, field="address", val="1 Glen Rd")
+        assert [c["id"] for c in org.search(field="address", text="glen")] == [ken, joe, bob]
+        assert org.search(field="address", text="shadow") == []
+        org.rem(pre=ken)
+        assert [c["id"] for c in org.lookup(field="company", val="GLEIF")] == [joe]
+
+        # sorted and paginated listing
+        assert [c["id"] for c in org.list()] == [joe, bob]
+        assert [c["id"] for c in org.list(sort="first")] == [bob, joe]
+        assert [c["id"] for c in org.list(sort="first", start=1, limit=5)] == [joe]
+        org.replace(pre=ken, data=dict(last="Knight"))
+        assert [c["id"] for c in org.list(sort="first")] == [bob, joe, ken]  # no first sorts last
+        assert org.list(start=1, limit=1)[0]["id"] == joe  # by prefix
+
+        # verified cache is only used while data and signature are unchanged
+        contact = org.get(pre=bob)
+        contact["challenges"] = []
+        assert "challenges" not in org.get(pre=bob)
+        cigar = hby.signator.sign(ser=b"garbage")
+        hby.db.ccigs.pin(keys=(bob,), val=cigar)
+        with pytest.raises(kering.ValidationError):
+            org.get(pre=bob)
+        assert bob not in org._verified
+
+        # verified cache is bounded evicting least recently read first
+        org.CacheSize = 1
+        org.get(pre=joe)
+        org.get(pre=ken)
+        assert list(org._verified) == [ken]
+
+        # indexes rebuilt for contacts stored without them
+        hby.db.cidx.trim()
+        hby.db.ctok.trim()
+        org = connecting.Organizer(hby=hby)
+        assert [c["id"] for c in org.lookup(field="last", val="knight")] == [ken]
+        assert org.values(field="first") == ["Bob", "Joe"]
+
+
 def test_organizer_imgs():
 
     with habbing.openHab(name="test", transferable=True, temp=True) as (hby, hab):
@@ -7,16 +7,17 @@ import json
 import os
 
 import falcon
+import pytest
 from falcon import testing
 from hio.base import doing
 
 from keri import kering
 from keri.app import habbing, kiwiing, grouping, indirecting, directing, booting, notifying
 from keri.core import scheming, coring, eventing, parsing
-from keri.db import basing
+from keri.db import basing, dbing
 from keri.vc import proving
 from keri.vdr import credentialing, verifying
-from tests.app import test_grouping
+from tests.app import test_grouping, openMultiSig
 
 TEST_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -184,7 +185,7 @@ class TestDoer(doing.DoDoer):
             yield tock
 
         registry = self.rgy2.registryByName("vLEI")
-        while registry.regk not in self.rgy3.tevers:
+        while registry.regk not in self.rgy2.tevers:
             yield tock
 
         registry = self.rgy3.registryByName("vLEI")
@@ -211,7 +212,7 @@ class TestDoer(doing.DoDoer):
             yield tock
         assert self.hab2.kever.ilk == coring.Ilks.rot
 
-        while self.hab2.db.cgms.get(keys=(prefixer.qb64, seqner.qb64)) is None:
+        while self.hab3.db.cgms.get(keys=(prefixer.qb64, seqner.qb64)) is None:
             yield tock
         assert self.hab3.kever.ilk == coring.Ilks.rot
 
@@ -267,3 +268,117 @@ def test_multisig_issue_agent():
         directing.runController(doers=[testDoer], expire=60.0)
 
         assert testDoer.done is True
+
+
+def test_registrar_batch():
+    """ Test batch issuance and revocation chunked in anchoring events of MaxSeals seals """
+    with habbing.openHab(name="batch", temp=True) as (hby, hab):
+        rgy = credentialing.Regery(hby=hby, name="batch", temp=True)
+        registrar = credentialing.Registrar(hby=hby, rgy=rgy, counselor=grouping.Counselor(hby=hby))
+        registrar.MaxSeals = 3
+        registry = registrar.incept(name="reg", pre=hab.pre, conf=dict(noBackers=True))
+        registrar.processEscrows()
+        rgy.processEscrows()
+        assert registry.regk in rgy.reger.tevers
+
+        def anchors(sn):  # seals anchored by KEL event sn
+            return [seal["i"] for seal in hab.kever.serder.ked["a"]] if hab.kever.sn == sn else None
+
+        # exactly MaxSeals anchored in one event
+        saids = [coring.Diger(ser=f"cred{i}".encode("utf-8")).qb64 for i in range(7)]
+        sn = hab.kever.sn
+        assert registrar.issueMany(regk=registry.regk, saids=saids[:3]) == [(said, 0) for said in saids[:3]]
+        assert anchors(sn + 1) == saids[:3]
+        assert len(list(rgy.reger.tpwe.getItemIter())) == 3
+
+        # MaxSeals + 1 anchored in two events
+        sn = hab.kever.sn
+        registrar.issueMany(regk=registry.regk, saids=saids[3:])
+        assert anchors(sn + 2) == saids[6:]
+        ixn = hby.db.getEvt(dbing.dgKey(hab.pre, hby.db.getKeLast(dbing.snKey(hab.pre, sn + 1))))
+        assert [seal["i"] for seal in coring.Serder(raw=bytes(ixn)).ked["a"]] == saids[3:6]
+
+        registrar.processEscrows()
+        rgy.processEscrows()
+        assert not list(rgy.reger.tpwe.getItemIter())
+        for said in saids:
+            assert registry.tever.vcState(vci=said).ked["et"] == coring.Ilks.iss
+
+        sn = hab.kever.sn
+        assert registrar.revokeMany(regk=registry.regk, saids=saids[:4]) == [(said, 1) for said in saids[:4]]
+        assert anchors(sn + 2) == saids[3:4]
+        registrar.processEscrows()
+        rgy.processEscrows()
+        for said in saids:
+            et = coring.Ilks.rev if said in saids[:4] else coring.Ilks.iss
+            assert registry.tever.vcState(vci=said).ked["et"] == et
+
+        with pytest.raises(kering.ValidationError):  # already revoked
+            registrar.revokeMany(regk=registry.regk, saids=saids[3:5])
+
+
+def test_registrar_batch_multisig():
+    """ Test batch issuance by multisig group anchoring seals in one group event """
+    with openMultiSig(prefix="batch") as ((hby1, ghab1), (hby2, ghab2), (hby3, ghab3)):
+        rgy = credentialing.Regery(hby=hby1, name="batch", temp=True)
+        counselor = grouping.Counselor(hby=hby1)
+        registrar = credentialing.Registrar(hby=hby1, rgy=rgy, counselor=counselor)
+        registrar.MaxSeals = 3
+        kvy = eventing.Kevery(db=hby1.db, lax=True, local=False)
+
+        def complete(seals):  # other members sign same group event
+            for ghab in (ghab2, ghab3):
+                parsing.Parser().parse(ims=bytearray(ghab.interact(data=seals)), kvy=kvy)
+            kvy.processEscrows()
+            for hby in (hby2, hby3):  # fully signed group event to other members
+                parsing.Parser().parse(ims=bytearray(ghab1.makeOwnEvent(sn=ghab1.kever.sn)),
+                                       kvy=eventing.Kevery(db=hby.db, lax=True, local=False))
+            counselor.processEscrows()
+            registrar.processEscrows()
+            rgy.processEscrows()
+
+        registry = registrar.incept(name="reg", pre=ghab1.pre, conf=dict(noBackers=True))
+        complete([dict(i=registry.regk, s="0", d=registry.regd)])
+        assert registry.regk in rgy.reger.tevers
+
+        # more than one group event of seals at once is refused before any TEL event
+        saids = [coring.Diger(ser=f"cred{i}".encode("utf-8")).qb64 for i in range(4)]
+        sn = ghab1.kever.sn
+        with pytest.raises(kering.ValidationError):
+            registrar.issueMany(regk=registry.regk, saids=saids)
+        assert ghab1.kever.sn == sn
+        assert not list(rgy.reger.tmse.getItemIter())
+
+        # exactly MaxSeals waits for group signatures in one event
+        assert registrar.issueMany(regk=registry.regk, saids=saids[:3]) == [(said, 0) for said in saids[:3]]
+        assert ghab1.kever.sn == sn  # not yet signed by group
+        assert len(list(rgy.reger.tmse.getItemIter())) == 3
+        assert [seqner.sn for seqner, _ in hby1.db.gpse.get(keys=(ghab1.pre,))] == [sn + 1]
+
+        evt = grouping.getEscrowedEvent(db=hby1.db, pre=ghab1.pre, sn=sn + 1)
+        seals = coring.Serder(raw=evt).ked["a"]
+        assert [seal["i"] for seal in seals] == saids[:3]
+        complete(seals)
+        assert ghab1.kever.sn == sn + 1
+        assert [seal["i"] for seal in ghab1.kever.serder.ked["a"]] == saids[:3]
+        assert not list(rgy.reger.tmse.getItemIter())
+        for said in saids[:3]:
+            assert registry.tever.vcState(vci=said).ked["et"] == coring.Ilks.iss
+
+        # one batch over two registries of the group would need two group events at once
+        other = registrar.incept(name="other", pre=ghab1.pre, conf=dict(noBackers=True))
+        complete([dict(i=other.regk, s="0", d=other.regd)])
+        assert other.regk in rgy.reger.tevers
+
+        verifier = verifying.Verifier(hby=hby1, reger=rgy.reger)
+        credentialer = credentialing.Credentialer(hby=hby1, rgy=rgy, registrar=registrar, verifier=verifier)
+        creders = [proving.credential(issuer=ghab1.pre, schema=saids[0], data=dict(n=i), status=regk)
+                   for i, regk in enumerate((registry.regk, other.regk))]
+        sn = ghab1.kever.sn
+        with pytest.raises(kering.ValidationError):
+            credentialer.issueMany(creders=creders)
+        assert ghab1.kever.sn == sn
+        assert not list(hby1.db.gpse.getItemIter())
+        assert not list(rgy.reger.tmse.getItemIter())
+        for creder in creders:
+            assert rgy.regs[creder.status].tever.vcState(vci=creder.said) is None
@@ -0,0 +1,109 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.app.exporting module
+
+"""
+import os
+
+from hio.base import doing
+
+from keri.app import exporting, habbing
+from keri.core import eventing
+
+
+def test_export_import(tmp_path):
+    """ Test streaming export and resumable import of KELs """
+    with habbing.openHby(name="deb", base="test") as debHby, \
+            habbing.openHby(name="cam", base="test") as camHby:
+        debHab = debHby.makeHab(name="deb", isith="1", icount=1)
+        bevHab = debHby.makeHab(name="bev", isith="1", icount=1)
+        for i in range(3):
+            debHab.interact()
+            bevHab.rotate()
+
+        path = str(tmp_path / "kels.cesr")
+        exporter = exporting.Exporter(db=debHby.db, path=path, chunk=3)
+        ckps = list(exporter.exportIter())
+        assert [ckp.count for ckp in ckps] == [3, 6, 9]  # includes signator hab
+        assert ckps[-1].offset == ckps[-1].pos == os.path.getsize(path)
+        assert exporting.readCheckpoints(path) == ckps
+
+        # stream matches in memory replay
+        with open(path, "rb") as f:
+            assert f.read() == debHab.replayAll()
+
+        # resume after crash mid chunk and mid index line
+        with open(path, "ab") as f:
+            f.write(b"partial chunk")
+        with open(path + exporting.IdxExt, "w") as f:
+            f.write('{"kind": "kel", "pre": "%s", "fn": %d, "count": 3, "offset": %d, "pos": %d}\n{"kind": "k'
+                    % (ckps[0].pre, ckps[0].fn, ckps[0].offset, ckps[0].pos))
+        resumed = list(exporter.exportIter(resume=True))
+        assert resumed == ckps[1:]
+        assert exporting.readCheckpoints(path) == ckps
+        with open(path, "rb") as f:
+            assert f.read() == debHab.replayAll()
+
+        kvy = eventing.Kevery(db=camHby.db, lax=False, local=False)
+        importer = exporting.Importer(path=path, kvy=kvy)
+        assert importer.checkpoint is None
+
+        # interrupted import after first chunk
+        loader = importer.loadIter()
+        assert next(loader) == ckps[0]
+        loader.close()
+        assert importer.checkpoint == ckps[0]
+        assert ckps[0].pre in camHby.db.kevers
+        assert not (debHab.pre in camHby.db.kevers and bevHab.pre in camHby.db.kevers)
+
+        assert list(importer.loadIter()) == ckps[1:]
+        assert importer.checkpoint == ckps[-1]
+        assert camHby.db.kevers[debHab.pre].sn == 3
+        assert camHby.db.kevers[bevHab.pre].sn == 3
+
+        # nothing left to do
+        assert list(importer.loadIter()) == []
+
+        # compressed stream imports the same
+        zpath = str(tmp_path / "kels.cesr.gz")
+        zckps = list(exporting.Exporter(db=debHby.db, path=zpath, chunk=3, compress=True).exportIter())
+        assert [(ckp.count, ckp.offset) for ckp in zckps] == [(ckp.count, ckp.offset) for ckp in ckps]
+        assert zckps[-1].pos == os.path.getsize(zpath)
+
+    with habbing.openHby(name="eve", base="test") as eveHby:
+        kvy = eventing.Kevery(db=eveHby.db, lax=False, local=False)
+        assert exporting.Importer(path=zpath, kvy=kvy).load() == zckps[-1]
+        assert eveHby.db.kevers[debHab.pre].sn == 3
+        assert eveHby.db.kevers[bevHab.pre].sn == 3
+
+
+def test_export_import_doers(tmp_path):
+    """ Test export and import doers close their resources once done """
+
+    class Closer:
+        def __init__(self):
+            self.closed = False
+
+        def close(self):
+            self.closed = True
+
+    with habbing.openHby(name="deb", base="test") as debHby, \
+            habbing.openHby(name="cam", base="test") as camHby:
+        debHab = debHby.makeHab(name="deb", isith="1", icount=1)
+        debHab.interact()
+
+        path = str(tmp_path / "kels.cesr")
+        closer = Closer()
+        doer = exporting.ExportDoer(exporter=exporting.Exporter(db=debHby.db, path=path, chunk=1),
+                                    closers=[closer])
+        doing.Doist(tock=0.03125, limit=1.0).do(doers=[doer])
+        assert doer.done is True
+        assert closer.closed
+
+        closer = Closer()
+        kvy = eventing.Kevery(db=camHby.db, lax=False, local=False)
+        doer = exporting.ImportDoer(importer=exporting.Importer(path=path, kvy=kvy), closers=[closer])
+        doing.Doist(tock=0.03125, limit=1.0).do(doers=[doer])
+        assert doer.done is True
+        assert closer.closed
+        assert camHby.db.kevers[debHab.pre].sn == 1
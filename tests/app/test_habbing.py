@@ -583,6 +583,73 @@ def test_habery_reinitialization():
     """End Test"""
 
 
+def test_habery_lazy_load():
+    """Test Habs and Registries are only built on first access after reopen
+    """
+    from keri.help import metering
+    from keri.vdr import credentialing
+
+    name = "lazy-test"
+    with habbing.openHby(name=name, base="test", temp=False, clear=True) as hby:
+        pres = [hby.makeHab(name=f"lazy{i}", icount=1).pre for i in range(3)]
+        rgy = credentialing.Regery(hby=hby, name=name, base="test", temp=False)
+        issuer = rgy.makeRegistry(name="reg", prefix=pres[1])
+        regk = issuer.regk
+        rgy.close()
+
+    metrics = metering.Metrics()
+    old = metering.install(metrics)
+    try:
+        with habbing.openHby(name=name, base="test", temp=False) as hby:
+            assert metrics.get("habery_setup_total", result="ok") == 1
+            assert hby.habs.loaded == {}
+            assert not any(dict.__contains__(hby.kevers, pre) for pre in pres)
+            assert all(pre in hby.prefixes for pre in pres)
+
+            assert len(hby.habs) == 3
+            assert list(hby.habs) == list(hby.habs.names)
+            assert set(hby.habs.names) == set(pres)
+            assert pres[0] in hby.habs
+            assert "unknown" not in hby.habs
+            assert hby.habs.loaded == {}
+
+            hab = hby.habByName("lazy0")
+            assert hab.pre == pres[0]
+            assert list(hby.habs.loaded) == [pres[0]]
+            assert hby.habs[pres[0]] is hab
+            assert hby.habByName("lazy0") is hab
+            assert metrics.get("habery_hab_load_total", kind="single") == 1
+            with pytest.raises(KeyError):
+                _ = hby.habs["unknown"]
+
+            rgy = credentialing.Regery(hby=hby, name=name, base="test", temp=False)
+            assert regk in rgy.regs
+            assert regk in rgy.reger.registries
+            assert rgy.regs.loaded == {}
+            assert list(hby.habs.loaded) == [pres[0]]  # issuer Hab not built yet
+
+            reg = rgy.registryByName("reg")
+            assert reg.regk == regk
+            assert reg.hab is hby.habs.loaded[pres[1]]
+            assert rgy.regs[regk] is reg
+            assert metrics.get("regery_registry_load_total") == 1
+
+            assert [hab.name for hab in hby.habs.values()] == [hby.habs.names[pre] for pre in hby.habs]
+            assert len(hby.habs.loaded) == 3
+
+            hby.loadHabs()  # drops built Habs such as after rename
+            assert hby.habs.loaded == {}
+            assert hby.habByName("lazy0") is not hab
+            rgy.reger.close(clear=True)
+
+    finally:
+        metering.install(old)
+        hby.close(clear=True)
+        hby.cf.close(clear=True)
+
+    """End Test"""
+
+
 def test_habery_signatory():
     with habbing.openHby() as hby:
         signer = hby.signator
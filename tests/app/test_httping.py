@@ -6,10 +6,12 @@ tests.peer.httping module
 
 import falcon
 import pytest
+from falcon import testing
 from falcon.testing import helpers
 
 from keri.app import habbing, httping
 from keri.core import coring
+from keri.help import metering
 from keri.vdr import credentialing, verifying
 
 
@@ -196,3 +198,71 @@ def test_stream_cesr_request(mockHelpingNowUTC):
 
 if __name__ == '__main__':
     test_parse_cesr_request()
+
+
+def test_metering_component():
+    metrics = metering.Metrics()
+
+    class Resource:
+        def on_get(self, req, rep, name):
+            rep.text = f"hello {name}"
+
+        def on_post(self, req, rep, name):
+            raise falcon.HTTPBadRequest(description="bad")
+
+    app = falcon.App(middleware=[httping.MeteringComponent(metrics=metrics, profiling=True)])
+    app.add_route("/hello/{name}", Resource())
+    httping.loadMetricsEnds(app, metrics=metrics)
+    client = testing.TestClient(app)
+
+    assert client.simulate_get("/hello/bob").text == "hello bob"
+    client.simulate_get("/hello/alice")
+    client.simulate_post("/hello/bob", body=b"12345")
+    client.simulate_get("/missing")
+
+    assert metrics.get("http_requests_total", method="GET", route="/hello/{name}", status="200") == 2
+    assert metrics.get("http_requests_total", method="POST", route="/hello/{name}", status="400") == 1
+    assert metrics.get("http_requests_total", method="GET", route="unmatched", status="404") == 1
+    assert metrics.get("http_request_duration_seconds", method="GET", route="/hello/{name}").count == 2
+    assert metrics.get("http_request_size_bytes", method="POST", route="/hello/{name}").sum == 5
+    assert metrics.get("http_response_size_bytes", method="GET", route="/hello/{name}").sum == 20
+    assert metrics.get("http_requests_in_flight") == 0
+    assert len(metrics.profiles) == 0
+
+    result = client.simulate_get("/hello/carol", headers={httping.MeteringComponent.ProfileHeader: "1"})
+    assert result.text == "hello carol"
+    assert len(metrics.profiles) == 1
+    assert metrics.profiles[0]["route"] == "/hello/{name}"
+    assert "function calls" in metrics.profiles[0]["profile"]
+
+    result = client.simulate_get("/metrics")
+    assert result.headers["content-type"] == httping.PROMETHEUS_CONTENT_TYPE
+    assert ('keri_http_requests_total{method="GET",route="/hello/{name}",status="200"} 3'
+            in result.text)
+    assert "# TYPE keri_http_request_duration_seconds histogram" in result.text
+
+    result = client.simulate_get("/metrics/profiles")
+    assert result.json[0]["path"] == "/hello/carol"
+
+    # profile header ignored unless profiling
+    metrics = metering.Metrics()
+    app = falcon.App(middleware=[httping.MeteringComponent(metrics=metrics)])
+    app.add_route("/hello/{name}", Resource())
+    client = testing.TestClient(app)
+    client.simulate_get("/hello/carol", headers={httping.MeteringComponent.ProfileHeader: "1"})
+    assert len(metrics.profiles) == 0
+
+    class Reject:  # stands in for signature validation of unauthenticated request
+        def process_request(self, req, resp):
+            resp.complete = True
+            resp.status = falcon.HTTP_401
+
+    # profile header ignored when later middleware rejects request
+    metrics = metering.Metrics()
+    app = falcon.App(middleware=[httping.MeteringComponent(metrics=metrics, profiling=True), Reject()])
+    app.add_route("/hello/{name}", Resource())
+    client = testing.TestClient(app)
+    result = client.simulate_get("/hello/carol", headers={httping.MeteringComponent.ProfileHeader: "1"})
+    assert result.status == falcon.HTTP_401
+    assert len(metrics.profiles) == 0
+    assert metrics.get("http_requests_total", method="GET", route="unmatched", status="401") == 1
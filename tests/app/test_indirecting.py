@@ -6,10 +6,13 @@ tests.app.indirecting module
 import json
 
 import pytest
+from hio.base import doing
 from hio.help import decking
 
 from keri.app import indirecting, storing, habbing
-from keri.core import coring
+from keri.db import basing
+from keri.core import coring, eventing, parsing
+from keri.help import helping
 
 
 def test_mailbox_iter():
@@ -97,6 +100,41 @@ def test_mailbox_multiple_iter():
         next(mbi)
 
 
+def test_mailbox_director_backlog():
+    with habbing.openHby(name="backlog", temp=True) as hby:
+        mbd = indirecting.MailboxDirector(hby=hby, topics=["/receipt"], backlog=4)
+        pollers = [Holder(), Holder(), Holder()]
+        mbd.pollers.extend(pollers)
+        for i, poller in enumerate(pollers):
+            poller.msgs.extend(bytearray(f"{i}{j}".encode("utf-8")) for j in range(4))
+
+        # backlog is checked before taking a message from a poller
+        for msg in mbd.processPollIter():
+            mbd.ims.extend(msg)
+        assert mbd.ims == bytearray(b"0001")
+        assert len(pollers[0].msgs) == 2
+
+        # while the parser is behind nothing more is taken
+        assert list(mbd.processPollIter()) == []
+
+        # each pass starts at the next poller so later pollers are not starved
+        mbd.ims.clear()
+        for msg in mbd.processPollIter():
+            mbd.ims.extend(msg)
+        assert mbd.ims == bytearray(b"2021")
+
+        mbd.ims.clear()
+        for msg in mbd.processPollIter():
+            mbd.ims.extend(msg)
+        assert mbd.ims == bytearray(b"0203")
+
+
+class Holder:
+    """ Test poller holding messages """
+    def __init__(self):
+        self.msgs = decking.Deck()
+
+
 def test_qrymailbox_iter():
     with habbing.openHab(name="test", transferable=True, temp=True) as (hby, hab):
         assert hab.pre == 'EIaGMMWJFPmtXznY1IIiKDIrg-vIyge6mBl2QV8dDjI3'
@@ -152,3 +190,185 @@ def test_qrymailbox_iter():
 if __name__ == "__main__":
     test_mailbox_iter()
     test_qrymailbox_iter()
+
+
+def test_poller(monkeypatch):
+    class Connector:
+        cutoff = False
+
+    class Client:
+        def __init__(self):
+            self.requests = decking.Deck()
+            self.responses = decking.Deck()
+            self.events = decking.Deck()
+            self.connector = Connector()
+            self.sent = []
+
+        def request(self, **kwa):
+            self.sent.append(kwa)  # sent right away
+
+    clients = []
+
+    def httpClient(hab, wit):
+        clients.append(Client())
+        return clients[-1], doing.Doer()
+
+    monkeypatch.setattr(indirecting.agenting, "httpClient", httpClient)
+
+    with habbing.openHab(name="test", transferable=True, temp=True) as (hby, hab):
+        wit = "BGKVzj4ve0VSd8z_AmvhLg4lqcC_9WYX90k03q-R_Ydo"
+        poller = indirecting.Poller(hab=hab, witness=wit, topics=["/receipt", "/multisig"],
+                                    batch=3, flush=10.0, limit=3, lifetime=0)
+        doist = doing.Doist(tock=0.25, real=False, doers=[poller])
+        doist.enter()
+        doist.recur()
+        doist.recur()
+        assert len(clients) == 1
+        client = clients[0]
+        assert len(client.sent) == 1  # one mbx query
+
+        for i in range(5):
+            client.events.append(dict(id=f"{i}", name="/receipt", data=f"msg{i}"))
+        doist.recur()
+        assert list(poller.msgs) == [b"msg0", b"msg1", b"msg2"]  # paused at limit
+        assert len(client.events) == 2
+        assert hby.db.tops.get((hab.pre, wit)).topics == {"/receipt": 2}  # batch committed
+
+        poller.msgs.clear()
+        for _ in range(3):
+            doist.recur()
+        assert list(poller.msgs) == [b"msg3", b"msg4"]
+        assert poller.dirty == 2  # second batch not yet committed
+        assert len(clients) == 1  # stream kept open
+
+        client.connector.cutoff = True  # witness closed stream
+        for _ in range(12):
+            doist.recur()
+        assert hby.db.tops.get((hab.pre, wit)).topics == {"/receipt": 4}
+        assert len(clients) == 2  # one reconnect resumes after last indices
+        (sent, ) = clients[1].sent
+        assert b'"topics":{"/receipt":5,"/multisig":0}' in sent["body"]
+        doist.exit()
+
+
+def test_multiplexed_mailbox(monkeypatch):
+    one = "EA3mbE6upuYnFlx68GmLYCQd7cCcwG_AtHM6dW_GT068"
+    two = "EBDp7aQLp4UjWvD0eKkBzYSHDd9W6tlgbmc6qRntQbWs"
+    mbx = storing.Mailboxer(temp=True)
+    mb = indirecting.MailboxIterable(mbx=mbx, pre=one, topics={"/receipt": 0}, retry=1000,
+                                     pres={one: {"/receipt": 0}, two: {"/receipt": 1}})
+    mbi = iter(mb)
+    assert next(mbi) == b'retry: 1000\n\n'
+    mbx.storeMsg(topic=f"{one}/receipt", msg=b'{"v": 1}')
+    mbx.storeMsg(topic=f"{two}/receipt", msg=b'{"v": 2}')
+    mbx.storeMsg(topic=f"{two}/receipt", msg=b'{"v": 3}')
+    assert next(mbi) == (f'id: 0\nevent: {one}/receipt\nretry: 1000\ndata: {{"v": 1}}\n\n'
+                         f'id: 1\nevent: {two}/receipt\nretry: 1000\ndata: {{"v": 3}}\n\n').encode("utf-8")
+    assert mb.pres == {one: {"/receipt": 1}, two: {"/receipt": 2}}
+    mbx.close(clear=True)
+
+    class Connector:
+        cutoff = False
+
+    class Client:
+        def __init__(self):
+            self.requests = decking.Deck()
+            self.responses = decking.Deck()
+            self.events = decking.Deck()
+            self.connector = Connector()
+            self.sent = []
+
+        def request(self, **kwa):
+            self.sent.append(kwa)
+
+    clients = []
+
+    def httpClient(hab, wit):
+        clients.append(Client())
+        return clients[-1], doing.Doer()
+
+    monkeypatch.setattr(indirecting.agenting, "httpClient", httpClient)
+
+    with habbing.openHby(name="test", temp=True) as hby:
+        first = hby.makeHab(name="first")
+        second = hby.makeHab(name="second")
+        third = hby.makeHab(name="third")
+        wit = "BGKVzj4ve0VSd8z_AmvhLg4lqcC_9WYX90k03q-R_Ydo"
+        hby.db.tops.pin((second.pre, wit), basing.TopicsRecord(topics={"/receipt": 4}))
+
+        poller = indirecting.MultiPoller(hab=first, witness=wit, topics=["/receipt"], batch=1)
+        poller.add(second)
+        doist = doing.Doist(tock=0.25, real=False, doers=[poller])
+        doist.enter()
+        doist.recur()
+        doist.recur()
+        (sent, ) = clients[0].sent
+        ked = json.loads(sent["body"])
+        assert ked["q"]["i"] == first.pre
+        assert ked["q"]["pres"] == {first.pre: {"/receipt": 0}, second.pre: {"/receipt": 5}}
+
+        clients[0].events.append(dict(id="5", name=f"{second.pre}/receipt", data="msg5"))
+        clients[0].events.append(dict(id="0", name="/receipt", data="msg0"))  # untagged
+        doist.recur()
+        assert list(poller.msgs) == [b"msg5", b"msg0"]
+        assert hby.db.tops.get((second.pre, wit)).topics == {"/receipt": 5}
+        assert hby.db.tops.get((first.pre, wit)).topics == {"/receipt": 0}
+        assert "/receipt" in poller.times
+
+        poller.add(third)  # requery with new identifier on same stream count
+        for _ in range(8):
+            doist.recur()
+        assert len(clients) == 2
+        (sent, ) = clients[1].sent
+        assert json.loads(sent["body"])["q"]["pres"] == {first.pre: {"/receipt": 1},
+                                                         second.pre: {"/receipt": 6},
+                                                         third.pre: {"/receipt": 0}}
+        doist.exit()
+
+
+def test_multiplexed_mailbox_consent():
+    with habbing.openHby(name="wit", salt=coring.Salter(raw=b'abcdef0123456789').qb64) as whby, \
+            habbing.openHby(name="ctl") as hby, \
+            habbing.openHby(name="eve", salt=coring.Salter(raw=b'0123456789fedcba').qb64) as ehby:
+        wit = whby.makeHab(name="wit", transferable=False)
+        first = hby.makeHab(name="first")
+        second = hby.makeHab(name="second")
+        eve = ehby.makeHab(name="eve")
+
+        kvy = eventing.Kevery(db=whby.db, lax=False, local=False)
+        psr = parsing.Parser(kvy=kvy)
+        for hab in (first, second, eve):
+            psr.parse(ims=bytearray(hab.makeOwnEvent(sn=0)))
+        kvy.cues.clear()
+
+        def stream(msg):
+            psr.parse(ims=bytearray(msg))
+            (cue, ) = [cue for cue in kvy.cues if cue["kin"] == "stream"]
+            kvy.cues.clear()
+            return cue
+
+        # mailbox of other identifier is not streamed without its consent
+        q = dict(pre=eve.pre, topics={"/receipt": 0},
+                 pres={eve.pre: {"/receipt": 0}, first.pre: {"/receipt": 0}})
+        cue = stream(eve.query(pre=eve.pre, src=wit.pre, route="mbx", query=q))
+        assert cue["pres"] == {eve.pre: {"/receipt": 0}}
+
+        # nor with consent signed by the signer of the query instead
+        stamp = helping.nowIso8601()
+        ser = eventing.mailboxConsent(signer=eve.pre, src=wit.pre, stamp=stamp)
+        q["sigs"] = {first.pre: [siger.qb64 for siger in eve.sign(ser)]}
+        cue = stream(eve.query(pre=eve.pre, src=wit.pre, route="mbx", query=q, stamp=stamp))
+        assert cue["pres"] == {eve.pre: {"/receipt": 0}}
+
+        # consent of one query is not valid for another signer
+        ser = eventing.mailboxConsent(signer=second.pre, src=wit.pre, stamp=stamp)
+        q["sigs"] = {first.pre: [siger.qb64 for siger in first.sign(ser)]}
+        cue = stream(eve.query(pre=eve.pre, src=wit.pre, route="mbx", query=q, stamp=stamp))
+        assert cue["pres"] == {eve.pre: {"/receipt": 0}}
+
+        # multiplexed query carries consent of every added identifier
+        poller = indirecting.MultiPoller(hab=first, witness=wit.pre, topics=["/receipt"])
+        poller.add(second)
+        poller.load()
+        cue = stream(poller.query())
+        assert cue["pres"] == {first.pre: {"/receipt": 0}, second.pre: {"/receipt": 0}}
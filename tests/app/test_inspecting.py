@@ -0,0 +1,113 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.app.inspecting module
+
+"""
+import json
+
+import falcon
+import pytest
+from falcon import testing
+
+from keri.app import habbing, inspecting, kiwiing
+from keri.db import dbing
+
+
+def test_cursor():
+    """ Test pagination cursor round trip """
+    cursor = inspecting.encodeCursor("out-of-order-events", b"EABC.00000000000000000000000000000001", 3)
+    assert inspecting.decodeCursor(cursor) == ("out-of-order-events",
+                                               b"EABC.00000000000000000000000000000001", 3)
+    assert inspecting.decodeCursor(inspecting.encodeCursor("ldes", b"")) == ("ldes", b"", 0)
+
+    with pytest.raises(ValueError):
+        inspecting.decodeCursor("not a cursor")
+
+
+def test_inspector():
+    """ Test Inspector seeks, pages, summaries and streams escrows """
+    with habbing.openHby(name="test", temp=True) as hby:
+        hab = hby.makeHab(name="alpha")
+        bob = hby.makeHab(name="bob")
+        for _ in range(4):
+            hab.interact()
+        bob.interact()
+
+        # escrow copies of accepted events as if they were pending
+        for sn in range(1, 5):
+            dig = hab.db.getKeLast(dbing.snKey(hab.pre, sn))
+            hby.db.addPwe(dbing.snKey(hab.pre, sn), bytes(dig))
+        hby.db.addPwe(dbing.snKey(bob.pre, 1), bytes(hby.db.getKeLast(dbing.snKey(bob.pre, 1))))
+        hby.db.addOoe(dbing.snKey(bob.pre, 0), bytes(hby.db.getKeLast(dbing.snKey(bob.pre, 0))))
+        hby.db.addLde(dbing.snKey(hab.pre, 9), b"EMissingEventDigest")
+
+        inspector = inspecting.Inspector(db=hby.db, chunk=2)
+        assert inspector.summary() == {"out-of-order-events": 1,
+                                       "partially-witnessed-events": 5,
+                                       "partially-signed-events": 0,
+                                       "likely-duplicitous-events": 1}
+        assert inspector.summary(pre=hab.pre) == {"out-of-order-events": 0,
+                                                  "partially-witnessed-events": 4,
+                                                  "partially-signed-events": 0,
+                                                  "likely-duplicitous-events": 1}
+        assert inspector.summary(escrow="partially-witnessed-events", pre=bob.pre) == {
+            "partially-witnessed-events": 1}
+
+        out = json.loads(b"".join(inspector.stream(summary=True)))
+        assert out == inspector.summary()
+
+        # prefix seek only returns events of pre
+        out = json.loads(b"".join(inspector.stream(pre=hab.pre)))
+        assert "next" not in out
+        assert [evt["ked"]["s"] for evt in out["partially-witnessed-events"]] == ["1", "2", "3", "4"]
+        assert all(evt["ked"]["i"] == hab.pre for evt in out["partially-witnessed-events"])
+        assert out["out-of-order-events"] == []
+        assert out["likely-duplicitous-events"] == [dict(said="EMissingEventDigest",
+                                                         error="Missing event for dig=b'EMissingEventDigest'.")]
+
+        # page through all escrows three at a time
+        events = []
+        cursor = None
+        pages = 0
+        while True:
+            out = json.loads(b"".join(inspector.stream(cursor=cursor, limit=3)))
+            pages += 1
+            cursor = out.pop("next")
+            for name, evts in out.items():
+                events.extend((name, evt.get("ked", evt)) for evt in evts)
+            if cursor is None:
+                break
+        assert pages == 3
+        full = json.loads(b"".join(inspector.stream()))
+        assert events == [(name, evt.get("ked", evt)) for name, evts in full.items() for evt in evts]
+        assert len(events) == 7
+        assert b"".join(inspector.stream(indent=2)).decode("utf-8") == json.dumps(full, indent=2)
+
+        with pytest.raises(ValueError):
+            inspector.stream(limit=0)
+        with pytest.raises(ValueError):
+            inspector.stream(cursor=inspecting.encodeCursor("missing-registry-escrow", b""))
+
+        # endpoint
+        app = falcon.App()
+        app.add_route("/escrows", kiwiing.EscrowEnd(db=hby.db))
+        client = testing.TestClient(app)
+
+        result = client.simulate_get(path="/escrows", params=dict(pre=hab.pre,
+                                                                  escrow="partially-witnessed-events",
+                                                                  limit="2"))
+        assert result.status == falcon.HTTP_200
+        assert len(result.json["partially-witnessed-events"]) == 2
+        result = client.simulate_get(path="/escrows", params=dict(pre=hab.pre,
+                                                                  escrow="partially-witnessed-events",
+                                                                  cursor=result.json["next"]))
+        assert [evt["ked"]["s"] for evt in result.json["partially-witnessed-events"]] == ["3", "4"]
+        assert result.json["next"] is None
+
+        result = client.simulate_get(path="/escrows", params=dict(summary="true"))
+        assert result.json == inspector.summary()
+
+        result = client.simulate_get(path="/escrows", params=dict(limit="x"))
+        assert result.status == falcon.HTTP_400
+        result = client.simulate_get(path="/escrows", params=dict(cursor="bad"))
+        assert result.status == falcon.HTTP_400
@@ -112,6 +112,31 @@ def test_credential_handlers(mockHelpingNowUTC, seeder):
 
         assert regery.reger.creds.get(creder.saidb).raw == creder.raw
 
+        body["credentials"] = {}
+        b = json.dumps(body).encode("utf-8")
+        result = client.simulate_post(path="/credentials/test", body=b)
+        assert result.status == falcon.HTTP_400
+
+        # Batch of two credentials anchored in one interaction event
+        sn = hab.kever.sn
+        body["credentials"] = [dict(credentialData=dict(LEI="1111111111abcdefg")),
+                               dict(credentialData=dict(LEI="2222222222abcdefg"))]
+        b = json.dumps(body).encode("utf-8")
+        result = client.simulate_post(path="/credentials/test", body=b)
+        assert result.status == falcon.HTTP_200
+        assert len(result.json) == 2
+        batch = [proving.Creder(ked=ked) for ked in result.json]
+        assert [bc.subject["LEI"] for bc in batch] == ["1111111111abcdefg", "2222222222abcdefg"]
+        assert hab.kever.sn == sn + 1
+        assert len(hab.kever.serder.ked["a"]) == 2
+        regery.processEscrows()
+        credentialer.processEscrows()
+        verifier.processEscrows()
+
+        for bc in batch:
+            assert regery.reger.creds.get(bc.saidb).raw == bc.raw
+        del body["credentials"]
+
         # Try to revoke a credential that doesn't exist and get the appropriate error
         result = client.simulate_delete(path="/credentials/test",
                                         query_string=("registry=test&"
@@ -131,11 +156,11 @@ def test_credential_handlers(mockHelpingNowUTC, seeder):
 
         result = client.simulate_get(path="/credentials/test", params=dict(type="issued", registry="test"))
         assert result.status == falcon.HTTP_200
-        assert len(result.json) == 1
-        sad = result.json[0]["sad"]
-        assert sad["d"] == creder.said
-        state = result.json[0]["status"]
-        assert state["et"] == coring.Ilks.rev
+        assert len(result.json) == 3
+        issued = {cred["sad"]["d"]: cred["status"]["et"] for cred in result.json}
+        assert issued[creder.said] == coring.Ilks.rev
+        for bc in batch:
+            assert issued[bc.said] == coring.Ilks.iss
 
 
 def test_multisig_incept():
@@ -961,6 +986,13 @@ def test_contact_ends(seeder):
         for aid in aids:
             assert aid in data
 
+        response = client.simulate_get("/contacts", query_string="sort=first&start=1&limit=2")
+        assert response.status == falcon.HTTP_200
+        assert [d["first"] for d in response.json] == ["Ken1", "Ken2"]
+
+        response = client.simulate_get("/contacts", query_string="start=-1")
+        assert response.status == falcon.HTTP_400
+
         data = dict(id=hab.pre, company="ProSapien")
         b = json.dumps(data).encode("utf-8")
 
@@ -1625,5 +1657,52 @@ def test_aied_ends():
         assert response.status == falcon.HTTP_400
 
 
+def test_notification_ends():
+    with habbing.openHby(name="test", temp=True) as hby:
+        notifier = notifying.Notifier(hby=hby)
+        for i in range(6):
+            assert notifier.add(attrs=dict(r="/even" if i % 2 == 0 else "/odd", a=i)) is True
+
+        app = falcon.App()
+        notes = kiwiing.NotificationEnd(notifier=notifier)
+        app.add_route("/notifications", notes)
+        app.add_route("/notifications/counts", notes, suffix="counts")
+        app.add_route("/notifications/{said}", notes, suffix="said")
+        client = testing.TestClient(app)
+
+        result = client.simulate_get(path="/notifications", params=dict(limit="2"))
+        assert result.status == falcon.HTTP_200
+        assert [note["a"]["a"] for note in result.json] == [0, 1]
+        cursor = result.json[-1]["i"]
+        result = client.simulate_get(path="/notifications", params=dict(cursor=cursor, limit="2"))
+        assert [note["a"]["a"] for note in result.json] == [2, 3]
+        result = client.simulate_get(path="/notifications", params=dict(reverse="true", route="/odd"))
+        assert [note["a"]["a"] for note in result.json] == [5, 3, 1]
+        result = client.simulate_get(path="/notifications", params=dict(limit="x"))
+        assert result.status == falcon.HTTP_400
+
+        rids = [note["i"] for note in client.simulate_get(path="/notifications").json]
+        result = client.simulate_put(path="/notifications", json=dict(rids=rids[:4]))
+        assert result.status == falcon.HTTP_202
+        assert result.json == dict(rids=rids[:4])
+        result = client.simulate_get(path="/notifications", params=dict(read="false"))
+        assert [note["a"]["a"] for note in result.json] == [4, 5]
+        result = client.simulate_get(path="/notifications/counts")
+        assert result.json == dict(total=6, unread=2)
+
+        result = client.simulate_delete(path="/notifications", json=dict(rids=rids[:3]))
+        assert result.status == falcon.HTTP_202
+        assert result.json == dict(rids=rids[:3])
+        result = client.simulate_get(path="/notifications/counts")
+        assert result.json == dict(total=3, unread=2)
+        result = client.simulate_put(path="/notifications", json=dict(said="x"))
+        assert result.status == falcon.HTTP_400
+
+        result = client.simulate_put(path=f"/notifications/{rids[4]}")
+        assert result.status == falcon.HTTP_202
+        result = client.simulate_get(path="/notifications/counts")
+        assert result.json == dict(total=3, unread=1)
+
+
 if __name__ == "__main__":
     test_multisig_incept()
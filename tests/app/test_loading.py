@@ -0,0 +1,45 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.app.loading module
+
+"""
+import time
+
+from hio.base import doing
+
+from keri.app import loading
+
+
+def test_percentile():
+    assert loading.percentile([], 50) is None
+    values = list(range(1, 101))
+    assert loading.percentile(values, 50) == 50
+    assert loading.percentile(values, 99) == 99
+    assert loading.percentile(values, 100) == 100
+    assert loading.percentile([7], 99) == 7
+
+
+def test_loader():
+    """ Test load against in process witnesses """
+    loader = loading.Loader(witnesses=2, controllers=2, events=2, messages=1, rate=50.0,
+                            port=5760, limit=30.0)
+    doist = doing.Doist(limit=40.0, tock=0.03125, real=True, doers=[loader])
+    doist.enter()
+    while not loader.done and doist.tyme < doist.limit:
+        doist.recur()
+        time.sleep(doist.tock)
+    doist.exit()
+
+    report = loader.report
+    assert report is not None
+    assert report["incomplete"] == 0
+    ops = report["ops"]
+    assert ops["icp"]["count"] == 2
+    assert ops["ixn"]["count"] == 2
+    assert ops["rot"]["count"] == 2
+    assert ops["fwd"]["count"] == 2
+    assert ops["mbx"]["count"] == 2
+    assert 0.0 < ops["icp"]["p50"] <= ops["icp"]["p99"]
+    assert report["lmdb"]["growth"] > 0
+    assert report["cpu"] > 0.0
+    assert all(hby.db.env is None for hby in loader.hbys)  # closed
@@ -7,7 +7,7 @@ import datetime
 
 import pytest
 
-from keri.app import notifying, habbing
+from keri.app import notifying, habbing, signaling
 from keri.core import coring
 from keri.db import dbing
 from keri.help import helping
@@ -219,3 +219,100 @@ def test_notifier():
 
     assert notifier.mar(note.rid) is False
     assert notifier.rem(note.rid) is True
+
+
+def test_noter_index():
+    noter = notifying.Noter(temp=True)
+    cig = coring.Cigar(qb64="AABr1EJXI1sTuI51TXo4F1JjxIJzwPeCxa-Cfbboi7F4Y4GatPEvK629M7G_5c86_Ssvwg8POZWNMV-WreVqBECw")
+    assert noter.cntNotes() == 0
+
+    notes = []
+    for i in range(10):
+        dt = datetime.datetime(2022, 7, 8, 15, 1, i)
+        route = "/multisig/icp" if i % 2 else "/multisig/rot"
+        note = notifying.notice(attrs=dict(r=route, a=i), dt=dt)
+        assert noter.add(note, cig) is True
+        notes.append(note)
+    assert noter.add(notes[0], cig) is False
+
+    assert noter.cntNotes() == 10
+    assert noter.cntNotes(read=False) == 10
+    assert noter.cntNotes(read=True) == 0
+
+    # forward and backward pages from cursor
+    page = noter.getNotePage(limit=4)
+    assert [note.attrs["a"] for note, _ in page] == [0, 1, 2, 3]
+    page = noter.getNotePage(cursor=page[-1][0].rid, limit=4)
+    assert [note.attrs["a"] for note, _ in page] == [4, 5, 6, 7]
+    page = noter.getNotePage(cursor=page[0][0].rid, limit=3, reverse=True)
+    assert [note.attrs["a"] for note, _ in page] == [3, 2, 1]
+    page = noter.getNotePage(limit=3, reverse=True)
+    assert [note.attrs["a"] for note, _ in page] == [9, 8, 7]
+    assert page[0][1].qb64 == cig.qb64
+    assert noter.getNotePage(cursor="ABC") == []
+
+    # route index
+    page = noter.getNotePage(route="/multisig/icp")
+    assert [note.attrs["a"] for note, _ in page] == [1, 3, 5, 7, 9]
+    page = noter.getNotePage(route="/multisig/icp", reverse=True, cursor=notes[5].rid, limit=1)
+    assert [note.attrs["a"] for note, _ in page] == [3]
+    assert noter.getNotePage(route="/multisig") == []
+
+    # batch update in one transaction moves read index
+    items = []
+    for note in notes[:3]:
+        note.read = True
+        items.append((note, cig))
+    assert noter.updateMany(items) == 3
+    assert noter.cntNotes(read=False) == 7
+    assert noter.cntNotes(read=True) == 3
+    page = noter.getNotePage(read=False)
+    assert [note.attrs["a"] for note, _ in page] == [3, 4, 5, 6, 7, 8, 9]
+    page = noter.getNotePage(read=True, reverse=True)
+    assert [note.attrs["a"] for note, _ in page] == [2, 1, 0]
+    page = noter.getNotePage(read=False, route="/multisig/rot")
+    assert [note.attrs["a"] for note, _ in page] == [4, 6, 8]
+
+    # batch delete
+    removed = noter.remMany([notes[0].rid, notes[5].rid, "ABC"])
+    assert [note.rid for note, _ in removed] == [notes[0].rid, notes[5].rid]
+    assert noter.cntNotes() == 8
+    assert noter.cntNotes(read=False) == 6
+    assert noter.get(notes[0].rid) is None
+    assert len(noter.getMany([note.rid for note in notes])) == 8
+    assert [note.attrs["a"] for note, _ in noter.getNotePage(route="/multisig/icp")] == [1, 3, 7, 9]
+
+    # indices rebuilt from notes
+    noter.ncnt.trim()
+    noter.nrdx.trim()
+    noter.reindex()
+    assert noter.cntNotes() == 8
+    assert noter.cntNotes(read=False) == 6
+    assert [note.attrs["a"] for note, _ in noter.getNotePage(read=True)] == [1, 2]
+
+    noter.close(clear=True)
+
+
+def test_notifier_batch():
+    with habbing.openHby(name="test", temp=True) as hby:
+        signaler = signaling.Signaler()
+        notifier = notifying.Notifier(hby=hby, signaler=signaler)
+        for i in range(5):
+            assert notifier.add(attrs=dict(r="/test", a=i)) is True
+        signaler.signals.clear()
+
+        notes = notifier.getNotePage()
+        rids = [note.rid for note in notes]
+        assert notifier.marMany(rids[:3] + ["ABC"]) == rids[:3]
+        assert notifier.marMany(rids[:3]) == []  # already read
+        assert len(signaler.signals) == 1
+        assert signaler.signals[0].attrs["rids"] == rids[:3]
+        assert notifier.noter.cntNotes(read=False) == 2
+        assert [note.rid for note in notifier.getNotePage(read=False)] == rids[3:]
+
+        assert notifier.remMany(rids[1:4]) == rids[1:4]
+        assert len(signaler.signals) == 1  # replaces pending signal with same ckey
+        assert signaler.signals[0].attrs["action"] == "rem"
+        assert signaler.signals[0].attrs["rids"] == rids[1:4]
+        assert [note.rid for note in notifier.getNotePage()] == [rids[0], rids[4]]
+        assert notifier.noter.cntNotes() == 2
@@ -3,6 +3,7 @@
 tests.app.test_multisig module
 
 """
+import collections
 import json
 
 import falcon
@@ -176,6 +177,138 @@ def test_oobiery():
     """Done Test"""
 
 
+def test_oobiery_pipeline():
+    with habbing.openHby(name="oobi") as hby, habbing.openHby(name="server") as shby:
+        hab = shby.makeHab(name="server")
+        msgs = bytearray()
+        msgs.extend(hab.makeEndRole(eid=hab.pre,
+                                    role=kering.Roles.controller,
+                                    stamp=help.nowIso8601()))
+
+        msgs.extend(hab.makeLocScheme(url='http://127.0.0.1:5645',
+                                      scheme=kering.Schemes.http,
+                                      stamp=help.nowIso8601()))
+        hab.psr.parse(ims=msgs)
+
+        oobiery = keri.app.oobiing.Oobiery(hby=hby)
+        oobiery.MaxHostInflight = 1
+
+        curl = f'http://127.0.0.1:5645/oobi/{hab.pre}/controller'
+        urls = [curl, f'{curl}?name=first', f'{curl}?name=second']
+        for url in urls:
+            hby.db.oobis.pin(keys=(url,), val=basing.OobiRecord(date=helping.nowIso8601()))
+
+        recorder = Recorder()
+        app = falcon.App(middleware=[recorder])
+        ending.loadEnds(app, hby=shby)
+
+        server = http.Server(port=5645, app=app)
+        httpServerDoer = http.ServerDoer(server=server)
+
+        limit = 2.0
+        tock = 0.03125
+        doers = oobiery.doers + [httpServerDoer]
+        doist = doing.Doist(limit=limit, tock=tock)
+        doist.do(doers=doers)
+
+        # one request at a time to the same host over one pooled connection
+        assert recorder.most == 1
+        assert [tag for tag, _ in recorder.requests] == [None, None, None]
+        assert {status for _, status in recorder.requests} == {falcon.HTTP_200}
+        for url in urls:
+            obr = hby.db.roobi.get(keys=(url,))
+            assert obr.state == oobiing.Result.resolved
+            assert obr.cid == hab.pre
+            assert url in oobiery.cache
+        assert not oobiery.clients
+        assert not oobiery.clienter.clients
+        assert list(oobiery.clienter.idle) == [("http", "127.0.0.1", 5645)]
+        assert len(oobiery.clienter.idle[("http", "127.0.0.1", 5645)]) == 1
+
+        # resolve again with conditional request answered from cache
+        etag = oobiery.cache[curl]["headers"]["ETag"]
+        hby.db.roobi.rem(keys=(curl,))
+        hby.db.oobis.pin(keys=(curl,), val=basing.OobiRecord(date=helping.nowIso8601()))
+        doist.do(doers=doers)
+
+        assert recorder.requests[-1] == (etag, falcon.HTTP_304)
+        obr = hby.db.roobi.get(keys=(curl,))
+        assert obr.state == oobiing.Result.resolved
+        assert obr.cid == hab.pre
+
+        doist.exit()
+
+    """Done Test"""
+
+
+def test_oobiery_inflight():
+    with habbing.openHby(name="oobi", temp=True) as hby, \
+            habbing.openHab(name="server", temp=True) as (shby, hab):
+        oobiery = keri.app.oobiing.Oobiery(hby=hby)
+
+        good = f'http://127.0.0.1:5645/oobi/{hab.pre}/controller'
+        bad = 'http://127.0.0.1:5646/oobi'
+        for url in (good, bad):
+            oobiery.clients[url] = Responder()
+            oobiery.started[url] = helping.nowUTC()
+            hby.db.coobi.pin(keys=(url,), val=basing.OobiRecord(date=helping.nowIso8601()))
+
+        # repeated request of url in flight keeps its alias on the pending record
+        hby.db.oobis.pin(keys=(good,), val=basing.OobiRecord(oobialias="server", date=helping.nowIso8601()))
+        oobiery.processOobis()
+        assert hby.db.oobis.get(keys=(good,)) is None
+        assert hby.db.coobi.get(keys=(good,)).oobialias == "server"
+
+        headers = {"Content-Type": "application/json+cesr", ending.OOBI_AID_HEADER: hab.pre}
+        oobiery.clients[good].responses.append(dict(status=200, headers=headers,
+                                                    body=bytearray(hab.replay())))
+        oobiery.clients[bad].responses.append(dict(status=200, headers=headers, body=bytearray(b"bad")))
+
+        parse = oobiery.parser.parse
+
+        def parsing(ims):
+            if ims == bytearray(b"bad"):
+                raise ValueError("bad stream")
+            parse(ims=ims)
+
+        oobiery.parser.parse = parsing
+        oobiery.processClients()
+
+        # bad OOBI fails while the good one is still resolved
+        assert hby.db.roobi.get(keys=(bad,)).state == oobiing.Result.failed
+        obr = hby.db.roobi.get(keys=(good,))
+        assert obr.state == oobiing.Result.resolved
+        assert obr.oobialias == "server"
+        assert hab.pre in hby.kevers
+        assert oobiery.org.get(hab.pre)["alias"] == "server"
+        assert not oobiery.clients
+
+    """Done Test"""
+
+
+class Responder:
+    """ Test client with canned responses """
+    def __init__(self):
+        self.responses = collections.deque()
+        self.requests = []
+
+
+class Recorder:
+    """ Test middleware recording If-None-Match and status of requests """
+    def __init__(self):
+        self.requests = []
+        self.inflight = 0
+        self.most = 0
+
+    def process_request(self, req, rep):
+        self.inflight += 1
+        self.most = max(self.most, self.inflight)
+
+    def process_response(self, req, rep, resource, req_succeeded):
+        self.inflight -= 1
+        self.requests.append((req.get_header("If-None-Match"), rep.status))
+
+
 class MOOBIEnd:
     """ Test endpoint returning a static MOOBI """
     def __init__(self, hab, url):
@@ -0,0 +1,164 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.app.scheduling module
+
+"""
+import threading
+import time
+
+from hio.base import doing
+
+from keri.app import scheduling
+from keri.db import dbing
+
+
+def test_backoff():
+    """ Test Backoff gating on database commits """
+    with dbing.openLMDB() as db:
+        assert db.txnid is not None
+        sub = db.env.open_db(key=b"test.")
+        backoff = scheduling.Backoff(dbs=[db], low=0.25, high=1.0)
+
+        assert backoff.due(0.0)  # always due first time
+        backoff.done(0.0)
+        assert backoff.delay == 0.25
+        assert not backoff.due(0.125)  # nothing changed
+        assert backoff.due(0.25)  # delay expired
+        backoff.done(0.25)
+        assert backoff.delay == 0.5
+        backoff.done(0.75)
+        assert backoff.delay == 1.0
+        backoff.done(1.75)
+        assert backoff.delay == 1.0  # capped at high
+        assert not backoff.due(2.0)
+
+        db.putVal(sub, b"a", b"1")  # commit wakes it
+        assert backoff.due(2.0)
+        db.putVal(sub, b"b", b"2")  # run that commits resets delay
+        backoff.done(2.0)
+        assert backoff.delay == 0.0
+        assert backoff.due(2.0)
+        backoff.done(2.0)
+        assert backoff.delay == 0.25
+
+        backoff.reset()
+        assert backoff.due(2.0)
+
+    assert db.txnid is None  # closed
+
+
+def test_waker():
+    """ Test Waker wait and wake across threads """
+    waker = scheduling.Waker()
+    start = time.monotonic()
+    assert not waker.wait(0.05)
+    assert time.monotonic() - start >= 0.04
+
+    waker.wake()
+    assert waker.gen == 1
+    assert waker.wait(1.0)
+    assert not waker.wait(0.0)  # drained
+
+    threading.Timer(0.05, waker.wake).start()
+    start = time.monotonic()
+    assert waker.wait(5.0)
+    assert time.monotonic() - start < 1.0
+    waker.close()
+
+
+def test_scheduler():
+    """ Test Scheduler accounting, idle backoff and wake """
+    runs = []
+
+    def counter(tymth=None, tock=0.0, **opts):
+        yield
+        while True:
+            runs.append(tymth())
+            yield
+
+    counter = doing.doify(counter)
+
+    # simulated time runs like Doist
+    scheduler = scheduling.Scheduler(tock=0.03125, real=False, limit=1.0)
+    scheduler.do(doers=[counter])
+    assert len(runs) == 32
+    acct = scheduler.accounts[counter.__qualname__]
+    assert acct.runs == 32
+    assert acct.cpu >= 0.0 and acct.wall > 0.0
+
+    # idle real time backs off
+    runs.clear()
+    scheduler = scheduling.Scheduler(tock=0.03125, real=True, limit=1.0, idle=0.25)
+    scheduler.do(doers=[counter])
+    assert 4 <= len(runs) < 16  # plain Doist runs 32 times
+    assert scheduler.pause == 0.25
+    assert runs[-1] >= 0.75  # tyme follows real time across waits
+
+    # wake ends idle wait at once
+    runs.clear()
+    waker = scheduling.Waker()
+    wakes = []
+
+    def waiter(tymth=None, tock=0.0, **opts):
+        yield
+        while waker.gen == 0:
+            yield
+        wakes.append(time.monotonic())
+        return True
+
+    scheduler = scheduling.Scheduler(tock=0.03125, real=True, limit=5.0, idle=2.0, waker=waker)
+    woke = []
+
+    def wake():
+        woke.append(time.monotonic())
+        waker.wake()
+
+    threading.Timer(0.5, wake).start()
+    scheduler.do(doers=[doing.doify(waiter)])
+    assert scheduler.done
+    assert wakes[0] - woke[0] < 0.1
+    waker.close()
+
+
+def test_scheduler_queues():
+    """ Test Scheduler stays busy on queue changes and wakes on WakeDeck appends """
+    waker = scheduling.Waker()
+
+    class Consumer(doing.Doer):
+        def __init__(self, **kwa):
+            super(Consumer, self).__init__(**kwa)
+            self.cues = scheduling.WakeDeck(waker=waker)
+            self.got = []
+
+        def recur(self, tyme):
+            while self.cues:
+                self.got.append((self.cues.popleft(), time.monotonic()))
+                if len(self.got) < 8:  # queue more work for next pass
+                    self.cues.append(len(self.got))
+            return len(self.got) >= 9
+
+    consumer = Consumer(tock=0.0)
+    consumer.cues.append(0)
+    scheduler = scheduling.Scheduler(tock=0.03125, real=True, limit=5.0, idle=2.0, waker=waker)
+    prb = scheduling.Probe([consumer])
+    prb.refresh()
+    assert prb.decks == [consumer.cues]
+    servers = prb.servers
+    prb.refresh()
+    assert prb.servers is servers  # cached while doers unchanged
+
+    appended = []
+
+    def append():
+        appended.append(time.monotonic())
+        consumer.cues.append("late")
+
+    threading.Timer(1.0, append).start()
+    scheduler.do(doers=[consumer])
+    assert scheduler.done
+    assert [cue for cue, _ in consumer.got] == [0, 1, 2, 3, 4, 5, 6, 7, "late"]
+    # queued work runs at full speed without backing off
+    assert consumer.got[7][1] - consumer.got[0][1] < 0.5
+    # append from other thread ends idle wait at once
+    assert consumer.got[8][1] - appended[0] < 0.1
+    waker.close()
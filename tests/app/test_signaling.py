@@ -4,6 +4,7 @@ tests.app.test_multisig module
 
 """
 import datetime
+import threading
 import time
 
 import falcon
@@ -164,3 +165,73 @@ def test_signal_ends():
                            '"2022-08-11T08:10:05.165089", "r": "/m", "a": {"a": 2}}\n'
                            '\n')
     assert len(signaler.signals) == 0
+
+
+def test_signals():
+    signals = signaling.Signals(timeout=10.0, resolution=1.0)
+    assert not signals
+    with pytest.raises(IndexError):
+        signals.popleft()
+
+    now = time.monotonic()
+    a = signaling.signal(attrs=dict(a=1), topic="/m")
+    b = signaling.signal(attrs=dict(a=2), topic="/m", ckey="abc")
+    c = signaling.signal(attrs=dict(a=3), topic="/m")
+    d = signaling.signal(attrs=dict(a=4), topic="/m", ckey="abc")
+    signals.append(a)
+    signals.append(b, age=5.0)
+    signals.append(c, age=2.0)
+    assert len(signals) == 3
+    signals.append(d)  # collapses onto b in place with new deadline
+    assert len(signals) == 3
+    assert [sig.attrs["a"] for sig in signals] == [1, 4, 3]
+    assert signals[1] is d
+    assert signals[-1] is c
+
+    assert signals.expire(now=now + 5.0) == 0  # replaced b deadline ignored
+    assert signals.expire(now=now + 8.5) == 1  # c
+    assert [sig.attrs["a"] for sig in signals] == [1, 4]
+    assert signals.expire(now=now + 20.0) == 2
+    assert not signals
+    assert signals.buckets == []
+
+    # popped signals leave no stale ckey or expiry
+    signals.append(a)
+    signals.append(d)
+    assert signals.popleft() is a
+    assert signals.popleft() is d
+    signals.append(b)
+    assert len(signals) == 1
+    assert signals.expire(now=now + 20.0) == 1
+
+    # many collapsed pushes keep one signal and compact wheel
+    for i in range(1000):
+        signals.append(signaling.signal(attrs=dict(a=i), topic="/m", ckey="burst"), age=-i)
+    assert len(signals) == 1
+    signals.expire(now=now + 20.0)
+    assert len(signals.buckets) < 100
+    signals.clear()
+
+    # wait blocks until pushed from another thread
+    assert signals.wait(0.01) is False
+    threading.Timer(0.05, signals.append, args=(a,)).start()
+    start = time.monotonic()
+    assert signals.wait(5.0) is True
+    assert time.monotonic() - start < 1.0
+
+
+def test_signal_stream_wait():
+    signals = signaling.Signals()
+    stream = iter(signaling.SignalIterable(signals=signals, wait=0.5))
+    assert next(stream) == b"retry: 5000\n\n"
+
+    start = time.monotonic()
+    assert next(stream) == b""  # blocked then timed out
+    assert time.monotonic() - start >= 0.4
+
+    sig = signaling.signal(attrs=dict(a=1), topic="/m")
+    threading.Timer(0.05, signals.append, args=(sig,)).start()
+    start = time.monotonic()
+    data = next(stream)
+    assert time.monotonic() - start < 0.4
+    assert data.startswith(f"id: {sig.rid}\n".encode("utf-8"))
@@ -9,6 +9,7 @@ from hio.base import doing, tyming
 from hio.core import http
 from hio.help import decking
 
+from keri import kering
 from keri.app import habbing, watching
 from keri.core import eventing, parsing, coring
 
@@ -59,3 +60,54 @@ def test_watcher_rotate_handler(seeder):
 
         habr = ctrl.db.habs.get(ctrl.name)
         assert habr.watchers == [wat.pre]
+
+
+def test_key_state_watcher(seeder):
+    with habbing.openHby(name="wit", salt=coring.Salter(raw=b'abcdef0123456789').qb64) as witHby, \
+            habbing.openHby(name="ctrl", salt=coring.Salter(raw=b'0123456789abcdef').qb64) as hby:
+        wan = witHby.makeHab(name="wan", transferable=False)
+        wil = witHby.makeHab(name="wil", transferable=False)
+        seeder.seedWitEnds(hby.db, witHabs=[wan, wil], protocols=[kering.Schemes.http])
+        hab = hby.makeHab(name="ctrl", wits=[wan.pre, wil.pre], toad=2)
+        solo = hby.makeHab(name="solo")  # no witnesses
+        kvy = eventing.Kevery(db=hby.db)
+
+        watcher = watching.KeyStateWatcher(hby=hby, kvy=kvy, timeout=5.0, witTimeout=1.0)
+        doist = doing.Doist(tock=0.03125, real=False, doers=[watcher])
+        doist.enter()
+        doist.recur()
+        assert set(watcher.witers) == {wan.pre, wil.pre}  # one pooled witnesser per witness
+        assert set(watcher.pending) == {(hab.pre, wan.pre), (hab.pre, wil.pre)}
+        assert len(watcher.witers[wan.pre].msgs) == 1  # ksn query
+        assert watcher.cues.popleft() == dict(kin="watched", pre=solo.pre, states=[], missing=[])
+
+        # wan answers, wil never does, cues of others are left in order
+        other = dict(kin="keyStateSaved", serder=solo.kever.state(), aid=wan.pre)
+        kvy.cues.append(dict(kin="receipt", serder=hab.kever.serder))
+        kvy.cues.append(dict(kin="keyStateSaved", serder=hab.kever.state(), aid=wan.pre))
+        kvy.cues.append(other)
+        doist.recur()
+        assert set(watcher.pending) == {(hab.pre, wil.pre)}
+        assert not watcher.cues
+        assert [cue["kin"] for cue in kvy.cues] == ["receipt", "keyStateSaved"]
+        assert kvy.cues[1] is other
+        kvy.cues.clear()
+
+        while not watcher.cues:
+            doist.recur()
+        assert doist.tyme >= 1.0
+        cue = watcher.cues.popleft()
+        assert cue["pre"] == hab.pre
+        assert cue["missing"] == [wil.pre]
+        (state, ) = cue["states"]
+        assert state.wit == wan.pre
+        assert state.state == watching.States.even
+        assert state.sn == 0
+        assert watcher.late == {(hab.pre, wil.pre)}
+
+        kvy.cues.append(dict(kin="keyStateSaved", serder=hab.kever.state(), aid=wil.pre))
+        doist.recur()
+        assert not kvy.cues  # late response of timed out query dropped
+        assert watcher.done
+        assert not watcher.witers
+        doist.exit()
@@ -5816,6 +5816,40 @@ def test_tholder():
     assert not tholder.satisfy(indices=[5, 6])
     assert not tholder.satisfy(indices=[2, 3, 4])
     assert not tholder.satisfy(indices=[])
+    assert not tholder.satisfy(indices=[0, 1, 5, 7])  # index beyond key list
+
+    # precomputed scaled weights and clause bitmasks
+    assert tholder._lcd == 4
+    assert tholder._clauses == ((0b0011111, ((0b1, 2), (0b10, 2), (0b100, 1),
+                                             (0b1000, 1), (0b10000, 1))),
+                                (0b1100000, ((0b100000, 4), (0b1000000, 4))))
+
+    # zero weights are dropped from scaled pairs but still count in size
+    tholder = Tholder(sith=["1/3", "1/3", "1/3", "0"])
+    assert tholder.size == 4
+    assert tholder._lcd == 3
+    assert tholder._clauses == ((0b1111, ((0b1, 1), (0b10, 1), (0b100, 1))),)
+    assert tholder.satisfy(indices=[0, 1, 2])
+    assert not tholder.satisfy(indices=[0, 1, 3])
+
+    # identical sith expressions share cached precomputation
+    sith = ["1/20"] * 20
+    tholder = Tholder(sith=sith)
+    hits = Tholder._weighting.cache_info().hits
+    other = Tholder(sith=json.dumps(sith))
+    assert Tholder._weighting.cache_info().hits == hits + 1
+    assert other._clauses is tholder._clauses
+    assert other.thold == tholder.thold
+    assert other.thold is not tholder.thold  # thold not shared so safe to mutate
+    assert tholder.size == 20
+    assert tholder.satisfy(indices=list(range(20)))
+    assert not tholder.satisfy(indices=list(range(19)))
+    assert tholder.satisfy(indices=list(range(19)) + [19, 19])
+
+    # limen of same threshold also shares precomputation
+    limened = Tholder(limen=tholder.limen)
+    assert limened._clauses is tholder._clauses
+    assert limened.sith == tholder.sith
 
 
 
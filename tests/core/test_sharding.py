@@ -0,0 +1,109 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.core.sharding module
+
+"""
+from keri.app import habbing
+from keri.core import coring, eventing, parsing, sharding
+from keri.db import dbing
+
+
+def test_verify_sigs_memo():
+    """ Test verifySigs accepts signatures memoized as already verified """
+    signer = coring.Signer(transferable=True)
+    raw = b"abcdefghijklmnopqrstuvwxyz0123456789"
+    siger = signer.sign(raw, index=0)
+    bad = coring.Siger(raw=bytes(64), code=siger.code, index=0)
+
+    sigers, indices = eventing.verifySigs(raw=raw, sigers=[siger, bad], verfers=[signer.verfer])
+    assert indices == [0]
+    assert [s.qb64 for s in sigers] == [siger.qb64]
+
+    # memoized triple is trusted and consumed
+    verified = {(signer.verfer.qb64b, bad.raw, raw)}
+    sigers, indices = eventing.verifySigs(raw=raw, sigers=[bad], verfers=[signer.verfer],
+                                          verified=verified)
+    assert indices == [0]
+    assert verified == set()
+
+
+def test_sharder():
+    """ Test sharded validation of KELs by prefix """
+    with habbing.openHby(name="deb", base="test") as debHby, \
+            habbing.openHby(name="cam", base="test") as camHby:
+        habs = [debHby.makeHab(name=f"deb{i}", isith="1", icount=1) for i in range(4)]
+        for hab in habs:
+            hab.rotate()
+            hab.interact()
+
+        triples = sharding.verifyShards([(None, None, [(bytes(msg[:coring.Serder(raw=msg).size]), [], [])])
+                                         for msg in debHby.db.clonePreIter(pre=habs[0].pre)])
+        assert triples == []  # no signatures given
+
+        kvy = eventing.Kevery(db=camHby.db, lax=False, local=False)
+        sharder = sharding.Sharder(kvy=kvy, workers=2)
+        assert kvy.verified == set()
+        try:
+            msgs = bytearray()
+            for hab in habs:
+                msgs.extend(hab.replay())
+            sharder.parser.parse(ims=bytearray(msgs))
+            events = [kwa for name, _, kwa in sharder.msgs]
+            sharder.msgs = []
+            assert len(events) == 12
+            shards = sharder.shard(events)
+            assert [len(items) for keys, wits, items in shards] == [3, 3, 3, 3]
+            assert all(keys is None for keys, wits, items in shards)  # unknown to cam
+            assert len(sharder.verify(events)) == 12  # one sig per event
+
+            assert sharder.process(msgs) == 12
+            assert kvy.verified == set()  # all consumed or dropped
+            for hab in habs:
+                assert camHby.db.kevers[hab.pre].sn == 2
+                assert camHby.db.kevers[hab.pre].serder.said == hab.kever.serder.said
+
+            # known state so interaction sigs verified from shard keys
+            for hab in habs:
+                hab.interact()
+            shards = sharder.shard([dict(serder=hab.kever.serder, sigers=[], wigers=[])
+                                    for hab in habs])
+            assert [keys for keys, wits, items in shards] == [[hab.kever.verfers[0].qb64]
+                                                               for hab in habs]
+            msgs = bytearray()
+            for hab in habs:
+                msgs.extend(hab.replay(fn=3))
+            assert sharder.process(msgs) == 4
+            for hab in habs:
+                assert camHby.db.kevers[hab.pre].sn == 3
+        finally:
+            sharder.close()
+
+
+def test_sharder_receipts():
+    """ Test receipts in stream after their events are handed to Kevery in order """
+    with habbing.openHby(name="deb", base="test") as debHby, \
+            habbing.openHby(name="cam", base="test") as camHby, \
+            habbing.openHby(name="wes", base="test") as wesHby:
+        deb = debHby.makeHab(name="deb", isith="1", icount=1)
+        deb.interact()
+        wes = wesHby.makeHab(name="wes", transferable=False)
+        parsing.Parser().parse(ims=bytearray(deb.replay()),
+                               kvy=eventing.Kevery(db=wesHby.db, lax=False, local=False))
+
+        msgs = bytearray(deb.replay())
+        serders = [coring.Serder(raw=bytes(msg)) for msg in debHby.db.clonePreIter(pre=deb.pre)]
+        for serder in serders:
+            msgs.extend(wes.receipt(serder))
+
+        kvy = eventing.Kevery(db=camHby.db, lax=False, local=False)
+        sharder = sharding.Sharder(kvy=kvy, workers=1)
+        try:
+            assert sharder.process(msgs) == 2
+            assert not sharder.msgs
+        finally:
+            sharder.close()
+
+        assert camHby.db.kevers[deb.pre].sn == 1
+        for serder in serders:  # receipts accepted not escrowed
+            assert camHby.db.cntRcts(key=dbing.dgKey(deb.pre, serder.said)) == 1
+        assert camHby.db.cntUres(key=dbing.snKey(deb.pre, 0)) == 0
@@ -5,6 +5,8 @@ tests.db.dbing module
 """
 import json
 import os
+import subprocess
+import sys
 
 import lmdb
 import pytest
@@ -2057,6 +2059,32 @@ def test_dbdict():
     """End Test"""
 
 
+def test_reload_prunes_habs():
+    """
+    Test Baser.reload removes .habs records without KEL event of key state
+    even when their Kever is not in memory
+    """
+    with habbing.openHby(name="nat") as hby:
+        hab = hby.makeHab(name="nat")
+        pre = 'DApYGFaqnrALTyejaJaGAVhNpSCtqyerPqWVK9ZBNZk0'
+        dig = 'EAskHI462CuIMS_gNkcl_QewzrRSKH2p9zHQIO132Z30'
+        eevt = eventing.StateEstEvent(s='3', d=dig, br=[], ba=[])
+        state = eventing.state(pre=pre, sn=4, pig=dig, dig=dig, fn=4,
+                               eilk=coring.Ilks.ixn, keys=[pre], eevt=eevt)
+        hby.db.states.pin(keys=pre, val=state)  # key state without kel event
+        hby.db.habs.put(keys="stale", val=basing.HabitatRecord(hid=pre))
+
+        hby.db.kevers.clear()  # nothing in memory as after reopen
+        hby.db.prefixes.clear()
+        hby.db.reload()
+        assert hby.db.habs.get(keys="stale") is None
+        assert pre not in hby.db.prefixes
+        assert hab.pre in hby.db.prefixes
+        assert not dict.__contains__(hby.db.kevers, hab.pre)  # still lazy
+
+    """End Test"""
+
+
 def test_baserdoer():
     """
     Test BaserDoer
@@ -2121,6 +2149,44 @@ def test_baserdoer():
     """End Test"""
 
 
+def test_readonly_baser(tmp_path):
+    """
+    Test readonly Baser reader beside writer in another process with snapshot
+    reads. LMDB environments must not be opened twice in one process so the
+    writer runs in a subprocess.
+    """
+    headDirPath = str(tmp_path)
+    with habbing.openHby(name="ro", temp=False, headDirPath=headDirPath) as hby:
+        hab = hby.makeHab(name="alpha")
+        hab.interact()
+        pre = hab.pre
+
+    writer = ("from keri.app import habbing\n"
+              f"with habbing.openHby(name='ro', temp=False, headDirPath={headDirPath!r}) as hby:\n"
+              "    hby.habByName('alpha').interact()\n")
+
+    reader = Baser(name="ro", headDirPath=headDirPath, readonly=True, reopen=True)
+    assert reader.readonly
+    assert reader.kevers[pre].sn == 1
+    assert reader.habs.get(keys=("alpha",)).hid == pre
+    assert len(list(reader.clonePreIter(pre=pre))) == 2
+
+    with reader.snapshot():
+        subprocess.run([sys.executable, "-c", writer], check=True)  # writer commits
+        assert len(list(reader.clonePreIter(pre=pre))) == 2
+        assert reader.getKeLast(snKey(pre, 2)) is None
+    assert len(list(reader.clonePreIter(pre=pre))) == 3
+    assert reader.getKeLast(snKey(pre, 2)) is not None
+
+    with pytest.raises(lmdb.ReadonlyError):
+        reader.habs.pin(keys=("beta",), val=reader.habs.get(keys=("alpha",)))
+
+    reader.close(clear=True)
+    assert not os.path.exists(reader.path)
+
+    """ End Test """
+
+
 if __name__ == "__main__":
     test_baser()
     test_clean_baser()
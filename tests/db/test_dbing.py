@@ -3,6 +3,7 @@
 tests.db.dbing module
 
 """
+import itertools
 import pytest
 
 import os
@@ -620,6 +621,39 @@ def test_lmdber():
         assert items == []  # empty
         assert not items
 
+        # Test getIoItemsTopIter and cntIoValsTop
+        eKey = snKey(pre=b'B', sn=0)
+        assert dber.putIoVals(edb, key=eKey, vals=[b"q"])
+        items = list(dber.getIoItemsTopIter(edb, top=b'A.'))
+        assert [(key, val) for key, ion, val in items] == (
+                [(aKey, val) for val in aVals] + [(bKey, val) for val in bVals] +
+                [(cKey, val) for val in cVals] + [(dKey, val) for val in dVals])
+        assert [ion for key, ion, val in items[:3]] == [0, 1, 2]
+        assert len(list(dber.getIoItemsTopIter(edb))) == 11
+        assert list(dber.getIoItemsTopIter(edb, top=b'B.')) == [(eKey, 0, b"q")]
+        assert list(dber.getIoItemsTopIter(edb, top=b'C.')) == []
+
+        # resume after each item in turn as cursor
+        after = None
+        paged = []
+        while True:
+            page = list(itertools.islice(dber.getIoItemsTopIter(edb, top=b'A.', after=after), 4))
+            if not page:
+                break
+            paged.extend(page)
+            after = page[-1][:2]
+        assert paged == items
+        after = (dKey, 1)  # last item of prefix
+        assert list(dber.getIoItemsTopIter(edb, top=b'A.', after=after)) == []
+        after = (cKey, 5)  # deleted or missing ion resumes at next key
+        assert list(dber.getIoItemsTopIter(edb, top=b'A.', after=after)) == items[-2:]
+
+        assert dber.cntIoValsTop(edb, top=b'A.') == 10
+        assert dber.cntIoValsTop(edb, top=b'B.') == 1
+        assert dber.cntIoValsTop(edb) == 11
+        assert dber.cntIoValsTop(edb, top=b'C.') == 0
+        assert dber.delIoVals(edb, key=eKey)
+
         # Test getIoItemsNextIter(self, db, key=b"")
         #  get dups at first key in database
         # aVals
@@ -796,6 +830,169 @@ def test_lmdber():
     """ End Test """
 
 
+def test_lmdber_snapshot(tmp_path):
+    """
+    Test LMDBer snapshot read sessions across raw, Suber and Komer reads
+    """
+    from keri.db import koming, subing
+    from keri.db.basing import EndpointRecord
+
+    dber = LMDBer(name="snap", headDirPath=str(tmp_path))
+    assert not dber.readonly
+    db = dber.env.open_db(key=b'beep.')
+    ddb = dber.env.open_db(key=b'boop.', dupsort=True)
+    sdb = subing.Suber(db=dber, subkey='bags.')
+    kdb = koming.Komer(db=dber, subkey='ends.', schema=EndpointRecord)
+
+    assert dber.putVal(db, b"a", b"0")
+    assert dber.putIoVals(ddb, b"a", [b"x", b"y"])
+    assert sdb.put(keys=("a",), val="0")
+    assert kdb.put(keys=("a",), val=EndpointRecord(allowed=True))
+
+    with dber.snapshot() as snap:
+        assert snap is dber
+        assert isinstance(dber.reader(db), dbing.SubTxn)
+        # writes commit but reads see the snapshot
+        assert dber.setVal(db, b"a", b"1")
+        assert dber.putVal(db, b"b", b"2")
+        assert dber.addIoVal(ddb, b"a", b"z")
+        assert sdb.pin(keys=("a",), val="1")
+        assert kdb.pin(keys=("a",), val=EndpointRecord(allowed=False))
+
+        assert bytes(dber.getVal(db, b"a")) == b"0"
+        assert dber.getVal(db, b"b") is None
+        assert dber.cnt(db) == 1
+        assert [bytes(val) for val in dber.getIoValsIter(ddb, b"a")] == [b"x", b"y"]
+        assert sdb.get(keys=("a",)) == "0"
+        assert kdb.get(keys=("a",)).allowed
+        assert [val for keys, val in sdb.getItemIter()] == ["0"]
+
+        with dber.snapshot():  # nested reuses the outer transaction
+            assert bytes(dber.getVal(db, b"a")) == b"0"
+        assert bytes(dber.getVal(db, b"a")) == b"0"
+
+    assert not isinstance(dber.reader(db), dbing.SubTxn)
+    assert bytes(dber.getVal(db, b"a")) == b"1"
+    assert bytes(dber.getVal(db, b"b")) == b"2"
+    assert dber.getIoVals(ddb, b"a") == [b"x", b"y", b"z"]
+    assert sdb.get(keys=("a",)) == "1"
+    assert not kdb.get(keys=("a",)).allowed
+
+    # raw batches in one transaction
+    assert dber.putVal(db, b"c", b"3")
+    assert dber.putMany(db, [(b"d", b"4"), (b"c", b"x"), (b"e", b"5")]) == 2
+    assert [bytes(val) if val is not None else None
+            for val in dber.getMany(db, [b"c", b"d", b"z"])] == [b"3", b"4", None]
+    assert dber.putMany(db, [(b"c", b"x")], overwrite=True) == 1
+    assert bytes(dber.getVal(db, b"c")) == b"x"
+    with dber.transact() as txn:
+        assert dber.delMany(db, [b"d", b"e", b"z"]) == 2
+        assert dber.getVal(db, b"d") is None
+        with dber.transact() as inner:  # nested reuses outer
+            assert inner is txn
+    assert dber.cnt(db) == 3  # a, b, c
+
+    # snapshot of generator only while it runs
+    def vals():
+        for key in (b"a", b"b", b"c"):
+            yield bytes(dber.getVal(db, key))
+
+    items = dber.snapshotIter(vals())
+    assert next(items) == b"1"
+    assert not isinstance(dber.reader(db), dbing.SubTxn)  # not held between items
+    assert dber.setVal(db, b"b", b"7")
+    assert bytes(dber.getVal(db, b"b")) == b"7"
+    assert list(items) == [b"2", b"x"]  # generator still sees its snapshot
+    with dber.snapshot():  # nested reuses the outer transaction
+        assert dber.setVal(db, b"c", b"8")
+        assert list(dber.snapshotIter(vals())) == [b"1", b"7", b"x"]
+
+    dber.close(clear=True)
+    assert not os.path.exists(dber.path)
+
+    """ End Test """
+
+
+def test_lmdber_compact(tmp_path):
+    """
+    Test compact storage format of insertion ordinals and migration to it
+    """
+    from keri.db import subing
+
+    class Dber(LMDBer):
+        IoDupSubkeys = (b"dups.", )
+
+    # new database in compact format
+    dber = Dber(name="compact", headDirPath=str(tmp_path), compact=True)
+    assert dber.compact
+    assert dber.proemSize == dbing.CompactSize
+    assert dber.maxSuffix == dbing.MaxCompact
+    assert dber.unproem(dber.proem(300) + b"val") == 300
+    ions = [0, 1, 63, 64, 128, 255, 256, 2 ** 32, dbing.MaxCompact]
+    iokeys = [dber.suffix("a.b", ion) for ion in ions]
+    assert iokeys == sorted(iokeys)  # sorted by ion
+    assert all(b"." not in iokey[4:] for iokey in iokeys)  # splits cleanly
+    assert [dber.unsuffix(iokey) for iokey in iokeys] == [(b"a.b", ion) for ion in ions]
+    assert dber.unsuffix(memoryview(iokeys[2]).tobytes().decode()) == (b"a.b", 63)
+
+    ddb = dber.env.open_db(key=b"dups.", dupsort=True)
+    assert dber.putIoVals(ddb, b"a", [b"z", b"m", b"a"])
+    assert dber.addIoVal(ddb, b"a", b"b")
+    assert [bytes(val) for val in dber.getIoVals(ddb, b"a")] == [b"z", b"m", b"a", b"b"]
+    assert bytes(dber.getIoValLast(ddb, b"a")) == b"b"
+    sdb = subing.IoSetSuber(db=dber, subkey="sets.")
+    assert dber.ioSets[b"sets."] == b"."
+    assert sdb.put(keys=("a", "b"), vals=["z", "m", "a"])
+    assert sdb.get(keys=("a", "b")) == ["z", "m", "a"]
+    assert [keys for keys, val in sdb.getItemIter()] == [("a", "b")] * 3
+    dber.close()
+
+    dber = Dber(name="compact", headDirPath=str(tmp_path), compact=False)
+    assert dber.compact  # marked format wins
+    dber.close(clear=True)
+
+    # existing hex database stays hex until migrated
+    dber = Dber(name="hex", headDirPath=str(tmp_path))
+    assert not dber.compact
+    assert dber.proemSize == dbing.ProemSize + 1
+    ddb = dber.env.open_db(key=b"dups.", dupsort=True)
+    sdb = subing.IoSetSuber(db=dber, subkey="sets.")
+    assert dber.putIoVals(ddb, b"a", [b"z", b"m", b"a"])
+    assert sdb.put(keys="a", vals=["z", "m", "a"])
+    assert sdb.rem(keys="a", val="m")
+    dber.close()
+
+    dber = Dber(name="hex", headDirPath=str(tmp_path), compact=True)
+    assert not dber.compact
+    ddb = dber.env.open_db(key=b"dups.", dupsort=True)
+    sdb = subing.IoSetSuber(db=dber, subkey="sets.")
+    assert dber.migrate(compact=True) == {b"dups.": 3, b"sets.": 2}
+    assert dber.compact
+    assert dber.migrate(compact=True) == {}
+    assert [bytes(val) for val in dber.getIoVals(ddb, b"a")] == [b"z", b"m", b"a"]
+    assert sdb.get(keys="a") == ["z", "a"]
+    assert [dber.unsuffix(iokey)[1] for iokey, val
+            in dber.getIoSetItems(sdb.sdb, b"a")] == [0, 2]  # ions kept
+    assert sdb.add(keys="a", val="b")
+    assert sdb.get(keys="a") == ["z", "a", "b"]
+    dber.close()
+
+    dber = Dber(name="hex", headDirPath=str(tmp_path), readonly=True)
+    assert dber.compact  # marker persisted
+    dber.close()
+
+    dber = Dber(name="hex", headDirPath=str(tmp_path))
+    ddb = dber.env.open_db(key=b"dups.", dupsort=True)
+    sdb = subing.IoSetSuber(db=dber, subkey="sets.")
+    assert dber.migrate(compact=False) == {b"dups.": 3, b"sets.": 3}  # and back
+    assert not dber.compact
+    assert [bytes(val) for val in dber.getIoVals(ddb, b"a")] == [b"z", b"m", b"a"]
+    assert sdb.get(keys="a") == ["z", "a", "b"]
+    dber.close(clear=True)
+
+    """ End Test """
+
+
 if __name__ == "__main__":
     test_key_funcs()
     test_lmdber()
@@ -25,6 +25,36 @@ def test_broker():
         assert isinstance(bork.saiderdb, subing.CesrSuber)
 
 
+def test_waitlist():
+    with dbing.openLMDB() as db:
+        waits = escrowing.Waitlist(db=db, subkey="test")
+        pre = "EDfK6yI9gK4mQRQpSGbZC5bJgwS48MjOcvr2WC3P6ZkB"
+        said = "EBRzmSCFmG2a5U2OqZF-yUobeSYkW-a3FsN82eZXMxY0"
+
+        waits.wait("taes", ("EAbc", f"{0:032x}"), pre, 3)
+        waits.wait("taes", ("EDef", f"{1:032x}"), pre, 3)
+        waits.wait("tmse", ("EAbc", "0AAA", said), pre, 3)
+        waits.wait("cmse", (said, "0AAB"), said)
+        assert waits.take("taes") == []
+
+        assert waits.wake(pre, 2) == 0
+        assert waits.wake(pre, 3) == 3
+        assert waits.wake(pre, 3) == 0  # only woken once
+        assert waits.take("taes") == [("EAbc", f"{0:032x}"), ("EDef", f"{1:032x}")]
+        assert waits.take("taes") == []
+
+        waits.rouse("taes", ("EGhi", f"{2:032x}"))
+        assert waits.take("taes") == [("EGhi", f"{2:032x}")]
+
+        tmse = subing.Suber(db=db, subkey="tmse.")
+        tmse.put(keys=("EAbc", "0AAA", said), val="anchor")
+        assert waits.items("tmse", tmse) == [(("EAbc", "0AAA", said), "anchor")]
+        assert waits.items("tmse", tmse) == []
+
+        assert waits.wake(said) == 1
+        assert waits.items("cmse", tmse) == []  # entry gone so skipped
+
+
 def test_broker_nontrans():
     raw = b'\x05\xaa\x8f-S\x9a\xe9\xfaU\x9c\x02\x9c\x9b\x08Hu'
     salter = coring.Salter(raw=raw)
@@ -842,6 +842,44 @@ def test_ioset_komer():
     assert not db.opened
 
 
+def test_komer_batches():
+    """
+    Test putMany, pinMany, getMany and remMany batches of Komer classes
+    """
+
+    @dataclass
+    class Record:
+        first: str
+        last: str
+
+    with dbing.openLMDB() as db:
+        mydb = koming.Komer(db=db, schema=Record, subkey='records.')
+        jim = Record(first="Jim", last="Black")
+        sue = Record(first="Sue", last="Black")
+        kip = Record(first="Kip", last="Green")
+
+        assert mydb.putMany([(("b", "sue"), sue), (("a", "jim"), jim)]) == 2
+        assert mydb.putMany([(("a", "jim"), kip)]) == 0
+        assert mydb.getMany([("a", "jim"), ("z", "none"), ("b", "sue")]) == [jim, None, sue]
+        assert mydb.pinMany([(("a", "jim"), kip)]) == 1
+        assert mydb.get(keys=("a", "jim")) == kip
+        assert mydb.remMany([("a", "jim"), ("z", "none")]) == 1
+        assert mydb.cntAll() == 1
+
+        iodb = koming.IoSetKomer(db=db, schema=Record, subkey='sets.')
+        with db.env.begin(write=True) as txn:
+            assert iodb.putMany([(("x",), [jim, sue]), (("y",), [kip])], txn=txn) == 2
+        assert iodb.getMany([("x",), ("y",)]) == [[jim, sue], [kip]]
+        assert iodb.remMany([("x",)]) == 1
+        assert iodb.getMany([("x",), ("y",)]) == [[], [kip]]
+
+        dupdb = koming.DupKomer(db=db, schema=Record, subkey='dups.')
+        assert dupdb.pinMany([(("x",), [jim, sue])]) == 1
+        assert dupdb.getMany([("x",)]) == [[jim, sue]]
+
+    """ End Test """
+
+
 if __name__ == "__main__":
     test_dup_komer()
     test_kom_get_item_iter()
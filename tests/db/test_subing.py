@@ -1632,6 +1632,53 @@ def test_crypt_signer_suber():
 
 
 
+def test_suber_batches():
+    """
+    Test putMany, pinMany, getMany and remMany batches of Suber classes
+    """
+    with dbing.openLMDB() as db:
+        sdb = subing.Suber(db=db, subkey='bags.')
+        items = [(("b", "2"), "two"), (("a", "1"), "one"), (("c", "3"), "three")]
+        assert sdb.putMany(items) == 3
+        assert sdb.putMany([(("a", "1"), "uno"), (("d", "4"), "four")]) == 1  # no overwrite
+        assert sdb.getMany([("a", "1"), ("z", "0"), ("d", "4")]) == ["one", None, "four"]
+        assert sdb.pinMany([(("a", "1"), "uno"), (("e", "5"), "five")]) == 2
+        assert sdb.get(keys=("a", "1")) == "uno"
+        assert sdb.remMany([("a", "1"), ("z", "0"), ("e", "5")]) == 2
+        assert [keys for keys, val in sdb.getItemIter()] == [("b", "2"), ("c", "3"), ("d", "4")]
+        assert sdb.putMany([]) == 0
+
+        # caller transaction commits or aborts the whole batch
+        with db.env.begin(write=True) as txn:
+            assert sdb.pinMany([(("b", "2"), "dos"), (("c", "3"), "tres")], txn=txn) == 2
+            assert sdb.getMany([("b", "2"), ("c", "3")], txn=txn) == ["dos", "tres"]
+        assert sdb.get(keys=("b", "2")) == "dos"
+
+        with pytest.raises(ValueError):
+            with db.transact():
+                assert sdb.pinMany([(("b", "2"), "deux"), (("c", "3"), "trois")]) == 2
+                assert sdb.get(keys=("b", "2")) == "deux"  # reads see session writes
+                raise ValueError("abort")
+        assert sdb.getMany([("b", "2"), ("c", "3")]) == ["dos", "tres"]
+
+        # ioset batch puts each set of vals with one scan per key
+        iosdb = subing.CesrIoSetSuber(db=db, subkey='sigs.', klas=coring.Diger)
+        d0, d1, d2 = (coring.Diger(ser=ser) for ser in (b"a", b"b", b"c"))
+        assert iosdb.putMany([(("x",), [d0, d1]), (("y",), [d2]), (("x",), [d1, d2])]) == 3
+        assert [[diger.qb64 for diger in vals] for vals in iosdb.getMany([("x",), ("y",), ("z",)])] == \
+               [[d0.qb64, d1.qb64, d2.qb64], [d2.qb64], []]
+        assert iosdb.remMany([("x",), ("z",)]) == 1
+        assert iosdb.get(keys=("x",)) == []
+
+        # serder suber batches serialize with raw
+        serder = eventing.incept(keys=[coring.Signer().verfer.qb64])
+        srdb = subing.SerderSuber(db=db, subkey='evts.')
+        assert srdb.putMany([((serder.pre, serder.said), serder)]) == 1
+        assert srdb.getMany([(serder.pre, serder.said)])[0].raw == serder.raw
+
+    """ End Test """
+
+
 if __name__ == "__main__":
     test_cesr_ioset_suber()
     test_serder_suber()
@@ -0,0 +1,156 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.help.test_metering module
+
+"""
+import socket
+import time
+
+import pytest
+
+from keri.app import habbing
+from keri.core import eventing, parsing
+from keri.db import basing
+from keri.help import metering
+
+
+def test_histogram():
+    hist = metering.Histogram(buckets=(1, 5, 10))
+    assert hist.quantile(0.5) is None
+    for val in (0.5, 1, 2, 3, 7, 20):
+        hist.observe(val)
+    assert hist.counts == [2, 2, 1, 1]
+    assert hist.count == 6
+    assert hist.sum == 33.5
+    assert hist.quantile(0.5) == 5
+    assert hist.quantile(0.3) == 1
+    assert hist.quantile(0.99) == float("inf")
+
+
+def test_metrics():
+    metrics = metering.Metrics()
+    metrics.describe("requests_total", "Requests by route")
+    metrics.describe("size_bytes", "Sizes", buckets=(10, 100))
+    metrics.inc("requests_total", route="/oobi")
+    metrics.inc("requests_total", 2, route="/oobi")
+    metrics.inc("requests_total", route='/a"b')
+    metrics.add("in_flight", 1)
+    metrics.add("in_flight", -1)
+    metrics.set("escrow_size", 7, escrow="ooes")
+    metrics.observe("size_bytes", 50, route="/oobi")
+    with metrics.timer("duration_seconds"):
+        time.sleep(0.001)
+
+    assert metrics.get("requests_total", route="/oobi") == 3
+    assert metrics.get("in_flight") == 0
+    assert metrics.get("escrow_size", escrow="ooes") == 7
+    assert metrics.get("duration_seconds").count == 1
+    assert metrics.get("duration_seconds").sum >= 0.001
+    assert metrics.get("missing") is None
+
+    text = metrics.render()
+    assert text.splitlines()[:4] == ['# HELP keri_requests_total Requests by route',
+                                     '# TYPE keri_requests_total counter',
+                                     'keri_requests_total{route="/a\\"b"} 1',
+                                     'keri_requests_total{route="/oobi"} 3']
+    assert '# TYPE keri_escrow_size gauge' in text
+    assert 'keri_escrow_size{escrow="ooes"} 7' in text
+    assert 'keri_in_flight 0' in text
+    assert ('keri_size_bytes_bucket{route="/oobi",le="10"} 0\n'
+            'keri_size_bytes_bucket{route="/oobi",le="100"} 1\n'
+            'keri_size_bytes_bucket{route="/oobi",le="+Inf"} 1\n'
+            'keri_size_bytes_sum{route="/oobi"} 50.0\n'
+            'keri_size_bytes_count{route="/oobi"} 1\n') in text
+    assert 'keri_duration_seconds_count 1' in text
+
+
+def test_null_and_statsd_metrics():
+    null = metering.NullMetrics()
+    assert not null.enabled
+    null.inc("requests_total", route="/oobi")
+    null.set("escrow_size", 7)
+    null.observe("size_bytes", 50)
+    with null.timer("duration_seconds"):
+        pass
+    assert null.timer("a") is null.timer("b")  # shared no-op
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.settimeout(1.0)
+    statsd = metering.StatsdMetrics(port=sock.getsockname()[1])
+    try:
+        statsd.inc("requests_total", route="/oobi", method="GET")
+        assert sock.recv(1024) == b"keri.requests_total:1|c|#method:GET,route:/oobi"
+        statsd.add("in_flight", -1)
+        assert sock.recv(1024) == b"keri.in_flight:-1|g"
+        statsd.set("escrow_size", 7, escrow="ooes")
+        assert sock.recv(1024) == b"keri.escrow_size:7|g|#escrow:ooes"
+        statsd.observe("size_bytes", 50)
+        assert sock.recv(1024) == b"keri.size_bytes:50|h"
+        with statsd.timer("duration_seconds"):
+            pass
+        assert sock.recv(1024).startswith(b"keri.duration_seconds:")
+    finally:
+        statsd.close()
+        sock.close()
+
+
+def test_measure():
+    calls = []
+
+    @metering.measure("work")
+    def work(fail=False):
+        calls.append(fail)
+        if fail:
+            raise ValueError("failed")
+        return len(calls)
+
+    assert isinstance(metering.meter, metering.NullMetrics)
+    assert work() == 1  # nothing recorded
+
+    metrics = metering.Metrics()
+    old = metering.install(metrics)
+    try:
+        assert metering.meter is metrics
+        assert work() == 2
+        with pytest.raises(ValueError):
+            work(fail=True)
+    finally:
+        assert metering.install(old) is metrics
+
+    assert metering.meter is old
+    assert metrics.get("work_total", result="ok") == 1
+    assert metrics.get("work_total", result="ValueError") == 1
+    assert metrics.get("work_seconds").count == 2
+    assert work.__name__ == "work"
+
+
+def test_hot_path_metering():
+    """ Test counters and timers of Parser, Kevery and its escrows """
+    with habbing.openHby(name="test", temp=True) as hby, \
+            basing.openDB(name="remote", temp=True) as db:
+        hab = hby.makeHab(name="alpha")
+        hab.interact()
+        msgs = [bytearray(msg) for msg in hab.db.clonePreIter(pre=hab.pre)]
+
+        metrics = metering.Metrics()
+        old = metering.install(metrics)
+        try:
+            kvy = eventing.Kevery(db=db)
+            parser = parsing.Parser(kvy=kvy)
+            size = len(msgs[0]) + len(msgs[1])
+            parser.parse(ims=msgs[1])  # out of order so escrowed
+            parser.parse(ims=msgs[0])
+            kvy.processEscrows()
+            assert kvy.kevers[hab.pre].sn == 1
+        finally:
+            metering.install(old)
+
+    assert metrics.get("parser_messages_total", ident="KERI") == 2
+    assert 0 < metrics.get("parser_bytes_total", ident="KERI") < size  # bodies only
+    assert metrics.get("kevery_event_total", result="OutOfOrderError") == 1
+    assert metrics.get("kevery_event_total", result="ok") == 2  # icp and unescrowed ixn
+    assert metrics.get("kevery_escrow_size", escrow="ooes") == 1
+    assert metrics.get("kevery_unescrow_total", escrow="ooes", result="succeeded") == 1
+    assert metrics.get("kevery_escrow_age_seconds", escrow="ooes").count == 1
+    assert metrics.get("kevery_escrow_process_seconds", escrow="pwes").count == 1
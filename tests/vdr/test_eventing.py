@@ -6,7 +6,7 @@ tests.vdr.eventing module
 import pytest
 
 from keri.app import habbing, keeping
-from keri.core import coring
+from keri.core import coring, parsing
 from keri.core import eventing as keventing
 from keri.core.coring import versify, Serials, Ilks, MtrDex, Prefixer, Serder, Signer, Seqner
 from keri.db import basing
@@ -778,6 +778,85 @@ def test_tevery_process_escrow(mockCoringRandomNonce):
 
 
 
+def test_tevery_escrow_wake(mockCoringRandomNonce):
+    with basing.openDB() as db, keeping.openKS() as kpr, viring.openReger() as reg:
+        hby, hab = buildHab(db, kpr)
+
+        vcp = eventing.incept(hab.pre,
+                              baks=[],
+                              toad=0,
+                              cnfg=["NB"],
+                              code=MtrDex.Blake3_256)
+        regk = vcp.pre
+        rseal = keventing.SealEvent(i=regk, s=vcp.ked["s"], d=vcp.saider.qb64)
+
+        tvy = Tevery(reger=reg, db=db)
+        tvy.processEscrows()  # first pass sweeps all escrows
+        assert tvy.swept
+
+        seqner = Seqner(sn=1)
+        diger = coring.Diger(qb64b=b'EFEUzOixM-Avz6VPmQoB59eYQ2oan9ltJ1JOSe-QQFRq')
+        with pytest.raises(MissingAnchorError):  # escrows waiting on anchoring event
+            tvy.processEvent(serder=vcp, seqner=seqner, saider=diger)
+        assert db.kews.waits.get(keys=(hab.pre, f"{1:032x}")) == [f"taes.{regk}.{0:032x}"]
+
+        tvy.processEscrows()  # nothing woken so escrow untouched
+        assert reg.getTae(snKey(regk, 0)) is not None
+        assert regk not in tvy.tevers
+
+        hab.rotate(data=[rseal._asdict()])  # accepting anchoring event wakes escrow
+        assert db.kews.woken.get(keys=("taes",)) == [f"{regk}.{0:032x}"]
+        assert not db.kews.waits.get(keys=(hab.pre, f"{1:032x}"))
+
+        tvy.processEscrows()
+        assert regk in tvy.tevers
+        assert reg.getTae(snKey(regk, 0)) is None
+        assert not db.kews.woken.get(keys=("taes",))
+
+
+def test_tevery_escrow_batch(mockCoringRandomNonce):
+    with basing.openDB() as db, keeping.openKS() as kpr, viring.openReger() as reg, \
+            basing.openDB(name="remote") as rdb:
+        hby, hab = buildHab(db, kpr)
+
+        vcp = eventing.incept(hab.pre,
+                              baks=[],
+                              toad=0,
+                              cnfg=["NB"],
+                              code=MtrDex.Blake3_256)
+        regk = vcp.pre
+        rseal = keventing.SealEvent(i=regk, s=vcp.ked["s"], d=vcp.saider.qb64)
+        rotser = Serder(raw=hab.rotate(data=[rseal._asdict()]))
+
+        # remote validator has the KEL so far and the registry
+        rkvy = keventing.Kevery(db=rdb, lax=False, local=False)
+        parsing.Parser(kvy=rkvy).parse(ims=bytearray(hab.replay()))
+        assert rdb.kevers[hab.pre].sn == rotser.sn
+        tvy = Tevery(reger=reg, db=rdb)
+        tvy.processEvent(serder=vcp, seqner=Seqner(sn=rotser.sn), saider=rotser.saider)
+        tvy.processEscrows()  # first pass sweeps all escrows
+        assert tvy.swept
+
+        # batch of issuances anchored by one event the remote has not seen yet
+        isses = [eventing.issue(vcdig=coring.Diger(ser=b"cred%d" % i).qb64, regk=regk) for i in range(12)]
+        seals = [keventing.SealEvent(iss.pre, iss.ked["s"], iss.saider.qb64)._asdict() for iss in isses]
+        ixn = hab.interact(data=seals)
+        ixnser = Serder(raw=ixn)
+        for iss in isses:
+            with pytest.raises(MissingAnchorError):
+                tvy.processEvent(serder=iss, seqner=Seqner(sn=ixnser.sn), saider=ixnser.saider)
+            assert reg.getTae(snKey(iss.pre, 0)) is not None
+
+        parsing.Parser(kvy=rkvy).parse(ims=bytearray(ixn))  # wakes every escrowed issuance
+        assert rdb.kevers[hab.pre].sn == ixnser.sn
+        tvy.processEscrows()
+
+        for iss in isses:
+            assert reg.getTae(snKey(iss.pre, 0)) is None
+            assert reg.getTel(snKey(iss.pre, 0)) == iss.saidb
+        assert not rdb.kews.woken.get(keys=("taes",))
+
+
 if __name__ == "__main__":
     test_tever_escrow()
     test_tevery_process_escrow()
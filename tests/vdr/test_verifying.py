@@ -7,7 +7,7 @@ tests.vdr.verifying module
 import pytest
 
 from keri import kering
-from keri.app import habbing, signing
+from keri.app import habbing, indirecting, signing
 from keri.core import eventing as ceventing, scheming
 from keri.core import parsing, coring
 from keri.core.eventing import SealEvent
@@ -107,6 +107,85 @@ def test_verifier(seeder):
     """End Test"""
 
 
+def test_verifier_pipeline(seeder):
+    with (habbing.openHab(name="sid", temp=True, salt=b'0123456789abcdef') as (hby, hab),
+            habbing.openHab(name="recp", transferable=True, temp=True) as (recpHby, recp)):
+        seeder.seedSchema(db=hby.db)
+
+        regery = credentialing.Regery(hby=hby, name="test", temp=True)
+        issuer = regery.makeRegistry(prefix=hab.pre, name="test")
+        rseal = SealEvent(issuer.regk, "0", issuer.regd)._asdict()
+        hab.interact(data=[rseal])
+        seqner = coring.Seqner(sn=hab.kever.sn)
+        issuer.anchorMsg(pre=issuer.regk, regd=issuer.regd, seqner=seqner, saider=hab.kever.serder.saider)
+        regery.processEscrows()
+
+        creds = []
+        for i in range(4):
+            credSubject = dict(d="", i=recp.pre, dt=helping.nowIso8601(), LEI=f"254900OPPU84GM83MG3{i}")
+            _, d = scheming.Saider.saidify(sad=credSubject, code=coring.MtrDex.Blake3_256, label=scheming.Ids.d)
+            creder = proving.credential(issuer=hab.pre,
+                                        schema="EMQWEcCnVRk1hatTNyK3sIykYSrrFvafX3bHQ9Gkk1kC",
+                                        data=d,
+                                        status=issuer.regk)
+            iss = issuer.issue(said=creder.said)
+            rseal = SealEvent(iss.pre, "0", iss.said)._asdict()
+            hab.interact(data=[rseal])
+            seqner = coring.Seqner(sn=hab.kever.sn)
+            issuer.anchorMsg(pre=iss.pre, regd=iss.said, seqner=seqner, saider=hab.kever.serder.saider)
+            sadsigers, sadcigars = signing.signPaths(hab=hab, serder=creder, paths=[[]])
+            creds.append(dict(creder=creder, sadsigers=sadsigers, sadcigars=sadcigars))
+        regery.processEscrows()
+
+        # signed by wrong key so worker leaves it to be rejected in order
+        sadsigers, sadcigars = signing.signPaths(hab=recp, serder=creds[3]["creder"], paths=[[]])
+        creds[3]["sadsigers"] = [(pather, prefixer, seqner, saider, sigers)
+                                 for (pather, _, _, _, sigers), (_, prefixer, seqner, saider, _)
+                                 in zip(sadsigers, creds[3]["sadsigers"])]
+
+        verifier = verifying.Verifier(hby=hby, reger=regery.reger, workers=2)
+        dict.pop(hby.kevers, hab.pre)  # issuer not read through from key state yet
+        try:
+            items = verifier.items(creds)
+            assert [raw for raw, _, _, _ in items] == [cred["creder"].raw for cred in creds]
+            assert all(scraw is not None for _, scraw, _, _ in items)
+            assert all(len(sigs) == 1 for _, _, _, sigs in items)
+            checked, triples = verifying.verifyCredentials(items)
+            assert checked == [cred["creder"].raw for cred in creds]
+            assert len(triples) == 3
+            assert verifier.verify(creds) == (checked, triples)
+
+            for cred in creds:
+                verifier.creds.append(cred)
+            verifier.processMessages()
+        finally:
+            verifier.close()
+
+        assert verifier.checked == set() and verifier.verified == set()
+        assert verifier.chains is None
+        saved = [cue["creder"].said for cue in verifier.cues if cue["kin"] == "saved"]
+        assert saved == [cred["creder"].said for cred in creds[:3]]
+        assert regery.reger.saved.get(keys=creds[3]["creder"].said) is None
+
+        # mailbox parser collects credentials for batches of verifier with workers
+        mbd = indirecting.MailboxDirector(hby=hby, topics=["/credential"], verifier=verifier)
+        assert isinstance(mbd.parser.vry, verifying.Collector)
+        assert mbd.parser.vry.creds is verifier.creds
+        mbd = indirecting.MailboxDirector(hby=hby, topics=["/credential"],
+                                          verifier=verifying.Verifier(hby=hby, reger=regery.reger))
+        assert isinstance(mbd.parser.vry, verifying.Verifier)
+
+        # memo of chain node state lasts for one batch
+        verifier.chains = dict()
+        state = verifier.verifyChain(creds[0]["creder"].said)
+        assert state.ked["et"] == coring.Ilks.iss
+        assert verifier.chains == {creds[0]["creder"].said: state}
+        assert verifier.verifyChain(creds[3]["creder"].said) is None
+        assert creds[3]["creder"].said not in verifier.chains
+
+    """End Test"""
+
+
 # def test_verifier_multisig():
 #     with test_grouping.openMutlsig(prefix="test") as ((hby1, hab1), (hby2, hab2), (hby3, hab3)), \
 #             habbing.openHab(name="recp", transferable=True, temp=True) as (recpHab, recp), \